@@ -9,14 +9,23 @@ tümünü tek seferde üret.
 
 import sys
 import os
+import argparse
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config.roles_config import ROLES
 from generators.single_generator import SingleGenerator
+from generators.batch_scheduler import OUTPUT_FORMATS, BatchScheduler
 from core.question_generator import QuestionGenerator
 from config.openai_settings import validate_api_key
-from exporters.word_exporter import WordExporter
-from utils.file_helpers import FileHelper
+from core.response_cache import CACHE_MODES, configure_shared_response_cache, get_shared_response_cache
+from core.structured_output import get_parse_path_stats
+from core.cost_ledger import get_shared_cost_ledger
+from core.usage_tracker import get_shared_usage_tracker
+from utils.tracing import get_shared_tracer
+from generators.generation_plan import GenerationPlanError, load_generation_plan
+from generators.run_journal import RunJournal, RunJournalError
+from generators.batch_api_runner import BatchAPIRunner
+from config.generation_settings import get_generation_config, get_run_journal_config
 import logging
 
 # Logging ayarları
@@ -30,6 +39,13 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Çıktı biçimlerinin ekrandaki adları (listede olmayanlar büyük harfle gösterilir)
+FORMAT_LABELS = {
+    "json": "JSON",
+    "docx": "Word",
+    "md": "Markdown"
+}
+
 def display_header():
     """Başlık göster"""
     print("\n" + "="*60)
@@ -107,8 +123,15 @@ def get_user_input():
     
     return generation_plan
 
-def display_plan(generation_plan):
-    """Üretim planını göster"""
+def display_plan(generation_plan, concurrency=None, batch_api=False):
+    """
+    Üretim planını ve geçmişten kalibre edilmiş süre / maliyet tahminini göster.
+    
+    Args:
+        generation_plan (dict): {rol_kodu: {katsayı: soru_sayısı}}
+        concurrency (int, optional): Aynı anda çalışacak üretim görevi (None ise GENERATION_BATCH_CONCURRENCY)
+        batch_api (bool): Batch API fiyatıyla tahmin et
+    """
     if not generation_plan:
         print("\n❌ Hiç soru seçilmedi!")
         return False
@@ -118,7 +141,7 @@ def display_plan(generation_plan):
     print("="*50)
     
     total_questions = 0
-    total_api_calls = 0
+    units = []
     
     for role_code, difficulties in generation_plan.items():
         role_name = ROLES[role_code]["name"]
@@ -127,12 +150,22 @@ def display_plan(generation_plan):
         for difficulty, count in difficulties.items():
             print(f"   {difficulty}x: {count} soru")
             total_questions += count
-            total_api_calls += 3  # Kategori bazlı sistem - her rol için 3 API isteği
+            units.append(calculate_question_distribution(count))
+    
+    if concurrency is None:
+        concurrency = get_generation_config()["batch_concurrency"]
+    estimate = get_shared_cost_ledger().estimate(units, concurrency=concurrency, batch_api=batch_api)
+    source = (
+        f"son çalıştırmalardaki {estimate['history_calls']} çağrıdan" if estimate["history_calls"]
+        else "geçmiş yok, kaba tahmin"
+    )
     
     print(f"\n📊 TOPLAM:")
     print(f"   • Soru sayısı: {total_questions}")
-    print(f"   • API isteği: {total_api_calls}")
-    print(f"   • Tahmini maliyet: ~${total_api_calls * 0.01:.2f}")
+    print(f"   • API isteği: ~{estimate['calls']}")
+    print(f"   • Token: ~{estimate['prompt_tokens']} girdi ({estimate['cached_tokens']} önbellekli), ~{estimate['completion_tokens']} çıktı")
+    print(f"   • Tahmini süre: ~{format_duration(estimate['seconds'])}" + (" (+ Batch API kuyruğu)" if batch_api else ""))
+    print(f"   • Tahmini maliyet: ~${estimate['cost']:.4f} ({source})")
     print("="*50)
     
     return True
@@ -188,74 +221,261 @@ def confirm_generation():
     confirm = input().strip().lower()
     return confirm in ['y', 'yes', 'evet', 'e']
 
-def generate_questions(generation_plan):
-    """Soruları üret"""
+def generate_questions(
+    generation_plan,
+    concurrency=None,
+    export_workers=None,
+    concurrent_categories=None,
+    output_formats=None,
+    job_descriptions=None,
+    journal=None,
+    batch_api=False,
+    structured_output=None,
+    trace=None
+):
+    """
+    Soruları üret.
+    
+    Plan görev grafiğine çevrilir (üret → JSON kaydet → Word / diğer export'lar);
+    üretim görevleri sınırlı eşzamanlılıkla, export görevleri ayrı
+    worker havuzunda çalışır.
+    
+    Args:
+        generation_plan (dict): {rol_kodu: {katsayı: soru_sayısı}}
+        concurrency (int, optional): Aynı anda çalışacak üretim görevi sayısı
+        export_workers (int, optional): Export worker sayısı
+        concurrent_categories (bool, optional): Rol içinde kategorileri eşzamanlı üret
+        output_formats (list, optional): Çıktı biçimleri (json, docx, jsonl, csv, md, html; None ise json ve docx)
+        job_descriptions (dict, optional): {rol_kodu: ilan metni} (None ise ilan dosyaları)
+        journal (RunJournal, optional): Devam edilecek çalıştırmanın günlüğü
+            (None ise RUN_JOURNAL_ENABLED açıksa yeni günlük açılır)
+        batch_api (bool): Kategori isteklerini önce OpenAI Batch API ile toplu gönder
+        structured_output (bool, optional): JSON şemalı yanıt modu (None ise GENERATION_STRUCTURED_OUTPUT)
+        trace (bool, optional): Aşama sürelerini izle ve TRACE_DIR'e yaz (None ise TRACE_ENABLED)
+        
+    Returns:
+        tuple: (display_results için sonuç listesi, görev süreleri, başarısız birimler)
+    """
     print("\n" + "="*60)
     print("🚀 SORU ÜRETİMİ BAŞLIYOR...")
     print("="*60 + "\n")
     
-    generator = SingleGenerator()
-    word_exporter = WordExporter()
-    results = []
+    # Batch API modunda günlük her zaman tutulur: sonucu alınamayan batch --resume ile yoklanır
+    if journal is None and (batch_api or get_run_journal_config()["enabled"]):
+        journal = RunJournal.create(generation_plan, output_formats)
+    if journal is not None:
+        print(f"📒 Çalıştırma kimliği: {journal.run_id} (yarıda kalırsa: --resume {journal.run_id})\n")
     
-    for role_code, difficulties in generation_plan.items():
-        role_name = ROLES[role_code]["name"]
-        role_config = ROLES[role_code]
-        
-        for difficulty, count in difficulties.items():
-            print(f"📝 {role_name} ({difficulty}x) - {count} soru üretiliyor...")
-            
-            try:
-                # Soruları üret
-                result = generator.generate_questions(
-                    role_code=role_code,
-                    salary_coefficient=difficulty,
-                    question_counts=calculate_question_distribution(count)
-                )
-                
-                if result.get("success", False):
-                    print(f"   ✅ JSON: {result.get('total_questions', 0)} soru üretildi")
-                    
-                    # Word belgesi oluştur
-                    try:
-                        # İlan metnini yükle
-                        job_file_path = f"data/job_descriptions/{role_config['job_description_file']}"
-                        job_description = FileHelper.load_job_description(job_file_path)
-                        
-                        # Word dosyasını oluştur
-                        word_filename = word_exporter.generate_filename(
-                            role_name, 
-                            difficulty,
-                            "data/word_exports"
-                        )
-                        
-                        if word_exporter.export_questions(result, job_description, word_filename):
-                            print(f"   ✅ Word: {word_filename}")
-                            word_file = word_filename
-                        else:
-                            print(f"   ⚠️  Word oluşturulamadı")
-                            word_file = None
-                            
-                    except Exception as word_error:
-                        print(f"   ⚠️  Word hatası: {str(word_error)}")
-                        word_file = None
-                    
-                    results.append({
-                        "role": role_name,
-                        "difficulty": difficulty,
-                        "count": result.get('total_questions', 0),
-                        "word_file": word_file,
-                        "json_file": result.get('json_file')
-                    })
-                else:
-                    print(f"   ❌ Başarısız: {result.get('error', 'Bilinmeyen hata')}")
-                    
-            except Exception as e:
-                print(f"   ❌ Hata: {str(e)}")
-            
-            print()
+    scheduler = BatchScheduler(
+        generator=SingleGenerator(
+            concurrent_categories=concurrent_categories,
+            run_id=journal.run_id if journal is not None else None,
+            structured_output=structured_output
+        ),
+        max_concurrency=concurrency,
+        export_workers=export_workers,
+        output_formats=output_formats,
+        job_descriptions=job_descriptions,
+        journal=journal
+    )
+    failures = []
+    
+    # Çağrı bazlı token / süre / maliyet kaydı (sonraki planların tahminini besler)
+    ledger = get_shared_cost_ledger()
+    ledger.start_run(scheduler.generator.run_id)
+    
+    # Devam edilen çalıştırmada gönderilmiş batch varsa yeniden gönderilmez, yoklanır
+    if batch_api or (journal is not None and journal.batch is not None):
+        batch_report = run_batch_api(scheduler, generation_plan, journal, job_descriptions)
+        if batch_report.get("pending"):
+            # Batch sunucuda sürüyor: canlı üretim aynı istekleri ikinci kez faturalardı
+            ledger.stop_run()
+            return [], [], [{"unit": "batch_api", "error": batch_report.get("error") or "Batch sonucu alınamadı"}]
+    
+    def on_progress(event, unit, payload):
+        label = f"{unit['role_name']} ({unit['difficulty']}x)"
+        if event == "generate_started":
+            print(f"📝 {label} - {unit['count']} soru üretiliyor...")
+        elif event == "unit_skipped":
+            print(f"⏭️  {label} - günlükte tamamlanmış, atlandı")
+        elif event == "generate_completed":
+            print(f"   ✅ {label} JSON: {payload.get('total_questions', 0)} soru üretildi")
+        elif event == "generate_failed":
+            failures.append({"unit": unit["unit_id"], "error": payload.get("error", "Bilinmeyen hata")})
+            print(f"   ❌ {label} başarısız: {payload.get('error', 'Bilinmeyen hata')}")
+        elif event == "export_completed":
+            print(f"   ✅ {label} {format_label(payload.get('format', 'docx'))}: {payload['file']}")
+        elif event == "export_failed":
+            print(f"   ⚠️  {label} {format_label(payload.get('format', 'docx'))} hatası: {payload.get('error', 'Bilinmeyen hata')}")
+    
+    # Aşama süreleri (LLM çağrıları, parse, doldurma, JSON / Word yazımı)
+    tracer = get_shared_tracer()
+    if trace is not None:
+        tracer.enable(trace)
+    
+    try:
+        with tracer.span("batch.run", run_id=scheduler.generator.run_id, roles=len(generation_plan)):
+            report = scheduler.run(
+                generation_plan,
+                distribution_fn=calculate_question_distribution,
+                progress_callback=on_progress
+            )
+    finally:
+        ledger.stop_run()
+        if tracer.enabled:
+            tracer.export(scheduler.generator.run_id)
+    print()
+    
+    return report["results"], report["timings"], failures
+
+def run_batch_api(scheduler, generation_plan, journal=None, job_descriptions=None):
+    """
+    Planın kategori isteklerini Batch API ile gönder ve yanıtları bekle.
+    
+    Yanıtlar zamanlayıcının üreticisine yüklenir; başarısız / süresi
+    dolmuş kategoriler zamanlayıcı çalışırken canlı istekle üretilir.
+    Batch'in sonucu alınamazsa (pending) canlı üretime geçilmez.
+    """
+    units = scheduler.build_units(generation_plan, calculate_question_distribution)
+    runner = BatchAPIRunner(scheduler.generator, journal=journal, job_descriptions=job_descriptions)
+    
+    def on_status(batch):
+        counts = batch.get("request_counts") or {}
+        print(
+            f"   📦 Batch {batch.get('id')}: {batch.get('status')} "
+            f"({counts.get('completed', 0)}/{counts.get('total', 0)} tamamlandı, {counts.get('failed', 0)} hata)"
+        )
+    
+    print("📦 Batch API modu: tüm kategori istekleri tek batch olarak gönderiliyor...")
+    report = runner.run(units, on_status=on_status)
+    if report["success"]:
+        print(f"   ✅ {report['loaded']}/{report['requests']} yanıt alındı\n")
+    elif report.get("pending"):
+        print(
+            f"   ⚠️  Batch {report['batch_id']} sonucu alınamadı ({report.get('error')}); batch sunucuda "
+            f"sürüyor olabilir, çift ücret ödememek için canlı istek gönderilmedi."
+        )
+        if journal is not None:
+            print(f"   ↻ Daha sonra devam etmek için: --resume {journal.run_id}\n")
+    else:
+        print(
+            f"   ⚠️  Batch API tamamlanamadı ({report.get('error') or report['status']}); "
+            f"{report['failed']} istek canlı gönderilecek\n"
+        )
+    return report
+
+def format_label(output_format):
+    """Çıktı biçiminin ekranda gösterilen adı"""
+    return FORMAT_LABELS.get(output_format, output_format.upper())
+
+def display_task_timings(timings):
+    """Görev bazlı süreleri göster"""
+    if not timings:
+        return
+    
+    task_labels = {
+        "generate": "Üretim",
+        "save_json": "JSON"
+    }
+    
+    print("\n⏱️  GÖREV SÜRELERİ:")
+    for timing in timings:
+        status = "✅" if timing.get("success") else "❌"
+        task = timing["task"]
+        task_label = format_label(task[len("export_"):]) if task.startswith("export_") else task_labels.get(task, task)
+        print(f"   {status} {timing['role']} ({timing['difficulty']}x) - {task_label}: {timing['duration']:.2f} sn")
+
+def display_cache_stats():
+    """Yanıt önbelleği istatistiklerini göster"""
+    stats = get_shared_response_cache().stats()
+    if stats["mode"] == "off":
+        return
+    
+    print(f"\n💾 ÖNBELLEK ({stats['mode']}): {stats['hits']} isabet, {stats['misses']} ıskalama, {stats['writes']} yazma")
+
+def display_parse_stats():
+    """Yanıtların hangi parse yolundan çözüldüğünü göster"""
+    stats = get_parse_path_stats().snapshot()
+    total = sum(stats.values())
+    if total == 0:
+        return
+    
+    labels = {
+        "structured": "Şema (onarımsız)",
+        "scanner": "Tarayıcı",
+        "scanner_repaired": "Tarayıcı (onarımlı)",
+        "legacy_cascade": "Eski zincir",
+        "failed": "Başarısız"
+    }
+    parts = [f"{labels.get(path, path)} {count}" for path, count in stats.items() if count]
+    print(f"\n🧩 PARSE YOLLARI ({total} yanıt): " + ", ".join(parts))
+
+def format_duration(seconds):
+    """Saniyeyi okunur süreye çevir"""
+    if seconds < 60:
+        return f"{seconds:.0f} sn"
+    return f"{seconds / 60:.1f} dk"
+
+def display_cost_summary():
+    """Son çalıştırmanın maliyet defteri özetini göster"""
+    ledger = get_shared_cost_ledger()
+    if not ledger.enabled or ledger.run_id is None:
+        return
+    
+    summary = ledger.run_summary(ledger.run_id)
+    totals = summary["totals"]
+    if totals["calls"] == 0:
+        return
+    
+    print(
+        f"\n💰 MALİYET DEFTERİ ({summary['run_id']}): ${totals['cost']:.4f}, {totals['calls']} çağrı, "
+        f"{totals['prompt_tokens']} girdi ({totals['cached_tokens']} önbellekli) / {totals['completion_tokens']} çıktı token, "
+        f"{totals['retries']} yeniden deneme"
+    )
+    for row in summary["rows"]:
+        label = f"{row['role']} ({row['difficulty']}x) / {row['category']}" if row["category"] else "diğer"
+        print(
+            f"   {label}: ${row['cost']:.4f}, {row['calls']} çağrı, "
+            f"{row['prompt_tokens'] + row['completion_tokens']} token, {row['latency']:.1f} sn"
+        )
+
+def display_trace_summary(limit=12):
+    """İzleme açıksa aşama bazında süre özetini ve iz dosyalarını göster"""
+    tracer = get_shared_tracer()
+    if not tracer.enabled:
+        return
+    
+    rows = tracer.summary()
+    if not rows:
+        return
+    
+    print(f"\n🔬 AŞAMA SÜRELERİ (toplam süreye göre ilk {min(limit, len(rows))}):")
+    for row in rows[:limit]:
+        errors = f", {row['errors']} hata" if row["errors"] else ""
+        print(
+            f"   {row['name']:<28} {row['count']:>5} kez  toplam {row['total_ms'] / 1000:>7.2f} sn  "
+            f"ort. {row['avg_ms']:>8.1f} ms  en uzun {row['max_ms']:>8.1f} ms{errors}"
+        )
+    if tracer.last_export:
+        print(f"   📄 JSONL: {tracer.last_export['jsonl']}")
+        print(f"   📄 Chrome trace: {tracer.last_export['chrome']} (chrome://tracing veya ui.perfetto.dev)")
+
+def display_usage_stats():
+    """Token kullanımını ve sağlayıcı tarafı prompt önbelleği isabetini göster"""
+    stats = get_shared_usage_tracker().snapshot()
+    if stats["requests"] == 0:
+        return
     
-    return results
+    print(
+        f"\n🗄️ PROMPT ÖNBELLEĞİ: {stats['cached_tokens']}/{stats['prompt_tokens']} prompt token önbellekten "
+        f"(%{stats['cached_ratio'] * 100:.1f}), {stats['cached_requests']}/{stats['requests']} istekte isabet; "
+        f"{stats['completion_tokens']} çıktı token"
+    )
+    if stats["avg_latency_cached"] is not None and stats["avg_latency_uncached"] is not None:
+        print(
+            f"   Ortalama gecikme: önbellekli {stats['avg_latency_cached']:.2f} sn, "
+            f"önbelleksiz {stats['avg_latency_uncached']:.2f} sn"
+        )
 
 def display_results(results):
     """Sonuçları göster"""
@@ -280,11 +500,87 @@ def display_results(results):
             print(f"   📄 Word: {result['word_file']}")
         if result.get('json_file'):
             print(f"   📄 JSON: {result['json_file']}")
+        for output_format, file_path in result.get('files', {}).items():
+            print(f"   📄 {format_label(output_format)}: {file_path}")
     
     print("\n🎉 Tüm dosyalar hazır!")
 
+def merge_plan_settings(file_settings, **cli_settings):
+    """
+    Plan dosyası ayarlarını komut satırı değerleriyle birleştir (komut satırı önceliklidir).
+    
+    None / boş verilen komut satırı değerleri dosyadaki ayarı ezmez.
+    
+    Raises:
+        GenerationPlanError: Bilinmeyen çıktı biçimi veya önbellek modu
+    """
+    settings = dict(file_settings)
+    for key, value in cli_settings.items():
+        if value is not None and value != () and value != []:
+            settings[key] = value
+    if settings.get("formats") is not None:
+        formats = settings["formats"]
+        settings["formats"] = [formats] if isinstance(formats, str) else list(formats)
+        unknown = [fmt for fmt in settings["formats"] if fmt not in OUTPUT_FORMATS]
+        if unknown:
+            raise GenerationPlanError(f"Geçersiz çıktı biçimi: {unknown}. Geçerli biçimler: {list(OUTPUT_FORMATS)}")
+    if settings.get("cache") is not None and settings["cache"] not in CACHE_MODES:
+        raise GenerationPlanError(f"Geçersiz önbellek modu: {settings['cache']}. Geçerli modlar: {list(CACHE_MODES)}")
+    return settings
+
+def parse_args():
+    """Komut satırı argümanlarını oku"""
+    parser = argparse.ArgumentParser(description="Mülakat soru havuzu toplu üretim")
+    parser.add_argument(
+        "--concurrency", type=int, default=None,
+        help="Aynı anda çalışacak üretim görevi sayısı (varsayılan: GENERATION_BATCH_CONCURRENCY)"
+    )
+    parser.add_argument(
+        "--export-workers", type=int, default=None,
+        help="JSON/Word export worker sayısı (varsayılan: GENERATION_EXPORT_WORKERS)"
+    )
+    parser.add_argument(
+        "--cache", choices=CACHE_MODES, default=None,
+        help="LLM yanıt önbelleği modu (varsayılan: LLM_CACHE_MODE)"
+    )
+    parser.add_argument(
+        "--config-file", default=None,
+        help="Plan dosyası (JSON/YAML, rol → katsayı → sayı); verilirse soru sorulmadan üretilir"
+    )
+    parser.add_argument(
+        "--format", dest="formats", action="append", choices=OUTPUT_FORMATS, default=None,
+        help="Çıktı biçimi (birden çok kez verilebilir; varsayılan: json, docx)"
+    )
+    parser.add_argument(
+        "--structured-output", action="store_true", default=None,
+        help="Soru dizisi isteklerinde JSON şeması (response_format) gönder (varsayılan: GENERATION_STRUCTURED_OUTPUT)"
+    )
+    parser.add_argument(
+        "--trace", action="store_true", default=None,
+        help="Aşama sürelerini izle, JSONL ve Chrome trace olarak yaz (varsayılan: TRACE_ENABLED)"
+    )
+    parser.add_argument(
+        "--batch-api", action="store_true", default=None,
+        help="Kategori isteklerini OpenAI Batch API ile gönder (gece çalışan havuz üretimi, yarı fiyat)"
+    )
+    parser.add_argument(
+        "--resume", metavar="RUN_ID", default=None,
+        help="Yarıda kalan çalıştırmaya devam et: biten birimler atlanır, eksik kategoriler üretilir"
+    )
+    return parser.parse_args()
+
 def main():
     """Ana fonksiyon"""
+    args = parse_args()
+    cli_settings = {
+        "concurrency": args.concurrency,
+        "export_workers": args.export_workers,
+        "cache": args.cache,
+        "formats": args.formats,
+        "structured_output": args.structured_output,
+        "batch_api": args.batch_api,
+        "trace": args.trace
+    }
     try:
         # API key kontrolü
         if not validate_api_key():
@@ -292,30 +588,78 @@ def main():
             print("💡 Önce API key'ini ayarla: export OPENAI_API_KEY='your-key'")
             sys.exit(1)
         
-        # Header göster
-        display_header()
-        
-        # Rolleri listele
-        display_roles()
-        
-        # Kullanıcı girişi al
-        generation_plan = get_user_input()
-        
-        # Planı göster
-        if not display_plan(generation_plan):
-            print("👋 Çıkılıyor...")
-            sys.exit(0)
+        journal = None
+        if args.resume:
+            # Devam: plan günlükten okunur
+            try:
+                journal = RunJournal.open(args.resume)
+            except RunJournalError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            generation_plan = journal.plan
+            file_settings = {"formats": journal.output_formats} if journal.output_formats else {}
+            settings = merge_plan_settings(file_settings, **cli_settings)
+            if not display_plan(generation_plan, concurrency=settings.get("concurrency"), batch_api=bool(settings.get("batch_api"))):
+                sys.exit(1)
+        elif args.config_file:
+            # Plan dosyası: etkileşimsiz çalıştırma; dosyadaki ayarlar main.py'deki gibi uygulanır
+            try:
+                loaded = load_generation_plan(args.config_file)
+                generation_plan = loaded.pop("plan")
+                settings = merge_plan_settings(loaded, **cli_settings)
+            except GenerationPlanError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            if not display_plan(generation_plan, concurrency=settings.get("concurrency"), batch_api=bool(settings.get("batch_api"))):
+                sys.exit(1)
+        else:
+            # Header göster
+            display_header()
+            
+            # Rolleri listele
+            display_roles()
+            
+            # Kullanıcı girişi al
+            generation_plan = get_user_input()
+            settings = merge_plan_settings({}, **cli_settings)
+            
+            # Planı göster
+            if not display_plan(generation_plan, concurrency=settings.get("concurrency"), batch_api=bool(settings.get("batch_api"))):
+                print("👋 Çıkılıyor...")
+                sys.exit(0)
+            
+            # Onay al
+            if not confirm_generation():
+                print("👋 İptal edildi!")
+                sys.exit(0)
         
-        # Onay al
-        if not confirm_generation():
-            print("👋 İptal edildi!")
-            sys.exit(0)
+        # Yanıt önbelleği modu (--cache / plan dosyası, yoksa LLM_CACHE_MODE)
+        configure_shared_response_cache(mode=settings.get("cache"))
         
         # Soruları üret
-        results = generate_questions(generation_plan)
+        results, timings, failures = generate_questions(
+            generation_plan,
+            concurrency=settings.get("concurrency"),
+            export_workers=settings.get("export_workers"),
+            concurrent_categories=settings.get("concurrent_categories"),
+            output_formats=settings.get("formats"),
+            journal=journal,
+            batch_api=bool(settings.get("batch_api")),
+            structured_output=settings.get("structured_output"),
+            trace=settings.get("trace")
+        )
         
         # Sonuçları göster
         display_results(results)
+        display_task_timings(timings)
+        display_cache_stats()
+        display_parse_stats()
+        display_usage_stats()
+        display_cost_summary()
+        display_trace_summary()
+        
+        if failures:
+            sys.exit(1)
         
     except KeyboardInterrupt:
         print("\n\n❌ İptal edildi!")
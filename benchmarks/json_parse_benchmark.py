@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+JSON PARSE BENCHMARK'I
+======================
+
+Tek geçişli toleranslı tarayıcıyı (core/json_scanner.py) eski çok stratejili
+parse zinciriyle karşılaştırır. Kaydedilmiş bozuk model çıktıları
+benchmarks/corpus/ altındadır; ayrıca her bozukluk türü için ~50 KB'lık
+(100 soruluk) büyük örnekler üretilir.
+
+Kullanım:
+    python3 benchmarks/json_parse_benchmark.py
+    python3 benchmarks/json_parse_benchmark.py --repeat 20 --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.json_scanner import scan_questions
+from core.question_generator import QuestionGenerator
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+def load_corpus(corpus_dir: Path = CORPUS_DIR) -> Dict[str, str]:
+    """Kaydedilmiş bozuk çıktıları yükle"""
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted(corpus_dir.glob("*.txt"))}
+
+def build_large_samples(question_count: int = 100) -> Dict[str, str]:
+    """Her bozukluk türü için büyük (~50 KB) örnekler üret"""
+    items = []
+    for i in range(question_count):
+        items.append({
+            "question": (
+                f"Soru {i + 1}: Aşağıdaki servis katmanında hangi performans sorunları vardır?\n"
+                "var siparisler = db.Siparisler.ToList();\n"
+                "foreach (var s in siparisler)\n{\n"
+                "    s.Musteri = db.Musteriler.Find(s.MusteriId);\n}\n"
+                "return siparisler.Where(x => x.Tutar > 100);"
+            ),
+            "expected_answer": (
+                "N+1 sorgu problemi ve tüm tablonun belleğe alınması; Include ve "
+                "sunucu tarafı filtreleme kullanılmalı.\n\nAnahtar kelimeler: N+1, Include, IQueryable"
+            )
+        })
+
+    clean = json.dumps(items, ensure_ascii=False, indent=2)
+    return {
+        "large_clean": clean,
+        "large_markdown_fence": "İşte sorular:\n```json\n" + clean + "\n```",
+        "large_trailing_comma": clean.replace('"\n  }', '",\n  }').replace("}\n]", "},\n]"),
+        "large_unescaped_newlines": clean.replace("\\n", "\n"),
+        "large_nested_string_array": json.dumps({"question": clean, "expected_answer": ""}, ensure_ascii=False),
+        "large_truncated": clean[:int(len(clean) * 0.9)]
+    }
+
+def _legacy_parser() -> Callable[[str], List[Dict[str, Any]]]:
+    """Eski zincir (API client'ı gerektirmeden)"""
+    generator = QuestionGenerator.__new__(QuestionGenerator)
+    return generator._parse_with_legacy_cascade
+
+def _scanner_parser(text: str) -> List[Dict[str, Any]]:
+    return scan_questions(text)["questions"]
+
+def _time_parser(parser: Callable[[str], List[Dict[str, Any]]], text: str, repeat: int) -> Dict[str, Any]:
+    """Parser'ı repeat kez çalıştırıp ortalama süreyi ve bulunan soru sayısını döndür"""
+    questions = parser(text)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parser(text)
+    elapsed = time.perf_counter() - started
+    return {"ms": elapsed / repeat * 1000, "questions": len(questions)}
+
+def run_benchmark(repeat: int = 10, question_count: int = 100) -> Dict[str, Any]:
+    """
+    Benchmark'ı çalıştır.
+
+    Returns:
+        dict: Örnek bazında legacy/scanner süreleri ve toplamlar
+    """
+    logging.disable(logging.CRITICAL)
+    try:
+        legacy = _legacy_parser()
+        samples = {**load_corpus(), **build_large_samples(question_count)}
+
+        rows = []
+        for name, text in samples.items():
+            legacy_result = _time_parser(legacy, text, repeat)
+            scanner_result = _time_parser(_scanner_parser, text, repeat)
+            rows.append({
+                "sample": name,
+                "bytes": len(text.encode("utf-8")),
+                "repairs": scan_questions(text)["repairs"],
+                "legacy_ms": legacy_result["ms"],
+                "legacy_questions": legacy_result["questions"],
+                "scanner_ms": scanner_result["ms"],
+                "scanner_questions": scanner_result["questions"]
+            })
+    finally:
+        logging.disable(logging.NOTSET)
+
+    return {
+        "benchmark": "json_parse",
+        "repeat": repeat,
+        "rows": rows,
+        "total_legacy_ms": sum(row["legacy_ms"] for row in rows),
+        "total_scanner_ms": sum(row["scanner_ms"] for row in rows),
+        "legacy_questions": sum(row["legacy_questions"] for row in rows),
+        "scanner_questions": sum(row["scanner_questions"] for row in rows)
+    }
+
+def print_report(report: Dict[str, Any]):
+    """Sonuç tablosunu yazdır"""
+    print(f"\n{'Örnek':<28} {'KB':>6} {'Eski ms':>9} {'Soru':>5} {'Yeni ms':>9} {'Soru':>5}  Onarımlar")
+    print("-" * 100)
+    for row in report["rows"]:
+        print(
+            f"{row['sample']:<28} {row['bytes'] / 1024:>6.1f} "
+            f"{row['legacy_ms']:>9.3f} {row['legacy_questions']:>5} "
+            f"{row['scanner_ms']:>9.3f} {row['scanner_questions']:>5}  {', '.join(row['repairs'])}"
+        )
+    print("-" * 100)
+    speedup = report["total_legacy_ms"] / report["total_scanner_ms"] if report["total_scanner_ms"] else 0
+    print(
+        f"{'TOPLAM':<35} {report['total_legacy_ms']:>9.3f} {report['legacy_questions']:>5} "
+        f"{report['total_scanner_ms']:>9.3f} {report['scanner_questions']:>5}  ({speedup:.1f}x)"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Toleranslı JSON tarayıcı ile eski parse zinciri karşılaştırması")
+    parser.add_argument("--repeat", type=int, default=10, help="Örnek başına tekrar sayısı")
+    parser.add_argument("--questions", type=int, default=100, help="Büyük örneklerdeki soru sayısı")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yazdır")
+    args = parser.parse_args()
+
+    report = run_benchmark(repeat=args.repeat, question_count=args.questions)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
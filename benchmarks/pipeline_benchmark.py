@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+ÜRETİM HATTI BENCHMARK PAKETİ
+=============================
+
+Üretim hattının sıcak noktalarını kaydedilmiş (benchmarks/corpus/) ve sahte
+LLM yanıtları (core/llm_backends.FakeBackend) üzerinde uçtan uca ölçer:
+
+- parse: _parse_questions_array_robust ve extract_question_data verimi
+- practical_filter: _extract_code_block_from_question + _count_code_lines soru başı maliyeti
+- word_export: WordExporter.export_questions süresi ve Python bellek tepesi,
+  motor bazında (stream / docx; 50 / 500 / 5.000 soru)
+- batch_generate: sahte backend ile tam toplu üretimin farklı eşzamanlılıklardaki süresi
+- json_parse / regex: mevcut mikro-benchmark'lar (--micro ile)
+
+Sonuç JSON olarak yazılır; --compare ile önceki bir sonuçla karşılaştırılıp
+eşiği aşan gerilemeler raporlanır (gerileme varsa çıkış kodu 1).
+
+Kullanım:
+    python3 benchmarks/pipeline_benchmark.py --output bench.json
+    python3 benchmarks/pipeline_benchmark.py --sections parse,word_export --export-sizes 50,500
+    python3 benchmarks/pipeline_benchmark.py --sections word_export --export-engines stream
+    python3 benchmarks/pipeline_benchmark.py --compare bench.json --threshold 15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+import json_parse_benchmark
+import regex_benchmark
+from config.roles_config import ROLES
+from core.json_parser import extract_question_data
+from core.llm_backends import FakeBackend
+from core.question_generator import QuestionGenerator
+from exporters.word_exporter import WORD_EXPORT_ENGINES, WordExporter, get_document_template
+
+SECTIONS = ("parse", "practical_filter", "word_export", "batch_generate", "json_parse", "regex")
+DEFAULT_SECTIONS = ("parse", "practical_filter", "word_export", "batch_generate")
+
+# Toplu üretim ölçümünde kullanılan ortam (ağ, kalıcı havuz ve önbellek kapalı)
+BATCH_ENVIRONMENT = {
+    "LLM_BACKEND": "fake",
+    "LLM_CACHE_MODE": "off",
+    "OPENAI_RATE_LIMIT_ENABLED": "false",
+    "QUESTION_POOL_ENABLED": "false",
+    "RUN_JOURNAL_ENABLED": "false",
+    "COST_LEDGER_ENABLED": "false",
+    "OVERGENERATION_ENABLED": "false",
+    "GENERATION_STREAM": "false"
+}
+
+# Karşılaştırmada düşük olması iyi olan metrik sonekleri (diğerleri yüksek = iyi)
+LOWER_IS_BETTER = ("_ms", "_us", "_sec")
+
+# ---------------------------------------------------------------------------
+# Sahte yanıt korpusu
+# ---------------------------------------------------------------------------
+
+def _fake_prompt(count: int, category: str) -> List[Dict[str, str]]:
+    """FakeBackend'in soru sayısını ve kod beklentisini çıkardığı en küçük prompt"""
+    return [{"role": "user", "content": f"Kategori: {category}\n{count} adet soru üret."}]
+
+def build_fake_corpus(responses: int = 20, questions: int = 10, malformed_rate: float = 0.3, seed: int = 0) -> Dict[str, str]:
+    """Sahte backend'den kodlu / kodsuz, kısmen bozuk yanıtlar üret"""
+    backend = FakeBackend(latency=0, malformed_rate=malformed_rate, seed=seed)
+    corpus = {}
+    for i in range(responses):
+        category = "Pratik Uygulama" if i % 2 else "Teorik Bilgi"
+        text, _ = backend.render(_fake_prompt(questions, category), {})
+        corpus[f"fake_{i:02d}"] = text
+    return corpus
+
+def build_questions_data(question_count: int, seed: int = 0) -> Dict[str, Any]:
+    """Word export için kategorilere 1:2:2 dağıtılmış soru verisi üret"""
+    backend = FakeBackend(latency=0, malformed_rate=0, seed=seed)
+    shares = {"professional_experience": 1, "theoretical_knowledge": 2, "practical_application": 2}
+    remaining = question_count
+    questions: Dict[str, List[Dict[str, Any]]] = {}
+    for index, (category, share) in enumerate(shares.items()):
+        count = remaining if index == len(shares) - 1 else question_count * share // 5
+        remaining -= count
+        label = "Pratik Uygulama" if category == "practical_application" else "Teorik Bilgi"
+        text, _ = backend.render(_fake_prompt(count, label), {})
+        questions[category] = [
+            {**item, "success": True, "category": category, "difficulty_distribution": {"orta": 100}}
+            for item in json.loads(text)
+        ]
+    return {
+        "role": "Kıdemli Yazılım Geliştirme Uzmanı",
+        "salary_coefficient": 3,
+        "questions": questions,
+        "total_questions": question_count
+    }
+
+# ---------------------------------------------------------------------------
+# Bölümler
+# ---------------------------------------------------------------------------
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """fn'i repeat kez çalıştır, en iyi süreyi (sn) döndür"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def bench_parse(repeat: int = 5) -> Dict[str, Any]:
+    """Kaydedilmiş + sahte yanıtlarda iki parse giriş noktasının verimi"""
+    generator = QuestionGenerator.__new__(QuestionGenerator)
+    corpus = {**json_parse_benchmark.load_corpus(), **build_fake_corpus()}
+    total_bytes = sum(len(text.encode("utf-8")) for text in corpus.values())
+
+    rows = []
+    for name, parser in (
+        ("_parse_questions_array_robust", generator._parse_questions_array_robust),
+        ("extract_question_data", extract_question_data)
+    ):
+        results = [parser(text) for text in corpus.values()]
+        if name == "extract_question_data":
+            questions = sum(1 for result in results if result.get("success"))
+        else:
+            questions = sum(len(result) for result in results)
+        seconds = _best_of(lambda: [parser(text) for text in corpus.values()], repeat)
+        rows.append({
+            "function": name,
+            "responses": len(corpus),
+            "questions": questions,
+            "total_ms": seconds * 1000,
+            "per_response_us": seconds / len(corpus) * 1_000_000,
+            "mb_per_sec": total_bytes / 1_048_576 / seconds if seconds else 0.0
+        })
+    return {"responses": len(corpus), "bytes": total_bytes, "rows": rows}
+
+def bench_practical_filter(question_count: int = 5000, repeat: int = 5) -> Dict[str, Any]:
+    """Pratik kategori filtresinin soru başına maliyeti"""
+    generator = QuestionGenerator.__new__(QuestionGenerator)
+    pool = regex_benchmark.build_question_pool(question_count)
+
+    def run():
+        return [generator._count_code_lines(generator._extract_code_block_from_question(text) or "") for text in pool]
+
+    line_counts = run()
+    seconds = _best_of(run, repeat)
+    return {
+        "questions": question_count,
+        "with_code": sum(1 for count in line_counts if count),
+        "per_question_us": seconds / question_count * 1_000_000,
+        "total_ms": seconds * 1000
+    }
+
+def bench_word_export(sizes: List[int], engines: List[str], repeat: int = 1) -> Dict[str, Any]:
+    """
+    WordExporter.export_questions süresi (motor ve soru sayısına göre).
+
+    peak_py_kb, ilk (ısınma) export sırasında tracemalloc ile ölçülen Python
+    bellek tepesidir; lxml'in C tarafındaki ayırmaları dahil değildir.
+    """
+    rows = []
+    get_document_template()  # Şablon bir kez kurulur, tepe ölçümüne katılmasın
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for engine in engines:
+            for size in sizes:
+                questions_data = build_questions_data(size)
+                output_path = os.path.join(tmpdir, f"export_{engine}_{size}.docx")
+                exporter = WordExporter(engine=engine)
+                tracemalloc.start()
+                try:
+                    ok = exporter.export_questions(questions_data, "", output_path)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                seconds = _best_of(lambda: exporter.export_questions(questions_data, "", output_path), repeat)
+                rows.append({
+                    "engine": engine,
+                    "questions": size,
+                    "success": ok,
+                    "total_ms": seconds * 1000,
+                    "per_question_us": seconds / size * 1_000_000,
+                    "peak_py_kb": peak / 1024,
+                    "file_kb": os.path.getsize(output_path) / 1024 if ok else 0.0
+                })
+    return {"rows": rows}
+
+@contextlib.contextmanager
+def _batch_environment(workdir: str, latency: float, malformed_rate: float, seed: int) -> Iterator[None]:
+    """Toplu üretimi geçici dizinde, sahte backend ile çalıştır; ortamı ve dizini geri yükle"""
+    overrides = {
+        **BATCH_ENVIRONMENT,
+        "LLM_FAKE_LATENCY": str(latency),
+        "LLM_FAKE_MALFORMED_RATE": str(malformed_rate),
+        "LLM_FAKE_SEED": str(seed),
+        "OVERGENERATION_STATS_PATH": os.path.join(workdir, "acceptance_stats.sqlite3")
+    }
+    saved_env = {key: os.environ.get(key) for key in overrides}
+    saved_cwd = os.getcwd()
+    os.environ.update(overrides)
+    os.makedirs(os.path.join(workdir, "data"), exist_ok=True)
+    os.symlink(ROOT_DIR / "data" / "job_descriptions", os.path.join(workdir, "data", "job_descriptions"))
+    os.chdir(workdir)
+    try:
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+def build_batch_plan(roles: int, count: int) -> Dict[str, Dict[int, int]]:
+    """İlk `roles` rolün ilk katsayısı için `count` soruluk plan"""
+    return {
+        role_code: {config["salary_multipliers"][0]: count}
+        for role_code, config in list(ROLES.items())[:roles]
+    }
+
+def bench_batch_generate(
+    concurrency_levels: List[int],
+    roles: int = 6,
+    count: int = 10,
+    latency: float = 0.2,
+    malformed_rate: float = 0.1,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Sahte backend ile tam toplu üretimin eşzamanlılığa göre duvar saati süresi"""
+    from batch_generate import generate_questions
+    from core.response_cache import configure_shared_response_cache
+
+    plan = build_batch_plan(roles, count)
+    rows = []
+    for concurrency in concurrency_levels:
+        with tempfile.TemporaryDirectory() as tmpdir, _batch_environment(tmpdir, latency, malformed_rate, seed):
+            configure_shared_response_cache(mode="off")
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                results, _, failures = generate_questions(plan, concurrency=concurrency, output_formats=["json"])
+            seconds = time.perf_counter() - started
+            # Birim sonuçları istenen sayıyı taşır; üretilen sayı JSON çıktılarından okunur
+            questions = sum(
+                json.loads(Path(result["json_file"]).read_text(encoding="utf-8")).get("total_questions", 0)
+                for result in results if result.get("json_file")
+            )
+
+        rows.append({
+            "concurrency": concurrency,
+            "units": sum(len(difficulties) for difficulties in plan.values()),
+            "questions": questions,
+            "failures": len(failures),
+            "wall_sec": seconds,
+            "questions_per_sec": questions / seconds if seconds else 0.0
+        })
+    return {"roles": roles, "count_per_role": count, "fake_latency": latency, "malformed_rate": malformed_rate, "rows": rows}
+
+# ---------------------------------------------------------------------------
+# Rapor ve karşılaştırma
+# ---------------------------------------------------------------------------
+
+def flatten_metrics(report: Dict[str, Any]) -> Dict[str, float]:
+    """Karşılaştırılabilir metrikleri düz {ad: değer} sözlüğüne çevir"""
+    metrics: Dict[str, float] = {}
+    sections = report["sections"]
+    for row in sections.get("parse", {}).get("rows", []):
+        metrics[f"parse.{row['function']}.per_response_us"] = row["per_response_us"]
+    if "practical_filter" in sections:
+        metrics["practical_filter.per_question_us"] = sections["practical_filter"]["per_question_us"]
+    for row in sections.get("word_export", {}).get("rows", []):
+        metrics[f"word_export.{row['engine']}.{row['questions']}.total_ms"] = row["total_ms"]
+    for row in sections.get("batch_generate", {}).get("rows", []):
+        metrics[f"batch_generate.c{row['concurrency']}.wall_sec"] = row["wall_sec"]
+    if "json_parse" in sections:
+        metrics["json_parse.total_scanner_ms"] = sections["json_parse"]["total_scanner_ms"]
+    for row in sections.get("regex", {}).get("rows", []):
+        metrics[f"regex.{row['function']}.after_us"] = row["after_us"]
+    return metrics
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    İki raporun ortak metriklerini karşılaştır.
+
+    Returns:
+        list: Her metrik için önceki / şimdiki değer, % değişim ve gerileme bayrağı
+    """
+    before = baseline.get("metrics") or flatten_metrics(baseline)
+    after = current["metrics"]
+    rows = []
+    for name in sorted(set(before) & set(after)):
+        if not before[name]:
+            continue
+        change = (after[name] - before[name]) / before[name] * 100
+        worse = change if name.endswith(LOWER_IS_BETTER) else -change
+        rows.append({
+            "metric": name,
+            "before": before[name],
+            "after": after[name],
+            "change_pct": change,
+            "regression": worse > threshold
+        })
+    return rows
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    """Seçilen bölümleri çalıştır ve raporu oluştur"""
+    runners: Dict[str, Callable[[], Dict[str, Any]]] = {
+        "parse": lambda: bench_parse(repeat=args.repeat),
+        "practical_filter": lambda: bench_practical_filter(question_count=args.filter_questions, repeat=args.repeat),
+        "word_export": lambda: bench_word_export(args.export_sizes, args.export_engines),
+        "batch_generate": lambda: bench_batch_generate(
+            args.concurrency_levels, roles=args.roles, count=args.count,
+            latency=args.fake_latency, malformed_rate=args.malformed_rate
+        ),
+        "json_parse": lambda: json_parse_benchmark.run_benchmark(repeat=args.repeat),
+        "regex": lambda: regex_benchmark.run_benchmark(repeat=args.repeat)
+    }
+
+    sections: Dict[str, Any] = {}
+    logging.disable(logging.CRITICAL)
+    try:
+        for name in args.sections:
+            started = time.perf_counter()
+            print(f"⏱️  {name}...", file=sys.stderr)
+            sections[name] = runners[name]()
+            sections[name]["section_sec"] = time.perf_counter() - started
+    finally:
+        logging.disable(logging.NOTSET)
+
+    report = {
+        "benchmark": "pipeline",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sections": sections
+    }
+    report["metrics"] = flatten_metrics(report)
+    return report
+
+def print_report(report: Dict[str, Any]):
+    """Özet tabloyu yazdır"""
+    sections = report["sections"]
+    if "parse" in sections:
+        print(f"\n📄 PARSE ({sections['parse']['responses']} yanıt, {sections['parse']['bytes'] / 1024:.1f} KB)")
+        for row in sections["parse"]["rows"]:
+            print(
+                f"   {row['function']:<32} {row['per_response_us']:>10.1f} µs/yanıt "
+                f"{row['mb_per_sec']:>8.2f} MB/sn {row['questions']:>6} soru"
+            )
+    if "practical_filter" in sections:
+        row = sections["practical_filter"]
+        print(f"\n🔍 PRATİK FİLTRE: {row['per_question_us']:.2f} µs/soru ({row['questions']} soru, {row['with_code']} kodlu)")
+    if "word_export" in sections:
+        print("\n📝 WORD EXPORT")
+        for row in sections["word_export"]["rows"]:
+            print(
+                f"   {row['engine']:<6} {row['questions']:>6} soru {row['total_ms']:>10.1f} ms "
+                f"{row['per_question_us']:>9.1f} µs/soru {row['peak_py_kb']:>9.1f} KB tepe {row['file_kb']:>8.1f} KB"
+            )
+    if "batch_generate" in sections:
+        batch = sections["batch_generate"]
+        print(f"\n🚀 TOPLU ÜRETİM (sahte backend, {batch['fake_latency']} sn gecikme)")
+        for row in batch["rows"]:
+            print(
+                f"   eşzamanlılık {row['concurrency']:>2}: {row['wall_sec']:>7.2f} sn "
+                f"{row['questions']:>5} soru {row['questions_per_sec']:>7.1f} soru/sn {row['failures']} hata"
+            )
+    if "json_parse" in sections:
+        json_parse_benchmark.print_report(sections["json_parse"])
+    if "regex" in sections:
+        regex_benchmark.print_report(sections["regex"])
+
+def print_comparison(rows: List[Dict[str, Any]], threshold: float):
+    """Karşılaştırma tablosunu yazdır"""
+    print(f"\n📊 KARŞILAŞTIRMA (eşik %{threshold:.0f})")
+    for row in rows:
+        flag = "❌" if row["regression"] else "  "
+        print(f"{flag} {row['metric']:<52} {row['before']:>12.2f} → {row['after']:>12.2f} ({row['change_pct']:+.1f}%)")
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+def _engine_list(value: str) -> List[str]:
+    names = [part.strip() for part in value.split(",") if part.strip()]
+    unknown = [name for name in names if name not in WORD_EXPORT_ENGINES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen export motoru: {unknown} (geçerli: {', '.join(WORD_EXPORT_ENGINES)})")
+    return names
+
+def _section_list(value: str) -> List[str]:
+    names = [part.strip() for part in value.split(",") if part.strip()]
+    unknown = [name for name in names if name not in SECTIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen bölüm: {unknown} (geçerli: {', '.join(SECTIONS)})")
+    return names
+
+def main():
+    parser = argparse.ArgumentParser(description="Üretim hattı uçtan uca benchmark paketi")
+    parser.add_argument("--sections", type=_section_list, default=list(DEFAULT_SECTIONS),
+                        help=f"Virgülle ayrılmış bölümler ({', '.join(SECTIONS)})")
+    parser.add_argument("--micro", action="store_true", help="json_parse ve regex mikro-benchmark'larını da çalıştır")
+    parser.add_argument("--repeat", type=int, default=5, help="Mikro ölçümlerde tekrar sayısı")
+    parser.add_argument("--filter-questions", type=int, default=5000, help="Pratik filtre havuzundaki soru sayısı")
+    parser.add_argument("--export-sizes", type=_int_list, default=[50, 500, 5000], help="Word export soru sayıları")
+    parser.add_argument("--export-engines", type=_engine_list, default=list(WORD_EXPORT_ENGINES),
+                        help=f"Word export motorları ({', '.join(WORD_EXPORT_ENGINES)})")
+    parser.add_argument("--concurrency-levels", type=_int_list, default=[1, 2, 4, 8], help="Toplu üretim eşzamanlılıkları")
+    parser.add_argument("--roles", type=int, default=6, help="Toplu üretimdeki rol sayısı")
+    parser.add_argument("--count", type=int, default=10, help="Rol başına soru sayısı")
+    parser.add_argument("--fake-latency", type=float, default=0.2, help="Sahte backend yanıt gecikmesi (sn)")
+    parser.add_argument("--malformed-rate", type=float, default=0.1, help="Sahte backend bozuk yanıt oranı")
+    parser.add_argument("--output", help="JSON raporun yazılacağı dosya")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON rapor")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Gerileme eşiği (%%)")
+    parser.add_argument("--json", action="store_true", help="Raporu stdout'a JSON olarak yazdır")
+    args = parser.parse_args()
+    if args.micro:
+        args.sections += [name for name in ("json_parse", "regex") if name not in args.sections]
+
+    report = run_suite(args)
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["comparison"] = compare_reports(baseline, report, args.threshold)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 Rapor yazıldı: {args.output}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+        if "comparison" in report:
+            print_comparison(report["comparison"], args.threshold)
+
+    if any(row["regression"] for row in report.get("comparison", [])):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+REGEX MİKRO-BENCHMARK'I
+=======================
+
+Kod tespiti ve soru temizleme sıcak yollarının soru başına maliyetini,
+önceki (çağrı içinde desen kuran) uygulamalar ile derlenmiş desen kaydı
+(core/patterns.py) arasında karşılaştırır. 1.000 soruluk sentetik bir havuz
+kullanılır; iki uygulamanın sonuçlarının aynı olduğu da doğrulanır.
+
+Kullanım:
+    python3 benchmarks/regex_benchmark.py
+    python3 benchmarks/regex_benchmark.py --questions 5000 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.question_generator import QuestionGenerator
+from exporters.word_exporter import WordExporter
+
+# ---------------------------------------------------------------------------
+# Önceki uygulamalar (karşılaştırma için birebir kopya)
+# ---------------------------------------------------------------------------
+
+def legacy_is_code_like(text: str) -> bool:
+    if not text:
+        return False
+    indicators = [
+        r"```", r";\s*$", r"\bclass\s+\w+", r"\bdef\s+\w+\s*\(", r"\bfunction\s*\(",
+        r"Console\.WriteLine", r"using\s+\w+;", r"public\s+(static\s+)?(void|int|string|class)",
+        r"\bvar\s+\w+\s*=", r"\blet\s+\w+\s*=", r"\bconst\s+\w+\s*=",
+        r"SELECT\s+.+\s+FROM", r"INSERT\s+INTO", r"UPDATE\s+\w+\s+SET", r"DELETE\s+FROM",
+        r"CREATE\s+TABLE", r"\b(New|Get|Set)-[A-Za-z]+", r"^[\s\t]*[{}]$",
+    ]
+    for pat in indicators:
+        if re.search(pat, text, re.IGNORECASE | re.MULTILINE):
+            return True
+    symbol_hits = len(re.findall(r"[{}();=<>\[\]]", text))
+    return symbol_hits >= 3
+
+def legacy_sanitize_non_practical_question(text: str) -> str:
+    if not text:
+        return text
+    text = re.sub(r"```[\s\S]*?```", "", text)
+    first_line = text.splitlines()[0].strip()
+    if legacy_is_code_like(first_line):
+        return "Bu konuda edindiğiniz deneyiminizi, karşılaştığınız zorlukları ve yaklaşımınızı anlatınız."
+    return first_line
+
+def legacy_looks_like_code_block(text: str) -> bool:
+    if not text:
+        return False
+    code_indicators = [
+        r"^\s*(for|if|while|def|class|try|catch|public|private|protected|static|using|import|from)\b",
+        r"\bConsole\.", r"\bprint\(", r"\bSystem\.", r"\bvar\s+\w+\s*=", r"\blet\s+\w+\s*=",
+        r"\bconst\s+\w+\s*=", r"\bNew-[A-Za-z]+\b", r"\bGet-[A-Za-z]+\b", r"\bSet-[A-Za-z]+\b",
+        r"SELECT\s+.+\s+FROM", r"CREATE\s+TABLE", r"INSERT\s+INTO", r"UPDATE\s+\w+\s+SET",
+        r"DELETE\s+FROM", r"[{};=()<>\[\]]", r":\s*$",
+    ]
+    lines = [ln for ln in text.splitlines() if ln.strip()]
+    if not lines:
+        return False
+    indicator_regexes = [re.compile(pat, re.IGNORECASE) for pat in code_indicators]
+    hits = 0
+    for ln in lines:
+        if any(r.search(ln) for r in indicator_regexes):
+            hits += 1
+    return hits >= 1 and len(lines) >= 1
+
+# ---------------------------------------------------------------------------
+# Soru havuzu
+# ---------------------------------------------------------------------------
+
+_PLAIN_QUESTIONS = [
+    "Bir projede ekip içi anlaşmazlığı nasıl çözdünüz?",
+    "Mikroservis mimarisinin monolitik yapıya göre avantaj ve dezavantajlarını açıklayın.",
+    "Yoğun trafik altında yavaşlayan bir uygulamada darboğazı nasıl tespit edersiniz?",
+    "Müşteriden gelen belirsiz bir gereksinimi netleştirmek için hangi adımları izlersiniz?",
+    "Sürekli entegrasyon sürecinde test otomasyonunun rolü nedir?",
+]
+
+_CODE_SNIPPETS = [
+    "var toplam = 0;\nfor (int i = 0; i < liste.Count; i++)\n{\n    toplam += liste[i];\n}\nConsole.WriteLine(toplam);",
+    "SELECT ad, soyad FROM Musteriler\nWHERE sehir = 'Ankara'\nORDER BY soyad;",
+    "def ortalama(sayilar):\n    if not sayilar:\n        return 0\n    return sum(sayilar) / len(sayilar)",
+    "Get-Service | Where-Object { $_.Status -eq 'Running' }\nSet-Service -Name Spooler -StartupType Manual",
+    "const veri = await fetch(url);\nlet sonuc = await veri.json();\nconsole.log(sonuc);",
+]
+
+def build_question_pool(size: int = 1000, seed: int = 42) -> List[str]:
+    """Kodlu ve kodsuz soruların karışık olduğu sentetik havuz üret"""
+    rng = random.Random(seed)
+    pool = []
+    for i in range(size):
+        question = rng.choice(_PLAIN_QUESTIONS)
+        if i % 3 == 0:
+            question = f"{question}\n{rng.choice(_CODE_SNIPPETS)}"
+        elif i % 7 == 0:
+            question = f"{question}\n```\n{rng.choice(_CODE_SNIPPETS)}\n```"
+        pool.append(question)
+    return pool
+
+# ---------------------------------------------------------------------------
+# Ölçüm
+# ---------------------------------------------------------------------------
+
+def _measure(fn: Callable[[str], Any], pool: List[str], repeat: int) -> Dict[str, Any]:
+    best = float("inf")
+    results = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [fn(text) for text in pool]
+        best = min(best, time.perf_counter() - started)
+    return {"us_per_question": best / len(pool) * 1_000_000, "results": results}
+
+def run_benchmark(question_count: int = 1000, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Benchmark'ı çalıştır.
+
+    Returns:
+        dict: Her sıcak yol için önce/sonra soru başına mikrosaniye ve uyumsuzluk sayısı
+    """
+    pool = build_question_pool(question_count)
+    generator = QuestionGenerator.__new__(QuestionGenerator)
+    exporter = WordExporter.__new__(WordExporter)
+    code_blocks = ["\n".join(text.splitlines()[1:]) for text in pool]
+
+    cases = [
+        ("_is_code_like", legacy_is_code_like, generator._is_code_like, pool),
+        ("_sanitize_non_practical_question", legacy_sanitize_non_practical_question,
+         generator._sanitize_non_practical_question, pool),
+        ("_looks_like_code_block", legacy_looks_like_code_block, exporter._looks_like_code_block, code_blocks),
+    ]
+
+    rows = []
+    for name, before_fn, after_fn, inputs in cases:
+        before = _measure(before_fn, inputs, repeat)
+        after = _measure(after_fn, inputs, repeat)
+        mismatches = sum(1 for a, b in zip(before["results"], after["results"]) if a != b)
+        rows.append({
+            "function": name,
+            "before_us": before["us_per_question"],
+            "after_us": after["us_per_question"],
+            "speedup": before["us_per_question"] / after["us_per_question"] if after["us_per_question"] else 0,
+            "mismatches": mismatches
+        })
+
+    return {"benchmark": "regex", "questions": question_count, "repeat": repeat, "rows": rows}
+
+def print_report(report: Dict[str, Any]):
+    """Sonuç tablosunu yazdır"""
+    print(f"\n{report['questions']} soruluk havuz, soru başına maliyet (en iyi {report['repeat']} tekrar)\n")
+    print(f"{'Fonksiyon':<36} {'Önce µs':>9} {'Sonra µs':>9} {'Hızlanma':>9} {'Uyumsuz':>8}")
+    print("-" * 75)
+    for row in report["rows"]:
+        print(
+            f"{row['function']:<36} {row['before_us']:>9.2f} {row['after_us']:>9.2f} "
+            f"{row['speedup']:>8.1f}x {row['mismatches']:>8}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Derlenmiş regex kaydı mikro-benchmark'ı")
+    parser.add_argument("--questions", type=int, default=1000, help="Havuzdaki soru sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Tekrar sayısı")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yazdır")
+    args = parser.parse_args()
+
+    report = run_benchmark(question_count=args.questions, repeat=args.repeat)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
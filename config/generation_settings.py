@@ -0,0 +1,246 @@
+"""
+ÜRETİM (GENERATION) AYARLARI
+============================
+
+Soru üretim akışının eşzamanlılık ve çalışma davranışı ayarları.
+"""
+
+import os
+
+# Kategori bazlı üretim varsayılanları
+DEFAULT_CONCURRENT_CATEGORIES = False
+DEFAULT_CATEGORY_WORKERS = 3
+
+# Yanıtı akış (stream) olarak al, soruları geldikçe çöz
+DEFAULT_STREAM_RESPONSES = False
+
+# Soru dizisi isteklerinde JSON şeması (response_format) gönder
+DEFAULT_STRUCTURED_OUTPUT = False
+
+# Toplu üretim zamanlayıcısı varsayılanları
+DEFAULT_BATCH_CONCURRENCY = 2
+DEFAULT_EXPORT_WORKERS = 1
+
+# LLM yanıt önbelleği varsayılanları
+DEFAULT_CACHE_MODE = "off"
+DEFAULT_CACHE_PATH = "data/cache/llm_responses.sqlite3"
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_CACHE_MAX_ENTRIES = 5000
+
+# Kalıcı soru havuzu varsayılanları
+DEFAULT_POOL_ENABLED = True
+DEFAULT_POOL_PATH = "data/question_pool.sqlite3"
+
+# Yakın-tekrar (MinHash/LSH) tespiti varsayılanları
+DEFAULT_NEAR_DUPLICATE_ENABLED = True
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.7
+DEFAULT_NEAR_DUPLICATE_NUM_PERM = 64
+DEFAULT_NEAR_DUPLICATE_BANDS = 16
+DEFAULT_NEAR_DUPLICATE_REFILL_ROUNDS = 2
+
+# Fazla üretim (overgeneration) planlayıcısı varsayılanları
+DEFAULT_OVERGENERATION_ENABLED = True
+DEFAULT_OVERGENERATION_STATS_PATH = "data/cache/acceptance_stats.sqlite3"
+DEFAULT_OVERGENERATION_MAX_FACTOR = 2.0
+DEFAULT_OVERGENERATION_MIN_RATE = 0.25
+DEFAULT_OVERGENERATION_SPECULATIVE_BELOW = 0.6
+DEFAULT_OVERGENERATION_SPECULATIVE_WORKERS = 2
+DEFAULT_OVERGENERATION_SMOOTHING = 0.3
+
+# Devam ettirilebilir çalıştırma günlüğü varsayılanları
+DEFAULT_RUN_JOURNAL_ENABLED = True
+DEFAULT_RUN_JOURNAL_DIR = "data/runs"
+
+# Maliyet defteri (çağrı bazlı token / süre / maliyet kaydı) varsayılanları
+DEFAULT_COST_LEDGER_ENABLED = True
+DEFAULT_COST_LEDGER_PATH = "data/cache/cost_ledger.sqlite3"
+DEFAULT_COST_ESTIMATE_RUNS = 20
+
+# Word export motoru: stream (akışlı DOCX yazıcı) veya docx (python-docx)
+DEFAULT_WORD_EXPORT_ENGINE = "stream"
+# Çoklu rol export'unda süreç sayısı (0: CPU sayısı)
+DEFAULT_WORD_EXPORT_PROCESSES = 0
+# Word şablonu (.dotx/.docx); boşsa python-docx varsayılan şablonu
+DEFAULT_WORD_TEMPLATE_PATH = ""
+
+# JSONL / CSV / Markdown / HTML export varsayılanları
+DEFAULT_EXPORT_OUTPUT_DIR = "data/exports"
+DEFAULT_HTML_EXPORT_TEMPLATE = ""
+
+# Aday soru formu varsayılanları
+DEFAULT_CANDIDATE_SHEET_DIR = "data/candidate_sheets"
+DEFAULT_SHEET_QUESTIONS_PER_CATEGORY = 4
+
+# Aşama süresi izleme (span) varsayılanları
+DEFAULT_TRACE_ENABLED = False
+DEFAULT_TRACE_DIR = "data/traces"
+DEFAULT_TRACE_MAX_SPANS = 200000
+
+TRUE_VALUES = ("1", "true", "yes", "on", "evet", "e")
+
+def env_flag(name: str, default: bool) -> bool:
+    """
+    Boolean bir çevre değişkenini oku.
+
+    Args:
+        name (str): Değişken adı
+        default (bool): Tanımlı değilse kullanılacak değer
+
+    Returns:
+        bool: Değişkenin boolean karşılığı
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in TRUE_VALUES
+
+def get_generation_config() -> dict:
+    """
+    Çevre değişkenlerinden üretim akışı konfigürasyonunu al.
+
+    Returns:
+        dict: Üretim akışı ayarları
+    """
+    return {
+        "concurrent_categories": env_flag("GENERATION_CONCURRENT_CATEGORIES", DEFAULT_CONCURRENT_CATEGORIES),
+        "category_workers": max(1, int(os.getenv("GENERATION_CATEGORY_WORKERS", DEFAULT_CATEGORY_WORKERS))),
+        "stream": env_flag("GENERATION_STREAM", DEFAULT_STREAM_RESPONSES),
+        "structured_output": env_flag("GENERATION_STRUCTURED_OUTPUT", DEFAULT_STRUCTURED_OUTPUT),
+        "batch_concurrency": max(1, int(os.getenv("GENERATION_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY))),
+        "export_workers": max(1, int(os.getenv("GENERATION_EXPORT_WORKERS", DEFAULT_EXPORT_WORKERS)))
+    }
+
+def get_cache_config() -> dict:
+    """
+    Çevre değişkenlerinden LLM yanıt önbelleği konfigürasyonunu al.
+
+    Returns:
+        dict: Önbellek ayarları (mode: off | read | readwrite)
+    """
+    return {
+        "mode": os.getenv("LLM_CACHE_MODE", DEFAULT_CACHE_MODE).strip().lower() or DEFAULT_CACHE_MODE,
+        "path": os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+        "ttl_seconds": max(0, int(os.getenv("LLM_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS))),
+        "max_entries": max(0, int(os.getenv("LLM_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES)))
+    }
+
+def get_pool_config() -> dict:
+    """
+    Çevre değişkenlerinden kalıcı soru havuzu konfigürasyonunu al.
+
+    Returns:
+        dict: Havuz ayarları
+    """
+    return {
+        "enabled": env_flag("QUESTION_POOL_ENABLED", DEFAULT_POOL_ENABLED),
+        "path": os.getenv("QUESTION_POOL_PATH", DEFAULT_POOL_PATH)
+    }
+
+def get_near_duplicate_config() -> dict:
+    """
+    Çevre değişkenlerinden yakın-tekrar tespiti konfigürasyonunu al.
+
+    Returns:
+        dict: Eşik (tahmini Jaccard), MinHash/LSH boyutları ve yenileme tur sayısı
+    """
+    return {
+        "enabled": env_flag("NEAR_DUPLICATE_ENABLED", DEFAULT_NEAR_DUPLICATE_ENABLED),
+        "threshold": min(1.0, max(0.0, float(os.getenv("NEAR_DUPLICATE_THRESHOLD", DEFAULT_NEAR_DUPLICATE_THRESHOLD)))),
+        "num_perm": max(1, int(os.getenv("NEAR_DUPLICATE_NUM_PERM", DEFAULT_NEAR_DUPLICATE_NUM_PERM))),
+        "bands": max(1, int(os.getenv("NEAR_DUPLICATE_BANDS", DEFAULT_NEAR_DUPLICATE_BANDS))),
+        "refill_rounds": max(0, int(os.getenv("NEAR_DUPLICATE_REFILL_ROUNDS", DEFAULT_NEAR_DUPLICATE_REFILL_ROUNDS)))
+    }
+
+def get_overgeneration_config() -> dict:
+    """
+    Çevre değişkenlerinden fazla üretim planlayıcısı konfigürasyonunu al.
+
+    Returns:
+        dict: İstatistik dosyası, en fazla çarpan, kabul oranı tabanı,
+            spekülatif yedek istek eşiği ve eşzamanlılığı, öğrenme hızı (EMA ağırlığı)
+    """
+    return {
+        "enabled": env_flag("OVERGENERATION_ENABLED", DEFAULT_OVERGENERATION_ENABLED),
+        "path": os.getenv("OVERGENERATION_STATS_PATH", DEFAULT_OVERGENERATION_STATS_PATH),
+        "max_factor": max(1.0, float(os.getenv("OVERGENERATION_MAX_FACTOR", DEFAULT_OVERGENERATION_MAX_FACTOR))),
+        "min_rate": min(1.0, max(0.01, float(os.getenv("OVERGENERATION_MIN_RATE", DEFAULT_OVERGENERATION_MIN_RATE)))),
+        "speculative_below": float(os.getenv("OVERGENERATION_SPECULATIVE_BELOW", DEFAULT_OVERGENERATION_SPECULATIVE_BELOW)),
+        "speculative_workers": max(1, int(os.getenv("OVERGENERATION_SPECULATIVE_WORKERS", DEFAULT_OVERGENERATION_SPECULATIVE_WORKERS))),
+        "smoothing": min(1.0, max(0.01, float(os.getenv("OVERGENERATION_SMOOTHING", DEFAULT_OVERGENERATION_SMOOTHING))))
+    }
+
+def get_run_journal_config() -> dict:
+    """
+    Çevre değişkenlerinden çalıştırma günlüğü (checkpoint) konfigürasyonunu al.
+
+    Returns:
+        dict: Günlük açık mı ve günlük dosyalarının dizini
+    """
+    return {
+        "enabled": env_flag("RUN_JOURNAL_ENABLED", DEFAULT_RUN_JOURNAL_ENABLED),
+        "directory": os.getenv("RUN_JOURNAL_DIR", DEFAULT_RUN_JOURNAL_DIR)
+    }
+
+def get_cost_ledger_config() -> dict:
+    """
+    Çevre değişkenlerinden maliyet defteri konfigürasyonunu al.
+
+    Returns:
+        dict: Defter açık mı, SQLite dosyası ve tahminde kullanılacak son çalıştırma sayısı
+    """
+    return {
+        "enabled": env_flag("COST_LEDGER_ENABLED", DEFAULT_COST_LEDGER_ENABLED),
+        "path": os.getenv("COST_LEDGER_PATH", DEFAULT_COST_LEDGER_PATH),
+        "estimate_runs": max(1, int(os.getenv("COST_ESTIMATE_RUNS", DEFAULT_COST_ESTIMATE_RUNS)))
+    }
+
+def get_word_export_config() -> dict:
+    """
+    Çevre değişkenlerinden Word export konfigürasyonunu al.
+
+    Returns:
+        dict: Export motoru (stream / docx), çoklu export süreç sayısı ve şablon yolu
+    """
+    processes = int(os.getenv("WORD_EXPORT_PROCESSES", DEFAULT_WORD_EXPORT_PROCESSES))
+    return {
+        "engine": os.getenv("WORD_EXPORT_ENGINE", DEFAULT_WORD_EXPORT_ENGINE).strip().lower() or DEFAULT_WORD_EXPORT_ENGINE,
+        "processes": processes if processes > 0 else (os.cpu_count() or 1),
+        "template_path": os.getenv("WORD_TEMPLATE_PATH", DEFAULT_WORD_TEMPLATE_PATH).strip()
+    }
+
+def get_export_config() -> dict:
+    """
+    Çevre değişkenlerinden ek export biçimleri (jsonl, csv, md, html) konfigürasyonunu al.
+
+    Returns:
+        dict: Çıktı dizini ve HTML şablon yolu (boşsa paketle gelen şablon)
+    """
+    return {
+        "output_dir": os.getenv("EXPORT_OUTPUT_DIR", DEFAULT_EXPORT_OUTPUT_DIR),
+        "html_template": os.getenv("HTML_EXPORT_TEMPLATE", DEFAULT_HTML_EXPORT_TEMPLATE).strip()
+    }
+
+def get_candidate_sheet_config() -> dict:
+    """
+    Çevre değişkenlerinden aday soru formu konfigürasyonunu al.
+
+    Returns:
+        dict: Çıktı dizini ve kategori başına soru sayısı
+    """
+    return {
+        "output_dir": os.getenv("CANDIDATE_SHEET_DIR", DEFAULT_CANDIDATE_SHEET_DIR),
+        "questions_per_category": max(1, int(os.getenv("SHEET_QUESTIONS_PER_CATEGORY", DEFAULT_SHEET_QUESTIONS_PER_CATEGORY)))
+    }
+
+def get_tracing_config() -> dict:
+    """
+    Çevre değişkenlerinden aşama süresi izleme konfigürasyonunu al.
+
+    Returns:
+        dict: İzleme açık mı, iz dosyalarının dizini ve bellekte tutulacak en fazla span sayısı
+    """
+    return {
+        "enabled": env_flag("TRACE_ENABLED", DEFAULT_TRACE_ENABLED),
+        "directory": os.getenv("TRACE_DIR", DEFAULT_TRACE_DIR),
+        "max_spans": max(1, int(os.getenv("TRACE_MAX_SPANS", DEFAULT_TRACE_MAX_SPANS)))
+    }
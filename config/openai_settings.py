@@ -8,6 +8,8 @@ OpenAI API bağlantısı ve parametreleri için konfigürasyon dosyası.
 import os
 from typing import Optional
 
+from config.generation_settings import env_flag
+
 # OpenAI API konfigürasyonu
 DEFAULT_MODEL = "gpt-4o-mini"
 DEFAULT_TIMEOUT = 60.0
@@ -15,6 +17,41 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_TEMPERATURE = 0.8
 DEFAULT_MAX_TOKENS = 16000  # GPT-4o-mini max output (100+ soru için)
 
+# Paylaşılan HTTP bağlantı havuzu (async client)
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Hız sınırlama (gpt-4o-mini Tier 1 limitleri)
+DEFAULT_RATE_LIMIT_ENABLED = True
+DEFAULT_RPM_LIMIT = 500
+DEFAULT_TPM_LIMIT = 200000
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MIN_CONCURRENCY = 1
+
+# Batch API (gece çalışan toplu havuz üretimi)
+DEFAULT_BATCH_API_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_BATCH_API_COMPLETION_WINDOW = "24h"
+DEFAULT_BATCH_API_POLL_INTERVAL = 30.0
+DEFAULT_BATCH_API_MAX_WAIT = 24 * 3600.0
+# Yoklama / indirme GET'lerinde geçici hata (ağ, 429, 5xx) başına tekrar sayısı ve en uzun bekleme
+DEFAULT_BATCH_API_POLL_RETRIES = 8
+DEFAULT_BATCH_API_MAX_BACKOFF = 600.0
+DEFAULT_BATCH_API_DIR = "data/batch_api"
+
+# LLM backend'i (openai, http, fake)
+DEFAULT_LLM_BACKEND = "openai"
+DEFAULT_LLM_HTTP_BASE_URL = "http://127.0.0.1:8000/v1"
+DEFAULT_LLM_FAKE_LATENCY = 0.0
+DEFAULT_LLM_FAKE_MALFORMED_RATE = 0.0
+DEFAULT_LLM_FAKE_SEED = 0
+
+# Token fiyatları (USD / 1M token, gpt-4o-mini); Batch API yarı fiyat
+DEFAULT_PRICE_INPUT_PER_1M = 0.15
+DEFAULT_PRICE_CACHED_INPUT_PER_1M = 0.075
+DEFAULT_PRICE_OUTPUT_PER_1M = 0.60
+DEFAULT_BATCH_API_PRICE_FACTOR = 0.5
+
 def get_openai_config() -> dict:
     """
     Çevre değişkenlerinden OpenAI konfigürasyonunu al.
@@ -24,20 +61,98 @@ def get_openai_config() -> dict:
     """
     return {
         "api_key": os.getenv("OPENAI_API_KEY"),
+        "base_url": os.getenv("OPENAI_BASE_URL") or None,
         "model": os.getenv("OPENAI_MODEL", DEFAULT_MODEL),
         "timeout": float(os.getenv("OPENAI_TIMEOUT", DEFAULT_TIMEOUT)),
         "max_retries": int(os.getenv("OPENAI_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
         "temperature": float(os.getenv("OPENAI_TEMPERATURE", DEFAULT_TEMPERATURE)),
-        "max_tokens": int(os.getenv("OPENAI_MAX_TOKENS", DEFAULT_MAX_TOKENS))
+        "max_tokens": int(os.getenv("OPENAI_MAX_TOKENS", DEFAULT_MAX_TOKENS)),
+        "max_connections": int(os.getenv("OPENAI_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+        "max_keepalive_connections": int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)),
+        "keepalive_expiry": float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY))
+    }
+
+def get_rate_limit_config() -> dict:
+    """
+    Çevre değişkenlerinden hız sınırlama konfigürasyonunu al.
+    
+    RPM/TPM değeri 0 verilirse ilgili limit devre dışı kalır.
+    
+    Returns:
+        dict: Rate limit ayarları
+    """
+    return {
+        "enabled": env_flag("OPENAI_RATE_LIMIT_ENABLED", DEFAULT_RATE_LIMIT_ENABLED),
+        "requests_per_minute": float(os.getenv("OPENAI_RPM_LIMIT", DEFAULT_RPM_LIMIT)),
+        "tokens_per_minute": float(os.getenv("OPENAI_TPM_LIMIT", DEFAULT_TPM_LIMIT)),
+        "max_concurrency": int(os.getenv("OPENAI_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        "min_concurrency": int(os.getenv("OPENAI_MIN_CONCURRENCY", DEFAULT_MIN_CONCURRENCY)),
+        "max_retries": int(os.getenv("OPENAI_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+    }
+
+def get_batch_api_config() -> dict:
+    """
+    Çevre değişkenlerinden Batch API konfigürasyonunu al.
+    
+    Returns:
+        dict: Tamamlanma penceresi, yoklama aralığı, en uzun bekleme süresi,
+            geçici hatalarda tekrar sayısı / en uzun bekleme ve JSONL
+            girdi/çıktı dosyalarının dizini
+    """
+    return {
+        "base_url": os.getenv("OPENAI_BASE_URL") or DEFAULT_BATCH_API_BASE_URL,
+        "completion_window": os.getenv("BATCH_API_COMPLETION_WINDOW", DEFAULT_BATCH_API_COMPLETION_WINDOW),
+        "poll_interval": max(0.1, float(os.getenv("BATCH_API_POLL_INTERVAL", DEFAULT_BATCH_API_POLL_INTERVAL))),
+        "max_wait": max(1.0, float(os.getenv("BATCH_API_MAX_WAIT", DEFAULT_BATCH_API_MAX_WAIT))),
+        "poll_retries": max(0, int(os.getenv("BATCH_API_POLL_RETRIES", DEFAULT_BATCH_API_POLL_RETRIES))),
+        "max_backoff": max(0.1, float(os.getenv("BATCH_API_MAX_BACKOFF", DEFAULT_BATCH_API_MAX_BACKOFF))),
+        "directory": os.getenv("BATCH_API_DIR", DEFAULT_BATCH_API_DIR)
+    }
+
+def get_llm_backend_config() -> dict:
+    """
+    Çevre değişkenlerinden LLM backend konfigürasyonunu al.
+    
+    Returns:
+        dict: Backend adı, HTTP backend adresi / anahtarı / zaman aşımı ve
+            sahte backend'in gecikme, bozuk yanıt oranı ve tohumu
+    """
+    return {
+        "backend": os.getenv("LLM_BACKEND", DEFAULT_LLM_BACKEND).strip().lower(),
+        "http_base_url": os.getenv("LLM_HTTP_BASE_URL") or os.getenv("OPENAI_BASE_URL") or DEFAULT_LLM_HTTP_BASE_URL,
+        "http_api_key": os.getenv("LLM_HTTP_API_KEY") or os.getenv("OPENAI_API_KEY"),
+        "timeout": float(os.getenv("OPENAI_TIMEOUT", DEFAULT_TIMEOUT)),
+        "fake_latency": max(0.0, float(os.getenv("LLM_FAKE_LATENCY", DEFAULT_LLM_FAKE_LATENCY))),
+        "fake_malformed_rate": min(1.0, max(0.0, float(os.getenv("LLM_FAKE_MALFORMED_RATE", DEFAULT_LLM_FAKE_MALFORMED_RATE)))),
+        "fake_seed": int(os.getenv("LLM_FAKE_SEED", DEFAULT_LLM_FAKE_SEED))
+    }
+
+def get_pricing_config() -> dict:
+    """
+    Çevre değişkenlerinden token fiyatlarını al (maliyet defteri ve tahmin için).
+    
+    Returns:
+        dict: Girdi, önbellekli girdi ve çıktı token fiyatı (USD / 1M token)
+            ve Batch API fiyat çarpanı
+    """
+    return {
+        "input_per_1m": float(os.getenv("OPENAI_PRICE_INPUT_PER_1M", DEFAULT_PRICE_INPUT_PER_1M)),
+        "cached_input_per_1m": float(os.getenv("OPENAI_PRICE_CACHED_INPUT_PER_1M", DEFAULT_PRICE_CACHED_INPUT_PER_1M)),
+        "output_per_1m": float(os.getenv("OPENAI_PRICE_OUTPUT_PER_1M", DEFAULT_PRICE_OUTPUT_PER_1M)),
+        "batch_api_factor": float(os.getenv("BATCH_API_PRICE_FACTOR", DEFAULT_BATCH_API_PRICE_FACTOR))
     }
 
 def validate_api_key() -> bool:
     """
     OpenAI API anahtarının tanımlı olup olmadığını kontrol et.
     
+    Anahtar yalnızca openai backend'i için zorunludur (http / fake için True).
+    
     Returns:
-        bool: API key tanımlı ise True
+        bool: API key tanımlı ise (veya gerekmiyorsa) True
     """
+    if get_llm_backend_config()["backend"] != "openai":
+        return True
     api_key = os.getenv("OPENAI_API_KEY")
     return api_key is not None and len(api_key.strip()) > 0
 
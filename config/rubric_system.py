@@ -70,6 +70,22 @@ RUBRIC_LEVELS = {
     }
 }
 
+# Seviye etiketi olmayan havuz sorularını sınıflandırmak için anahtar ifadeler
+# (küçük harf, Türkçe; en yüksek seviyeden başlanarak ilk eşleşen seviye seçilir)
+RUBRIC_LEVEL_KEYWORDS = {
+    "K5_Stratejik": ["strateji", "yol haritası", "liderlik", "ekibinizi", "ekibinize", "önceliklendir",
+                     "süreç iyileştir", "organizasyon", "karar verirsiniz", "kurum genelinde"],
+    "K4_Tasarim": ["tasarla", "mimari", "ölçeklen", "karşılaştır", "alternatif", "trade-off",
+                   "hangi teknolojiyi", "yüksek erişilebilir", "dağıtık"],
+    "K3_Hata_Cozumleme": ["hata", "log", "sorun", "çalışmıyor", "debug", "tespit", "arıza",
+                          "troubleshoot", "kök neden", "neden yavaş"],
+    "K2_Uygulamali": ["nasıl", "yapılandır", "konfigür", "uygula", "kullanır", "adım", "örnek"],
+    "K1_Temel_Bilgi": ["nedir", "tanımla", "ne demek", "kavram", "farkı ne"]
+}
+
+# Anahtar ifade eşleşmeyen sorular için varsayılan seviye
+DEFAULT_RUBRIC_LEVEL = "K2_Uygulamali"
+
 # Zorluk seviyesi etiketleri
 DIFFICULTY_LABELS = {
     2: {"name": "Junior", "label": "2x", "description": "Temel seviye"},
@@ -0,0 +1,761 @@
+"""
+ASYNC SORU ÜRETİM MOTORU
+========================
+
+QuestionGenerator ile aynı public arayüze sahip, asyncio tabanlı üretici.
+Tüm örnekler tek bir paylaşılan AsyncOpenAI/httpx client'ı (keep-alive ve
+sınırlı bağlantı havuzu) kullanır; böylece tek event loop üzerinde yüzlerce
+üretim eşzamanlı çalıştırılabilir.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Any, Generator, List, Optional, Callable, Tuple
+
+import httpx
+from openai import AsyncOpenAI
+
+from core.question_generator import QuestionGenerator, _response_total_tokens, _stream_result_tokens, _streamed_total_tokens
+from core.llm_backends import LLMBackend, OpenAIBackend, create_llm_backend
+from core.overgeneration_planner import OvergenerationPlanner
+from core.rate_limiter import RateLimiter
+from core.response_cache import ResponseCache
+from core.stream_parser import IncrementalJSONArrayParser
+from core.usage_tracker import pop_usage_context, push_usage_context
+from utils.near_duplicate import NearDuplicateDetector
+from utils.tracing import current_span, traced
+from config.openai_settings import get_llm_backend_config, get_openai_config, get_rate_limit_config, validate_api_key
+from config.question_categories import get_active_question_categories
+
+logger = logging.getLogger(__name__)
+
+_shared_client: Optional[AsyncOpenAI] = None
+_shared_client_lock = threading.Lock()
+
+def get_shared_async_client() -> AsyncOpenAI:
+    """
+    Süreç genelinde paylaşılan AsyncOpenAI client'ını döndür (yoksa oluştur).
+
+    Not: httpx bağlantıları oluşturuldukları event loop'a bağlıdır; client'ı
+    tek bir uzun ömürlü event loop üzerinde kullanın.
+
+    Returns:
+        AsyncOpenAI: Paylaşılan client
+    """
+    global _shared_client
+
+    if _shared_client is not None:
+        return _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is None:
+            if not validate_api_key():
+                raise ValueError("OPENAI_API_KEY environment variable tanımlı değil!")
+
+            config = get_openai_config()
+            http_client = httpx.AsyncClient(
+                timeout=config["timeout"],
+                limits=httpx.Limits(
+                    max_connections=config["max_connections"],
+                    max_keepalive_connections=config["max_keepalive_connections"],
+                    keepalive_expiry=config["keepalive_expiry"]
+                )
+            )
+            # Rate limiter aktifse yeniden denemeler sınırlayıcıda yapılır
+            max_retries = 0 if get_rate_limit_config()["enabled"] else config["max_retries"]
+            _shared_client = AsyncOpenAI(
+                api_key=config["api_key"],
+                base_url=config["base_url"],
+                timeout=config["timeout"],
+                max_retries=max_retries,
+                http_client=http_client
+            )
+            logger.info(
+                f"Paylaşılan AsyncOpenAI client başlatıldı "
+                f"(max_connections={config['max_connections']}, "
+                f"keepalive={config['max_keepalive_connections']})"
+            )
+
+    return _shared_client
+
+async def close_shared_async_client():
+    """Paylaşılan client'ı ve bağlantı havuzunu kapat"""
+    global _shared_client
+
+    with _shared_client_lock:
+        client = _shared_client
+        _shared_client = None
+
+    if client is not None:
+        await client.close()
+        logger.info("Paylaşılan AsyncOpenAI client kapatıldı")
+
+class AsyncQuestionGenerator(QuestionGenerator):
+    """Asyncio tabanlı soru üretim sınıfı - paylaşılan AsyncOpenAI client ile"""
+
+    def __init__(
+        self,
+        client: Optional[AsyncOpenAI] = None,
+        concurrent_categories: Optional[bool] = None,
+        response_cache: Optional[ResponseCache] = None,
+        stream: Optional[bool] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        overgeneration_planner: Optional[OvergenerationPlanner] = None,
+        structured_output: Optional[bool] = None,
+        backend: Optional[LLMBackend] = None
+    ):
+        """
+        Async soru üretici başlatıcı
+
+        Args:
+            client: Kullanılacak AsyncOpenAI client'ı (None ise paylaşılan client)
+            concurrent_categories: Kategori isteklerini aynı anda gönder
+                (None ise GENERATION_CONCURRENT_CATEGORIES ayarı kullanılır)
+            response_cache: Yanıt önbelleği (None ise paylaşılan önbellek)
+            stream: Batch yanıtlarını akış olarak al (None ise GENERATION_STREAM ayarı)
+            near_duplicates: Rol bazlı yakın-tekrar dedektörü (None ise NEAR_DUPLICATE_ENABLED)
+            overgeneration_planner: Kabul oranı planlayıcısı (None ise paylaşılan planlayıcı)
+            structured_output: Soru dizisi isteklerinde JSON şeması gönder
+                (None ise GENERATION_STRUCTURED_OUTPUT ayarı)
+            backend: Model backend'i (None ise client veya LLM_BACKEND ayarı)
+        """
+        self._injected_client = client
+        super().__init__(
+            concurrent_categories=concurrent_categories,
+            response_cache=response_cache,
+            stream=stream,
+            near_duplicates=near_duplicates,
+            overgeneration_planner=overgeneration_planner,
+            structured_output=structured_output,
+            backend=backend
+        )
+
+    def _initialize_client(self):
+        """Backend verilmediyse enjekte edilen / paylaşılan AsyncOpenAI client'ını veya LLM_BACKEND'i bağla"""
+        if self.backend is not None:
+            return
+        if self._injected_client is not None:
+            self.backend = OpenAIBackend(async_client=self._injected_client)
+            return
+
+        backend_name = get_llm_backend_config()["backend"]
+        if backend_name != "openai":
+            self.backend = create_llm_backend(backend_name)
+            logger.info(f"LLM backend'i: {backend_name}")
+        else:
+            self.backend = OpenAIBackend(async_client=get_shared_async_client())
+
+    async def _create_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+        **overrides
+    ):
+        """Tüm async model çağrılarının geçtiği tek nokta (rate limiter dahil); (metin, usage) döndürür"""
+        params = self._backend_params(config, **overrides)
+        attempts = 0
+
+        async def send():
+            nonlocal attempts
+            attempts += 1
+            started = time.monotonic()
+            with self._llm_span("llm.complete", params, attempts) as current:
+                result = await self.backend.acomplete(messages, params)
+                current.set(total_tokens=_response_total_tokens(result))
+            self.usage_tracker.record(
+                result[1], model=params["model"], latency=time.monotonic() - started, retries=attempts - 1
+            )
+            return result
+
+        if self.rate_limiter is None:
+            return await send()
+
+        return await self.rate_limiter.acall(
+            send,
+            estimated_tokens=RateLimiter.estimate_tokens(messages, params.get("max_tokens", 0)),
+            usage_tokens=_response_total_tokens
+        )
+
+    async def _complete_prompt(
+        self,
+        prompt: str,
+        config: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        call_site: Optional[str] = None
+    ) -> str:
+        """System mesajı + prompt ile istek gönder, yanıt metnini döndür (önbellek dahil)"""
+        messages = self._build_messages(prompt)
+        cache_key = self._response_cache_key(messages, config, response_format)
+        if cache_key is not None:
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                logger.info("Yanıt önbellekten alındı")
+                return cached_text
+
+        context_token = push_usage_context(call_site=call_site) if call_site else None
+        try:
+            text, _ = await self._create_chat_completion(messages, config, response_format=response_format)
+        finally:
+            if context_token is not None:
+                pop_usage_context(context_token)
+        generated_text = text.strip()
+
+        if cache_key is not None:
+            self.response_cache.set(cache_key, generated_text, model=(config or self.openai_config)["model"])
+        return generated_text
+
+    async def _stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        on_delta: Callable[[str], None],
+        config: Optional[Dict[str, Any]] = None,
+        **overrides
+    ) -> Optional[Exception]:
+        """İsteği akış olarak gönder (async); akış koparsa hatayı döndür"""
+        params = self._backend_params(config, **overrides)
+        attempts = 0
+
+        async def consume() -> Tuple[Optional[Exception], int]:
+            nonlocal attempts
+            attempts += 1
+            received_chars = 0
+            started = time.monotonic()
+
+            def forward(delta: str):
+                nonlocal received_chars
+                received_chars += len(delta)
+                on_delta(delta)
+
+            try:
+                with self._llm_span("llm.stream", params, attempts) as current:
+                    usage = await self.backend.astream(messages, params, forward)
+                    current.set(total_tokens=(usage or {}).get("total_tokens"))
+            except Exception as error:
+                if not received_chars:
+                    raise
+                # Kopan akışın harcadığı token'lar da TPM bütçesinden düşülür
+                return error, _streamed_total_tokens(messages, None, received_chars)
+            self.usage_tracker.record(
+                usage, model=params["model"], latency=time.monotonic() - started, retries=attempts - 1
+            )
+            return None, _streamed_total_tokens(messages, usage, received_chars)
+
+        if self.rate_limiter is None:
+            return (await consume())[0]
+
+        # max_tokens ile ayrılan rezervasyon akış bitince gerçek kullanıma göre düzeltilir
+        stream_error, _ = await self.rate_limiter.acall(
+            consume,
+            estimated_tokens=RateLimiter.estimate_tokens(messages, params.get("max_tokens", 0)),
+            usage_tokens=_stream_result_tokens
+        )
+        return stream_error
+
+    async def _stream_questions(
+        self,
+        prompt: str,
+        on_question: Optional[Callable[[Dict[str, Any]], None]] = None,
+        config: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Batch prompt'unu akış modunda çalıştır (async)"""
+        messages = self._build_messages(prompt)
+        parser = IncrementalJSONArrayParser()
+        questions: List[Dict[str, Any]] = []
+
+        def on_delta(delta: str):
+            for item in self._format_questions_array(parser.feed(delta)):
+                questions.append(item)
+                if on_question is not None:
+                    on_question(item)
+
+        response_format = self.question_response_format
+        cache_key = self._response_cache_key(messages, config, response_format)
+        cached_text = self.response_cache.get(cache_key) if cache_key is not None else None
+        if cached_text is not None:
+            logger.info("Yanıt önbellekten alındı")
+            on_delta(cached_text)
+            stream_error = None
+        else:
+            stream_error = await self._stream_chat_completion(
+                messages, on_delta, config, response_format=response_format
+            )
+
+        return self._finish_stream(parser, questions, stream_error, cache_key, cached_text is not None, config)
+
+    async def check_api_status(self) -> Dict[str, Any]:
+        """API durumunu kontrol et"""
+        try:
+            text, _ = await self._create_chat_completion(
+                [{"role": "user", "content": "test"}],
+                self.openai_config,
+                max_tokens=10,
+                temperature=None
+            )
+
+            return {
+                "api_available": True,
+                "model": self.openai_config["model"],
+                "status": "connected",
+                "test_response": text
+            }
+
+        except Exception as e:
+            logger.error(f"API durumu kontrol hatası: {e}")
+            return {
+                "api_available": False,
+                "error": str(e),
+                "details": "API bağlantı hatası"
+            }
+
+    async def generate_single_question(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_type: str,
+        type_name: str,
+        type_description: str,
+        question_number: int = 1
+    ) -> Dict[str, Any]:
+        """Tek bir soru üret (async)"""
+        try:
+            prompt, difficulty_distribution = self._build_batch_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, question_count=1
+            )
+
+            raw_response = await self._complete_prompt(prompt, self.openai_config, call_site="single_question")
+            logger.info(f"{type_name} sorusu {question_number} için API yanıtı alındı")
+
+            return self._build_single_question_result(
+                raw_response, role_name, salary_coefficient,
+                question_type, type_name, question_number, difficulty_distribution
+            )
+
+        except Exception as e:
+            logger.error(f"Soru üretim hatası ({type_name} {question_number}): {e}")
+            return self._single_question_error(e, question_type, type_name)
+
+    @traced("refill.strict_code")
+    async def _generate_practical_code_questions_strict(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        count: int,
+        avoid: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """5–10 satır kod şartını kesin uygulayan ek üretim (async)"""
+        try:
+            strict_prompt = self._build_strict_code_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, count
+            ) + self._avoid_near_duplicates_block(avoid or [])
+            generated_text = await self._complete_prompt(
+                strict_prompt, response_format=self.question_response_format, call_site="strict_code"
+            )
+            return self._filter_code_questions(self._parse_refill_questions(generated_text))
+        except Exception:
+            return []
+
+    @traced("refill.nocode")
+    async def _generate_practical_nocode_questions(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        count: int,
+        avoid: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """KOD İÇERMEYEN pratik uygulama soruları üretir (async)"""
+        try:
+            nocode_prompt = self._build_nocode_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, count
+            ) + self._avoid_near_duplicates_block(avoid or [])
+            generated_text = await self._complete_prompt(
+                nocode_prompt, response_format=self.question_response_format, call_site="nocode"
+            )
+            return self._filter_nocode_questions(self._parse_refill_questions(generated_text))
+        except Exception:
+            return []
+
+    @traced("refill.near_duplicates")
+    async def _generate_replacement_questions(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        count: int,
+        rejected: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Yakın-tekrar olarak elenen soruların yerine yenilerini üret (async)"""
+        try:
+            prompt, _ = self._build_batch_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, count
+            )
+            generated_text = await self._complete_prompt(
+                prompt + self._avoid_near_duplicates_block(rejected),
+                response_format=self.question_response_format,
+                call_site="near_duplicate_refill"
+            )
+            return self._parse_refill_questions(generated_text)
+        except Exception as e:
+            logger.error(f"Yakın-tekrar yerine soru üretilemedi ({type_name}, {count} soru): {e}")
+            return []
+
+    @traced("generate.batch")
+    async def generate_questions_batch(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_type: str,
+        type_name: str,
+        type_description: str,
+        question_count: int,
+        stream: Optional[bool] = None,
+        on_question: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """Belirli bir kategori için toplu soru üretimi (async; filtre ve doldurma akışı _batch_pipeline'da)"""
+        speculative = None
+        # Bu kategori için gönderilen isteklerin kullanım kayıtları (maliyet defteri)
+        context_token = push_usage_context(
+            role=role_name, difficulty=salary_coefficient, category=question_type,
+            question_count=question_count, call_site="batch"
+        )
+        current_span().set(role=role_name, difficulty=salary_coefficient, category=question_type, question_count=question_count)
+        try:
+            batch = self._prepare_batch(
+                role_name, job_context, description, salary_coefficient,
+                question_type, type_name, type_description, question_count
+            )
+
+            speculative = self._start_speculative_fallbacks(batch)
+
+            if batch["prefetched"] is not None:
+                questions_data = self._parse_prefetched_response(batch["prefetched"])
+            elif self.stream if stream is None else stream:
+                questions_data = await self._stream_questions(
+                    batch["prompt"], self._filtered_question_callback(batch, on_question)
+                )
+            else:
+                generated_text = await self._complete_prompt(batch["prompt"], response_format=self.question_response_format)
+                logger.info(f"OpenAI yanıtı alındı: {len(generated_text)} karakter")
+
+                questions_data = self._parse_generated_questions(generated_text)
+
+            return await self._run_batch_pipeline(
+                batch, self._batch_pipeline(batch, questions_data, speculative is not None), speculative
+            )
+
+        except Exception as e:
+            logger.error(f"Batch soru üretim hatası: {e}")
+            return self._batch_error(e, question_type)
+        finally:
+            # Kullanılmayan spekülatif istekleri beklemeden iptal et
+            for task in (speculative or {}).values():
+                if not task.done():
+                    task.cancel()
+            pop_usage_context(context_token)
+
+    async def _run_batch_pipeline(
+        self,
+        batch: Dict[str, Any],
+        pipeline: Generator[Tuple[str, int, List[Dict[str, Any]]], List[Dict[str, Any]], Dict[str, Any]],
+        speculative: Optional[Dict[str, asyncio.Task]]
+    ) -> Dict[str, Any]:
+        """_batch_pipeline'ı sür (async): ek istekleri bekle, spekülatif görev varsa onu kullan"""
+        try:
+            kind, count, avoid = next(pipeline)
+            while True:
+                if speculative and kind in speculative:
+                    items = await speculative[kind]
+                else:
+                    items = await self._refill_request(kind)(*self._refill_args(batch), count, avoid)
+                kind, count, avoid = pipeline.send(items)
+        except StopIteration as finished:
+            return finished.value
+
+    def _start_speculative_fallbacks(self, batch: Dict[str, Any]) -> Optional[Dict[str, asyncio.Task]]:
+        """Katı mod ve kodsuz yedek istekleri ana istekle paralel başlat (async görevler)"""
+        plan = batch["plan"]
+        if batch["question_type"] != "practical_application" or not plan["speculative"]:
+            return None
+
+        logger.info(
+            f"⚡ {batch['type_name']}: kabul oranı düşük (%{plan['acceptance_rate'] * 100:.0f}), "
+            f"katı mod ve kodsuz yedekler ({plan['fallback_count']} soru) paralel başlatılıyor"
+        )
+        args = self._refill_args(batch) + (plan["fallback_count"], self._known_near_duplicates(batch["role_name"]))
+        return {
+            kind: asyncio.create_task(self._refill_request(kind)(*args))
+            for kind in ("strict", "nocode")
+        }
+
+    async def _generate_category_batch(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int],
+        category: tuple,
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Any]:
+        """Tek bir kategori için batch üretimini çalıştır ve bitince bildir (async)"""
+        category_code, category_name, category_description = category
+        question_count = question_counts.get(category_code, 0)
+
+        logger.info(f"{category_name}: {question_count} adet soru üretiliyor...")
+
+        batch_result = await self.generate_questions_batch(
+            role_name=role_name,
+            job_context=job_context,
+            description=description,
+            salary_coefficient=salary_coefficient,
+            question_type=category_code,
+            type_name=category_name,
+            type_description=category_description,
+            question_count=question_count
+        )
+        self._notify_category_completed(on_category_completed, category_code, batch_result)
+        return batch_result
+
+    async def generate_all_questions_single_request(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Tek API isteği ile tüm kategorilerde sorular üret (async)"""
+        try:
+            prompt, total_questions = self._build_single_request_prompt(
+                role_name, job_context, description, salary_coefficient, question_counts
+            )
+
+            logger.info(f"Tek istek ile {total_questions} soru üretimi başlıyor...")
+
+            generated_text = await self._complete_prompt(prompt, call_site="single_request")
+            return self._build_single_request_result(generated_text, question_counts)
+
+        except Exception as e:
+            logger.error(f"Tek istek hatası: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "questions": {}
+            }
+
+    async def generate_questions_category_based(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int],
+        concurrent: Optional[bool] = None,
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Kategori bazlı soru üretimi (async).
+
+        concurrent True ise kategori istekleri asyncio.gather ile aynı anda
+        gönderilir; sonuçlar order_index sırasıyla birleştirilir.
+        on_category_completed her başarılı kategori biter bitmez
+        (kategori_kodu, sorular) ile çağrılır (senkron sürümle aynı).
+        """
+        try:
+            active_categories = get_active_question_categories()
+            all_questions = {}
+
+            if concurrent is None:
+                concurrent = self.concurrent_categories
+
+            pending_categories = [
+                category for category in active_categories
+                if question_counts.get(category[0], 0) > 0
+            ]
+
+            if concurrent and len(pending_categories) > 1:
+                logger.info("KATEGORİ BAZLI sistem başlıyor - kategori istekleri eşzamanlı gönderiliyor")
+                outcomes = await asyncio.gather(
+                    *[
+                        self._generate_category_batch(
+                            role_name, job_context, description, salary_coefficient,
+                            question_counts, category, on_category_completed
+                        )
+                        for category in pending_categories
+                    ],
+                    return_exceptions=True
+                )
+            else:
+                logger.info("KATEGORİ BAZLI sistem başlıyor - her kategori için ayrı API isteği")
+                outcomes = []
+                for category in pending_categories:
+                    outcomes.append(await self._generate_category_batch(
+                        role_name, job_context, description, salary_coefficient,
+                        question_counts, category, on_category_completed
+                    ))
+
+            batch_results = {}
+            for category, outcome in zip(pending_categories, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"{category[0]} eşzamanlı üretim hatası: {outcome}")
+                    outcome = self._batch_error(outcome, category[0])
+                batch_results[category[0]] = outcome
+
+            # Sonuçları order_index sırasıyla birleştir
+            for category_code, category_name, category_description in active_categories:
+                batch_result = batch_results.get(category_code)
+
+                if batch_result is None:
+                    all_questions[category_code] = []
+                elif batch_result.get("success", False):
+                    all_questions[category_code] = batch_result["questions"]
+                    logger.info(f"{category_name} başarılı: {len(batch_result['questions'])} soru")
+                else:
+                    logger.error(f"{category_name} başarısız!")
+                    all_questions[category_code] = []
+
+            total_generated = sum(len(qs) for qs in all_questions.values())
+            logger.info(f"KATEGORİ BAZLI sistem tamamlandı: {total_generated} soru")
+
+            return {
+                "success": True,
+                "questions": all_questions,
+                "total_questions": total_generated
+            }
+
+        except Exception as e:
+            logger.error(f"Kategori bazlı sistem hatası: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "questions": {}
+            }
+
+    async def generate_questions_chunked(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Büyük istekler için chunk sistemi (async, chunk'lar eşzamanlı gönderilir)"""
+        try:
+            chunk_plan = self._plan_chunks(question_counts)
+
+            all_results = {category_code: [] for category_code in question_counts.keys()}
+
+            chunk_results = await asyncio.gather(*[
+                self.generate_all_questions_single_request(
+                    role_name=role_name,
+                    job_context=job_context,
+                    description=description,
+                    salary_coefficient=salary_coefficient,
+                    question_counts=chunk_counts
+                )
+                for chunk_counts in chunk_plan
+            ])
+
+            # Sonuçları chunk sırasıyla birleştir
+            for chunk_num, chunk_result in enumerate(chunk_results):
+                if chunk_result.get("success", False):
+                    for category_code, questions_list in chunk_result["questions"].items():
+                        all_results[category_code].extend(questions_list)
+                    logger.info(f"Chunk {chunk_num + 1} başarılı: {chunk_result.get('total_questions', 0)} soru")
+                else:
+                    logger.error(f"Chunk {chunk_num + 1} başarısız!")
+
+            total_generated = sum(len(qs) for qs in all_results.values())
+            logger.info(f"CHUNK SİSTEMİ tamamlandı: {total_generated} soru")
+
+            return {
+                "success": True,
+                "questions": all_results,
+                "total_questions": total_generated
+            }
+
+        except Exception as e:
+            logger.error(f"Chunk sistemi hatası: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "questions": {}
+            }
+
+    @traced("generate.role")
+    async def generate_questions_for_role(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int],
+        completed_questions: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Bir rol için tüm kategorilerde sorular üret (async).
+
+        completed_questions ve on_category_completed senkron sürümdeki
+        gibidir: günlükte tamamlanan kategoriler yeniden istenmez, biten
+        kategoriler hemen bildirilir (devam ettirilebilir çalıştırmalar).
+        """
+        logger.info(f"{role_name} ({salary_coefficient}x) için soru üretimi başlatılıyor")
+
+        all_questions = {}
+        completed_questions = completed_questions or {}
+        question_counts = self._remaining_question_counts(question_counts, completed_questions)
+
+        all_batch_result = await self.generate_questions_category_based(
+            role_name=role_name,
+            job_context=job_context,
+            description=description,
+            salary_coefficient=salary_coefficient,
+            question_counts=question_counts,
+            on_category_completed=on_category_completed
+        )
+
+        if all_batch_result.get("success", False):
+            all_questions = all_batch_result["questions"]
+            for category_code, questions in completed_questions.items():
+                all_questions[category_code] = list(questions)
+            self._fill_role_metadata(all_questions, role_name, salary_coefficient)
+            logger.info(f"TEK İSTEK başarılı: {all_batch_result.get('total_questions', 0)} soru")
+        else:
+            logger.error("TEK İSTEK başarısız, kategori bazlı fallback...")
+            for category in get_active_question_categories():
+                if category[0] in completed_questions:
+                    all_questions[category[0]] = list(completed_questions[category[0]])
+                    continue
+                if question_counts.get(category[0], 0) <= 0:
+                    continue
+
+                logger.info(f"{category[1]} soruları üretiliyor: {question_counts[category[0]]} adet (FALLBACK)")
+                batch_result = await self._generate_category_batch(
+                    role_name, job_context, description, salary_coefficient,
+                    question_counts, category, on_category_completed
+                )
+                all_questions[category[0]] = batch_result["questions"] if batch_result.get("success", False) else []
+
+        logger.info(f"{role_name} için soru üretimi tamamlandı")
+        return self._build_role_result(all_questions, role_name, salary_coefficient)
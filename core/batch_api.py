@@ -0,0 +1,211 @@
+"""
+OPENAI BATCH API İSTEMCİSİ
+==========================
+
+Etkileşimsiz (gece çalışan) havuz üretimi için Batch API uç noktaları:
+JSONL girdi dosyasını yükle (/files), batch oluştur (/batches), tamamlanana
+kadar yokla ve çıktı dosyasını indir (/files/{id}/content).
+
+Batch API istekleri senkron fiyatın yarısına, oran limitlerinden bağımsız
+işlenir; karşılığında yanıtlar tamamlanma penceresi (24 saat) içinde gelir.
+OPENAI_BASE_URL verilirse aynı uç noktaları sunan yerel bir sahte sunucuya
+karşı çalıştırılabilir.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from config.openai_settings import get_batch_api_config, get_openai_config
+
+logger = logging.getLogger(__name__)
+
+# Batch'in artık değişmeyeceği durumlar
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Batch satırlarının hedef uç noktası
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# Tekrar denenebilecek HTTP durumları (oran limiti ve sunucu hataları)
+TRANSIENT_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+class BatchAPIError(RuntimeError):
+    """Batch API isteği başarısız olduğunda"""
+
+    def __init__(self, message: str, transient: bool = False):
+        """
+        Args:
+            message: Hata mesajı
+            transient: Geçici hata mı (ağ hatası, 429, 5xx; aynı istek tekrar denenebilir)
+        """
+        super().__init__(message)
+        self.transient = transient
+
+class BatchAPIClient:
+    """Batch API dosya / batch uç noktaları için ince HTTP istemcisi"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+        max_retries: Optional[int] = None
+    ):
+        """
+        Args:
+            api_key: API anahtarı (None ise OPENAI_API_KEY)
+            base_url: API kök adresi (None ise OPENAI_BASE_URL veya api.openai.com)
+            timeout: Tek HTTP isteği zaman aşımı (None ise OPENAI_TIMEOUT)
+            session: Paylaşılacak requests oturumu
+            max_retries: Yoklama / indirmede geçici hata başına tekrar (None ise BATCH_API_POLL_RETRIES)
+        """
+        openai_config = get_openai_config()
+        batch_config = get_batch_api_config()
+        self.api_key = api_key or openai_config["api_key"]
+        self.base_url = (base_url or batch_config["base_url"]).rstrip("/")
+        self.timeout = timeout or openai_config["timeout"]
+        self.max_retries = batch_config["poll_retries"] if max_retries is None else max_retries
+        self.max_backoff = batch_config["max_backoff"]
+        self.session = session or requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """İsteği gönder; ağ hatası veya 2xx dışı yanıtta BatchAPIError"""
+        url = f"{self.base_url}{path}"
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            raise BatchAPIError(f"Batch API isteği gönderilemedi ({method} {path}): {e}", transient=True)
+        if response.status_code >= 400:
+            raise BatchAPIError(
+                f"Batch API hatası ({method} {path}): HTTP {response.status_code} {response.text[:300]}",
+                transient=response.status_code in TRANSIENT_STATUS_CODES
+            )
+        return response
+
+    def _get_with_retries(self, path: str, retry_delay: float) -> requests.Response:
+        """
+        Idempotent GET; geçici hatalarda artan beklemeyle (retry_delay, 2x, ...
+        en fazla max_backoff) max_retries kez tekrar dene.
+
+        Raises:
+            BatchAPIError: Kalıcı hata veya tekrarlar tükendiğinde
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._request("GET", path)
+            except BatchAPIError as e:
+                if not e.transient or attempt >= self.max_retries:
+                    raise
+                delay = min(self.max_backoff, retry_delay * (2 ** attempt))
+                attempt += 1
+                logger.warning(f"{e}; {delay:.1f} sn sonra tekrar denenecek ({attempt}/{self.max_retries})")
+                time.sleep(delay)
+
+    def upload_file(self, content: bytes, filename: str = "batch_input.jsonl") -> str:
+        """
+        JSONL girdi dosyasını yükle.
+
+        Returns:
+            str: Dosya kimliği
+        """
+        response = self._request(
+            "POST", "/files",
+            files={"file": (filename, content, "application/jsonl")},
+            data={"purpose": "batch"}
+        )
+        return response.json()["id"]
+
+    def create_batch(
+        self,
+        input_file_id: str,
+        completion_window: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Yüklenen dosya için chat.completions batch'i oluştur"""
+        payload = {
+            "input_file_id": input_file_id,
+            "endpoint": CHAT_COMPLETIONS_ENDPOINT,
+            "completion_window": completion_window or get_batch_api_config()["completion_window"]
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        return self._request("POST", "/batches", json=payload).json()
+
+    def get_batch(self, batch_id: str, retry_delay: Optional[float] = None) -> Dict[str, Any]:
+        """Batch durumunu al (geçici hatalarda tekrar dener; retry_delay None ise BATCH_API_POLL_INTERVAL)"""
+        retry_delay = retry_delay or get_batch_api_config()["poll_interval"]
+        return self._get_with_retries(f"/batches/{batch_id}", retry_delay).json()
+
+    def download_file(self, file_id: str) -> str:
+        """Çıktı / hata dosyasının içeriğini indir (geçici hatalarda tekrar dener)"""
+        return self._get_with_retries(f"/files/{file_id}/content", get_batch_api_config()["poll_interval"]).text
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: Optional[float] = None,
+        max_wait: Optional[float] = None,
+        on_status: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Batch son durumuna ulaşana kadar yokla.
+
+        Args:
+            batch_id: Batch kimliği
+            poll_interval: Yoklama aralığı (sn, None ise BATCH_API_POLL_INTERVAL)
+            max_wait: En uzun bekleme (sn, None ise BATCH_API_MAX_WAIT)
+            on_status: Her yoklamada batch nesnesi ile çağrılır
+
+        Returns:
+            dict: Son durumdaki batch nesnesi
+
+        Raises:
+            BatchAPIError: Bekleme süresi dolarsa, kalıcı bir hata alınırsa veya
+                geçici hatalar max_retries kez üst üste sürerse (batch sunucuda
+                işlenmeye devam ediyor olabilir)
+        """
+        config = get_batch_api_config()
+        poll_interval = poll_interval or config["poll_interval"]
+        deadline = time.monotonic() + (max_wait or config["max_wait"])
+
+        while True:
+            batch = self.get_batch(batch_id, retry_delay=poll_interval)
+            if on_status is not None:
+                on_status(batch)
+            if batch.get("status") in BATCH_TERMINAL_STATUSES:
+                return batch
+            if time.monotonic() + poll_interval > deadline:
+                raise BatchAPIError(f"Batch {batch_id} beklenen sürede tamamlanmadı (durum: {batch.get('status')})")
+            time.sleep(poll_interval)
+
+    @staticmethod
+    def parse_output(content: str) -> List[Dict[str, Any]]:
+        """
+        Çıktı / hata JSONL'ini satır kayıtlarına çevir.
+
+        Returns:
+            list: {"custom_id", "status_code", "body", "error"} kayıtları
+        """
+        records = []
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Batch çıktı satırı okunamadı: {line[:120]}")
+                continue
+            response = item.get("response") or {}
+            records.append({
+                "custom_id": item.get("custom_id"),
+                "status_code": response.get("status_code"),
+                "body": response.get("body"),
+                "error": item.get("error")
+            })
+        return records
@@ -0,0 +1,342 @@
+"""
+MALİYET DEFTERİ VE ÇALIŞTIRMA ÖNCESİ TAHMİN
+===========================================
+
+Her chat.completions çağrısının prompt / önbellekli / çıktı token sayısını,
+süresini, yeniden deneme sayısını ve maliyetini çalıştırma, rol, katsayı,
+kategori ve çağrı noktası (batch, strict_code, nocode, near_duplicate_refill,
+...) ile birlikte SQLite'a yazar. Kayıtlar paylaşılan UsageTracker hook'u ile
+toplanır; rol/kategori bilgisi üreticinin kullanım bağlamından gelir.
+
+Aynı defter çalıştırma öncesi tahmini besler: son çalıştırmalardaki
+kategori başına çağrı, token ve süre ortalamaları plandaki soru sayılarıyla
+ölçeklenir. Geçmişi olmayan kategoriler için kaba varsayılanlar kullanılır.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config.generation_settings import get_cost_ledger_config
+from config.openai_settings import get_pricing_config
+from core.usage_tracker import UsageTracker, get_shared_usage_tracker
+
+logger = logging.getLogger(__name__)
+
+# Geçmişi olmayan kategoriler için kaba varsayılanlar
+DEFAULT_PROMPT_TOKENS_PER_CALL = 1500
+DEFAULT_COMPLETION_TOKENS_PER_QUESTION = 120
+DEFAULT_SECONDS_PER_QUESTION = 1.5
+DEFAULT_CALLS_PER_UNIT = {"practical_application": 2.0}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    role TEXT,
+    difficulty INTEGER,
+    category TEXT,
+    question_count INTEGER,
+    call_site TEXT NOT NULL,
+    model TEXT,
+    prompt_tokens INTEGER NOT NULL,
+    cached_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    latency REAL,
+    retries INTEGER NOT NULL,
+    batch_api INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_run_id ON llm_calls(run_id);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_category ON llm_calls(category);
+"""
+
+def call_cost(
+    prompt_tokens: float,
+    cached_tokens: float,
+    completion_tokens: float,
+    batch_api: bool = False,
+    pricing: Optional[Dict[str, float]] = None
+) -> float:
+    """
+    Token sayılarından USD maliyet hesapla.
+
+    Önbellekli prompt token'ları önbellekli girdi fiyatından, kalanı normal
+    girdi fiyatından ücretlendirilir; Batch API yanıtlarına fiyat çarpanı uygulanır.
+    """
+    pricing = pricing or get_pricing_config()
+    cost = (
+        (prompt_tokens - cached_tokens) * pricing["input_per_1m"]
+        + cached_tokens * pricing["cached_input_per_1m"]
+        + completion_tokens * pricing["output_per_1m"]
+    ) / 1_000_000
+    return cost * pricing["batch_api_factor"] if batch_api else cost
+
+class CostLedger:
+    """Çağrı bazlı token / süre / maliyet defteri"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        estimate_runs: Optional[int] = None
+    ):
+        """
+        Args:
+            path: Defter SQLite dosyası (None ise COST_LEDGER_PATH)
+            enabled: Kayıt açık mı (None ise COST_LEDGER_ENABLED)
+            estimate_runs: Tahminde kullanılacak son çalıştırma sayısı (None ise COST_ESTIMATE_RUNS)
+        """
+        config = get_cost_ledger_config()
+        self.path = path or config["path"]
+        self.enabled = config["enabled"] if enabled is None else enabled
+        self.estimate_runs = estimate_runs or config["estimate_runs"]
+        self.run_id: Optional[str] = None
+        self._tracker: Optional[UsageTracker] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def start_run(self, run_id: str, tracker: Optional[UsageTracker] = None):
+        """
+        Çalıştırmanın çağrılarını kaydetmeye başla.
+
+        Args:
+            run_id: Çalıştırma kimliği
+            tracker: Kayıtların alınacağı izleyici (None ise paylaşılan izleyici)
+        """
+        if not self.enabled:
+            return
+        self.stop_run()
+        self.run_id = run_id
+        self._tracker = tracker or get_shared_usage_tracker()
+        self._tracker.add_hook(self._on_usage)
+
+    def stop_run(self):
+        """Kaydı durdur (run_id özet için korunur)"""
+        if self._tracker is not None:
+            self._tracker.remove_hook(self._on_usage)
+            self._tracker = None
+
+    def _on_usage(self, record: Dict[str, Any]):
+        """UsageTracker hook'u: kaydı geçerli çalıştırmaya yaz"""
+        if self.run_id is not None:
+            self.record(self.run_id, record)
+
+    def record(self, run_id: str, record: Dict[str, Any]):
+        """
+        Bir çağrının kullanım kaydını deftere yaz.
+
+        Args:
+            run_id: Çalıştırma kimliği
+            record: usage_record çıktısı (token, süre, yeniden deneme ve bağlam alanları)
+        """
+        cost = call_cost(
+            record["prompt_tokens"], record["cached_tokens"], record["completion_tokens"],
+            batch_api=record.get("batch_api", False)
+        )
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                """
+                INSERT INTO llm_calls (
+                    run_id, role, difficulty, category, question_count, call_site, model,
+                    prompt_tokens, cached_tokens, completion_tokens, latency, retries,
+                    batch_api, cost, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    run_id, record.get("role"), record.get("difficulty"), record.get("category"),
+                    record.get("question_count"), record.get("call_site") or "other", record.get("model"),
+                    record["prompt_tokens"], record["cached_tokens"], record["completion_tokens"],
+                    record.get("latency"), record.get("retries", 0), int(bool(record.get("batch_api"))),
+                    cost, time.time()
+                )
+            )
+            conn.commit()
+
+    def run_summary(self, run_id: str) -> Dict[str, Any]:
+        """
+        Çalıştırmanın toplamları ve rol/katsayı/kategori kırılımı.
+
+        Returns:
+            dict: totals (calls, prompt/cached/completion token, latency, retries, cost)
+                ve rows (role, difficulty, category bazında aynı alanlar)
+        """
+        columns = """
+            COUNT(*) AS calls,
+            COALESCE(SUM(prompt_tokens), 0) AS prompt_tokens,
+            COALESCE(SUM(cached_tokens), 0) AS cached_tokens,
+            COALESCE(SUM(completion_tokens), 0) AS completion_tokens,
+            COALESCE(SUM(latency), 0) AS latency,
+            COALESCE(SUM(retries), 0) AS retries,
+            COALESCE(SUM(cost), 0) AS cost
+        """
+        with self._lock:
+            conn = self._connection()
+            totals = conn.execute(f"SELECT {columns} FROM llm_calls WHERE run_id = ?", (run_id,)).fetchone()
+            rows = conn.execute(
+                f"""
+                SELECT role, difficulty, category, {columns}
+                FROM llm_calls WHERE run_id = ?
+                GROUP BY role, difficulty, category
+                ORDER BY role, difficulty, category
+                """,
+                (run_id,)
+            ).fetchall()
+        return {"run_id": run_id, "totals": dict(totals), "rows": [dict(row) for row in rows]}
+
+    def _category_history(self) -> Dict[str, Dict[str, float]]:
+        """
+        Son çalıştırmalardan kategori başına ortalamalar.
+
+        Returns:
+            dict: {kategori: calls_per_unit, prompt_per_call, cached_per_call,
+                completion_per_question, seconds_per_question, calls}
+        """
+        with self._lock:
+            conn = self._connection()
+            recent = """
+                SELECT run_id FROM llm_calls GROUP BY run_id
+                ORDER BY MAX(created_at) DESC LIMIT ?
+            """
+            calls = conn.execute(
+                f"""
+                SELECT category,
+                       COUNT(*) AS calls,
+                       SUM(prompt_tokens) AS prompt_tokens,
+                       SUM(cached_tokens) AS cached_tokens,
+                       SUM(completion_tokens) AS completion_tokens,
+                       SUM(latency) AS latency,
+                       SUM(CASE WHEN latency IS NOT NULL THEN question_count ELSE 0 END) AS timed_questions
+                FROM llm_calls
+                WHERE category IS NOT NULL AND question_count > 0 AND run_id IN ({recent})
+                GROUP BY category
+                """,
+                (self.estimate_runs,)
+            ).fetchall()
+            units = conn.execute(
+                f"""
+                SELECT category, COUNT(*) AS units, SUM(question_count) AS questions
+                FROM (
+                    SELECT DISTINCT run_id, role, difficulty, category, question_count
+                    FROM llm_calls
+                    WHERE category IS NOT NULL AND question_count > 0 AND run_id IN ({recent})
+                )
+                GROUP BY category
+                """,
+                (self.estimate_runs,)
+            ).fetchall()
+
+        unit_stats = {row["category"]: row for row in units}
+        history = {}
+        for row in calls:
+            unit_row = unit_stats.get(row["category"])
+            if unit_row is None or not unit_row["questions"]:
+                continue
+            history[row["category"]] = {
+                "calls": row["calls"],
+                "calls_per_unit": row["calls"] / unit_row["units"],
+                "prompt_per_call": row["prompt_tokens"] / row["calls"],
+                "cached_per_call": row["cached_tokens"] / row["calls"],
+                # Çağrı başına token birim boyutuyla ölçeklenir; soru başına normalize edilir
+                "completion_per_question": row["completion_tokens"] / unit_row["questions"],
+                "seconds_per_question": (
+                    row["latency"] / row["timed_questions"] if row["timed_questions"] else None
+                )
+            }
+        return history
+
+    def estimate(
+        self,
+        units: List[Dict[str, int]],
+        concurrency: int = 1,
+        batch_api: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Plan için çağrı, token, süre ve maliyet tahmini.
+
+        Args:
+            units: Rol/katsayı birimi başına {kategori_kodu: soru_sayısı}
+            concurrency: Aynı anda çalışacak birim sayısı
+            batch_api: Batch API fiyatı uygulansın mı
+
+        Returns:
+            dict: calls, prompt_tokens, cached_tokens, completion_tokens, cost,
+                seconds (duvar saati), history_calls (tahmini besleyen geçmiş çağrı
+                sayısı), calibrated (geçmişi olan kategoriler)
+        """
+        try:
+            history = self._category_history()
+        except sqlite3.Error as e:
+            logger.warning(f"Maliyet geçmişi okunamadı, varsayılanlar kullanılıyor: {e}")
+            history = {}
+
+        totals = {"calls": 0.0, "prompt_tokens": 0.0, "cached_tokens": 0.0, "completion_tokens": 0.0}
+        seconds = 0.0
+        for unit in units:
+            for category, question_count in unit.items():
+                if question_count <= 0:
+                    continue
+                stats = history.get(category)
+                if stats is None:
+                    calls = DEFAULT_CALLS_PER_UNIT.get(category, 1.0)
+                    prompt_tokens = calls * DEFAULT_PROMPT_TOKENS_PER_CALL
+                    cached_tokens = 0.0
+                    completion_tokens = question_count * DEFAULT_COMPLETION_TOKENS_PER_QUESTION
+                    seconds_per_question = DEFAULT_SECONDS_PER_QUESTION
+                else:
+                    calls = stats["calls_per_unit"]
+                    prompt_tokens = calls * stats["prompt_per_call"]
+                    cached_tokens = calls * stats["cached_per_call"]
+                    completion_tokens = question_count * stats["completion_per_question"]
+                    seconds_per_question = stats["seconds_per_question"] or DEFAULT_SECONDS_PER_QUESTION
+                totals["calls"] += calls
+                totals["prompt_tokens"] += prompt_tokens
+                totals["cached_tokens"] += cached_tokens
+                totals["completion_tokens"] += completion_tokens
+                seconds += question_count * seconds_per_question
+
+        parallel = max(1, min(concurrency, len(units)))
+        return {
+            **{key: round(value) for key, value in totals.items()},
+            "cost": call_cost(
+                totals["prompt_tokens"], totals["cached_tokens"], totals["completion_tokens"],
+                batch_api=batch_api
+            ),
+            "seconds": seconds / parallel,
+            "history_calls": sum(stats["calls"] for stats in history.values()),
+            "calibrated": sorted(history)
+        }
+
+    def close(self):
+        """Kaydı durdur ve SQLite bağlantısını kapat"""
+        self.stop_run()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+_shared_ledger: Optional[CostLedger] = None
+_shared_ledger_lock = threading.Lock()
+
+def get_shared_cost_ledger() -> CostLedger:
+    """Paylaşılan maliyet defterini döndür (yoksa ayarlardan oluştur)"""
+    global _shared_ledger
+    with _shared_ledger_lock:
+        if _shared_ledger is None:
+            _shared_ledger = CostLedger()
+        return _shared_ledger
@@ -9,8 +9,11 @@ from typing import Dict, List, Any
 from config.rubric_system import (
     get_difficulty_distribution_by_multiplier,
     RUBRIC_LEVELS,
+    RUBRIC_LEVEL_KEYWORDS,
+    DEFAULT_RUBRIC_LEVEL,
     DIFFICULTY_LABELS
 )
+from utils.text_normalization import turkish_lower
 
 class DifficultyManager:
     """Zorluk seviyesi yönetim sınıfı"""
@@ -91,6 +94,23 @@ class DifficultyManager:
         
         return question_counts
     
+    @staticmethod
+    def classify_question_level(question_text: str) -> str:
+        """
+        Seviye etiketi olmayan bir sorunun K1-K5 rübrik seviyesini metinden tahmin et.
+        
+        Args:
+            question_text (str): Soru metni
+            
+        Returns:
+            str: Rübrik seviyesi (ör. "K3_Hata_Cozumleme")
+        """
+        text = turkish_lower(question_text)
+        for level, keywords in RUBRIC_LEVEL_KEYWORDS.items():
+            if any(keyword in text for keyword in keywords):
+                return level
+        return DEFAULT_RUBRIC_LEVEL
+    
     @staticmethod
     def validate_difficulty_requirements(
         role_code: str, 
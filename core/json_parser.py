@@ -8,9 +8,16 @@ Diğer projeden adapte edilmiş gelişmiş regex temizleme mekanizmaları.
 
 import json
 import logging
-import re
 from typing import Dict, Any
 
+from core.patterns import (
+    JSON_FENCE_OBJECT,
+    KEYWORDS_FORMAT_1,
+    KEYWORDS_FORMAT_2,
+    KEYWORDS_FORMAT_4,
+    KEYWORDS_FORMAT_5,
+)
+
 logger = logging.getLogger(__name__)
 
 def extract_question_data(generated_text: str) -> Dict[str, Any]:
@@ -27,7 +34,7 @@ def extract_question_data(generated_text: str) -> Dict[str, Any]:
         # ```json { ... } ``` formatını temizle
         if '```json' in cleaned_text and '```' in cleaned_text:
             # Regex ile ```json ile ``` arasındaki kısmı çıkar
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', cleaned_text, re.DOTALL)
+            json_match = JSON_FENCE_OBJECT.search(cleaned_text)
             if json_match:
                 cleaned_text = json_match.group(1).strip()
         elif cleaned_text.startswith('```json'):
@@ -54,30 +61,26 @@ def extract_question_data(generated_text: str) -> Dict[str, Any]:
         # AI'ın ürettiği en yaygın hatalı formatları yakala ve düzelt:
         
         # Format 1: "expected_answer": "text", "\n\nAnahtar kelimeler: words" }
-        pattern1 = r'("expected_answer":\s*"[^"]*"),\s*"(\\n\\nAnahtar kelimeler:[^"]*)"(\s*\})'
-        if re.search(pattern1, cleaned_text):
-            cleaned_text = re.sub(pattern1, r'\1\2"\3', cleaned_text)
+        if KEYWORDS_FORMAT_1.search(cleaned_text):
+            cleaned_text = KEYWORDS_FORMAT_1.sub(r'\1\2"\3', cleaned_text)
             logger.info("JSON Format 1 düzeltildi")
         
         # Format 2: "text", "\n\nAnahtar kelimeler: words" 
-        pattern2 = r'",\s*"(\\n\\nAnahtar kelimeler:[^"]*)"'
-        if re.search(pattern2, cleaned_text):
-            cleaned_text = re.sub(pattern2, r'\1"', cleaned_text)
+        if KEYWORDS_FORMAT_2.search(cleaned_text):
+            cleaned_text = KEYWORDS_FORMAT_2.sub(r'\1"', cleaned_text)
             logger.info("JSON Format 2 düzeltildi")
             
         # Format 3: Çift quotes düzeltme
         cleaned_text = cleaned_text.replace('""', '"')
         
         # Format 4: Anahtar kelimeler için özel düzeltme - yanlış virgül yerleşimi
-        pattern4 = r'",\s*\n\s*"(\\n\\nAnahtar kelimeler:[^"]*)"'
-        if re.search(pattern4, cleaned_text):
-            cleaned_text = re.sub(pattern4, r'\1"', cleaned_text)
+        if KEYWORDS_FORMAT_4.search(cleaned_text):
+            cleaned_text = KEYWORDS_FORMAT_4.sub(r'\1"', cleaned_text)
             logger.info("JSON Format 4 düzeltildi")
             
         # Format 5: Satır sonu ve anahtar kelimeler düzeltmesi
-        pattern5 = r'",\s*\n\s*\n\s*"(\\n\\nAnahtar kelimeler:[^"]*)"'
-        if re.search(pattern5, cleaned_text):
-            cleaned_text = re.sub(pattern5, r'\1"', cleaned_text)
+        if KEYWORDS_FORMAT_5.search(cleaned_text):
+            cleaned_text = KEYWORDS_FORMAT_5.sub(r'\1"', cleaned_text)
             logger.info("JSON Format 5 düzeltildi")
         
         # Eğer JSON formatında geldiyse parse et
@@ -93,7 +96,7 @@ def extract_question_data(generated_text: str) -> Dict[str, Any]:
                 
                 # ```json blokları içindeki nested JSON'ı temizle
                 if '```json' in question_text:
-                    json_match = re.search(r'```json\s*(\{.*?\})\s*```', question_text, re.DOTALL)
+                    json_match = JSON_FENCE_OBJECT.search(question_text)
                     if json_match:
                         question_text = json_match.group(1).strip()
                 
@@ -103,8 +106,8 @@ def extract_question_data(generated_text: str) -> Dict[str, Any]:
                         # JSON temizleme işlemleri
                         clean_question = question_text
                         # Anahtar kelimeler kısmını düzelt
-                        clean_question = re.sub(r'",\s*\n\s*"(\\n\\nAnahtar kelimeler:[^"]*)"', r'\1"', clean_question)
-                        clean_question = re.sub(r'",\s*"(\\n\\nAnahtar kelimeler:[^"]*)"', r'\1"', clean_question)
+                        clean_question = KEYWORDS_FORMAT_4.sub(r'\1"', clean_question)
+                        clean_question = KEYWORDS_FORMAT_2.sub(r'\1"', clean_question)
                         
                         nested_json = json.loads(clean_question)
                         question_text = nested_json.get('question', question_text)
@@ -0,0 +1,383 @@
+"""
+TEK GEÇİŞLİ TOLERANSLI JSON TARAYICI
+====================================
+
+Model yanıtını tek doğrusal taramada çözer ve uyguladığı onarımları raporlar.
+Eski çok stratejili zincirin (direkt parse → markdown temizleme → regex →
+nested → corrupted repair → fallback) her adımda metni baştan taramasının
+yerine geçer.
+
+Tolere edilen hatalar:
+- markdown_fence / leading_text: ```json blokları ve dizi öncesi açıklama
+- trailing_comma / extra_comma / missing_comma: virgül hataları
+- control_characters: string içinde kaçışsız satır sonu/tab
+- unescaped_quote: string içinde kaçışsız çift tırnak
+- invalid_escape: geçersiz ters eğik çizgi kaçışları (ör. regex kodu)
+- truncated: yarıda kesilmiş yanıt (tamamlanmamış son nesne atılır)
+- unbalanced_brace: eşleşmeyen kapanış (dizide "}", "}" yerine "]" veya
+  "}" unutulup yeni nesneye geçilmesi)
+- missing_value: değeri olmayan üye ({"question": })
+- wrapped_object: {"questions": [...]} sarmalı
+- nested_string_array: question alanına (veya tüm yanıta) string olarak gömülmüş dizi
+"""
+
+import json
+import logging
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_ROOT_START = re.compile(r'[\[{]')
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_LITERALS = (("true", True), ("false", False), ("null", None))
+_STRING_TERMINATORS = frozenset(':}]')
+_VALUE_STARTS = frozenset('"{[]}-0123456789tfn')
+_CONTROL_CHARS = re.compile(r'[\x00-\x1f]')
+_NESTED_ARRAY_HINT = re.compile(r'\[\s*\{')
+
+class _Truncated(Exception):
+    """Metin bir değerin ortasında bitti; partial o ana kadar tamamlanan kapsayıcı"""
+
+    def __init__(self, partial: Any = None):
+        super().__init__()
+        self.partial = partial
+
+class TolerantJSONScanner:
+    """Bozuk model çıktılarını tek geçişte çözen toleranslı JSON tarayıcı"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text)
+        self.pos = 0
+        self.repairs: List[str] = []
+
+    def _repair(self, name: str):
+        if name not in self.repairs:
+            self.repairs.append(name)
+
+    def _skip_ws(self) -> int:
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        return self.pos
+
+    def _peek(self) -> str:
+        self._skip_ws()
+        if self.pos >= self.length:
+            raise _Truncated()
+        return self.text[self.pos]
+
+    def scan(self) -> Dict[str, Any]:
+        """
+        Metni tara.
+
+        Returns:
+            dict: questions (ham soru sözlükleri), repairs, complete, error
+        """
+        match = _ROOT_START.search(self.text)
+        if match is None:
+            return self._result([], complete=False, error="JSON başlangıcı bulunamadı")
+
+        prefix = self.text[:match.start()]
+        self.pos = match.start()
+
+        # Tüm yanıt bir JSON string'i ise ("[{\"question\"...}]") kök dizi string içindedir
+        if prefix.rstrip().endswith('"') and self.text[match.start()] == "[":
+            self.pos = prefix.rstrip().rfind('"')
+            prefix = prefix[:self.pos]
+
+        if "```" in prefix:
+            self._repair("markdown_fence")
+        elif prefix.strip():
+            self._repair("leading_text")
+
+        # Hızlı yol: kök bölge zaten geçerli JSON ise C parser'ı tek seferde çözer
+        root = self._try_strict_root()
+        if root is not None:
+            return self._result(self._questions_from(root), complete=True)
+
+        complete = True
+        try:
+            root = self._value()
+        except _Truncated as truncated:
+            self._repair("truncated")
+            root = truncated.partial
+            complete = False
+
+        return self._result(self._questions_from(root), complete=complete)
+
+    def _try_strict_root(self) -> Any:
+        """Kök başlangıcından son kapanışa kadarki bölgeyi standart json ile dene"""
+        closing = "]" if self.text[self.pos] == "[" else "}"
+        end = self.text.rfind(closing)
+        if end <= self.pos:
+            return None
+        try:
+            return json.loads(self.text[self.pos:end + 1])
+        except json.JSONDecodeError:
+            return None
+
+    def _result(self, questions: List[Dict[str, Any]], complete: bool, error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "questions": questions,
+            "repairs": list(self.repairs),
+            "complete": complete,
+            "error": error
+        }
+
+    def _questions_from(self, root: Any) -> List[Dict[str, Any]]:
+        """Kök değerden soru sözlüklerini çıkar (sarmal ve gömülü dizileri aç)"""
+        if isinstance(root, str):
+            return self._nested_questions(root)
+
+        if isinstance(root, dict):
+            if isinstance(root.get("questions"), list):
+                self._repair("wrapped_object")
+                return self._questions_from(root["questions"])
+            if "question" in root:
+                nested = self._nested_questions(root.get("question"))
+                return nested or [root]
+            return []
+
+        if isinstance(root, list):
+            questions = []
+            for item in root:
+                if isinstance(item, dict) and "question" in item:
+                    questions.append(item)
+                elif isinstance(item, str):
+                    questions.extend(self._nested_questions(item))
+            return questions
+
+        return []
+
+    def _nested_questions(self, value: Any) -> List[Dict[str, Any]]:
+        """String içine gömülmüş JSON soru dizisini çöz"""
+        if not isinstance(value, str) or not _NESTED_ARRAY_HINT.search(value):
+            return []
+        nested = TolerantJSONScanner(value).scan()
+        if nested["questions"]:
+            self._repair("nested_string_array")
+            for repair in nested["repairs"]:
+                self._repair(repair)
+        return nested["questions"]
+
+    def _value(self) -> Any:
+        char = self._peek()
+        if char == "{":
+            return self._object()
+        if char == "[":
+            return self._array()
+        if char == '"':
+            return self._string()
+
+        for literal, value in _LITERALS:
+            if self.text.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            number = match.group()
+            return float(number) if any(c in number for c in ".eE") else int(number)
+
+        # Tanınmayan karakter: yapısal bir karaktere kadar düz metin olarak al
+        start = self.pos
+        while self.pos < self.length and self.text[self.pos] not in ',}]\n':
+            self.pos += 1
+        if self.pos == start:
+            # Yapısal karakterde en az bir karakter tüketilir; aksi halde çağıran döngü ilerlemez
+            self.pos += 1
+            return ""
+        return self.text[start:self.pos].strip()
+
+    def _object(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        self.pos += 1
+        try:
+            return self._object_members(result)
+        except _Truncated:
+            raise _Truncated(result) from None
+
+    def _object_members(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        expect_member = True
+        comma_pos = -1
+
+        while True:
+            char = self._peek()
+            if char == "}":
+                self.pos += 1
+                if expect_member and result:
+                    self._repair("trailing_comma")
+                return result
+            if char == ",":
+                comma_pos = self.pos
+                self.pos += 1
+                if expect_member:
+                    self._repair("extra_comma")
+                expect_member = True
+                continue
+            if char in "]{":
+                # "}" eksik: nesne dizi kapanışında veya yeni nesne başında biter;
+                # karakter tüketilmez, dizi kendisi işler (son virgül de diziye aittir)
+                self._repair("unbalanced_brace")
+                if expect_member and comma_pos >= 0:
+                    self.pos = comma_pos
+                return result
+            if not expect_member:
+                self._repair("missing_comma")
+
+            if char == '"':
+                key = self._string()
+            else:
+                key = str(self._value())
+
+            if self._peek() == ":":
+                self.pos += 1
+            else:
+                self._repair("missing_colon")
+
+            if self._peek() in ",}]":
+                self._repair("missing_value")
+                result[key] = ""
+                expect_member = False
+                continue
+
+            try:
+                result[key] = self._value()
+            except _Truncated as truncated:
+                # Yarım kalan kapsayıcı değer ({"questions": [...) korunur
+                if isinstance(truncated.partial, (list, dict)):
+                    result[key] = truncated.partial
+                raise
+            expect_member = False
+
+    def _array(self) -> List[Any]:
+        result: List[Any] = []
+        self.pos += 1
+        try:
+            return self._array_items(result)
+        except _Truncated:
+            # Tamamlanmamış son eleman atılır; öncekiler korunur
+            raise _Truncated(result) from None
+
+    def _array_items(self, result: List[Any]) -> List[Any]:
+        expect_item = True
+
+        while True:
+            char = self._peek()
+            if char == "]":
+                self.pos += 1
+                if expect_item and result:
+                    self._repair("trailing_comma")
+                return result
+            if char == ",":
+                self.pos += 1
+                if expect_item:
+                    self._repair("extra_comma")
+                expect_item = True
+                continue
+            if char == "}":
+                # Dizi içinde eşleşmeyen kapanış
+                self.pos += 1
+                self._repair("unbalanced_brace")
+                continue
+            if not expect_item:
+                self._repair("missing_comma")
+
+            result.append(self._value())
+            expect_item = False
+
+    def _string(self) -> str:
+        """String'i çöz; kaçışsız iç tırnak ve kontrol karakterlerini onar"""
+        parts = []
+        start = self.pos + 1
+        while True:
+            value, end = self._scan_string_segment(start)
+            parts.append(value)
+
+            if self._is_string_end(end):
+                self.pos = end
+                return '"'.join(parts)
+
+            # Kapanış değil: kaçışsız iç tırnak
+            self._repair("unescaped_quote")
+            start = end
+
+    def _is_string_end(self, end: int) -> bool:
+        """Tırnaktan sonra gelen karakterlere bakarak gerçek kapanış olup olmadığına karar ver"""
+        after = _WHITESPACE.match(self.text, end).end()
+        if after >= self.length:
+            return True
+
+        char = self.text[after]
+        if char == ",":
+            # Virgülden sonra yeni bir JSON değeri/anahtarı gelmeli ("say "hi", ok" değil)
+            following = _WHITESPACE.match(self.text, after + 1).end()
+            return following >= self.length or self.text[following] in _VALUE_STARTS
+        if char in _STRING_TERMINATORS:
+            return True
+        if char == '"':
+            # Virgülü unutulmuş bir sonraki anahtar: "...". "key":
+            closing = self.text.find('"', after + 1)
+            if closing == -1:
+                return False
+            following = _WHITESPACE.match(self.text, closing + 1).end()
+            return following < self.length and self.text[following] == ":"
+        return False
+
+    def _scan_string_segment(self, start: int) -> Tuple[str, int]:
+        """Açılış tırnağından sonraki konumdan kapanış tırnağına kadar çöz"""
+        try:
+            value, end = scanstring(self.text, start, False)
+        except json.JSONDecodeError as error:
+            if error.msg.startswith("Unterminated"):
+                raise _Truncated()
+            self._repair("invalid_escape")
+            return self._scan_string_lenient(start)
+
+        if _CONTROL_CHARS.search(value) and _CONTROL_CHARS.search(self.text, start, end):
+            self._repair("control_characters")
+        return value, end
+
+    def _scan_string_lenient(self, start: int) -> Tuple[str, int]:
+        """Geçersiz kaçışları düz metin kabul eden yavaş yol"""
+        chars = []
+        pos = start
+        while pos < self.length:
+            char = self.text[pos]
+            if char == '"':
+                return "".join(chars), pos + 1
+            if char == "\\" and pos + 1 < self.length:
+                is_unicode = self.text[pos + 1] == "u"
+                escape = self.text[pos:pos + (6 if is_unicode else 2)]
+                if not (is_unicode and '"' in escape):
+                    try:
+                        chars.append(scanstring('"' + escape + '"', 1, False)[0])
+                        pos += len(escape)
+                        continue
+                    except json.JSONDecodeError:
+                        pass
+                # Geçersiz kaçış: ters eğik çizgi düz metin olarak kalır
+                chars.append(char)
+                pos += 1
+                continue
+            chars.append(char)
+            pos += 1
+        raise _Truncated()
+
+def scan_questions(text: str) -> Dict[str, Any]:
+    """
+    Model çıktısındaki soru nesnelerini tek geçişte çıkar.
+
+    Args:
+        text: Ham model yanıtı
+
+    Returns:
+        dict: questions (ham sözlükler), repairs (uygulanan onarımlar),
+            complete (metin yarıda kesilmedi mi), error
+    """
+    if not text or not text.strip():
+        return {"questions": [], "repairs": [], "complete": False, "error": "Boş yanıt"}
+    return TolerantJSONScanner(text).scan()
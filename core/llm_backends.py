@@ -0,0 +1,391 @@
+"""
+LLM BACKEND'LERİ
+================
+
+Soru üreticileri modele tek bir arayüz üzerinden erişir:
+
+    complete(messages, params)           -> (metin, usage)
+    stream(messages, params, on_delta)   -> usage
+    acomplete / astream                  (asyncio karşılıkları)
+
+`params` chat.completions parametreleridir (model, max_tokens, temperature,
+response_format ...; messages ve stream hariç). `usage` OpenAI biçiminde
+sözlüktür (prompt_tokens, completion_tokens, total_tokens,
+prompt_tokens_details.cached_tokens) veya yoksa None.
+
+Backend'ler (LLM_BACKEND):
+    openai  openai SDK'sı (varsayılan)
+    http    SDK'sız OpenAI uyumlu HTTP istemcisi (yerel vLLM / llama.cpp / sahte sunucu)
+    fake    ağ kullanmayan, deterministik sahte model; geçerli veya kasıtlı bozuk
+            soru dizileri üretir, gecikme ayarlanabilir (yük testleri için)
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from config.openai_settings import get_llm_backend_config
+
+# Akış yanıtlarında son parçada usage istenir (prompt önbelleği ölçümü için)
+STREAM_USAGE_OPTIONS = {"stream_options": {"include_usage": True}}
+
+LLM_BACKENDS = ("openai", "http", "fake")
+
+Messages = List[Dict[str, str]]
+Usage = Optional[Dict[str, Any]]
+
+def usage_to_dict(usage: Any) -> Usage:
+    """SDK usage nesnesini (veya sözlüğü) düz sözlüğe çevir"""
+    if usage is None or isinstance(usage, dict):
+        return usage
+    if hasattr(usage, "model_dump"):
+        return usage.model_dump()
+    return usage.dict()
+
+class LLMBackend:
+    """Backend arayüzü; async metotlar varsayılan olarak senkron metodu thread'de çalıştırır"""
+
+    name = "base"
+
+    def complete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        """İsteği gönder, (yanıt metni, usage) döndür"""
+        raise NotImplementedError
+
+    def stream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        """İsteği akış olarak gönder, her metin parçasını on_delta'ya ilet, usage döndür"""
+        text, usage = self.complete(messages, params)
+        on_delta(text)
+        return usage
+
+    async def acomplete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        """complete'in asyncio karşılığı"""
+        return await asyncio.to_thread(self.complete, messages, params)
+
+    async def astream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        """stream'in asyncio karşılığı"""
+        text, usage = await self.acomplete(messages, params)
+        on_delta(text)
+        return usage
+
+class OpenAIBackend(LLMBackend):
+    """openai SDK'sı üzerinden backend (senkron ve/veya async client)"""
+
+    name = "openai"
+
+    def __init__(self, client=None, async_client=None):
+        """
+        Args:
+            client: openai.OpenAI (senkron çağrılar için)
+            async_client: openai.AsyncOpenAI (async çağrılar için)
+        """
+        self.client = client
+        self.async_client = async_client
+
+    def complete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        response = self.client.chat.completions.create(messages=messages, **params)
+        return response.choices[0].message.content or "", usage_to_dict(getattr(response, "usage", None))
+
+    def stream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        usage = None
+        stream = self.client.chat.completions.create(
+            messages=messages, stream=True, extra_body=STREAM_USAGE_OPTIONS, **params
+        )
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                on_delta(delta)
+        return usage_to_dict(usage)
+
+    async def acomplete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        response = await self.async_client.chat.completions.create(messages=messages, **params)
+        return response.choices[0].message.content or "", usage_to_dict(getattr(response, "usage", None))
+
+    async def astream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        usage = None
+        stream = await self.async_client.chat.completions.create(
+            messages=messages, stream=True, extra_body=STREAM_USAGE_OPTIONS, **params
+        )
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                on_delta(delta)
+        return usage_to_dict(usage)
+
+class HTTPBackend(LLMBackend):
+    """
+    SDK'sız OpenAI uyumlu HTTP backend'i (/chat/completions).
+
+    HTTP hataları yanıtı taşıyan istisna olarak fırlatılır; rate limiter
+    status_code ve Retry-After başlığını buradan okur. Bağlantı / zaman aşımı
+    hataları yerleşik ConnectionError / TimeoutError'a çevrilir (geçici hata).
+    """
+
+    name = "http"
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            base_url: API kök adresi (None ise LLM_HTTP_BASE_URL)
+            api_key: Bearer anahtarı (None ise LLM_HTTP_API_KEY / OPENAI_API_KEY, yoksa gönderilmez)
+            timeout: İstek zaman aşımı (None ise OPENAI_TIMEOUT)
+        """
+        config = get_llm_backend_config()
+        self.url = (base_url or config["http_base_url"]).rstrip("/") + "/chat/completions"
+        self.timeout = timeout or config["timeout"]
+        api_key = api_key or config["http_api_key"]
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.session = requests.Session()
+        self._async_client = None
+
+    def complete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        try:
+            response = self.session.post(
+                self.url, json={**params, "messages": messages}, headers=self.headers, timeout=self.timeout
+            )
+        except requests.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+        response.raise_for_status()
+        body = response.json()
+        return body["choices"][0]["message"]["content"] or "", body.get("usage")
+
+    def stream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        payload = {**params, **STREAM_USAGE_OPTIONS, "messages": messages, "stream": True}
+        try:
+            response = self.session.post(self.url, json=payload, headers=self.headers, timeout=self.timeout, stream=True)
+        except requests.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+        usage = None
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                done, event_usage = self._handle_event(line, on_delta)
+                usage = event_usage or usage
+                if done:
+                    break
+        return usage
+
+    async def acomplete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        import httpx
+
+        try:
+            response = await self._client().post(self.url, json={**params, "messages": messages}, headers=self.headers)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        response.raise_for_status()
+        body = response.json()
+        return body["choices"][0]["message"]["content"] or "", body.get("usage")
+
+    async def astream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        import httpx
+
+        payload = {**params, **STREAM_USAGE_OPTIONS, "messages": messages, "stream": True}
+        usage = None
+        try:
+            async with self._client().stream("POST", self.url, json=payload, headers=self.headers) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    done, event_usage = self._handle_event(line, on_delta)
+                    usage = event_usage or usage
+                    if done:
+                        break
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        return usage
+
+    def _client(self):
+        """Async istekler için httpx client'ı (ilk kullanımda oluşturulur)"""
+        if self._async_client is None:
+            import httpx
+
+            self._async_client = httpx.AsyncClient(timeout=self.timeout)
+        return self._async_client
+
+    @staticmethod
+    def _handle_event(line: str, on_delta: Callable[[str], None]) -> Tuple[bool, Usage]:
+        """
+        Tek SSE satırını işle: metin parçasını on_delta'ya ilet.
+
+        Returns:
+            tuple: (akış bitti mi, satırdaki usage)
+        """
+        if not line or not line.startswith("data:"):
+            return False, None
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return True, None
+        event = json.loads(data)
+        choices = event.get("choices") or []
+        delta = (choices[0].get("delta") or {}).get("content") if choices else None
+        if delta:
+            on_delta(delta)
+        return False, event.get("usage")
+
+# Sahte modelin bozuk yanıt türleri
+FAKE_MALFORMATIONS = ("markdown_fence", "trailing_comma", "prose_prefix", "truncated", "garbage")
+
+_FAKE_TOPICS = (
+    "DNS", "LVM", "Docker", "Kubernetes", "PostgreSQL", "Redis", "Nginx", "TLS", "OAuth", "LDAP",
+    "Git", "CI/CD", "Kafka", "RabbitMQ", "Elasticsearch", "Terraform", "Ansible", "SELinux",
+    "systemd", "iptables", "VLAN", "BGP", "RAID", "ZFS", "gRPC", "GraphQL", "REST", "JWT",
+    "Entity Framework", "LINQ", "async/await", "GC", "thread pool", "indeks", "transaction",
+    "replikasyon", "sharding", "önbellek", "yük dengeleme", "gözlemlenebilirlik"
+)
+
+_FAKE_ASPECTS = (
+    "temel farkı", "tipik kullanım senaryosu", "performans etkisi", "güvenlik riski",
+    "yapılandırma adımları", "hata ayıklama yaklaşımı", "ölçeklenme sınırı", "izleme metrikleri",
+    "yedekleme stratejisi", "sık yapılan yanlışı"
+)
+
+class FakeBackend(LLMBackend):
+    """
+    Ağ kullanmayan deterministik sahte model.
+
+    Prompt'taki "N adet" ifadesinden istenen soru sayısını, sonekten
+    kategoriyi (kod / kodsuz) çıkarır ve aynı tohum + prompt + tekrar sırası
+    için her zaman aynı yanıtı üretir. malformed_rate oranındaki yanıtlar
+    FAKE_MALFORMATIONS türlerinden biriyle bozulur; response_format şeması
+    istenirse yanıt {"questions": [...]} olarak sarılır.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: Optional[float] = None, malformed_rate: Optional[float] = None, seed: Optional[int] = None):
+        """
+        Args:
+            latency: Yanıt başına gecikme (sn, None ise LLM_FAKE_LATENCY)
+            malformed_rate: Bozuk yanıt oranı 0-1 (None ise LLM_FAKE_MALFORMED_RATE)
+            seed: Tohum (None ise LLM_FAKE_SEED)
+        """
+        config = get_llm_backend_config()
+        self.latency = config["fake_latency"] if latency is None else latency
+        self.malformed_rate = config["fake_malformed_rate"] if malformed_rate is None else malformed_rate
+        self.seed = config["fake_seed"] if seed is None else seed
+        self.calls = 0
+        self._repeats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rng(self, messages: Messages) -> random.Random:
+        """Prompt ve aynı prompt'un kaçıncı kez istendiğine bağlı deterministik üreteç"""
+        digest = hashlib.sha1("\x00".join(m["content"] for m in messages).encode("utf-8")).hexdigest()
+        with self._lock:
+            self.calls += 1
+            repeat = self._repeats.get(digest, 0)
+            self._repeats[digest] = repeat + 1
+        return random.Random(f"{self.seed}:{digest}:{repeat}")
+
+    def render(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        """Gecikme uygulamadan yanıt metnini ve usage'ı üret"""
+        rng = self._rng(messages)
+        prompt = messages[-1]["content"]
+        match = re.search(r"(\d+) adet", prompt)
+        count = int(match.group(1)) if match else 3
+        suffix = prompt.split("Kategori:", 1)[-1]
+        with_code = "KOD İÇERMEYEN" not in prompt and ("SADECE KOD" in prompt or "Pratik Uygulama" in suffix[:80])
+
+        items = [self._question(rng, index, with_code) for index in range(count)]
+        response_format = params.get("response_format") or {}
+        payload: Any = {"questions": items} if response_format.get("type") == "json_schema" else items
+        text = json.dumps(payload, ensure_ascii=False, indent=2)
+        if rng.random() < self.malformed_rate:
+            text = self._malform(rng, text)
+
+        prompt_tokens = sum(len(m["content"]) for m in messages) // 4
+        completion_tokens = len(text) // 4
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": 0}
+        }
+        return text, usage
+
+    @staticmethod
+    def _question(rng: random.Random, index: int, with_code: bool) -> Dict[str, str]:
+        topic, other = rng.sample(_FAKE_TOPICS, 2)
+        aspect = rng.choice(_FAKE_ASPECTS)
+        marker = rng.randrange(10 ** 6)
+        question = f"{topic} ve {other} birlikte kullanıldığında {aspect} nedir? (#{index + 1}-{marker})"
+        if with_code:
+            limit = rng.randint(2, 9)
+            question += (
+                f"\nint toplam = 0;\nfor (int i = 0; i <= {limit}; i++)\n{{\n"
+                f"    toplam += i * {marker % 7 + 1};\n}}\nConsole.WriteLine(toplam);"
+            )
+        answer = f"{topic} tarafında {aspect} {other} ile etkileşime göre belirlenir; yapılandırma ve izleme birlikte ele alınmalıdır."
+        return {"question": question, "expected_answer": answer}
+
+    @staticmethod
+    def _malform(rng: random.Random, text: str) -> str:
+        """Yanıtı modellerin tipik bozukluklarından biriyle boz"""
+        kind = rng.choice(FAKE_MALFORMATIONS)
+        if kind == "markdown_fence":
+            return "```json\n" + text + "\n```"
+        if kind == "trailing_comma":
+            return text.replace('"\n  }', '",\n  }').replace("}\n]", "},\n]")
+        if kind == "prose_prefix":
+            return "İşte istenen sorular:\n" + text + "\nUmarım yardımcı olur."
+        if kind == "truncated":
+            return text[: max(1, int(len(text) * rng.uniform(0.4, 0.9)))]
+        return "Üzgünüm, bu isteği şu anda yanıtlayamıyorum."
+
+    def complete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return self.render(messages, params)
+
+    def stream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        text, usage = self.render(messages, params)
+        chunks = [text[i:i + 40] for i in range(0, len(text), 40)] or [""]
+        for chunk in chunks:
+            if self.latency > 0:
+                time.sleep(self.latency / len(chunks))
+            on_delta(chunk)
+        return usage
+
+    async def acomplete(self, messages: Messages, params: Dict[str, Any]) -> Tuple[str, Usage]:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self.render(messages, params)
+
+    async def astream(self, messages: Messages, params: Dict[str, Any], on_delta: Callable[[str], None]) -> Usage:
+        text, usage = self.render(messages, params)
+        chunks = [text[i:i + 40] for i in range(0, len(text), 40)] or [""]
+        for chunk in chunks:
+            if self.latency > 0:
+                await asyncio.sleep(self.latency / len(chunks))
+            on_delta(chunk)
+        return usage
+
+def create_llm_backend(name: Optional[str] = None) -> LLMBackend:
+    """
+    SDK client'ı gerektirmeyen backend'i oluştur (http, fake).
+
+    openai backend'i üreticiler tarafından kendi client ayarlarıyla kurulur.
+
+    Raises:
+        ValueError: Bilinmeyen veya burada kurulamayan backend adı
+    """
+    name = name or get_llm_backend_config()["backend"]
+    if name == "http":
+        return HTTPBackend()
+    if name == "fake":
+        return FakeBackend()
+    raise ValueError(f"create_llm_backend ile kurulamayan LLM backend'i: {name} (geçerli: http, fake)")
@@ -0,0 +1,211 @@
+"""
+FAZLA ÜRETİM (OVERGENERATION) PLANLAYICISI
+==========================================
+
+Her rol/kategori için geçmiş çalıştırmalarda gözlenen kabul oranını
+(filtrelerden geçen soru / istenen soru) öğrenir ve hedef sayıya ilk istekte
+ulaşmak için kaç soru isteneceğini planlar. Böylece pratik uygulama
+kategorisindeki ardışık katı mod → kodsuz doldurma turları çoğunlukla
+gereksizleşir.
+
+Kabul oranı düşükse (açık riski yüksekse) katı mod ve kodsuz yedek istekler
+ana istekle AYNI ANDA spekülatif olarak başlatılır; yalnızca açık kalırsa
+kullanılır. Oranlar üstel hareketli ortalama (EMA) ile güncellenip SQLite'a
+yazılır, böylece çarpan çalıştırmalar arasında kendini ayarlar.
+"""
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.generation_settings import get_overgeneration_config
+
+logger = logging.getLogger(__name__)
+
+# Katı mod yedek isteklerinin istatistik anahtarı eki
+STRICT_SUFFIX = ":strict"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS acceptance_stats (
+    role TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    rate REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    requested_total INTEGER NOT NULL,
+    accepted_total INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (role, question_type)
+);
+"""
+
+class OvergenerationPlanner:
+    """Rol/kategori bazlı kabul oranı öğrenen istek boyutu planlayıcısı"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        max_factor: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        speculative_below: Optional[float] = None,
+        smoothing: Optional[float] = None
+    ):
+        """
+        Args:
+            path: İstatistik SQLite dosyası (None ise OVERGENERATION_STATS_PATH)
+            enabled: Planlama açık mı (kapalıysa hedef kadar istenir, oran yine kaydedilir)
+            max_factor: Hedefin en fazla kaç katı istenebilir
+            min_rate: Boyutlandırmada kullanılan kabul oranı tabanı
+            speculative_below: Bu oranın altında yedek istekler ana istekle paralel başlatılır
+            smoothing: Yeni gözlemin EMA ağırlığı (0-1)
+        """
+        config = get_overgeneration_config()
+        self.path = path or config["path"]
+        self.enabled = config["enabled"] if enabled is None else enabled
+        self.max_factor = config["max_factor"] if max_factor is None else max_factor
+        self.min_rate = config["min_rate"] if min_rate is None else min_rate
+        self.speculative_below = config["speculative_below"] if speculative_below is None else speculative_below
+        self.smoothing = config["smoothing"] if smoothing is None else smoothing
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def acceptance_rate(self, role: str, question_type: str) -> Tuple[float, int]:
+        """
+        Öğrenilmiş kabul oranı.
+
+        Returns:
+            tuple: (oran, gözlem sayısı) — gözlem yoksa (1.0, 0)
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT rate, samples FROM acceptance_stats WHERE role = ? AND question_type = ?",
+                (role, question_type)
+            ).fetchone()
+        if row is None:
+            return 1.0, 0
+        return row["rate"], row["samples"]
+
+    def plan(self, role: str, question_type: str, question_count: int) -> Dict[str, Any]:
+        """
+        Bir batch isteğinin boyutunu planla.
+
+        Args:
+            role: Rol adı
+            question_type: Kategori kodu
+            question_count: Hedef soru sayısı
+
+        Returns:
+            dict: request_count (ana istekte istenecek soru), acceptance_rate, samples,
+                speculative (yedekleri paralel başlat), fallback_count (yedek istek boyutu)
+        """
+        rate, samples = self.acceptance_rate(role, question_type)
+        plan = {
+            "request_count": question_count,
+            "acceptance_rate": rate,
+            "samples": samples,
+            "speculative": False,
+            "fallback_count": 0
+        }
+        if not self.enabled or question_count <= 0 or samples == 0:
+            return plan
+
+        sizing_rate = max(rate, self.min_rate)
+        plan["request_count"] = max(
+            question_count,
+            min(math.ceil(question_count / sizing_rate), math.ceil(question_count * self.max_factor))
+        )
+        if rate < self.speculative_below:
+            # Yedek istek boyutu: ana istek hiç fazla üretmeseydi beklenecek açık,
+            # katı modun kendi kabul oranına göre büyütülür
+            strict_rate, _ = self.acceptance_rate(role, question_type + STRICT_SUFFIX)
+            expected_deficit = question_count * (1 - rate)
+            plan["speculative"] = True
+            plan["fallback_count"] = min(
+                question_count,
+                max(1, math.ceil(expected_deficit / max(strict_rate, self.min_rate)))
+            )
+        return plan
+
+    def record(self, role: str, question_type: str, requested: int, accepted: int):
+        """
+        Bir isteğin sonucunu kaydet ve kabul oranını güncelle.
+
+        Args:
+            role: Rol adı
+            question_type: Kategori kodu (katı mod yedekleri için STRICT_SUFFIX ekli)
+            requested: İstenen soru sayısı
+            accepted: Filtrelerden geçen soru sayısı
+        """
+        if requested <= 0:
+            return
+        observed = min(1.0, max(0.0, accepted / requested))
+
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT rate, samples FROM acceptance_stats WHERE role = ? AND question_type = ?",
+                (role, question_type)
+            ).fetchone()
+            if row is None:
+                rate, samples = observed, 1
+            else:
+                rate = (1 - self.smoothing) * row["rate"] + self.smoothing * observed
+                samples = row["samples"] + 1
+            conn.execute(
+                """
+                INSERT INTO acceptance_stats (
+                    role, question_type, rate, samples, requested_total, accepted_total, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(role, question_type) DO UPDATE SET
+                    rate = excluded.rate,
+                    samples = excluded.samples,
+                    requested_total = requested_total + excluded.requested_total,
+                    accepted_total = accepted_total + excluded.accepted_total,
+                    updated_at = excluded.updated_at
+                """,
+                (role, question_type, rate, samples, requested, accepted, time.time())
+            )
+            conn.commit()
+
+        logger.debug(f"Kabul oranı {role}/{question_type}: {accepted}/{requested} → EMA {rate:.2f}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Tüm rol/kategori kabul istatistikleri"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT * FROM acceptance_stats ORDER BY role, question_type"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """SQLite bağlantısını kapat"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Tüm üreticilerin paylaştığı planlayıcı
+_shared_planner: Optional[OvergenerationPlanner] = None
+_shared_planner_lock = threading.Lock()
+
+def get_shared_overgeneration_planner() -> OvergenerationPlanner:
+    """Paylaşılan planlayıcıyı döndür (yoksa ayarlardan oluştur)"""
+    global _shared_planner
+    with _shared_planner_lock:
+        if _shared_planner is None:
+            _shared_planner = OvergenerationPlanner()
+        return _shared_planner
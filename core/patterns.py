@@ -0,0 +1,102 @@
+"""
+DERLENMİŞ REGEX KAYDI
+=====================
+
+Soru üretici, JSON parser ve Word exporter'ın sıcak yollarında kullanılan
+regex'ler modül yüklenirken bir kez derlenir. Kod göstergesi kontrolleri,
+her deseni ayrı ayrı aramak yerine tek bir birleşik alternasyonla yapılır.
+"""
+
+import re
+from typing import Iterable
+
+def combine_patterns(patterns: Iterable[str], flags: int = 0) -> "re.Pattern[str]":
+    """Desen listesini tek bir alternasyonda birleştirip derle (herhangi biri eşleşirse eşleşir)"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+# ---------------------------------------------------------------------------
+# Markdown / JSON blokları
+# ---------------------------------------------------------------------------
+
+JSON_FENCE_ARRAY = re.compile(r'```json\s*(\[.*?\])\s*```', re.DOTALL)
+JSON_FENCE_OBJECT = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+CODE_FENCE_BLOCK = re.compile(r"```[\s\S]*?```")
+
+# Strateji 2: markdown temizleyerek dizi çıkarma (sırayla denenir)
+MARKDOWN_ARRAY_PATTERNS = (
+    JSON_FENCE_ARRAY,
+    re.compile(r'```\s*(\[.*?\])\s*```', re.DOTALL),
+    re.compile(r'json\s*(\[.*?\])', re.DOTALL),
+)
+
+# Corrupted JSON repair: metin içindeki soru dizisi adayları
+CORRUPTED_ARRAY_PATTERNS = (
+    re.compile(r'\[\s*\{\s*"question".*?\]\s*', re.DOTALL),
+    re.compile(r'"question":\s*"\[.*?\]"', re.DOTALL),
+)
+
+# Manuel question/expected_answer çıkarma
+MANUAL_QUESTION = re.compile(r'"question":\s*"([^"]*(?:\\.[^"]*)*)"')
+MANUAL_ANSWER = re.compile(r'"expected_answer":\s*"([^"]*(?:\\.[^"]*)*)"')
+
+# ---------------------------------------------------------------------------
+# Yaygın JSON hatası düzeltmeleri
+# ---------------------------------------------------------------------------
+
+JSON_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+JSON_REPEATED_COMMA = re.compile(r',,+')
+JSON_UNESCAPED_NEWLINE = re.compile(r'(?<!\\)\n')
+JSON_UNESCAPED_QUOTE = re.compile(r'(?<!\\)"(?=\w)')
+
+# extract_question_data: "Anahtar kelimeler" alanının yanlış ayrıldığı formatlar
+KEYWORDS_FORMAT_1 = re.compile(r'("expected_answer":\s*"[^"]*"),\s*"(\\n\\nAnahtar kelimeler:[^"]*)"(\s*\})')
+KEYWORDS_FORMAT_2 = re.compile(r'",\s*"(\\n\\nAnahtar kelimeler:[^"]*)"')
+KEYWORDS_FORMAT_4 = re.compile(r'",\s*\n\s*"(\\n\\nAnahtar kelimeler:[^"]*)"')
+KEYWORDS_FORMAT_5 = re.compile(r'",\s*\n\s*\n\s*"(\\n\\nAnahtar kelimeler:[^"]*)"')
+
+# ---------------------------------------------------------------------------
+# Kod tespiti
+# ---------------------------------------------------------------------------
+
+# QuestionGenerator._is_code_like: tüm metinde aranır
+CODE_LIKE_INDICATORS = combine_patterns(
+    (
+        r"```", r";\s*$", r"\bclass\s+\w+", r"\bdef\s+\w+\s*\(", r"\bfunction\s*\(",
+        r"Console\.WriteLine", r"using\s+\w+;", r"public\s+(static\s+)?(void|int|string|class)",
+        r"\bvar\s+\w+\s*=", r"\blet\s+\w+\s*=", r"\bconst\s+\w+\s*=",
+        r"SELECT\s+.+\s+FROM", r"INSERT\s+INTO", r"UPDATE\s+\w+\s+SET", r"DELETE\s+FROM",
+        r"CREATE\s+TABLE", r"\b(New|Get|Set)-[A-Za-z]+", r"^[\s\t]*[{}]$",
+    ),
+    re.IGNORECASE | re.MULTILINE
+)
+CODE_SYMBOLS = re.compile(r"[{}();=<>\[\]]")
+
+# WordExporter._looks_like_code_block: satır satır aranır
+CODE_BLOCK_LINE_INDICATORS = combine_patterns(
+    (
+        # Yaygın anahtar kelimeler
+        r"^\s*(for|if|while|def|class|try|catch|public|private|protected|static|using|import|from)\b",
+        r"\bConsole\.",
+        r"\bprint\(",
+        r"\bSystem\.",
+        r"\bvar\s+\w+\s*=",
+        r"\blet\s+\w+\s*=",
+        r"\bconst\s+\w+\s*=",
+        r"\bNew-[A-Za-z]+\b",   # PowerShell
+        r"\bGet-[A-Za-z]+\b",
+        r"\bSet-[A-Za-z]+\b",
+        r"SELECT\s+.+\s+FROM",
+        r"CREATE\s+TABLE",
+        r"INSERT\s+INTO",
+        r"UPDATE\s+\w+\s+SET",
+        r"DELETE\s+FROM",
+        # Semboller
+        r"[{};=()<>\[\]]",
+        r":\s*$",  # Python bloğu
+    ),
+    re.IGNORECASE
+)
+
+# Word çıktısında kod normalizasyonu
+CONSOLE_WRITE_CALL = re.compile(r"Console\.Write(Line|)\s*\(.*$")
+STATEMENT_CLOSED = re.compile(r"\)\s*;\s*$")
@@ -3,6 +3,12 @@ PROMPT ŞABLONLARİ - MEVCUT PROJEDEKİ GELİŞMİŞ PROMPT SİSTEMİ
 ============================================================
 
 Mevcut projeden taşınan ana prompt sistemi ve system mesajları.
+
+İstekler sağlayıcı tarafı prompt önbelleğinden yararlanacak şekilde dizilir:
+önce tüm isteklerde birebir aynı system mesajı (SHARED_SYSTEM_PROMPT: genel
+kurallar + kategori kuralları + örnekler), ardından aynı rolün tüm
+isteklerinde aynı rol bağlamı (ROLE_CONTEXT_TEMPLATE), en sonda katsayı,
+kategori ve soru sayısı gibi değişen alanları içeren kısa sonek.
 """
 
 # Ana sistem mesajı
@@ -35,30 +41,23 @@ TEKNİK KAPSAM:
 - Başında/sonunda metin, markdown, açıklama olmayacaktır.
 """
 
-# Toplu soru üretimi için özel template
-BATCH_PROMPT_TEMPLATE = """İlan Başlığı: {job_context}
-Pozisyon: {role_name}
-Maaş Katsayısı: {salary_coefficient}x
-Özel Şartlar: {description}
-
-Bu pozisyona ait {type_name} kategorisinde ({type_description}) {question_count} adet kısa, doğrudan ve teknik odaklı soru ile beklenen cevaplarını üret.
+# Kategori kuralları ve örnekler (tüm isteklerde aynı; system mesajına eklenir)
+CATEGORY_RULES = """KATEGORİ KURALLARI:
 
-Kurallar:
-
-- {type_name} = "Mesleki Deneyim Soruları" ise:
+- "Mesleki Deneyim Soruları" kategorisinde:
   • Adayın geçmişte yaşadığı projeler, ekip içindeki rolü, karşılaştığı zorluklar ve bunlara yaklaşımı hakkında bilgi edinmeyi amaçla.
   • Somut örnekler, kişisel katkılar ve sonuç odaklı anlatımlar ara.
   • Gerçek deneyim paylaşımı, başarı/başarısızlık durumları sorgulanabilir.
   • Kesinlikle KOD, kod parçası, psödokod veya method imzası üretme.
 
-- {type_name} = "Teorik Bilgi Soruları" ise:
+- "Teorik Bilgi Soruları" kategorisinde:
   • Sorular iki cümle veya en fazla üç cümle olmalı, doğrudan teknik bilgi sormalı.
   • Gereksiz açıklama/şablon/etiket ekleme.
   • Her soru farklı bir konu/teknolojiye odaklanmalı.
   • Cevaplar 2–3 cümle, net ve teknik doğruluk odaklı olmalı.
   • Kesinlikle KOD, kod parçası, psödokod veya method imzası üretme.
 
-- {type_name} = "Pratik Uygulama Soruları" ise:
+- "Pratik Uygulama Soruları" kategorisinde:
   • Soru kısa ve doğrudan olmalı; “Senaryo: …” gibi kalıp başlıklar ve numaralandırılmış senaryo listeleri kullanılmamalı.
   • Üretilecek sorulardan bazılarını kod sorusu olarak üretebilirsin:
     – Kod Anlama: “Aşağıdaki kod ne yapar? Çıktısı nedir?”
@@ -66,7 +65,7 @@ Kurallar:
     – Kod 5–10 satır olmalı; markdown kod blokları kullanma; satırları \\n ile kaçışla.
     – Kod parçası TAM ve KESİNTİSİZ olmalı; satır sonları, kapanış parantezleri/ayraçları eksiksiz, derlenebilir/sentaktik olarak geçerli bir parça olmalı.
     – KOD PARÇASI ASLA üç nokta (…) ile kesilmemeli; eksik satırlar veya yarım ifadeler bulunmamalı.
-    – {salary_coefficient}x = 2x ise orta, 3x ise zor seviye seç.
+    – Maaş katsayısı 2x ise orta, 3x ise zor seviye seç.
   • Kod içermeyen pratik sorularda da komut adı veya path belirtilebilir; adaydan çıktı/kod yazması istenmez.
   • Her soru farklı bir konu/teknolojiye odaklanmalı.
   • Cevaplar 2-3 cümle, net ve teknik doğruluk odaklı olmalı.
@@ -78,6 +77,25 @@ Cevap: Forwarder, tüm dış DNS sorgularını belirlenen sunucuya yönlendirirk
 Örnek iyi soru (Linux 2x):
 1) LVM kullanarak disk yapılandırmalarında hangi Linux komutları kullanılır?
 Cevap: fdisk, pvcreate, vgcreate ve lvcreate komutları kullanılır.
+"""
+
+# Sağlayıcı tarafı prompt önbelleği için ortak önek: isteklerin hepsinde
+# birebir aynı olan system mesajı (değişken alan içermez)
+SHARED_SYSTEM_PROMPT = SYSTEM_MESSAGE + "\n" + CATEGORY_RULES
+
+# Rol bağlamı: aynı rolün tüm kategori/katsayı isteklerinde aynı; kullanıcı
+# mesajının başına konur ki önek rol içinde de paylaşılsın
+ROLE_CONTEXT_TEMPLATE = """Pozisyon: {role_name}
+Özel Şartlar: {description}
+İlan Başlığı: {job_context}
+"""
+
+# Toplu soru üretimi için değişken sonek (rol bağlamından sonra gelir)
+BATCH_PROMPT_TEMPLATE = """
+Maaş Katsayısı: {salary_coefficient}x
+Kategori: {type_name} ({type_description})
+
+Bu pozisyona ait {type_name} kategorisinde {question_count} adet kısa, doğrudan ve teknik odaklı soru ile beklenen cevaplarını yukarıdaki kategori kurallarına göre üret.
 
 ÇIKTI FORMAT:
 [
@@ -92,4 +110,43 @@ Cevap: fdisk, pvcreate, vgcreate ve lvcreate komutları kullanılır.
 - ```json blokları kullanma.
 - Direkt [ ile başla, ] ile bitir.
 - Tam olarak {question_count} adet soru üret.
-"""
\ No newline at end of file
+"""
+
+# Katı mod (5–10 satır kod) doldurma isteği soneki
+STRICT_CODE_PROMPT_TEMPLATE = """
+Maaş Katsayısı: {salary_coefficient}x
+Kategori: {type_name} ({type_description})
+
+Bu pozisyona ait {type_name} kategorisinde SADECE KOD SORUSU üret.
+Tam olarak {count} adet soru döndür.
+
+Kesin kurallar:
+- İlk satır soru cümlesi olsun. Hemen alt satırlarda 5 ila 10 SATIR arasında TAM bir kod parçası yaz.
+- Kod 5 satırdan az olmayacak, 10 satırı geçmeyecek. Üç nokta …, yarım çağrı, eksik parantez/ayraç YASAK.
+- Markdown veya ``` kullanma. Kod satırlarını normal satırlar halinde, \n ile ayır.
+- Cevap 2-4 cümle kısa ve teknik olsun.
+
+ÇIKTI SADECE JSON ARRAY OLMALI:
+[
+  {{"question": "Soru metni\n<kod satırı 1>\n<kod satırı 2>\n...", "expected_answer": "..."}}
+]
+"""
+
+# Kod içermeyen pratik soru doldurma isteği soneki
+NOCODE_PROMPT_TEMPLATE = """
+Maaş Katsayısı: {salary_coefficient}x
+Kategori: {type_name} ({type_description})
+
+Bu pozisyona ait {type_name} kategorisinde KOD İÇERMEYEN pratik sorular üret.
+Tam olarak {count} adet soru döndür.
+
+Kurallar:
+- KESİNLİKLE kod parçası verme; yalnızca sözel anlatım ve kavramsal/operasyonel açıklama sor.
+- Gerekirse komut/araç adlarını sözel olarak geçebilirsin (ör. Docker, systemctl), ancak kod veya komut satırı vermek YASAK.
+- Her soru kısa, doğrudan ve tek konu odaklı olsun.
+
+ÇIKTI SADECE JSON ARRAY OLMALI:
+[
+  {{"question": "Soru metni", "expected_answer": "..."}}
+]
+"""
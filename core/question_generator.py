@@ -5,59 +5,427 @@ ANA SORU ÜRETİM MOTORU
 OpenAI API entegrasyonu ile soru üretimi.
 """
 
+import contextvars
 import json
 import logging
-import re
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Generator, List, Optional, Callable, Tuple
 from openai import OpenAI
 
-from core.prompt_templates import SYSTEM_MESSAGE, BATCH_PROMPT_TEMPLATE
+from core.prompt_templates import (
+    BATCH_PROMPT_TEMPLATE, NOCODE_PROMPT_TEMPLATE, ROLE_CONTEXT_TEMPLATE, SHARED_SYSTEM_PROMPT,
+    STRICT_CODE_PROMPT_TEMPLATE
+)
 from core.json_parser import extract_question_data
 from config.rubric_system import get_difficulty_distribution_by_multiplier
-from config.openai_settings import get_openai_config, validate_api_key
+from config.openai_settings import get_llm_backend_config, get_openai_config, get_rate_limit_config, validate_api_key
 from config.question_categories import get_active_question_categories
+from config.generation_settings import get_generation_config, get_near_duplicate_config, get_overgeneration_config
+from core.rate_limiter import CHARS_PER_TOKEN, RateLimiter, get_shared_rate_limiter
+from core.response_cache import ResponseCache, get_shared_response_cache
+from core.stream_parser import IncrementalJSONArrayParser
+from core.llm_backends import LLMBackend, OpenAIBackend, create_llm_backend
+from core.usage_tracker import (
+    UsageTracker, current_usage_context, get_shared_usage_tracker, pop_usage_context, push_usage_context
+)
+from core.json_scanner import scan_questions
+from core.structured_output import QUESTIONS_RESPONSE_FORMAT, get_parse_path_stats, parse_structured_questions
+from core.overgeneration_planner import (
+    OvergenerationPlanner, STRICT_SUFFIX, get_shared_overgeneration_planner
+)
+from core import patterns
+from utils.near_duplicate import NearDuplicateDetector
+from utils.tracing import current_span, span, traced
 
 logger = logging.getLogger(__name__)
 
+def _response_total_tokens(result: Tuple[str, Optional[Dict[str, Any]]]) -> Optional[int]:
+    """Backend sonucundaki gerçek toplam token sayısını al (usage yoksa None)"""
+    usage = result[1]
+    return usage.get("total_tokens") if usage else None
+
+def _streamed_total_tokens(messages: List[Dict[str, str]], usage: Optional[Dict[str, Any]], received_chars: int) -> int:
+    """
+    Akışın gerçek toplam token sayısı; usage gelmediyse (akış koptu veya
+    sağlayıcı göndermedi) prompt + alınan metin uzunluğundan tahmin edilir.
+    """
+    if usage and usage.get("total_tokens") is not None:
+        return usage["total_tokens"]
+    return RateLimiter.estimate_tokens(messages) + received_chars // CHARS_PER_TOKEN
+
+def _stream_result_tokens(result: Tuple[Optional[Exception], int]) -> int:
+    """Akış sonucundaki (hata, token) çiftinden token sayısı (rate limiter uzlaştırması)"""
+    return result[1]
+
+_speculative_executor: Optional[ThreadPoolExecutor] = None
+_speculative_executor_lock = threading.Lock()
+
+def get_speculative_executor() -> ThreadPoolExecutor:
+    """
+    Spekülatif yedek istekler için süreç genelinde paylaşılan havuz
+    (OVERGENERATION_SPECULATIVE_WORKERS thread). Sınırlı havuz, aynı anda
+    gönderilebilecek boşa gitme ihtimalli istek sayısını da sınırlar.
+    """
+    global _speculative_executor
+
+    if _speculative_executor is not None:
+        return _speculative_executor
+
+    with _speculative_executor_lock:
+        if _speculative_executor is None:
+            _speculative_executor = ThreadPoolExecutor(
+                max_workers=get_overgeneration_config()["speculative_workers"],
+                thread_name_prefix="speculative"
+            )
+    return _speculative_executor
+
 class QuestionGenerator:
-    """Ana soru üretim sınıfı - OpenAI API ile entegre"""
+    """Ana soru üretim sınıfı - LLM backend'i (varsayılan OpenAI API) ile entegre"""
     
-    def __init__(self):
-        """Soru üretici başlatıcı"""
+    def __init__(
+        self,
+        concurrent_categories: Optional[bool] = None,
+        response_cache: Optional[ResponseCache] = None,
+        stream: Optional[bool] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        overgeneration_planner: Optional[OvergenerationPlanner] = None,
+        structured_output: Optional[bool] = None,
+        backend: Optional[LLMBackend] = None
+    ):
+        """
+        Soru üretici başlatıcı
+        
+        Args:
+            concurrent_categories: Kategori isteklerini eşzamanlı gönder
+                (None ise GENERATION_CONCURRENT_CATEGORIES ayarı kullanılır)
+            response_cache: Yanıt önbelleği (None ise paylaşılan önbellek, LLM_CACHE_MODE)
+            stream: Batch yanıtlarını akış olarak al (None ise GENERATION_STREAM ayarı)
+            near_duplicates: Rol bazlı yakın-tekrar dedektörü
+                (None ise NEAR_DUPLICATE_ENABLED açıksa yeni dedektör)
+            overgeneration_planner: Kabul oranı öğrenen istek boyutu planlayıcısı
+                (None ise paylaşılan planlayıcı, OVERGENERATION_*)
+            structured_output: Soru dizisi isteklerinde JSON şeması gönder
+                (None ise GENERATION_STRUCTURED_OUTPUT ayarı)
+            backend: Model backend'i (None ise LLM_BACKEND: openai, http, fake)
+        """
         self.openai_config = get_openai_config()
-        self.client = None
+        self.generation_config = get_generation_config()
+        if concurrent_categories is None:
+            concurrent_categories = self.generation_config["concurrent_categories"]
+        self.concurrent_categories = concurrent_categories
+        self.stream = self.generation_config["stream"] if stream is None else stream
+        if structured_output is None:
+            structured_output = self.generation_config["structured_output"]
+        self.structured_output = structured_output
+        # Soru dizisi isteklerinin response_format'ı (kapalıysa gönderilmez)
+        self.question_response_format = QUESTIONS_RESPONSE_FORMAT if structured_output else None
+        self.parse_path_stats = get_parse_path_stats()
+        self.usage_tracker: UsageTracker = get_shared_usage_tracker()
+        self.rate_limiter: Optional[RateLimiter] = (
+            get_shared_rate_limiter() if get_rate_limit_config()["enabled"] else None
+        )
+        self.response_cache: ResponseCache = response_cache or get_shared_response_cache()
+        near_duplicate_config = get_near_duplicate_config()
+        if near_duplicates is None and near_duplicate_config["enabled"]:
+            near_duplicates = NearDuplicateDetector()
+        self.near_duplicates: Optional[NearDuplicateDetector] = near_duplicates
+        self.near_duplicate_refill_rounds = near_duplicate_config["refill_rounds"]
+        self.overgeneration_planner: OvergenerationPlanner = (
+            overgeneration_planner or get_shared_overgeneration_planner()
+        )
+        # Batch API'den önceden alınmış kategori yanıtları {(rol, katsayı, kategori): yanıt}
+        self._prefetched_responses: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
+        self._prefetched_lock = threading.Lock()
+        self.backend: Optional[LLMBackend] = backend
         self._initialize_client()
     
     def _initialize_client(self):
-        """OpenAI client'ını başlat"""
+        """Backend verilmediyse LLM_BACKEND ayarına göre oluştur (openai için OpenAI client'ı)"""
+        if self.backend is not None:
+            return
+        
+        backend_name = get_llm_backend_config()["backend"]
+        if backend_name != "openai":
+            self.backend = create_llm_backend(backend_name)
+            logger.info(f"LLM backend'i: {backend_name}")
+            return
+        
         if not validate_api_key():
             raise ValueError("OPENAI_API_KEY environment variable tanımlı değil!")
         
         try:
-            self.client = OpenAI(
+            self.backend = OpenAIBackend(client=OpenAI(
                 api_key=self.openai_config["api_key"],
+                base_url=self.openai_config["base_url"],
                 timeout=self.openai_config["timeout"],
-                max_retries=self.openai_config["max_retries"]
-            )
+                max_retries=self._client_max_retries()
+            ))
             logger.info("OpenAI client başarıyla başlatıldı")
         except Exception as e:
             logger.error(f"OpenAI client başlatma hatası: {e}")
             raise
     
+    def _client_max_retries(self) -> int:
+        """Rate limiter aktifse yeniden denemeler sınırlayıcıda yapılır (429 takibi için)"""
+        return 0 if self.rate_limiter is not None else self.openai_config["max_retries"]
+    
+    def _completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+        **overrides
+    ) -> Dict[str, Any]:
+        """chat.completions parametrelerini ayarlardan oluştur (None değerler gönderilmez)"""
+        config = config or get_openai_config()
+        params = {
+            "model": config["model"],
+            "messages": messages,
+            "max_tokens": config["max_tokens"],
+            "temperature": config["temperature"]
+        }
+        params.update(overrides)
+        return {key: value for key, value in params.items() if value is not None}
+    
+    def _backend_params(self, config: Optional[Dict[str, Any]] = None, **overrides) -> Dict[str, Any]:
+        """Backend'e giden parametreler (messages hariç)"""
+        params = self._completion_params([], config, **overrides)
+        del params["messages"]
+        return params
+    
+    @staticmethod
+    def _llm_span(name: str, params: Dict[str, Any], attempt: int):
+        """Tek LLM denemesinin span'i (çağrı noktası / rol / kategori bilgisiyle)"""
+        return span(name, model=params["model"], attempt=attempt, **current_usage_context())
+    
+    def _create_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+        **overrides
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Tüm model çağrılarının geçtiği tek nokta.
+        
+        Rate limiter aktifse istek RPM/TPM bütçesi ve uyarlanabilir
+        eşzamanlılık limiti altında gönderilir, 429'larda Retry-After'a uyulur.
+        
+        Returns:
+            tuple: (yanıt metni, usage)
+        """
+        params = self._backend_params(config, **overrides)
+        attempts = 0
+        
+        def send():
+            nonlocal attempts
+            attempts += 1
+            started = time.monotonic()
+            with self._llm_span("llm.complete", params, attempts) as current:
+                result = self.backend.complete(messages, params)
+                current.set(total_tokens=_response_total_tokens(result))
+            self.usage_tracker.record(
+                result[1], model=params["model"], latency=time.monotonic() - started, retries=attempts - 1
+            )
+            return result
+        
+        if self.rate_limiter is None:
+            return send()
+        
+        return self.rate_limiter.call(
+            send,
+            estimated_tokens=RateLimiter.estimate_tokens(messages, params.get("max_tokens", 0)),
+            usage_tokens=_response_total_tokens
+        )
+    
+    def _response_cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Önbellek anahtarını üret (önbellek kapalıysa None)"""
+        if self.response_cache.mode == "off":
+            return None
+        params = self._completion_params(messages, config)
+        return ResponseCache.make_key(
+            params["model"],
+            params.get("temperature"),
+            messages[0]["content"],
+            messages[-1]["content"],
+            response_format=response_format
+        )
+    
+    def _complete_prompt(
+        self,
+        prompt: str,
+        config: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        call_site: Optional[str] = None
+    ) -> str:
+        """
+        System mesajı + prompt ile istek gönder, yanıt metnini döndür (önbellek dahil).
+        
+        call_site verilirse isteğin kullanım kaydı bu çağrı noktasıyla etiketlenir.
+        """
+        messages = self._build_messages(prompt)
+        cache_key = self._response_cache_key(messages, config, response_format)
+        if cache_key is not None:
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                logger.info("Yanıt önbellekten alındı")
+                return cached_text
+        
+        context_token = push_usage_context(call_site=call_site) if call_site else None
+        try:
+            text, _ = self._create_chat_completion(messages, config, response_format=response_format)
+        finally:
+            if context_token is not None:
+                pop_usage_context(context_token)
+        generated_text = text.strip()
+        
+        if cache_key is not None:
+            self.response_cache.set(cache_key, generated_text, model=(config or self.openai_config)["model"])
+        return generated_text
+    
+    def _stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        on_delta: Callable[[str], None],
+        config: Optional[Dict[str, Any]] = None,
+        **overrides
+    ) -> Optional[Exception]:
+        """
+        İsteği akış olarak gönder, her metin parçasını on_delta'ya ilet.
+        
+        İlk parça gelmeden oluşan hatalar (429 vb.) rate limiter'da yeniden
+        denenir; akış başladıktan sonra kopan bağlantıda hata döndürülür ve
+        o ana kadar alınan parçalar korunur.
+        
+        Returns:
+            Exception | None: Akış yarıda kesildiyse hata
+        """
+        params = self._backend_params(config, **overrides)
+        attempts = 0
+        
+        def consume() -> Tuple[Optional[Exception], int]:
+            nonlocal attempts
+            attempts += 1
+            received_chars = 0
+            started = time.monotonic()
+            
+            def forward(delta: str):
+                nonlocal received_chars
+                received_chars += len(delta)
+                on_delta(delta)
+            
+            try:
+                with self._llm_span("llm.stream", params, attempts) as current:
+                    usage = self.backend.stream(messages, params, forward)
+                    current.set(total_tokens=(usage or {}).get("total_tokens"))
+            except Exception as error:
+                if not received_chars:
+                    raise
+                # Kopan akışın harcadığı token'lar da TPM bütçesinden düşülür
+                return error, _streamed_total_tokens(messages, None, received_chars)
+            self.usage_tracker.record(
+                usage, model=params["model"], latency=time.monotonic() - started, retries=attempts - 1
+            )
+            return None, _streamed_total_tokens(messages, usage, received_chars)
+        
+        if self.rate_limiter is None:
+            return consume()[0]
+        
+        # max_tokens ile ayrılan rezervasyon akış bitince gerçek kullanıma göre düzeltilir
+        stream_error, _ = self.rate_limiter.call(
+            consume,
+            estimated_tokens=RateLimiter.estimate_tokens(messages, params.get("max_tokens", 0)),
+            usage_tokens=_stream_result_tokens
+        )
+        return stream_error
+    
+    def _stream_questions(
+        self,
+        prompt: str,
+        on_question: Optional[Callable[[Dict[str, Any]], None]] = None,
+        config: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch prompt'unu akış modunda çalıştır; her soru nesnesi kapandığı anda
+        on_question ile bildirilir.
+        
+        Returns:
+            list: Çözülen sorular (akış yarıda kesildiyse o ana kadarkiler)
+        """
+        messages = self._build_messages(prompt)
+        parser = IncrementalJSONArrayParser()
+        questions: List[Dict[str, Any]] = []
+        
+        def on_delta(delta: str):
+            for item in self._format_questions_array(parser.feed(delta)):
+                questions.append(item)
+                if on_question is not None:
+                    on_question(item)
+        
+        response_format = self.question_response_format
+        cache_key = self._response_cache_key(messages, config, response_format)
+        cached_text = self.response_cache.get(cache_key) if cache_key is not None else None
+        if cached_text is not None:
+            logger.info("Yanıt önbellekten alındı")
+            on_delta(cached_text)
+            stream_error = None
+        else:
+            stream_error = self._stream_chat_completion(
+                messages, on_delta, config, response_format=response_format
+            )
+        
+        return self._finish_stream(parser, questions, stream_error, cache_key, cached_text is not None, config)
+    
+    def _finish_stream(
+        self,
+        parser: IncrementalJSONArrayParser,
+        questions: List[Dict[str, Any]],
+        stream_error: Optional[Exception],
+        cache_key: Optional[str],
+        from_cache: bool,
+        config: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Akış sonucunu değerlendir: kısmi çıktıyı koru, gerekirse tam parse'a düş"""
+        generated_text = parser.text.strip()
+        logger.info(f"Akış tamamlandı: {len(generated_text)} karakter, {len(questions)} soru")
+        
+        if stream_error is not None:
+            if not questions:
+                raise stream_error
+            logger.warning(f"Akış yarıda kesildi ({stream_error}); {len(questions)} soru kurtarıldı")
+            return questions
+        
+        if not parser.finished:
+            # Dizi kapanmadan biten akış (ör. max_tokens sınırı) önbelleğe yazılmaz
+            logger.warning(f"Akış yanıtı eksik bitti (JSON dizisi kapanmadı); {len(questions)} soru alındı")
+        elif cache_key is not None and not from_cache:
+            self.response_cache.set(cache_key, generated_text, model=(config or self.openai_config)["model"])
+        
+        if not questions and generated_text:
+            logger.warning("Akış parser'ı soru çıkaramadı, tam yanıt parse ediliyor...")
+            return self._parse_generated_questions(generated_text)
+        return questions
+    
     def check_api_status(self) -> Dict[str, Any]:
         """API durumunu kontrol et"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.openai_config["model"],
-                messages=[{"role": "user", "content": "test"}],
-                max_tokens=10
+            text, _ = self._create_chat_completion(
+                [{"role": "user", "content": "test"}],
+                self.openai_config,
+                max_tokens=10,
+                temperature=None
             )
             
             return {
                 "api_available": True,
                 "model": self.openai_config["model"],
                 "status": "connected",
-                "test_response": response.choices[0].message.content
+                "test_response": text
             }
             
         except Exception as e:
@@ -96,68 +464,156 @@ class QuestionGenerator:
             dict: Üretilen soru verisi
         """
         try:
-            # Zorluk dağılımını hesapla
-            difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
-            
             # Prompt'u oluştur (tek soru için BATCH_PROMPT_TEMPLATE kullan)
-            prompt = BATCH_PROMPT_TEMPLATE.format(
-                job_context=job_context,
-                role_name=role_name,
-                salary_coefficient=salary_coefficient,
-                description=description,
-                type_name=type_name,
-                type_description=type_description,
-                question_count=1,  # Tek soru istiyoruz
-                K1=difficulty_distribution["K1_Temel_Bilgi"],
-                K2=difficulty_distribution["K2_Uygulamali"],
-                K3=difficulty_distribution["K3_Hata_Cozumleme"],
-                K4=difficulty_distribution["K4_Tasarim"],
-                K5=difficulty_distribution["K5_Stratejik"]
+            prompt, difficulty_distribution = self._build_batch_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, question_count=1  # Tek soru istiyoruz
             )
             
             # OpenAI API çağrısı
-            response = self.client.chat.completions.create(
-                model=self.openai_config["model"],
-                messages=[
-                    {"role": "system", "content": SYSTEM_MESSAGE},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.openai_config["temperature"],
-                max_tokens=self.openai_config["max_tokens"]
-            )
+            generated_text = self._complete_prompt(prompt, self.openai_config, call_site="single_question")
             
             logger.info(f"{type_name} sorusu {question_number} için API yanıtı alındı")
             
-            # Yanıtı parse et
-            raw_response = response.choices[0].message.content
-            question_data = extract_question_data(raw_response)
-            
-            # Sonuç verisini hazırla
-            result = {
-                "success": True,
-                "question": question_data["question"],
-                "expected_answer": question_data["expected_answer"],
-                "question_type": question_type,
-                "type_name": type_name,
-                "role": role_name,
-                "salary_coefficient": salary_coefficient,
-                "difficulty_distribution": difficulty_distribution,
-                "api_used": "openai",
-                "raw_response": raw_response if not question_data["success"] else None
-            }
-            
-            logger.info(f"{type_name} sorusu {question_number} başarıyla üretildi")
-            return result
+            return self._build_single_question_result(
+                generated_text, role_name, salary_coefficient,
+                question_type, type_name, question_number, difficulty_distribution
+            )
             
         except Exception as e:
             logger.error(f"Soru üretim hatası ({type_name} {question_number}): {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "question_type": question_type,
-                "type_name": type_name,
-                "api_used": "openai"
-            }
+            return self._single_question_error(e, question_type, type_name)
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """System mesajı + kullanıcı prompt'undan mesaj listesini oluştur"""
+        return [
+            {"role": "system", "content": SHARED_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _build_batch_prompt(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        question_count: int
+    ) -> tuple:
+        """
+        Rol bağlamı + BATCH_PROMPT_TEMPLATE soneki ile kategori prompt'unu oluştur.
+        
+        Returns:
+            tuple: (prompt, zorluk_dağılımı)
+        """
+        difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
+        prompt = self._build_role_context(role_name, job_context, description) + BATCH_PROMPT_TEMPLATE.format(
+            salary_coefficient=salary_coefficient,
+            type_name=type_name,
+            type_description=type_description,
+            question_count=question_count,
+            K1=difficulty_distribution["K1_Temel_Bilgi"],
+            K2=difficulty_distribution["K2_Uygulamali"],
+            K3=difficulty_distribution["K3_Hata_Cozumleme"],
+            K4=difficulty_distribution["K4_Tasarim"],
+            K5=difficulty_distribution["K5_Stratejik"]
+        )
+        return prompt, difficulty_distribution
+    
+    @staticmethod
+    def _build_role_context(role_name: str, job_context: str, description: str) -> str:
+        """Aynı rolün tüm isteklerinde birebir aynı kalan prompt öneki"""
+        return ROLE_CONTEXT_TEMPLATE.format(
+            role_name=role_name,
+            description=description,
+            job_context=job_context
+        )
+    
+    def build_batch_request(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_type: str,
+        type_name: str,
+        type_description: str,
+        question_count: int
+    ) -> Dict[str, Any]:
+        """
+        Kategori batch isteğini canlı üretimle aynı plan ve prompt ile derle
+        (Batch API girdi satırı için).
+        
+        Returns:
+            dict: request_count (istenen soru sayısı) ve body (chat.completions parametreleri)
+        """
+        plan = self._plan_batch(role_name, question_type, type_name, question_count)
+        prompt, _ = self._build_batch_prompt(
+            role_name, job_context, description, salary_coefficient,
+            type_name, type_description, plan["request_count"]
+        )
+        return {
+            "request_count": plan["request_count"],
+            "body": self._completion_params(
+                self._build_messages(prompt), response_format=self.question_response_format
+            )
+        }
+    
+    def load_prefetched_responses(self, responses: Dict[Tuple[str, int, str], Dict[str, Any]]):
+        """
+        Batch API yanıtlarını yükle; generate_questions_batch bu kategoriler için
+        istek göndermek yerine yanıtı aynı parse/filtre/metadata yolundan geçirir.
+        
+        Args:
+            responses: {(rol_adı, katsayı, kategori_kodu): {"text", "request_count"}}
+        """
+        with self._prefetched_lock:
+            self._prefetched_responses.update(responses)
+    
+    def _take_prefetched(self, role_name: str, salary_coefficient: int, question_type: str) -> Optional[Dict[str, Any]]:
+        """Kategori için önceden alınmış yanıtı al (bir kez kullanılır)"""
+        with self._prefetched_lock:
+            return self._prefetched_responses.pop((role_name, salary_coefficient, question_type), None)
+    
+    def _build_single_question_result(
+        self,
+        raw_response: str,
+        role_name: str,
+        salary_coefficient: int,
+        question_type: str,
+        type_name: str,
+        question_number: int,
+        difficulty_distribution: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Tek soru yanıtını parse edip sonuç verisini hazırla"""
+        question_data = extract_question_data(raw_response)
+        
+        result = {
+            "success": True,
+            "question": question_data["question"],
+            "expected_answer": question_data["expected_answer"],
+            "question_type": question_type,
+            "type_name": type_name,
+            "role": role_name,
+            "salary_coefficient": salary_coefficient,
+            "difficulty_distribution": difficulty_distribution,
+            "api_used": "openai",
+            "raw_response": raw_response if not question_data["success"] else None
+        }
+        
+        logger.info(f"{type_name} sorusu {question_number} başarıyla üretildi")
+        return result
+    
+    def _single_question_error(self, error: Exception, question_type: str, type_name: str) -> Dict[str, Any]:
+        """Tek soru üretim hatası sonucu"""
+        return {
+            "success": False,
+            "error": str(error),
+            "question_type": question_type,
+            "type_name": type_name,
+            "api_used": "openai"
+        }
     
     def _parse_questions_array(self, generated_text: str) -> List[Dict[str, Any]]:
         """JSON Array formatındaki soruları parse et"""
@@ -167,7 +623,7 @@ class QuestionGenerator:
             
             # Markdown code block'larını temizle
             if '```json' in cleaned_text:
-                json_match = re.search(r'```json\s*(\[.*?\])\s*```', cleaned_text, re.DOTALL)
+                json_match = patterns.JSON_FENCE_ARRAY.search(cleaned_text)
                 if json_match:
                     cleaned_text = json_match.group(1).strip()
             elif cleaned_text.startswith('```'):
@@ -222,6 +678,7 @@ class QuestionGenerator:
             logger.error(f"Array parse genel hatası: {e}")
             return []
     
+    @traced("parse.robust")
     def _parse_questions_array_robust(self, generated_text: str) -> List[Dict[str, Any]]:
         """
         SÜPER GÜÇLENDİRİLMİŞ JSON Parser - Tüm AI format'larını handle eder
@@ -255,6 +712,7 @@ class QuestionGenerator:
         logger.error("❌ Tüm parse stratejileri başarısız!")
         return []
     
+    @traced("parse.robust.direct")
     def _try_direct_json_array(self, text: str) -> List[Dict[str, Any]]:
         """Strateji 1: Direkt JSON Array parse"""
         try:
@@ -267,18 +725,13 @@ class QuestionGenerator:
             pass
         return []
     
+    @traced("parse.robust.markdown")
     def _try_markdown_cleanup_parse(self, text: str) -> List[Dict[str, Any]]:
         """Strateji 2: Markdown temizleyerek parse"""
         try:
             # ```json ... ``` blokları temizle
-            patterns = [
-                r'```json\s*(\[.*?\])\s*```',
-                r'```\s*(\[.*?\])\s*```',
-                r'json\s*(\[.*?\])',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.DOTALL)
+            for pattern in patterns.MARKDOWN_ARRAY_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     json_content = match.group(1).strip()
                     data = json.loads(json_content)
@@ -288,6 +741,7 @@ class QuestionGenerator:
             pass
         return []
     
+    @traced("parse.robust.regex")
     def _try_regex_extract_parse(self, text: str) -> List[Dict[str, Any]]:
         """Strateji 3: Regex ile JSON Array çıkarma"""
         try:
@@ -306,6 +760,7 @@ class QuestionGenerator:
             pass
         return []
     
+    @traced("parse.robust.nested")
     def _try_nested_json_robust(self, text: str) -> List[Dict[str, Any]]:
         """Strateji 4: AI tek object döndürürse (nested JSON)"""
         try:
@@ -347,16 +802,16 @@ class QuestionGenerator:
     def _fix_common_json_errors(self, json_text: str) -> str:
         """JSON'daki yaygın hataları düzelt"""
         # Fazla virgül temizle
-        json_text = re.sub(r',(\s*[}\]])', r'\1', json_text)
+        json_text = patterns.JSON_TRAILING_COMMA.sub(r'\1', json_text)
         
         # Çift virgül temizle
-        json_text = re.sub(r',,+', ',', json_text)
+        json_text = patterns.JSON_REPEATED_COMMA.sub(',', json_text)
         
         # Escape edilmemiş newline'ları düzelt
-        json_text = re.sub(r'(?<!\\)\n', '\\n', json_text)
+        json_text = patterns.JSON_UNESCAPED_NEWLINE.sub('\\n', json_text)
         
         # Escape edilmemiş quote'ları düzelt (basit versiyon)
-        json_text = re.sub(r'(?<!\\)"(?=\w)', '\\"', json_text)
+        json_text = patterns.JSON_UNESCAPED_QUOTE.sub('\\"', json_text)
         
         return json_text
     
@@ -364,18 +819,10 @@ class QuestionGenerator:
         """Bir metnin kod benzeri içerik taşıyıp taşımadığını sezgisel olarak tespit et."""
         if not text:
             return False
-        indicators = [
-            r"```", r";\s*$", r"\bclass\s+\w+", r"\bdef\s+\w+\s*\(", r"\bfunction\s*\(",
-            r"Console\.WriteLine", r"using\s+\w+;", r"public\s+(static\s+)?(void|int|string|class)",
-            r"\bvar\s+\w+\s*=", r"\blet\s+\w+\s*=", r"\bconst\s+\w+\s*=",
-            r"SELECT\s+.+\s+FROM", r"INSERT\s+INTO", r"UPDATE\s+\w+\s+SET", r"DELETE\s+FROM",
-            r"CREATE\s+TABLE", r"\b(New|Get|Set)-[A-Za-z]+", r"^[\s\t]*[{}]$",
-        ]
-        for pat in indicators:
-            if re.search(pat, text, re.IGNORECASE | re.MULTILINE):
-                return True
+        if patterns.CODE_LIKE_INDICATORS.search(text):
+            return True
         # Çok sayıda parantez/operatör içeren kısa satırlar
-        symbol_hits = len(re.findall(r"[{}();=<>\[\]]", text))
+        symbol_hits = len(patterns.CODE_SYMBOLS.findall(text))
         return symbol_hits >= 3
 
     def _sanitize_non_practical_question(self, text: str) -> str:
@@ -383,7 +830,7 @@ class QuestionGenerator:
         if not text:
             return text
         # Kod çitlerini sil
-        text = re.sub(r"```[\s\S]*?```", "", text)
+        text = patterns.CODE_FENCE_BLOCK.sub("", text)
         # Çok satırlı ise yalnızca ilk satırı al
         first_line = text.splitlines()[0].strip()
         # Halen kod gibi görünüyorsa güvenli bir mesleki deneyim sorusuna indir
@@ -391,6 +838,7 @@ class QuestionGenerator:
             return "Bu konuda edindiğiniz deneyiminizi, karşılaştığınız zorlukları ve yaklaşımınızı anlatınız."
         return first_line
 
+    @traced("parse.nested")
     def _try_parse_nested_json(self, generated_text: str) -> List[Dict[str, Any]]:
         """
         AI'ın question field'ında JSON Array döndürdüğü durum için parser
@@ -413,7 +861,7 @@ class QuestionGenerator:
             # Question içindeki JSON'u çıkar
             # Markdown temizle
             if '```json' in question_content:
-                json_match = re.search(r'```json\s*(\[.*?\])\s*```', question_content, re.DOTALL)
+                json_match = patterns.JSON_FENCE_ARRAY.search(question_content)
                 if json_match:
                     question_content = json_match.group(1).strip()
             
@@ -450,20 +898,15 @@ class QuestionGenerator:
             logger.error(f"Nested JSON parse hatası: {e}")
             return []
     
+    @traced("parse.repair")
     def _try_repair_corrupted_json(self, generated_text: str) -> List[Dict[str, Any]]:
         """AI'ın JSON string olarak döndürdüğü durumu düzelt"""
         try:
             logger.info("🔧 Corrupted JSON repair başlıyor...")
             
-            # JSON string içinde JSON Array arama
-            patterns = [
-                r'\[\s*\{\s*"question".*?\]\s*',  # JSON Array pattern
-                r'"question":\s*"\[.*?\]"',        # String içinde JSON Array
-            ]
-            
-            for pattern in patterns:
-                matches = re.finditer(pattern, generated_text, re.DOTALL)
-                for match in matches:
+            # JSON string içinde JSON Array arama (dizi kalıbı, string içinde dizi)
+            for pattern in patterns.CORRUPTED_ARRAY_PATTERNS:
+                for match in pattern.finditer(generated_text):
                     json_candidate = match.group(0)
                     
                     # String escape'lerini düzelt
@@ -495,11 +938,8 @@ class QuestionGenerator:
             questions = []
             
             # "question": "..." pattern'ini bul
-            question_pattern = r'"question":\s*"([^"]*(?:\\.[^"]*)*)"'
-            answer_pattern = r'"expected_answer":\s*"([^"]*(?:\\.[^"]*)*)"'
-            
-            question_matches = re.findall(question_pattern, text)
-            answer_matches = re.findall(answer_pattern, text)
+            question_matches = patterns.MANUAL_QUESTION.findall(text)
+            answer_matches = patterns.MANUAL_ANSWER.findall(text)
             
             # Eşleştir
             for i, question in enumerate(question_matches):
@@ -555,6 +995,92 @@ class QuestionGenerator:
                 unique.append(it)
         return unique
 
+    def _near_duplicate_text(self, item: Dict[str, Any], question_type: str) -> str:
+        """Yakın-tekrar karşılaştırmasında kullanılan metin (sorunun havuza yazılacak hâli)"""
+        question = item.get("question", "") or ""
+        if question_type != "practical_application":
+            return self._sanitize_non_practical_question(question)
+        return question
+
+    @traced("filter.near_duplicates")
+    def _filter_near_duplicates(
+        self,
+        role_name: str,
+        question_type: str,
+        items: List[Dict[str, Any]],
+        accepted: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Rolün geçmişine veya bu batch'te kabul edilenlere yakın soruları ele.
+
+        Returns:
+            tuple: (kabul edilen sorular, reddedilen girdiler)
+        """
+        if self.near_duplicates is None or not items:
+            return items, []
+
+        kept, rejected = self.near_duplicates.filter(
+            role_name, items,
+            text_of=lambda item: self._near_duplicate_text(item, question_type),
+            accepted=accepted or ()
+        )
+        for entry in rejected:
+            logger.debug(
+                f"Yakın-tekrar (%{entry['similarity'] * 100:.0f}): "
+                f"{entry['question'].get('question', '')[:80]!r} ~ {entry['duplicate_of'][:80]!r}"
+            )
+        if rejected:
+            logger.warning(f"🔁 {role_name}: {len(rejected)} yakın-tekrar soru elendi")
+        return kept, rejected
+
+    def _register_near_duplicates(self, role_name: str, questions: List[Dict[str, Any]]):
+        """Kabul edilen soruları rolün yakın-tekrar indeksine ekle"""
+        if self.near_duplicates is not None and questions:
+            self.near_duplicates.register(role_name, questions)
+
+    def _avoid_near_duplicates_block(self, rejected: List[Dict[str, Any]], limit: int = 10) -> str:
+        """Reddedilen soruların benzediği soruları prompt'a "bunları tekrar etme" listesi olarak ekle"""
+        if not rejected:
+            return ""
+        examples = list(dict.fromkeys(
+            (entry["duplicate_of"].splitlines() or [""])[0].strip()[:200] for entry in rejected
+        ))[:limit]
+        lines = "\n".join(f"- {example}" for example in examples if example)
+        return (
+            "\n\nAşağıdaki sorular bu pozisyon için ZATEN ÜRETİLDİ. Bunların aynısını veya "
+            "farklı kelimelerle tekrarını ÜRETME; farklı konu ve senaryolara odaklan:\n"
+            f"{lines}\n"
+        )
+
+    @traced("refill.near_duplicates")
+    def _generate_replacement_questions(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        count: int,
+        rejected: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Yakın-tekrar olarak elenen soruların yerine yenilerini üret (defisit doldurma)"""
+        try:
+            prompt, _ = self._build_batch_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, count
+            )
+            generated_text = self._complete_prompt(
+                prompt + self._avoid_near_duplicates_block(rejected),
+                response_format=self.question_response_format,
+                call_site="near_duplicate_refill"
+            )
+            return self._parse_refill_questions(generated_text)
+        except Exception as e:
+            logger.error(f"Yakın-tekrar yerine soru üretilemedi ({type_name}, {count} soru): {e}")
+            return []
+
+    @traced("refill.strict_code")
     def _generate_practical_code_questions_strict(
         self,
         role_name: str,
@@ -563,7 +1089,8 @@ class QuestionGenerator:
         salary_coefficient: int,
         type_name: str,
         type_description: str,
-        count: int
+        count: int,
+        avoid: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """5–10 satır kod şartını kesin uygulayan ek üretim.
 
@@ -571,54 +1098,22 @@ class QuestionGenerator:
         Question alanında ilk satır soru cümlesi, takip eden satırlar KOD olmalı.
         """
         try:
-            difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
-            strict_prompt = f"""İlan Başlığı: {job_context}
-Pozisyon: {role_name}
-Maaş Katsayısı: {salary_coefficient}x
-Özel Şartlar: {description}
-
-Bu pozisyona ait {type_name} kategorisinde ({type_description}) SADECE KOD SORUSU üret.
-Tam olarak {count} adet soru döndür.
+            strict_prompt = self._build_strict_code_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, count
+            ) + self._avoid_near_duplicates_block(avoid or [])
 
-Kesin kurallar:
-- İlk satır soru cümlesi olsun. Hemen alt satırlarda 5 ila 10 SATIR arasında TAM bir kod parçası yaz.
-- Kod 5 satırdan az olmayacak, 10 satırı geçmeyecek. Üç nokta …, yarım çağrı, eksik parantez/ayraç YASAK.
-- Markdown veya ``` kullanma. Kod satırlarını normal satırlar halinde, \n ile ayır.
-- Cevap 2-4 cümle kısa ve teknik olsun.
-
-ÇIKTI SADECE JSON ARRAY OLMALI:
-[
-  {{"question": "Soru metni\n<kod satırı 1>\n<kod satırı 2>\n...", "expected_answer": "..."}}
-]
-"""
-
-            config = get_openai_config()
-            response = self.client.chat.completions.create(
-                model=config["model"],
-                messages=[
-                    {"role": "system", "content": SYSTEM_MESSAGE},
-                    {"role": "user", "content": strict_prompt}
-                ],
-                max_tokens=config["max_tokens"],
-                temperature=config["temperature"]
+            generated_text = self._complete_prompt(
+                strict_prompt, response_format=self.question_response_format, call_site="strict_code"
             )
-            generated_text = response.choices[0].message.content.strip()
-            items = self._parse_questions_array_robust(generated_text)
-            if not items:
-                items = self._try_parse_nested_json(generated_text)
+            items = self._parse_refill_questions(generated_text)
 
             # 5–10 satır filtresi uygula
-            filtered: List[Dict[str, Any]] = []
-            for it in items:
-                cb = self._extract_code_block_from_question(it.get("question", ""))
-                n = self._count_code_lines(cb or "")
-                if 5 <= n <= 10:
-                    filtered.append(it)
-            return filtered
+            return self._filter_code_questions(items)
         except Exception:
             return []
 
-    def _generate_practical_nocode_questions(
+    def _build_strict_code_prompt(
         self,
         role_name: str,
         job_context: str,
@@ -627,52 +1122,95 @@ Kesin kurallar:
         type_name: str,
         type_description: str,
         count: int
-    ) -> List[Dict[str, Any]]:
-        """KOD İÇERMEYEN pratik uygulama soruları üretir (defisit doldurma)."""
-        try:
-            nocode_prompt = f"""İlan Başlığı: {job_context}
-Pozisyon: {role_name}
-Maaş Katsayısı: {salary_coefficient}x
-Özel Şartlar: {description}
+    ) -> str:
+        """Katı mod (5–10 satır kod) prompt'unu oluştur (rol bağlamı + sonek)"""
+        return self._build_role_context(role_name, job_context, description) + STRICT_CODE_PROMPT_TEMPLATE.format(
+            salary_coefficient=salary_coefficient,
+            type_name=type_name,
+            type_description=type_description,
+            count=count
+        )
 
-Bu pozisyona ait {type_name} kategorisinde ({type_description}) KOD İÇERMEYEN pratik sorular üret.
-Tam olarak {count} adet soru döndür.
+    @traced("parse.refill")
+    def _parse_refill_questions(self, generated_text: str) -> List[Dict[str, Any]]:
+        """Defisit doldurma yanıtlarını parse et (şema, tarayıcı, sonra robust + nested fallback)"""
+        items = self._parse_structured(generated_text)
+        if items is not None:
+            return items
+        items = self._scan_generated_questions(generated_text)
+        if items:
+            return items
+        items = self._parse_questions_array_robust(generated_text)
+        if not items:
+            items = self._try_parse_nested_json(generated_text)
+        self.parse_path_stats.record("legacy_cascade" if items else "failed")
+        return items
 
-Kurallar:
-- KESİNLİKLE kod parçası verme; yalnızca sözel anlatım ve kavramsal/operasyonel açıklama sor.
-- Gerekirse komut/araç adlarını sözel olarak geçebilirsin (ör. Docker, systemctl), ancak kod veya komut satırı vermek YASAK.
-- Her soru kısa, doğrudan ve tek konu odaklı olsun.
+    @traced("filter.code_lines")
+    def _filter_code_questions(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Yalnızca 5–10 satır kod içeren soruları tut"""
+        return [it for it in items if self._has_valid_code_block(it)]
 
-ÇIKTI SADECE JSON ARRAY OLMALI:
-[
-  {{"question": "Soru metni", "expected_answer": "..."}}
-]
-"""
-            config = get_openai_config()
-            response = self.client.chat.completions.create(
-                model=config["model"],
-                messages=[
-                    {"role": "system", "content": SYSTEM_MESSAGE},
-                    {"role": "user", "content": nocode_prompt}
-                ],
-                max_tokens=config["max_tokens"],
-                temperature=config["temperature"]
+    def _has_valid_code_block(self, item: Dict[str, Any]) -> bool:
+        """Soru 5–10 satır kod bloğu içeriyor mu?"""
+        cb = self._extract_code_block_from_question(item.get("question", ""))
+        return 5 <= self._count_code_lines(cb or "") <= 10
+
+    def _filter_nocode_questions(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Güvenlik: kod benzeri içerikleri ele"""
+        result: List[Dict[str, Any]] = []
+        for it in items:
+            q = it.get("question", "")
+            cb = self._extract_code_block_from_question(q)
+            if not cb:  # kod yoksa kabul
+                result.append(it)
+        return result
+
+    @traced("refill.nocode")
+    def _generate_practical_nocode_questions(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        count: int,
+        avoid: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """KOD İÇERMEYEN pratik uygulama soruları üretir (defisit doldurma)."""
+        try:
+            nocode_prompt = self._build_nocode_prompt(
+                role_name, job_context, description, salary_coefficient,
+                type_name, type_description, count
+            ) + self._avoid_near_duplicates_block(avoid or [])
+            generated_text = self._complete_prompt(
+                nocode_prompt, response_format=self.question_response_format, call_site="nocode"
             )
-            generated_text = response.choices[0].message.content.strip()
-            items = self._parse_questions_array_robust(generated_text)
-            if not items:
-                items = self._try_parse_nested_json(generated_text)
-            # Güvenlik: kod benzeri içerikleri ele
-            result: List[Dict[str, Any]] = []
-            for it in items:
-                q = it.get("question", "")
-                cb = self._extract_code_block_from_question(q)
-                if not cb:  # kod yoksa kabul
-                    result.append(it)
-            return result
+            items = self._parse_refill_questions(generated_text)
+            return self._filter_nocode_questions(items)
         except Exception:
             return []
 
+    def _build_nocode_prompt(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        type_name: str,
+        type_description: str,
+        count: int
+    ) -> str:
+        """Kod içermeyen pratik soru prompt'unu oluştur (rol bağlamı + sonek)"""
+        return self._build_role_context(role_name, job_context, description) + NOCODE_PROMPT_TEMPLATE.format(
+            salary_coefficient=salary_coefficient,
+            type_name=type_name,
+            type_description=type_description,
+            count=count
+        )
+
+    @traced("parse.fallback")
     def _fallback_parse(self, generated_text: str) -> List[Dict[str, Any]]:
         """Parse başarısız olursa fallback"""
         try:
@@ -695,7 +1233,7 @@ Kurallar:
             
             # Markdown code block'larını temizle
             if '```json' in cleaned_text:
-                json_match = re.search(r'```json\s*(\{.*?\})\s*```', cleaned_text, re.DOTALL)
+                json_match = patterns.JSON_FENCE_OBJECT.search(cleaned_text)
                 if json_match:
                     cleaned_text = json_match.group(1).strip()
             elif cleaned_text.startswith('```'):
@@ -790,28 +1328,75 @@ Kurallar:
             dict: Tüm kategorilerdeki sorular
         """
         try:
-            # Zorluk dağılımını hesapla
-            difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
-            
-            # Kategori bilgilerini hazırla
-            from config.question_categories import get_active_question_categories
-            active_categories = get_active_question_categories()
-            category_details = []
-            total_questions = 0
-            
-            for category_code, category_name, category_description in active_categories:
-                count = question_counts.get(category_code, 0)
-                if count > 0:
-                    category_details.append(f"- {category_name}: {count} adet soru")
-                    total_questions += count
+            prompt, total_questions = self._build_single_request_prompt(
+                role_name, job_context, description, salary_coefficient, question_counts
+            )
+
+            logger.info(f"Tek istek ile {total_questions} soru üretimi başlıyor...")
             
-            categories_text = "\n".join(category_details)
+            # OpenAI API'sine istek gönder
+            generated_text = self._complete_prompt(prompt, call_site="single_request")
+            return self._build_single_request_result(generated_text, question_counts)
             
-            # Özel tek istek prompt'u
-            prompt = f"""İlan Başlığı: {job_context}
-Pozisyon: {role_name}
-Maaş Katsayısı: {salary_coefficient}x
-Özel Şartlar: {description}
+        except Exception as e:
+            logger.error(f"Tek istek hatası: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "questions": {}
+            }
+    
+    def _build_single_request_result(self, generated_text: str, question_counts: Dict[str, int]) -> Dict[str, Any]:
+        """Tek istek yanıtını kategoriler halinde parse edip sonucu oluştur"""
+        logger.info(f"Tek istek yanıtı alındı: {len(generated_text)} karakter")
+        
+        # JSON parse et (kategoriler halinde)
+        all_questions = self._parse_all_questions(generated_text, question_counts)
+        
+        logger.info(f"Tek istek tamamlandı: {sum(len(qs) for qs in all_questions.values())} soru")
+        
+        return {
+            "success": True,
+            "questions": all_questions,
+            "total_questions": sum(len(qs) for qs in all_questions.values())
+        }
+    
+    def _build_single_request_prompt(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int]
+    ) -> tuple:
+        """
+        Tüm kategorileri tek istekte isteyen prompt'u oluştur.
+        
+        Returns:
+            tuple: (prompt, toplam_soru_sayısı)
+        """
+        # Zorluk dağılımını hesapla
+        difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
+        
+        # Kategori bilgilerini hazırla
+        from config.question_categories import get_active_question_categories
+        active_categories = get_active_question_categories()
+        category_details = []
+        total_questions = 0
+        
+        for category_code, category_name, category_description in active_categories:
+            count = question_counts.get(category_code, 0)
+            if count > 0:
+                category_details.append(f"- {category_name}: {count} adet soru")
+                total_questions += count
+        
+        categories_text = "\n".join(category_details)
+        
+        # Özel tek istek prompt'u
+        prompt = f"""İlan Başlığı: {job_context}
+Pozisyon: {role_name}
+Maaş Katsayısı: {salary_coefficient}x
+Özel Şartlar: {description}
 
 Bu pozisyon için toplam {total_questions} adet soru üret. Sorular şu kategorilerde dağılsın:
 
@@ -858,41 +1443,7 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
   ]
 }}"""
 
-            logger.info(f"Tek istek ile {total_questions} soru üretimi başlıyor...")
-            
-            # OpenAI API'sine istek gönder
-            config = get_openai_config()
-            response = self.client.chat.completions.create(
-                model=config["model"],
-                messages=[
-                    {"role": "system", "content": SYSTEM_MESSAGE},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=config["max_tokens"],
-                temperature=config["temperature"]
-            )
-            
-            generated_text = response.choices[0].message.content.strip()
-            logger.info(f"Tek istek yanıtı alındı: {len(generated_text)} karakter")
-            
-            # JSON parse et (kategoriler halinde)
-            all_questions = self._parse_all_questions(generated_text, question_counts)
-            
-            logger.info(f"Tek istek tamamlandı: {sum(len(qs) for qs in all_questions.values())} soru")
-            
-            return {
-                "success": True,
-                "questions": all_questions,
-                "total_questions": sum(len(qs) for qs in all_questions.values())
-            }
-            
-        except Exception as e:
-            logger.error(f"Tek istek hatası: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "questions": {}
-            }
+        return prompt, total_questions
     
     def generate_questions_category_based(
         self,
@@ -900,7 +1451,9 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
         job_context: str,
         description: str,
         salary_coefficient: int,
-        question_counts: Dict[str, int]
+        question_counts: Dict[str, int],
+        concurrent: Optional[bool] = None,
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
     ) -> Dict[str, Any]:
         """
         Kategori bazlı soru üretimi - En kaliteli sistem (≤15 soru için)
@@ -911,6 +1464,10 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             description: İş tanımı
             salary_coefficient: Maaş katsayısı
             question_counts: {kategori_kodu: soru_sayısı} formatında
+            concurrent: Kategori isteklerini aynı anda gönder
+                (None ise üreticinin varsayılanı kullanılır)
+            on_category_completed: Her başarılı kategori batch'i biter bitmez
+                (kategori_kodu, sorular) ile çağrılır (ör. çalıştırma günlüğü)
             
         Returns:
             dict: Her kategoriden kaliteli sorular
@@ -920,30 +1477,37 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             active_categories = get_active_question_categories()
             all_questions = {}
             
-            logger.info("KATEGORİ BAZLI sistem başlıyor - her kategori için ayrı API isteği")
+            if concurrent is None:
+                concurrent = self.concurrent_categories
             
+            pending_categories = [
+                category for category in active_categories
+                if question_counts.get(category[0], 0) > 0
+            ]
+            
+            if concurrent and len(pending_categories) > 1:
+                logger.info("KATEGORİ BAZLI sistem başlıyor - kategori istekleri eşzamanlı gönderiliyor")
+                batch_results = self._run_category_batches_concurrently(
+                    role_name, job_context, description, salary_coefficient,
+                    question_counts, pending_categories, on_category_completed
+                )
+            else:
+                logger.info("KATEGORİ BAZLI sistem başlıyor - her kategori için ayrı API isteği")
+                batch_results = {}
+                for category in pending_categories:
+                    batch_results[category[0]] = self._generate_category_batch(
+                        role_name, job_context, description, salary_coefficient,
+                        question_counts, category
+                    )
+                    self._notify_category_completed(on_category_completed, category[0], batch_results[category[0]])
+            
+            # Sonuçları order_index sırasıyla birleştir
             for category_code, category_name, category_description in active_categories:
-                question_count = question_counts.get(category_code, 0)
+                batch_result = batch_results.get(category_code)
                 
-                if question_count <= 0:
+                if batch_result is None:
                     all_questions[category_code] = []
-                    continue
-                    
-                logger.info(f"{category_name}: {question_count} adet soru üretiliyor...")
-                
-                # Kategori bazlı batch üretimi
-                batch_result = self.generate_questions_batch(
-                    role_name=role_name,
-                    job_context=job_context,
-                    description=description,
-                    salary_coefficient=salary_coefficient,
-                    question_type=category_code,
-                    type_name=category_name,
-                    type_description=category_description,
-                    question_count=question_count
-                )
-                
-                if batch_result.get("success", False):
+                elif batch_result.get("success", False):
                     all_questions[category_code] = batch_result["questions"]
                     logger.info(f"{category_name} başarılı: {len(batch_result['questions'])} soru")
                 else:
@@ -967,6 +1531,83 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
                 "questions": {}
             }
     
+    def _generate_category_batch(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int],
+        category: tuple
+    ) -> Dict[str, Any]:
+        """Tek bir kategori için batch üretimini çalıştır"""
+        category_code, category_name, category_description = category
+        question_count = question_counts.get(category_code, 0)
+        
+        logger.info(f"{category_name}: {question_count} adet soru üretiliyor...")
+        
+        return self.generate_questions_batch(
+            role_name=role_name,
+            job_context=job_context,
+            description=description,
+            salary_coefficient=salary_coefficient,
+            question_type=category_code,
+            type_name=category_name,
+            type_description=category_description,
+            question_count=question_count
+        )
+    
+    def _run_category_batches_concurrently(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_counts: Dict[str, int],
+        categories: List[tuple],
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Kategori batch'lerini thread havuzunda aynı anda çalıştır.
+        
+        OpenAI client'ı thread-safe olduğu için tüm kategoriler aynı client'ı
+        paylaşır; toplam süre en yavaş kategorinin süresine iner.
+        
+        Returns:
+            dict: {kategori_kodu: batch_sonucu}
+        """
+        max_workers = min(self.generation_config["category_workers"], len(categories))
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="category") as executor:
+            # Her görev kendi bağlam kopyasında: span ve kullanım bağlamı kategori thread'lerine taşınır
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._generate_category_batch,
+                    role_name, job_context, description, salary_coefficient,
+                    question_counts, category
+                ): category[0]
+                for category in categories
+            }
+            
+            # Biten kategori hemen bildirilir (günlük, yavaş kategoriyi beklemez)
+            for future in as_completed(futures):
+                category_code = futures[future]
+                try:
+                    results[category_code] = future.result()
+                    self._notify_category_completed(on_category_completed, category_code, results[category_code])
+                except Exception as e:
+                    logger.error(f"{category_code} eşzamanlı üretim hatası: {e}")
+                    results[category_code] = {
+                        "success": False,
+                        "error": str(e),
+                        "questions": [],
+                        "category": category_code
+                    }
+        
+        return results
+    
     def generate_questions_chunked(
         self,
         role_name: str,
@@ -989,40 +1630,16 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             dict: Tüm chunk'lardan birleştirilmiş sorular
         """
         try:
-            total_questions = sum(question_counts.values())
-            chunk_size = 50
-            chunks_needed = (total_questions + chunk_size - 1) // chunk_size
-            
-            logger.info(f"CHUNK SİSTEMİ: {total_questions} soru -> {chunks_needed} chunk ({chunk_size}'şer)")
+            chunk_plan = self._plan_chunks(question_counts)
+            chunks_needed = len(chunk_plan)
             
             all_results = {}
             for category_code in question_counts.keys():
                 all_results[category_code] = []
             
             # Her chunk için istek at
-            for chunk_num in range(chunks_needed):
-                start_idx = chunk_num * chunk_size
-                remaining = total_questions - start_idx
-                current_chunk_size = min(chunk_size, remaining)
-                
-                logger.info(f"Chunk {chunk_num + 1}/{chunks_needed}: {current_chunk_size} soru")
-                
-                # Bu chunk için question_counts'u hesapla
-                chunk_counts = {}
-                remaining_per_category = current_chunk_size
-                
-                for category_code, total_count in question_counts.items():
-                    if remaining_per_category <= 0:
-                        chunk_counts[category_code] = 0
-                    else:
-                        # Orantılı dağılım
-                        ratio = total_count / total_questions
-                        chunk_count = min(
-                            remaining_per_category,
-                            max(1, int(current_chunk_size * ratio))
-                        )
-                        chunk_counts[category_code] = chunk_count
-                        remaining_per_category -= chunk_count
+            for chunk_num, chunk_counts in enumerate(chunk_plan):
+                logger.info(f"Chunk {chunk_num + 1}/{chunks_needed}: {sum(chunk_counts.values())} soru")
                 
                 # Chunk isteği gönder
                 chunk_result = self.generate_all_questions_single_request(
@@ -1058,6 +1675,46 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
                 "questions": {}
             }
     
+    def _plan_chunks(self, question_counts: Dict[str, int], chunk_size: int = 50) -> List[Dict[str, int]]:
+        """
+        Toplam soru sayısını chunk'lara ve chunk içinde kategorilere orantılı böl.
+        
+        Returns:
+            list: Her chunk için {kategori_kodu: soru_sayısı}
+        """
+        total_questions = sum(question_counts.values())
+        chunks_needed = (total_questions + chunk_size - 1) // chunk_size
+        
+        logger.info(f"CHUNK SİSTEMİ: {total_questions} soru -> {chunks_needed} chunk ({chunk_size}'şer)")
+        
+        chunk_plan = []
+        for chunk_num in range(chunks_needed):
+            start_idx = chunk_num * chunk_size
+            remaining = total_questions - start_idx
+            current_chunk_size = min(chunk_size, remaining)
+            
+            # Bu chunk için question_counts'u hesapla
+            chunk_counts = {}
+            remaining_per_category = current_chunk_size
+            
+            for category_code, total_count in question_counts.items():
+                if remaining_per_category <= 0:
+                    chunk_counts[category_code] = 0
+                else:
+                    # Orantılı dağılım
+                    ratio = total_count / total_questions
+                    chunk_count = min(
+                        remaining_per_category,
+                        max(1, int(current_chunk_size * ratio))
+                    )
+                    chunk_counts[category_code] = chunk_count
+                    remaining_per_category -= chunk_count
+            
+            chunk_plan.append(chunk_counts)
+        
+        return chunk_plan
+    
+    @traced("generate.batch")
     def generate_questions_batch(
         self,
         role_name: str,
@@ -1067,7 +1724,9 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
         question_type: str,
         type_name: str,
         type_description: str,
-        question_count: int
+        question_count: int,
+        stream: Optional[bool] = None,
+        on_question: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Belirli bir kategori için toplu soru üretimi (daha verimli ve çeşitli)
@@ -1081,140 +1740,462 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             type_name: Soru kategorisi ismi
             type_description: Soru kategorisi açıklaması
             question_count: Üretilecek soru sayısı
+            stream: Yanıtı akış olarak al (None ise self.stream)
+            on_question: Akış modunda her soru çözülüp filtrelerden geçtiğinde
+                çağrılır (bkz. _filtered_question_callback)
             
         Returns:
             dict: Üretilen sorular listesi
         """
+        speculative = None
+        # Bu kategori için gönderilen isteklerin kullanım kayıtları (maliyet defteri)
+        context_token = push_usage_context(
+            role=role_name, difficulty=salary_coefficient, category=question_type,
+            question_count=question_count, call_site="batch"
+        )
+        current_span().set(role=role_name, difficulty=salary_coefficient, category=question_type, question_count=question_count)
         try:
-            # Zorluk dağılımını hesapla
-            difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
-            
-            # Prompt'u oluştur (Batch template kullan)
-            prompt = BATCH_PROMPT_TEMPLATE.format(
-                job_context=job_context,
-                role_name=role_name,
-                salary_coefficient=salary_coefficient,
-                description=description,
-                type_name=type_name,
-                type_description=type_description,
-                question_count=question_count,
-                K1=difficulty_distribution["K1_Temel_Bilgi"],
-                K2=difficulty_distribution["K2_Uygulamali"],
-                K3=difficulty_distribution["K3_Hata_Cozumleme"],
-                K4=difficulty_distribution["K4_Tasarim"],
-                K5=difficulty_distribution["K5_Stratejik"]
+            batch = self._prepare_batch(
+                role_name, job_context, description, salary_coefficient,
+                question_type, type_name, type_description, question_count
             )
             
-            logger.info(f"{type_name} - {question_count} soru toplu üretimi başlıyor...")
+            # Kabul oranı düşükse yedek istekleri ana istekle aynı anda başlat
+            speculative = self._start_speculative_fallbacks(batch)
             
             # OpenAI API'sine istek gönder
-            config = get_openai_config()
-            response = self.client.chat.completions.create(
-                model=config["model"],
-                messages=[
-                    {"role": "system", "content": SYSTEM_MESSAGE},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=config["max_tokens"],
-                temperature=config["temperature"]
-            )
-            
-            generated_text = response.choices[0].message.content.strip()
-            logger.info(f"OpenAI yanıtı alındı: {len(generated_text)} karakter")
-            
-            # JSON Array parse et (güçlendirilmiş)
-            questions_data = self._parse_questions_array_robust(generated_text)
-            
-            # Eğer parse başarısız oldu ama content var ise nested parse dene
-            if not questions_data and generated_text.strip():
-                logger.warning("Normal parse başarısız, nested JSON deneniyor...")
-                questions_data = self._try_parse_nested_json(generated_text)
-            
-            # Hala boşsa, corrupted JSON string'i düzeltmeyi dene
-            if not questions_data and generated_text.strip():
-                logger.warning("Nested parse başarısız, corrupted JSON repair deneniyor...")
-                questions_data = self._try_repair_corrupted_json(generated_text)
-            
-            # Son çare: Fallback parse
-            if not questions_data:
-                logger.error("Tüm parse yöntemleri başarısız, fallback...")
-                questions_data = self._fallback_parse(generated_text)
-            
-            # 5–10 satır şartını pratik uygulama için uygula
-            if question_type == "practical_application":
-                # 1) Kod satır aralığı kontrolü
-                kept: List[Dict[str, Any]] = []
-                for q in questions_data:
-                    cb = self._extract_code_block_from_question(q.get("question", ""))
-                    num = self._count_code_lines(cb or "")
-                    if 5 <= num <= 10:
-                        kept.append(q)
-
-                # 2) Eksik kod sorularını katı mod ile tamamlama
-                deficit = max(0, question_count - len(kept))
-                if deficit > 0:
-                    logger.warning(f"Pratik Uygulama: {deficit} kod sorusu eksik. Katı mod denenecek.")
-                    extra = self._generate_practical_code_questions_strict(
-                        role_name, job_context, description, salary_coefficient,
-                        type_name, type_description, deficit
-                    )
-                    kept.extend(extra)
-
-                # 3) Hâlâ eksikse kod içermeyen pratik sorularla doldur (toplamı garanti altına al)
-                deficit2 = max(0, question_count - len(kept))
-                if deficit2 > 0:
-                    logger.warning(f"Pratik Uygulama: katı mod da yetersiz. {deficit2} adet KODSUZ pratik soru ile tamamlanacak.")
-                    nocode = self._generate_practical_nocode_questions(
-                        role_name, job_context, description, salary_coefficient,
-                        type_name, type_description, deficit2
-                    )
-                    kept.extend(nocode)
-
-                # 4) Uniq + hedef uzunluğa indir
-                kept = self._deduplicate_by_question(kept)[:question_count]
-                questions_data = kept
-
-            # Her soruya metadata ekle
-            for i, question in enumerate(questions_data):
-                # Pratik dışı kategorilerde kodu temizle
-                if question_type != "practical_application":
-                    original_q = question.get("question", "")
-                    question["question"] = self._sanitize_non_practical_question(original_q)
-                question.update({
-                    "question_type": question_type,
-                    "type_name": type_name,
-                    "role": role_name,
-                    "salary_coefficient": salary_coefficient,
-                    "difficulty_distribution": difficulty_distribution,
-                    "api_used": "openai",
-                    "raw_response": None
-                })
+            if batch["prefetched"] is not None:
+                questions_data = self._parse_prefetched_response(batch["prefetched"])
+            elif self.stream if stream is None else stream:
+                questions_data = self._stream_questions(batch["prompt"], self._filtered_question_callback(batch, on_question))
+            else:
+                generated_text = self._complete_prompt(batch["prompt"], response_format=self.question_response_format)
+                logger.info(f"OpenAI yanıtı alındı: {len(generated_text)} karakter")
+                
+                questions_data = self._parse_generated_questions(generated_text)
             
-            logger.info(f"{type_name} kategorisi tamamlandı: {len(questions_data)} / hedef {question_count} soru")
-            
-            return {
-                "success": True,
-                "questions": questions_data,
-                "category": question_type,
-                "total_questions": len(questions_data)
-            }
+            return self._run_batch_pipeline(batch, self._batch_pipeline(batch, questions_data, speculative is not None), speculative)
             
         except Exception as e:
             logger.error(f"Batch soru üretim hatası: {e}")
+            return self._batch_error(e, question_type)
+        finally:
+            # Henüz başlamamış kullanılmayan yedekler iptal edilir (gönderilmiş istek durdurulamaz)
+            for future in (speculative or {}).values():
+                future.cancel()
+            pop_usage_context(context_token)
+
+    def _prepare_batch(
+        self,
+        role_name: str,
+        job_context: str,
+        description: str,
+        salary_coefficient: int,
+        question_type: str,
+        type_name: str,
+        type_description: str,
+        question_count: int
+    ) -> Dict[str, Any]:
+        """
+        Kategori batch'ini hazırla: kabul oranı planı, varsa Batch API yanıtı ve prompt.
+        
+        Returns:
+            dict: İstek alanları + plan, prefetched, prompt, difficulty_distribution
+        """
+        # Geçmiş kabul oranına göre hedeften fazla iste
+        plan = self._plan_batch(role_name, question_type, type_name, question_count)
+        prefetched = self._take_prefetched(role_name, salary_coefficient, question_type)
+        if prefetched is not None:
+            # Batch API yanıtı: derlenen istek boyutu geçerli, beklenecek gecikme yok
+            plan = {**plan, "request_count": prefetched["request_count"], "speculative": False}
+        
+        # Prompt'u oluştur (Batch template kullan)
+        prompt, difficulty_distribution = self._build_batch_prompt(
+            role_name, job_context, description, salary_coefficient,
+            type_name, type_description, plan["request_count"]
+        )
+        logger.info(f"{type_name} - {plan['request_count']} soru toplu üretimi başlıyor...")
+        
+        return {
+            "role_name": role_name,
+            "job_context": job_context,
+            "description": description,
+            "salary_coefficient": salary_coefficient,
+            "question_type": question_type,
+            "type_name": type_name,
+            "type_description": type_description,
+            "question_count": question_count,
+            "plan": plan,
+            "prefetched": prefetched,
+            "prompt": prompt,
+            "difficulty_distribution": difficulty_distribution
+        }
+
+    def _filtered_question_callback(
+        self,
+        batch: Dict[str, Any],
+        on_question: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Optional[Callable[[Dict[str, Any]], None]]:
+        """
+        Akıştan gelen soruyu on_question'a yalnızca yakın-tekrar (rol geçmişi ve
+        önceki bildirilenler) ve pratik kategoride kod satırı filtresinden
+        geçerse ilet.
+        
+        Bildirilen sorular yine de geçicidir: fazla üretimde hedef sayıya
+        indirme bazılarını dışarıda bırakabilir, defisit doldurmadan gelenler
+        ise bildirilmez. Nihai liste sonucun "questions" alanıdır.
+        """
+        if on_question is None:
+            return None
+        role_name = batch["role_name"]
+        question_type = batch["question_type"]
+        emitted: List[Dict[str, Any]] = []
+        
+        def emit(item: Dict[str, Any]):
+            if question_type == "practical_application" and not self._has_valid_code_block(item):
+                return
+            if self.near_duplicates is not None:
+                kept, _ = self.near_duplicates.filter(
+                    role_name, [item],
+                    text_of=lambda question: self._near_duplicate_text(question, question_type),
+                    accepted=emitted,
+                    record_stats=False
+                )
+                if not kept:
+                    return
+            emitted.append(item)
+            on_question(item)
+        
+        return emit
+
+    def _parse_prefetched_response(self, prefetched: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Batch API'den önceden alınmış yanıtı canlı yanıtla aynı yoldan çöz"""
+        generated_text = prefetched["text"]
+        logger.info(f"Batch API yanıtı kullanılıyor: {len(generated_text)} karakter")
+        return self._parse_generated_questions(generated_text)
+
+    def _batch_pipeline(
+        self,
+        batch: Dict[str, Any],
+        questions_data: List[Dict[str, Any]],
+        speculative: bool
+    ) -> Generator[Tuple[str, int, List[Dict[str, Any]]], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Ana yanıttan sonraki filtre ve defisit doldurma akışı (senkron ve async
+        üreticinin ortak mantığı).
+        
+        Ek istek gerektiğinde (tür, soru sayısı, kaçınılacak sorular) üçlüsünü
+        verir ve çözülen soruları send ile geri alır; isteği _run_batch_pipeline
+        gönderir. Türler için bkz. _refill_request.
+        
+        Returns:
+            dict: _build_batch_result sonucu
+        """
+        role_name = batch["role_name"]
+        question_type = batch["question_type"]
+        question_count = batch["question_count"]
+        plan = batch["plan"]
+        
+        # Rolün geçmişine yakın (parafraz) soruları ele; açık defisit doldurmaya gider
+        questions_data, near_duplicates = self._filter_near_duplicates(role_name, question_type, questions_data)
+        
+        # 5–10 satır şartını pratik uygulama için uygula
+        if question_type == "practical_application":
+            # 1) Kod satır aralığı kontrolü (kabul oranı planlayıcıya yazılır)
+            kept = self._filter_code_questions(questions_data)
+            self._record_acceptance(role_name, question_type, plan["request_count"], len(kept))
+            kept = self._take_evenly(kept, question_count)
+            
+            # 2) Eksik kod sorularını katı mod ile tamamlama
+            deficit = max(0, question_count - len(kept))
+            if deficit > 0:
+                if speculative:
+                    logger.info(f"Pratik Uygulama: {deficit} kod sorusu eksik. Spekülatif katı mod sonucu kullanılıyor.")
+                    strict_requested = plan["fallback_count"]
+                else:
+                    logger.warning(f"Pratik Uygulama: {deficit} kod sorusu eksik. Katı mod denenecek.")
+                    strict_requested = deficit
+                extra = yield "strict", deficit, near_duplicates
+                self._record_acceptance(role_name, question_type + STRICT_SUFFIX, strict_requested, len(extra))
+                extra, rejected = self._filter_near_duplicates(role_name, question_type, extra, accepted=kept)
+                near_duplicates.extend(rejected)
+                kept.extend(extra)
+            
+            # 3) Hâlâ eksikse kod içermeyen pratik sorularla doldur (toplamı garanti altına al)
+            deficit2 = max(0, question_count - len(kept))
+            if deficit2 > 0:
+                logger.warning(f"Pratik Uygulama: katı mod da yetersiz. {deficit2} adet KODSUZ pratik soru ile tamamlanacak.")
+                nocode = yield "nocode", deficit2, near_duplicates
+                nocode, _ = self._filter_near_duplicates(role_name, question_type, nocode, accepted=kept)
+                kept.extend(nocode)
+            
+            if speculative and deficit == 0:
+                logger.info("Pratik Uygulama: fazla üretim yeterli oldu, spekülatif yedekler kullanılmadı.")
+            
+            # 4) Uniq + hedef uzunluğa indir
+            questions_data = self._deduplicate_by_question(kept)[:question_count]
+        else:
+            self._record_acceptance(role_name, question_type, plan["request_count"], len(questions_data))
+            questions_data = self._take_evenly(questions_data, question_count)
+            
+            # Elenen yakın-tekrarların açtığı açığı yeni isteklerle kapat (en fazla refill_rounds tur)
+            rejected = near_duplicates
+            for _ in range(self.near_duplicate_refill_rounds):
+                deficit = question_count - len(questions_data)
+                if deficit <= 0 or not rejected:
+                    break
+                logger.warning(f"{batch['type_name']}: {deficit} soru eksik ({len(rejected)} yakın-tekrar). Yenileri isteniyor...")
+                extra = yield "replacement", deficit, rejected
+                extra, rejected = self._filter_near_duplicates(role_name, question_type, extra, accepted=questions_data)
+                questions_data = questions_data + extra[:deficit]
+        
+        result = self._build_batch_result(
+            questions_data, role_name, batch["salary_coefficient"], question_type,
+            batch["type_name"], question_count, batch["difficulty_distribution"]
+        )
+        self._register_near_duplicates(role_name, result["questions"])
+        return result
+
+    def _refill_request(self, kind: str) -> Callable[..., Any]:
+        """
+        _batch_pipeline'ın istediği ek üretim metodu: "strict" (5–10 satır kodlu),
+        "nocode" (kodsuz pratik) veya "replacement" (yakın-tekrar yerine yenisi).
+        Hepsi (rol alanları..., sayı, kaçınılacak sorular) alır.
+        """
+        return {
+            "strict": self._generate_practical_code_questions_strict,
+            "nocode": self._generate_practical_nocode_questions,
+            "replacement": self._generate_replacement_questions
+        }[kind]
+
+    @staticmethod
+    def _refill_args(batch: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Ek üretim metotlarının ortak rol / kategori argümanları"""
+        return (
+            batch["role_name"], batch["job_context"], batch["description"], batch["salary_coefficient"],
+            batch["type_name"], batch["type_description"]
+        )
+
+    def _run_batch_pipeline(
+        self,
+        batch: Dict[str, Any],
+        pipeline: Generator[Tuple[str, int, List[Dict[str, Any]]], List[Dict[str, Any]], Dict[str, Any]],
+        speculative: Optional[Dict[str, Future]]
+    ) -> Dict[str, Any]:
+        """_batch_pipeline'ı sür: ek istekleri gönder, spekülatif sonuç varsa onu kullan"""
+        try:
+            kind, count, avoid = next(pipeline)
+            while True:
+                if speculative and kind in speculative:
+                    items = speculative[kind].result()
+                else:
+                    items = self._refill_request(kind)(*self._refill_args(batch), count, avoid)
+                kind, count, avoid = pipeline.send(items)
+        except StopIteration as finished:
+            return finished.value
+
+    def _plan_batch(
+        self,
+        role_name: str,
+        question_type: str,
+        type_name: str,
+        question_count: int
+    ) -> Dict[str, Any]:
+        """Öğrenilmiş kabul oranına göre batch istek boyutunu planla"""
+        try:
+            plan = self.overgeneration_planner.plan(role_name, question_type, question_count)
+        except Exception as e:
+            logger.error(f"Fazla üretim planı alınamadı: {e}")
             return {
-                "success": False,
-                "error": str(e),
-                "questions": [],
-                "category": question_type
+                "request_count": question_count, "acceptance_rate": 1.0, "samples": 0,
+                "speculative": False, "fallback_count": 0
             }
+        if plan["request_count"] > question_count:
+            logger.info(
+                f"📈 {type_name}: kabul oranı %{plan['acceptance_rate'] * 100:.0f} "
+                f"({plan['samples']} gözlem) → hedef {question_count}, istenen {plan['request_count']}"
+            )
+        return plan
+
+    def _record_acceptance(self, role_name: str, question_type: str, requested: int, accepted: int):
+        """Filtrelerden geçen soru oranını planlayıcıya yaz; hata üretimi bozmaz"""
+        try:
+            self.overgeneration_planner.record(role_name, question_type, requested, accepted)
+        except Exception as e:
+            logger.error(f"Kabul oranı kaydedilemedi: {e}")
+
+    @staticmethod
+    def _take_evenly(items: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+        """Fazla üretilen listeden zorluk sırasını koruyarak eşit aralıklı count soru seç"""
+        if len(items) <= count:
+            return items
+        step = len(items) / count
+        return [items[int(i * step)] for i in range(count)]
+
+    def _start_speculative_fallbacks(self, batch: Dict[str, Any]) -> Optional[Dict[str, Future]]:
+        """
+        Pratik uygulamada açık riski yüksekse katı mod ve kodsuz yedek istekleri
+        ana istekle paralel başlat.
 
+        Yedekler paylaşılan sınırlı havuzda çalışır; kullanılmayanlar başlamadan
+        iptal edilir. Gönderilmiş bir yedek durdurulamaz ve ücretlendirilir
+        (istek başına en fazla fallback_count soru; maliyet defterinde
+        strict_code / nocode çağrı noktası).
+
+        Returns:
+            dict | None: {"strict": Future, "nocode": Future} veya spekülasyon yoksa None
+        """
+        plan = batch["plan"]
+        if batch["question_type"] != "practical_application" or not plan["speculative"]:
+            return None
+
+        logger.info(
+            f"⚡ {batch['type_name']}: kabul oranı düşük (%{plan['acceptance_rate'] * 100:.0f}), "
+            f"katı mod ve kodsuz yedekler ({plan['fallback_count']} soru) paralel başlatılıyor"
+        )
+        args = self._refill_args(batch) + (plan["fallback_count"], self._known_near_duplicates(batch["role_name"]))
+        executor = get_speculative_executor()
+        # Kullanım bağlamı (rol/kategori) yedek isteklerin thread'lerine taşınır
+        return {
+            kind: executor.submit(contextvars.copy_context().run, self._refill_request(kind), *args)
+            for kind in ("strict", "nocode")
+        }
+
+    def _known_near_duplicates(self, role_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Ana yanıt gelmeden başlatılan yedeklerin kaçınacağı sorular: rolün
+        yakın-tekrar indeksine son eklenenler (_avoid_near_duplicates_block biçiminde)
+        """
+        if self.near_duplicates is None:
+            return []
+        return [{"duplicate_of": text} for text in self.near_duplicates.recent(role_name, limit)]
+
+    @traced("parse.generated")
+    def _parse_generated_questions(self, generated_text: str) -> List[Dict[str, Any]]:
+        """
+        Batch yanıtını çöz: şemaya uygunsa onarımsız hızlı yol, değilse tek
+        geçişli tarayıcı, o da sonuçsuzsa eski parse zinciri.
+        """
+        questions_data = self._parse_structured(generated_text)
+        if questions_data is not None:
+            return questions_data
+        
+        questions_data = self._scan_generated_questions(generated_text)
+        if questions_data:
+            return questions_data
+        
+        if generated_text.strip():
+            logger.warning("Tek geçişli tarayıcı soru bulamadı, eski parse zinciri deneniyor...")
+        questions_data = self._parse_with_legacy_cascade(generated_text)
+        self.parse_path_stats.record("legacy_cascade" if questions_data else "failed")
+        return questions_data
+    
+    @traced("parse.structured")
+    def _parse_structured(self, generated_text: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Yapılandırılmış çıktı modunda şemaya uygun yanıtı onarımsız çöz.
+        
+        Returns:
+            list | None: Sorular; mod kapalıysa veya yanıt şemaya uymuyorsa None
+        """
+        if not self.structured_output:
+            return None
+        questions = parse_structured_questions(generated_text)
+        if questions is None:
+            logger.warning("Yanıt JSON şemasına uymuyor, tarayıcıya düşülüyor")
+            return None
+        self.parse_path_stats.record("structured")
+        return self._format_questions_array(questions)
+    
+    @traced("parse.scanner")
+    def _scan_generated_questions(self, generated_text: str) -> List[Dict[str, Any]]:
+        """Yanıtı toleranslı JSON tarayıcı ile tek geçişte çöz, onarımları logla"""
+        scan = scan_questions(generated_text)
+        questions_data = self._format_questions_array(scan["questions"])
+        if questions_data:
+            self.parse_path_stats.record("scanner_repaired" if scan["repairs"] else "scanner")
+        if questions_data and scan["repairs"]:
+            logger.info(f"🔧 Tarayıcı onarımları: {', '.join(scan['repairs'])} ({len(questions_data)} soru)")
+        return questions_data
+    
+    @traced("parse.legacy_cascade")
+    def _parse_with_legacy_cascade(self, generated_text: str) -> List[Dict[str, Any]]:
+        """Eski çok stratejili parse zinciri (robust → nested → repair → fallback)"""
+        # JSON Array parse et (güçlendirilmiş)
+        questions_data = self._parse_questions_array_robust(generated_text)
+        
+        # Eğer parse başarısız oldu ama content var ise nested parse dene
+        if not questions_data and generated_text.strip():
+            logger.warning("Normal parse başarısız, nested JSON deneniyor...")
+            questions_data = self._try_parse_nested_json(generated_text)
+        
+        # Hala boşsa, corrupted JSON string'i düzeltmeyi dene
+        if not questions_data and generated_text.strip():
+            logger.warning("Nested parse başarısız, corrupted JSON repair deneniyor...")
+            questions_data = self._try_repair_corrupted_json(generated_text)
+        
+        # Son çare: Fallback parse
+        if not questions_data:
+            logger.error("Tüm parse yöntemleri başarısız, fallback...")
+            questions_data = self._fallback_parse(generated_text)
+        
+        return questions_data
+
+    def _build_batch_result(
+        self,
+        questions_data: List[Dict[str, Any]],
+        role_name: str,
+        salary_coefficient: int,
+        question_type: str,
+        type_name: str,
+        question_count: int,
+        difficulty_distribution: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Batch sorularına metadata ekleyip sonuç sözlüğünü oluştur"""
+        # Her soruya metadata ekle
+        for i, question in enumerate(questions_data):
+            # Pratik dışı kategorilerde kodu temizle
+            if question_type != "practical_application":
+                original_q = question.get("question", "")
+                question["question"] = self._sanitize_non_practical_question(original_q)
+            question.update({
+                "question_type": question_type,
+                "type_name": type_name,
+                "role": role_name,
+                "salary_coefficient": salary_coefficient,
+                "difficulty_distribution": difficulty_distribution,
+                "api_used": "openai",
+                "raw_response": None
+            })
+        
+        logger.info(f"{type_name} kategorisi tamamlandı: {len(questions_data)} / hedef {question_count} soru")
+        
+        return {
+            "success": True,
+            "questions": questions_data,
+            "category": question_type,
+            "total_questions": len(questions_data)
+        }
+
+    def _batch_error(self, error: Exception, question_type: str) -> Dict[str, Any]:
+        """Batch üretim hatası sonucu"""
+        return {
+            "success": False,
+            "error": str(error),
+            "questions": [],
+            "category": question_type
+        }
+
+    @traced("generate.role")
     def generate_questions_for_role(
         self,
         role_name: str,
         job_context: str,
         description: str,
         salary_coefficient: int,
-        question_counts: Dict[str, int]
+        question_counts: Dict[str, int],
+        completed_questions: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
     ) -> Dict[str, Any]:
         """
         Bir rol için tüm kategorilerde sorular üret.
@@ -1225,6 +2206,10 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             description: İş tanımı
             salary_coefficient: Maaş katsayısı
             question_counts: {kategori_kodu: soru_sayısı} formatında soru sayıları
+            completed_questions: Önceki (yarıda kalmış) çalıştırmada tamamlanan
+                kategoriler {kategori_kodu: sorular}; bunlar için istek gönderilmez
+            on_category_completed: Her başarılı kategori batch'inden sonra
+                (kategori_kodu, sorular) ile çağrılır
             
         Returns:
             dict: Üretilen tüm sorular
@@ -1234,6 +2219,9 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
         all_questions = {}
         active_categories = get_active_question_categories()
         
+        completed_questions = completed_questions or {}
+        question_counts = self._remaining_question_counts(question_counts, completed_questions)
+        
         # TEK API İSTEĞİ ile tüm soruları üret
         total_questions = sum(question_counts.values())
         
@@ -1244,21 +2232,19 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             job_context=job_context,
             description=description,
             salary_coefficient=salary_coefficient,
-            question_counts=question_counts
+            question_counts=question_counts,
+            on_category_completed=on_category_completed
         )
         
         if all_batch_result.get("success", False):
             all_questions = all_batch_result["questions"]
             
+            # Günlükten gelen kategorileri ekle
+            for category_code, questions in completed_questions.items():
+                all_questions[category_code] = list(questions)
+            
             # Metadata'yı doldur
-            difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
-            for category_code, questions_list in all_questions.items():
-                for question in questions_list:
-                    question.update({
-                        "role": role_name,
-                        "salary_coefficient": salary_coefficient,
-                        "difficulty_distribution": difficulty_distribution
-                    })
+            self._fill_role_metadata(all_questions, role_name, salary_coefficient)
             
             logger.info(f"TEK İSTEK başarılı: {all_batch_result.get('total_questions', 0)} soru")
         else:
@@ -1267,6 +2253,9 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
             for category_code, category_name, category_description in active_categories:
                 question_count = question_counts.get(category_code, 0)
                 
+                if category_code in completed_questions:
+                    all_questions[category_code] = list(completed_questions[category_code])
+                    continue
                 if question_count <= 0:
                     continue
                     
@@ -1285,10 +2274,64 @@ Sonuç şu JSON formatında döndürülmelidir (category_code kullan):
                 
                 if batch_result.get("success", False):
                     all_questions[category_code] = batch_result["questions"]
+                    self._notify_category_completed(on_category_completed, category_code, batch_result)
                 else:
                     all_questions[category_code] = []
         
         logger.info(f"{role_name} için soru üretimi tamamlandı")
+        return self._build_role_result(all_questions, role_name, salary_coefficient)
+
+    def _remaining_question_counts(
+        self,
+        question_counts: Dict[str, int],
+        completed_questions: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """Günlükte tamamlanmış kategorileri çıkar (devam eden çalıştırmada yeniden istenmez)"""
+        if not completed_questions:
+            return question_counts
+        logger.info(f"Devam: {list(completed_questions)} kategorileri günlükten alınıyor")
+        return {
+            category_code: count for category_code, count in question_counts.items()
+            if category_code not in completed_questions
+        }
+
+    def _notify_category_completed(
+        self,
+        callback: Optional[Callable[[str, List[Dict[str, Any]]], None]],
+        category_code: str,
+        batch_result: Dict[str, Any]
+    ):
+        """Soru üreten başarılı kategori batch'ini bildir; bildirim hatası üretimi bozmaz"""
+        if callback is None or not batch_result.get("success", False) or not batch_result.get("questions"):
+            return
+        try:
+            callback(category_code, batch_result["questions"])
+        except Exception as e:
+            logger.error(f"Kategori tamamlanma bildirimi hatası ({category_code}): {e}")
+
+    def _fill_role_metadata(
+        self,
+        all_questions: Dict[str, List[Dict[str, Any]]],
+        role_name: str,
+        salary_coefficient: int
+    ):
+        """Tüm kategorilerdeki sorulara rol metadata'sını yaz"""
+        difficulty_distribution = get_difficulty_distribution_by_multiplier(salary_coefficient)
+        for category_code, questions_list in all_questions.items():
+            for question in questions_list:
+                question.update({
+                    "role": role_name,
+                    "salary_coefficient": salary_coefficient,
+                    "difficulty_distribution": difficulty_distribution
+                })
+
+    def _build_role_result(
+        self,
+        all_questions: Dict[str, List[Dict[str, Any]]],
+        role_name: str,
+        salary_coefficient: int
+    ) -> Dict[str, Any]:
+        """Rol bazlı üretim sonuç sözlüğünü oluştur"""
         return {
             "success": True,
             "role": role_name,
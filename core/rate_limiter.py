@@ -0,0 +1,434 @@
+"""
+OPENAI İSTEK HIZ SINIRLAYICI
+============================
+
+Tüm chat.completions çağrılarının geçtiği paylaşılan throttling katmanı:
+
+- RPM ve TPM için ayrı token bucket'lar (dakikalık limitler)
+- AIMD tarzı uyarlanabilir eşzamanlılık: başarıda limit yavaşça artar,
+  429 yanıtında yarıya iner
+- Retry-After / retry-after-ms başlıklarına uyan bekleme ve yeniden deneme
+
+Hem thread (senkron) hem asyncio çağrıları aynı sınırlayıcıyı paylaşabilir.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config.openai_settings import get_rate_limit_config
+
+logger = logging.getLogger(__name__)
+
+# Token tahmini için yaklaşık karakter/token oranı
+CHARS_PER_TOKEN = 4
+
+class TokenBucket:
+    """Dakikalık hız limiti için token bucket"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate_per_minute: Dakikada eklenen token sayısı (<= 0 ise sınırsız)
+            capacity: Maksimum birikme (varsayılan: bir dakikalık limit)
+        """
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate_per_second <= 0
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+
+    def reserve(self, amount: float) -> float:
+        """
+        Token ayır ve ayrılan tokenlar kullanılabilir olana kadar beklenecek
+        süreyi döndür. Bakiye eksiye düşebilir; sonraki istekler borcu öder.
+
+        Returns:
+            float: Beklenecek süre (saniye)
+        """
+        if self.unlimited:
+            return 0.0
+
+        # Kapasiteden büyük istekler hiç karşılanamaz; kapasiteye kırp
+        amount = min(amount, self.capacity)
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate_per_second
+
+    def refund(self, amount: float):
+        """Fazla ayrılan tokenları iade et (gerçek kullanım tahminden azsa)"""
+        if self.unlimited or amount <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def charge(self, amount: float):
+        """Tahminden fazla kullanılan tokenları bakiyeden düş"""
+        if self.unlimited or amount <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= amount
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD (additive increase / multiplicative decrease) eşzamanlılık sınırlayıcı"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        decrease_factor: float = 0.5
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.decrease_factor = decrease_factor
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def _can_acquire(self, now: float) -> bool:
+        return now >= self.blocked_until and self.in_flight < max(self.min_concurrency, int(self.limit))
+
+    def _wait_hint(self, now: float) -> float:
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        return 0.05
+
+    def acquire(self):
+        """Slot boşalana (ve Retry-After süresi dolana) kadar bekle"""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._can_acquire(now):
+                    self.in_flight += 1
+                    return
+                self._condition.wait(timeout=self._wait_hint(now))
+
+    async def acquire_async(self):
+        """acquire'ın event loop'u bloklamayan karşılığı"""
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                if self._can_acquire(now):
+                    self.in_flight += 1
+                    return
+                delay = self._wait_hint(now)
+            await asyncio.sleep(delay)
+
+    def release(self, rate_limited: bool = False, retry_after: Optional[float] = None, success: bool = True):
+        """
+        Slotu bırak ve limiti güncelle.
+
+        Args:
+            rate_limited: İstek 429 ile döndüyse True (limit yarıya iner)
+            retry_after: Sunucunun bildirdiği bekleme süresi (saniye)
+            success: İstek başarılıysa True (limit yavaşça artar)
+        """
+        with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if rate_limited:
+                self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+                if retry_after:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+                logger.warning(f"Rate limit: eşzamanlılık limiti {self.limit:.2f} değerine düşürüldü")
+            elif success:
+                self.limit = min(float(self.max_concurrency), self.limit + 1.0 / max(self.limit, 1.0))
+            self._condition.notify_all()
+
+class RateLimiter:
+    """RPM/TPM bucket'ları ve AIMD eşzamanlılığını birleştiren paylaşılan sınırlayıcı"""
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.concurrency = AdaptiveConcurrencyLimiter(max_concurrency, min_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "rate_limited": 0,
+            "retries": 0,
+            "failures": 0,
+            "throttle_wait_seconds": 0.0
+        }
+
+    @staticmethod
+    def estimate_tokens(messages: List[Dict[str, str]], max_tokens: int = 0) -> int:
+        """
+        İsteğin TPM bütçesinden düşülecek token sayısını tahmin et.
+
+        OpenAI limit hesabında max_tokens da sayıldığı için tahmine eklenir;
+        yanıt geldikten sonra gerçek kullanım ile fark düzeltilir.
+        """
+        prompt_chars = sum(len(message.get("content") or "") for message in messages)
+        return prompt_chars // CHARS_PER_TOKEN + (max_tokens or 0)
+
+    def _record(self, key: str, amount: float = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        """Sınırlayıcı istatistiklerini döndür"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["concurrency_limit"] = round(self.concurrency.limit, 2)
+        stats["in_flight"] = self.concurrency.in_flight
+        return stats
+
+    def _reserve_budget(self, estimated_tokens: int) -> float:
+        wait = max(
+            self.request_bucket.reserve(1),
+            self.token_bucket.reserve(estimated_tokens)
+        )
+        if wait > 0:
+            self._record("throttle_wait_seconds", wait)
+            logger.info(f"Rate limit bütçesi: {wait:.2f} sn bekleniyor")
+        return wait
+
+    def _reconcile_tokens(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        if actual_tokens is None:
+            return
+        difference = estimated_tokens - actual_tokens
+        if difference > 0:
+            self.token_bucket.refund(difference)
+        else:
+            self.token_bucket.charge(-difference)
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    def _handle_failure(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Hatayı sınıflandır ve yeniden denenecekse bekleme süresini döndür.
+
+        Returns:
+            float | None: Bekleme süresi; None ise hata yeniden fırlatılmalı
+        """
+        rate_limited = is_rate_limit_error(error)
+        retry_after = get_retry_after_seconds(error) if rate_limited else None
+
+        self.concurrency.release(rate_limited=rate_limited, retry_after=retry_after, success=False)
+        if rate_limited:
+            self._record("rate_limited")
+
+        if attempt >= self.max_retries or not (rate_limited or is_transient_error(error)):
+            self._record("failures")
+            return None
+
+        self._record("retries")
+        delay = self._backoff_delay(attempt, retry_after)
+        logger.warning(
+            f"İstek {'429 ile reddedildi' if rate_limited else 'geçici hata verdi'} "
+            f"({error.__class__.__name__}); {delay:.2f} sn sonra tekrar denenecek "
+            f"({attempt + 1}/{self.max_retries})"
+        )
+        return delay
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        estimated_tokens: int = 0,
+        usage_tokens: Optional[Callable[[Any], Optional[int]]] = None
+    ) -> Any:
+        """
+        Fonksiyonu hız limitleri altında çalıştır (senkron).
+
+        Args:
+            fn: API isteğini yapan fonksiyon
+            estimated_tokens: TPM bütçesinden ayrılacak token tahmini
+            usage_tokens: Sonuçtan gerçek toplam token sayısını çıkaran fonksiyon
+
+        Returns:
+            fn'in döndürdüğü değer
+        """
+        attempt = 0
+        while True:
+            self.concurrency.acquire()
+            released = False
+            try:
+                wait = self._reserve_budget(estimated_tokens)
+                if wait > 0:
+                    time.sleep(wait)
+
+                self._record("requests")
+                try:
+                    result = fn()
+                except Exception as error:
+                    released = True
+                    delay = self._handle_failure(error, attempt)
+                    if delay is None:
+                        raise
+                else:
+                    released = True
+                    self.concurrency.release(success=True)
+                    self._reconcile_tokens(estimated_tokens, usage_tokens(result) if usage_tokens else None)
+                    return result
+            finally:
+                # KeyboardInterrupt / iptal: slot bırakılmazsa paylaşılan sınırlayıcı kilitlenir
+                if not released:
+                    self.concurrency.release(success=False)
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        estimated_tokens: int = 0,
+        usage_tokens: Optional[Callable[[Any], Optional[int]]] = None
+    ) -> Any:
+        """call'un asyncio karşılığı; fn bir coroutine döndürmelidir"""
+        attempt = 0
+        while True:
+            await self.concurrency.acquire_async()
+            released = False
+            try:
+                wait = self._reserve_budget(estimated_tokens)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                self._record("requests")
+                try:
+                    result = await fn()
+                except Exception as error:
+                    released = True
+                    delay = self._handle_failure(error, attempt)
+                    if delay is None:
+                        raise
+                else:
+                    released = True
+                    self.concurrency.release(success=True)
+                    self._reconcile_tokens(estimated_tokens, usage_tokens(result) if usage_tokens else None)
+                    return result
+            finally:
+                # CancelledError (gather / spekülatif görev iptali): slot her durumda bırakılır
+                if not released:
+                    self.concurrency.release(success=False)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+def _error_status_code(error: Exception) -> Optional[int]:
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return status_code
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Hatanın HTTP 429 (rate limit) olup olmadığını kontrol et"""
+    return _error_status_code(error) == 429
+
+def is_transient_error(error: Exception) -> bool:
+    """Bağlantı/zaman aşımı/5xx gibi yeniden denenebilir hataları tespit et"""
+    status_code = _error_status_code(error)
+    if status_code is not None:
+        return status_code in (408, 409) or status_code >= 500
+    try:
+        from openai import APIConnectionError
+        if isinstance(error, APIConnectionError):
+            return True
+    except ImportError:
+        pass
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+def get_retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Hata yanıtındaki retry-after-ms / Retry-After başlığını saniyeye çevir.
+
+    Returns:
+        float | None: Bekleme süresi (başlık yoksa None)
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(retry_after)
+        return max(0.0, retry_date.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """
+    Süreç genelinde paylaşılan sınırlayıcıyı döndür (yoksa ayarlardan oluştur).
+
+    Returns:
+        RateLimiter: Paylaşılan sınırlayıcı
+    """
+    global _shared_limiter
+
+    if _shared_limiter is not None:
+        return _shared_limiter
+
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            config = get_rate_limit_config()
+            _shared_limiter = RateLimiter(
+                requests_per_minute=config["requests_per_minute"],
+                tokens_per_minute=config["tokens_per_minute"],
+                max_concurrency=config["max_concurrency"],
+                min_concurrency=config["min_concurrency"],
+                max_retries=config["max_retries"]
+            )
+            logger.info(
+                f"Rate limiter başlatıldı: RPM={config['requests_per_minute']}, "
+                f"TPM={config['tokens_per_minute']}, eşzamanlılık={config['max_concurrency']}"
+            )
+
+    return _shared_limiter
+
+def reset_shared_rate_limiter():
+    """Paylaşılan sınırlayıcıyı sıfırla (ayar değişikliklerinden sonra)"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        _shared_limiter = None
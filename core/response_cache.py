@@ -0,0 +1,259 @@
+"""
+LLM YANIT ÖNBELLEĞİ
+===================
+
+Model, sıcaklık, system mesajı ve kullanıcı prompt'unun hash'i ile
+adreslenen, SQLite tabanlı disk önbelleği. Aynı prompt tekrar
+gönderildiğinde API'ye gitmeden kayıtlı yanıt döndürülür.
+
+Modlar:
+- off: önbellek kullanılmaz
+- read: yalnızca okunur, yeni yanıtlar yazılmaz (CI / tekrar üretim)
+- readwrite: okunur ve yeni yanıtlar yazılır
+
+Tahliye: TTL süresi dolan kayıtlar silinir; kayıt sayısı sınırı aşılırsa
+en uzun süredir erişilmeyen (LRU) kayıtlar silinir.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.generation_settings import get_cache_config
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("off", "read", "readwrite")
+
+class ResponseCache:
+    """İçerik adresli LLM yanıt önbelleği (SQLite)"""
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "off",
+        ttl_seconds: float = 0,
+        max_entries: int = 0
+    ):
+        """
+        Args:
+            path: SQLite dosya yolu
+            mode: off | read | readwrite
+            ttl_seconds: Kayıt ömrü (0 ise süresiz)
+            max_entries: Maksimum kayıt sayısı (0 ise sınırsız)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Geçersiz önbellek modu: {mode}. Geçerli modlar: {list(CACHE_MODES)}")
+
+        self.path = path
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    @property
+    def readable(self) -> bool:
+        return self.mode in ("read", "readwrite")
+
+    @property
+    def writable(self) -> bool:
+        return self.mode == "readwrite"
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: Optional[float],
+        system_message: str,
+        user_prompt: str,
+        **extra: Any
+    ) -> str:
+        """
+        İstek içeriğinden önbellek anahtarı üret.
+
+        Args:
+            model: Model adı
+            temperature: Sıcaklık
+            system_message: System mesajı
+            user_prompt: Kullanıcı prompt'u
+            extra: Yanıtı etkileyen ek parametreler (ör. response_format)
+
+        Returns:
+            str: SHA-256 hex anahtar
+        """
+        payload = {
+            "model": model,
+            "temperature": temperature,
+            "system": system_message,
+            "prompt": user_prompt
+        }
+        payload.update({key: value for key, value in extra.items() if value is not None})
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response_text TEXT NOT NULL,
+                    metadata TEXT,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_accessed ON llm_responses(last_accessed)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Anahtara ait yanıtı döndür.
+
+        Returns:
+            str | None: Kayıtlı yanıt (yoksa veya süresi dolmuşsa None)
+        """
+        if not self.readable:
+            return None
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT response_text, created_at FROM llm_responses WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+
+                if row is None or (self.ttl_seconds and now - row[1] > self.ttl_seconds):
+                    self._stats["misses"] += 1
+                    return None
+
+                if self.writable:
+                    conn.execute("UPDATE llm_responses SET last_accessed = ? WHERE cache_key = ?", (now, key))
+                    conn.commit()
+                self._stats["hits"] += 1
+                return row[0]
+            except sqlite3.Error as e:
+                logger.error(f"Önbellek okuma hatası: {e}")
+                self._stats["misses"] += 1
+                return None
+
+    def set(self, key: str, response_text: str, model: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
+        """Yanıtı önbelleğe yaz (yalnızca readwrite modunda)"""
+        if not self.writable or not response_text:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_responses
+                        (cache_key, model, response_text, metadata, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, model, response_text, json.dumps(metadata or {}, ensure_ascii=False), now, now)
+                )
+                self._stats["writes"] += 1
+                self._evict(conn, now)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Önbellek yazma hatası: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Süresi dolan ve LRU sınırını aşan kayıtları sil"""
+        evicted = 0
+        if self.ttl_seconds:
+            evicted += conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            ).rowcount
+
+        if self.max_entries:
+            count = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                evicted += conn.execute(
+                    """
+                    DELETE FROM llm_responses WHERE cache_key IN (
+                        SELECT cache_key FROM llm_responses ORDER BY last_accessed ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,)
+                ).rowcount
+
+        if evicted:
+            self._stats["evictions"] += evicted
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_responses")
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek istatistiklerini döndür"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["mode"] = self.mode
+        return stats
+
+    def close(self):
+        """SQLite bağlantısını kapat"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+def configure_shared_response_cache(mode: Optional[str] = None, path: Optional[str] = None) -> ResponseCache:
+    """
+    Paylaşılan önbelleği (yeniden) oluştur; verilmeyen değerler ayarlardan alınır.
+
+    Args:
+        mode: off | read | readwrite (ör. --cache argümanı)
+        path: SQLite dosya yolu
+
+    Returns:
+        ResponseCache: Paylaşılan önbellek
+    """
+    global _shared_cache
+
+    config = get_cache_config()
+    with _shared_cache_lock:
+        if _shared_cache is not None:
+            _shared_cache.close()
+        _shared_cache = ResponseCache(
+            path=path or config["path"],
+            mode=mode or config["mode"],
+            ttl_seconds=config["ttl_seconds"],
+            max_entries=config["max_entries"]
+        )
+        if _shared_cache.mode != "off":
+            logger.info(f"LLM yanıt önbelleği aktif: mod={_shared_cache.mode}, dosya={_shared_cache.path}")
+    return _shared_cache
+
+def get_shared_response_cache() -> ResponseCache:
+    """Paylaşılan önbelleği döndür (yoksa ayarlardan oluştur)"""
+    if _shared_cache is None:
+        return configure_shared_response_cache()
+    return _shared_cache
@@ -0,0 +1,126 @@
+"""
+AKIŞ (STREAMING) JSON PARSER
+============================
+
+Model yanıtı parça parça gelirken JSON soru dizisini artımlı olarak çözer.
+Dizideki her {"question", "expected_answer"} nesnesi kapanış parantezi
+geldiği anda döndürülür; bağlantı yarıda koparsa o ana kadar tamamlanan
+nesneler kaybolmaz.
+
+Dizi öncesindeki metin (```json bloğu, açıklama vb.) atlanır;
+{"questions": [...]} şeklinde sarmalanmış yanıtlarda da ilk dizi kullanılır.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from core.json_scanner import scan_questions
+
+logger = logging.getLogger(__name__)
+
+_ARRAY_START = re.compile(r'\[')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+class IncrementalJSONArrayParser:
+    """Parça parça beslenen metinden dizi elemanı nesneleri çıkaran parser"""
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._array_started = False
+        self._in_string = False
+        self._object_start: Optional[int] = None
+        self.finished = False
+        self.items_emitted = 0
+        self.items_skipped = 0
+
+    @property
+    def text(self) -> str:
+        """Şu ana kadar alınan tüm metin"""
+        return self._text
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Yeni metin parçasını işle.
+
+        Args:
+            chunk: Akıştan gelen metin parçası
+
+        Returns:
+            list: Bu parça ile tamamlanan nesneler
+        """
+        self._text += chunk
+        completed = []
+        if self.finished:
+            return completed
+
+        text = self._text
+        while True:
+            if not self._array_started:
+                match = _ARRAY_START.search(text, self._pos)
+                if match is None:
+                    self._pos = max(self._pos, len(text))
+                    break
+                self._array_started = True
+                self._depth = 1
+                self._pos = match.end()
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, self._pos)
+                if match is None:
+                    self._pos = max(self._pos, len(text))
+                    break
+                if match.group() == "\\":
+                    # Kaçış karakteri: sonraki karakter (henüz gelmemiş olabilir) atlanır
+                    self._pos = match.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(text, self._pos)
+            if match is None:
+                self._pos = max(self._pos, len(text))
+                break
+
+            char = match.group()
+            self._pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if char == "{" and self._depth == 2:
+                    self._object_start = match.start()
+            else:
+                self._depth -= 1
+                if char == "}" and self._depth == 1 and self._object_start is not None:
+                    item = self._decode_object(text[self._object_start:self._pos])
+                    self._object_start = None
+                    if item is not None:
+                        completed.append(item)
+                elif self._depth <= 0:
+                    self.finished = True
+                    break
+
+        self.items_emitted += len(completed)
+        return completed
+
+    def _decode_object(self, object_text: str) -> Optional[Dict[str, Any]]:
+        """Tamamlanan nesne metnini çöz (bozuksa toleranslı tarayıcıya düş)"""
+        try:
+            data = json.loads(object_text, strict=False)
+        except json.JSONDecodeError:
+            scanned = scan_questions(object_text)["questions"]
+            data = scanned[0] if scanned else None
+        if isinstance(data, dict) and "question" in data:
+            return data
+
+        self.items_skipped += 1
+        logger.warning(f"Akıştaki nesne çözülemedi, atlandı: {object_text[:80]!r}")
+        return None
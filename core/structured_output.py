@@ -0,0 +1,105 @@
+"""
+YAPILANDIRILMIŞ ÇIKTI (JSON SCHEMA) MODU
+=======================================
+
+Soru dizisi istekleri `response_format` ile JSON şeması gönderir; model
+şemaya uygun {"questions": [{question, expected_answer}]} döndürür. Yanıt
+jsonschema ile doğrulanırsa onarım yapılmadan doğrudan kullanılır (hızlı
+yol); doğrulanamazsa toleranslı tarayıcı ve eski parse zinciri yedek olarak
+devreye girer.
+
+Hangi yolun ne sıklıkla kullanıldığı parse yolu sayaçlarında tutulur:
+    structured       şemaya uygun yanıt, onarımsız
+    scanner          tarayıcı, onarım gerekmedi
+    scanner_repaired tarayıcı, onarım uygulandı
+    legacy_cascade   eski çok stratejili parse zinciri
+    failed           hiçbir yol soru çıkaramadı
+"""
+
+import json
+import threading
+from typing import Any, Dict, List, Optional
+
+from jsonschema import Draft202012Validator
+
+# Structured outputs kök düzeyde nesne ister; dizi "questions" alanında
+QUESTIONS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "question": {"type": "string"},
+                    "expected_answer": {"type": "string"}
+                },
+                "required": ["question", "expected_answer"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["questions"],
+    "additionalProperties": False
+}
+
+QUESTIONS_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "interview_questions",
+        "strict": True,
+        "schema": QUESTIONS_SCHEMA
+    }
+}
+
+PARSE_PATHS = ("structured", "scanner", "scanner_repaired", "legacy_cascade", "failed")
+
+_validator = Draft202012Validator(QUESTIONS_SCHEMA)
+
+def parse_structured_questions(text: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Şemaya uygun yanıtı onarım yapmadan çöz.
+
+    Çıplak dizi ([{...}]) de {"questions": [...]} olarak kabul edilir.
+
+    Returns:
+        list | None: Sorular; yanıt geçerli JSON değilse veya şemaya uymuyorsa None
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    if isinstance(data, list):
+        data = {"questions": data}
+    if not _validator.is_valid(data):
+        return None
+    return data["questions"]
+
+class ParsePathStats:
+    """Parse yollarının kullanım sayaçları (thread-safe)"""
+
+    def __init__(self):
+        self._counts = {path: 0 for path in PARSE_PATHS}
+        self._lock = threading.Lock()
+
+    def record(self, path: str):
+        """Bir yanıtın hangi yoldan çözüldüğünü say"""
+        with self._lock:
+            self._counts[path] = self._counts.get(path, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Sayaçların kopyası"""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        """Sayaçları sıfırla"""
+        with self._lock:
+            self._counts = {path: 0 for path in PARSE_PATHS}
+
+# Tüm üreticilerin paylaştığı sayaçlar
+_parse_path_stats = ParsePathStats()
+
+def get_parse_path_stats() -> ParsePathStats:
+    """Paylaşılan parse yolu sayaçlarını döndür"""
+    return _parse_path_stats
@@ -0,0 +1,176 @@
+"""
+TOKEN KULLANIMI VE PROMPT ÖNBELLEĞİ İZLEME
+==========================================
+
+Her chat.completions yanıtının `usage` alanını (prompt / completion token,
+`prompt_tokens_details.cached_tokens`) ve istek süresini toplar. Sağlayıcı
+tarafı prompt önbelleğinin ne kadar isabet ettiği, önbellekli isteklerin
+ortalama gecikmesi ve önbelleksiz isteklerle farkı çalıştırma sonunda
+raporlanır.
+
+Ek ölçümler (ör. maliyet defteri) `add_hook` ile kaydedilen callback'lerle
+her yanıtın kullanım kaydını alabilir. Kayıtlar, isteği gönderen kod
+bölgesinin `push_usage_context` ile bildirdiği rol / katsayı / kategori /
+çağrı noktası bilgisini taşır (contextvars; thread havuzlarına
+`contextvars.copy_context().run` ile aktarılır).
+"""
+
+import contextvars
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# İsteği gönderen kod bölgesinin bilgisi (role, difficulty, category, question_count, call_site)
+_usage_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("usage_context", default={})
+
+def push_usage_context(**fields) -> contextvars.Token:
+    """
+    Sonraki isteklerin kullanım kayıtlarına eklenecek bilgileri ayarla
+    (mevcut bağlamın üzerine yazar). pop_usage_context ile geri alınır.
+    """
+    return _usage_context.set({**_usage_context.get(), **fields})
+
+def pop_usage_context(token: contextvars.Token):
+    """push_usage_context öncesindeki bağlama dön"""
+    _usage_context.reset(token)
+
+def current_usage_context() -> Dict[str, Any]:
+    """Geçerli kullanım bağlamının kopyası"""
+    return dict(_usage_context.get())
+
+def _field(obj: Any, name: str) -> Any:
+    """Nesne veya sözlükten alan oku (Batch API gövdeleri sözlük, SDK yanıtları nesne)"""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+def usage_record(
+    usage: Any,
+    model: Optional[str] = None,
+    latency: Optional[float] = None,
+    retries: int = 0,
+    batch_api: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Yanıttaki usage alanını geçerli kullanım bağlamıyla birlikte düz kayda çevir.
+
+    Returns:
+        dict | None: model, prompt_tokens, cached_tokens, completion_tokens, latency,
+            retries, batch_api ve bağlam alanları (usage yoksa None)
+    """
+    if usage is None:
+        return None
+    return {
+        **_usage_context.get(),
+        "model": model,
+        "prompt_tokens": _field(usage, "prompt_tokens") or 0,
+        "cached_tokens": _field(_field(usage, "prompt_tokens_details"), "cached_tokens") or 0,
+        "completion_tokens": _field(usage, "completion_tokens") or 0,
+        "latency": latency,
+        "retries": retries,
+        "batch_api": batch_api
+    }
+
+class UsageTracker:
+    """Yanıt kullanım kayıtlarını toplayan sayaçlar (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks: List[Callable[[Dict[str, Any]], None]] = []
+        self.reset()
+
+    def reset(self):
+        """Sayaçları sıfırla (kayıtlı hook'lar korunur)"""
+        with self._lock:
+            self._counts = {
+                "requests": 0,
+                "cached_requests": 0,
+                "prompt_tokens": 0,
+                "cached_tokens": 0,
+                "completion_tokens": 0,
+                "retries": 0
+            }
+            self._latency = {"cached": [0.0, 0], "uncached": [0.0, 0]}
+
+    def add_hook(self, hook: Callable[[Dict[str, Any]], None]):
+        """Her kullanım kaydıyla çağrılacak callback ekle"""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[Dict[str, Any]], None]):
+        """Callback'i kaldır"""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def record(
+        self,
+        usage: Any,
+        model: Optional[str] = None,
+        latency: Optional[float] = None,
+        retries: int = 0,
+        batch_api: bool = False
+    ):
+        """
+        Yanıtın usage alanını say ve hook'lara ilet.
+
+        Args:
+            usage: SDK usage nesnesi veya sözlük (None ise yok sayılır)
+            model: Yanıtı üreten model
+            latency: İstek süresi (sn, Batch API yanıtlarında None)
+            retries: Başarılı denemeden önceki yeniden deneme sayısı
+            batch_api: Yanıt Batch API çıktısından mı geldi
+        """
+        record = usage_record(usage, model, latency, retries, batch_api)
+        if record is None:
+            return
+
+        with self._lock:
+            self._counts["requests"] += 1
+            self._counts["prompt_tokens"] += record["prompt_tokens"]
+            self._counts["cached_tokens"] += record["cached_tokens"]
+            self._counts["completion_tokens"] += record["completion_tokens"]
+            self._counts["retries"] += retries
+            if record["cached_tokens"]:
+                self._counts["cached_requests"] += 1
+            if latency is not None:
+                bucket = self._latency["cached" if record["cached_tokens"] else "uncached"]
+                bucket[0] += latency
+                bucket[1] += 1
+            hooks = list(self._hooks)
+
+        for hook in hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                logger.warning(f"Kullanım hook'u başarısız: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Sayaçların özeti.
+
+        Returns:
+            dict: requests, cached_requests, prompt_tokens, cached_tokens,
+                completion_tokens, retries, cached_ratio, avg_latency_cached, avg_latency_uncached
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counts)
+            latency = {key: list(value) for key, value in self._latency.items()}
+
+        stats["cached_ratio"] = (
+            stats["cached_tokens"] / stats["prompt_tokens"] if stats["prompt_tokens"] else 0.0
+        )
+        for key, (total, count) in latency.items():
+            stats[f"avg_latency_{key}"] = total / count if count else None
+        return stats
+
+# Tüm üreticilerin paylaştığı izleyici
+_shared_usage_tracker = UsageTracker()
+
+def get_shared_usage_tracker() -> UsageTracker:
+    """Paylaşılan kullanım izleyicisini döndür"""
+    return _shared_usage_tracker
@@ -0,0 +1,212 @@
+"""
+AKIŞLI DOCX YAZICI
+==================
+
+Büyük soru havuzları için Word belgesini python-docx nesne ağacı kurmadan
+yazar. Şablon belgenin (stiller, tema, ayarlar) parçaları süreç başına bir
+kez sıkıştırılıp hazır bir zip önekine dönüştürülür; her export bu öneki
+kopyalar ve `word/document.xml`'i paragraf paragraf WordprocessingML olarak
+doğrudan zip girdisine akıtır. Bellek kullanımı soru sayısından, açılış
+maliyeti şablon boyutundan bağımsız kalır.
+
+Örnek:
+    template = DocxTemplate.from_bytes(template_bytes)
+    with StreamingDocxWriter(template, "cikti.docx") as writer:
+        writer.add_paragraph("Başlık", style="Custom Title")
+        writer.add_paragraph("   int x = 0;", style="Custom Code", bold=False)
+"""
+
+import os
+import re
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+# .dotx ana parçası belge olarak açılabilsin diye içerik türü dönüştürülür
+TEMPLATE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml"
+DOCUMENT_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+
+# Zip girdisine tek seferde yazılacak en küçük XML parçası (bayt)
+FLUSH_THRESHOLD = 64 * 1024
+
+# XML 1.0'da geçersiz kontrol karakterleri (python-docx bunlarda hata verir)
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+# python-docx run.text ile aynı: sekme → <w:tab/>, satır sonu → <w:br/>
+_RUN_BREAKS = re.compile(r"(\t|\r\n|\r|\n)")
+_STYLE_DEFINITION = re.compile(r"<w:style\b[^>]*?w:styleId=\"([^\"]+)\"[^>]*>.*?<w:name w:val=\"([^\"]+)\"", re.S)
+
+def as_document_package(data: bytes) -> bytes:
+    """
+    .dotx paketini .docx paketine çevir (yalnızca ana parçanın içerik türü
+    değişir); zaten belge olan paket aynen döner.
+    """
+    with zipfile.ZipFile(BytesIO(data)) as archive:
+        content_types = archive.read(CONTENT_TYPES_PART).decode("utf-8")
+        if TEMPLATE_CONTENT_TYPE not in content_types:
+            return data
+        output = BytesIO()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as converted:
+            for info in archive.infolist():
+                content = archive.read(info.filename)
+                if info.filename == CONTENT_TYPES_PART:
+                    content = content_types.replace(TEMPLATE_CONTENT_TYPE, DOCUMENT_CONTENT_TYPE).encode("utf-8")
+                converted.writestr(info.filename, content, compress_type=zipfile.ZIP_DEFLATED)
+    return output.getvalue()
+
+class DocxTemplate:
+    """Süreç başına bir kez hazırlanan şablon paketi (iki export motoru için)"""
+
+    def __init__(self, package: bytes, prefix: bytes, document_head: str, document_tail: str, style_ids: Dict[str, str]):
+        """
+        Args:
+            package: Gövdesi boş tam .docx paketi (python-docx motoru bundan klonlar)
+            prefix: document.xml dışındaki parçaları sıkıştırılmış olarak içeren zip
+            document_head: document.xml'in <w:body> dahil başlangıcı
+            document_tail: Bölüm ayarları (<w:sectPr>) ve kapanış etiketleri
+            style_ids: Stil adı → styleId eşlemesi (ör. "Custom Code" → "CustomCode")
+        """
+        self.package = package
+        self.prefix = prefix
+        self.document_head = document_head
+        self.document_tail = document_tail
+        self.style_ids = style_ids
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DocxTemplate":
+        """
+        .docx / .dotx içeriğinden şablon oluştur. Şablonun gövdesindeki
+        paragraflar atılır, yalnızca bölüm ayarları korunur.
+
+        Raises:
+            ValueError: Belge gövdesi bulunamazsa
+        """
+        data = as_document_package(data)
+        document_xml = None
+        style_ids: Dict[str, str] = {}
+        prefix = BytesIO()
+        with zipfile.ZipFile(BytesIO(data)) as archive, zipfile.ZipFile(prefix, "w", zipfile.ZIP_DEFLATED) as output:
+            for info in archive.infolist():
+                content = archive.read(info.filename)
+                if info.filename == DOCUMENT_PART:
+                    document_xml = content.decode("utf-8")
+                    continue
+                if info.filename == STYLES_PART:
+                    style_ids = {name: style_id for style_id, name in _STYLE_DEFINITION.findall(content.decode("utf-8"))}
+                output.writestr(info.filename, content, compress_type=zipfile.ZIP_DEFLATED)
+
+        if document_xml is None:
+            raise ValueError("Şablonda word/document.xml yok")
+        body_start = document_xml.find("<w:body>")
+        body_end = document_xml.rfind("</w:body>")
+        if body_start < 0 or body_end < 0:
+            raise ValueError("Şablon belge gövdesi (<w:body>) bulunamadı")
+
+        body_start += len("<w:body>")
+        section_start = document_xml.rfind("<w:sectPr", body_start, body_end)
+        section = document_xml[section_start:body_end] if section_start >= 0 else ""
+        return cls(data, prefix.getvalue(), document_xml[:body_start], section + document_xml[body_end:], style_ids)
+
+    def style_id(self, name: str) -> str:
+        """Stil adının styleId'si (şablonda yoksa boşluksuz ad)"""
+        return self.style_ids.get(name, name.replace(" ", ""))
+
+def run_xml(text: str, bold: Optional[bool] = None) -> str:
+    """Tek bir <w:r> (python-docx add_run ile aynı sekme / satır sonu eşlemesi)"""
+    properties = "" if bold is None else f'<w:rPr><w:b w:val="{1 if bold else 0}"/></w:rPr>'
+    content = []
+    for piece in _RUN_BREAKS.split(_INVALID_XML_CHARS.sub("", text)):
+        if not piece:
+            continue
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\n", "\r", "\r\n"):
+            content.append("<w:br/>")
+        else:
+            content.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return f"<w:r>{properties}{''.join(content)}</w:r>"
+
+class StreamingDocxWriter:
+    """Paragrafları doğrudan zip'teki document.xml'e akıtan yazıcı (context manager)"""
+
+    def __init__(self, template: DocxTemplate, output_path: str):
+        """
+        Args:
+            template: Stil ve belge parçalarının alınacağı şablon
+            output_path: Çıktı .docx yolu (yazım bitince atomik olarak yerine konur)
+        """
+        self.template = template
+        self.output_path = Path(output_path)
+        self.paragraphs = 0
+        self._temp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._stream = None
+        self._buffer: List[str] = []
+        self._buffered = 0
+
+    def __enter__(self) -> "StreamingDocxWriter":
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Hazır sıkıştırılmış öneki kopyala, document.xml'i sona ekle
+        self._temp_path.write_bytes(self.template.prefix)
+        self._archive = zipfile.ZipFile(self._temp_path, "a", zipfile.ZIP_DEFLATED)
+        self._stream = self._archive.open(DOCUMENT_PART, "w", force_zip64=True)
+        self._write(self.template.document_head)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write(self.template.document_tail)
+                self._flush()
+            self._stream.close()
+            self._archive.close()
+            if exc_type is None:
+                os.replace(self._temp_path, self.output_path)
+        finally:
+            if self._temp_path.exists():
+                self._temp_path.unlink()
+        return False
+
+    def add_paragraph(
+        self,
+        text: str = "",
+        style: Optional[str] = None,
+        center: bool = False,
+        bold: Optional[bool] = None
+    ):
+        """
+        Paragraf yaz (python-docx add_paragraph ile aynı XML).
+
+        Args:
+            text: Paragraf metni (boşsa run eklenmez)
+            style: Paragraf stil adı (ör. "Custom Question")
+            center: Ortala
+            bold: Run kalınlığı (None ise stilden gelir)
+        """
+        properties = ""
+        if style or center:
+            style_xml = f'<w:pStyle w:val="{self.template.style_id(style)}"/>' if style else ""
+            align_xml = '<w:jc w:val="center"/>' if center else ""
+            properties = f"<w:pPr>{style_xml}{align_xml}</w:pPr>"
+        if not text and bold is None:
+            self._write(f"<w:p>{properties}</w:p>" if properties else "<w:p/>")
+        else:
+            self._write(f"<w:p>{properties}{run_xml(text, bold)}</w:p>")
+        self.paragraphs += 1
+
+    def _write(self, xml: str):
+        self._buffer.append(xml)
+        self._buffered += len(xml)
+        if self._buffered >= FLUSH_THRESHOLD:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._stream.write("".join(self._buffer).encode("utf-8"))
+            self._buffer = []
+            self._buffered = 0
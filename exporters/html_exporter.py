@@ -0,0 +1,84 @@
+"""
+HTML EXPORT (YAZDIRMAYA HAZIR)
+==============================
+
+Soruları jinja2 şablonuyla A4 yazdırmaya / PDF'e dönüştürmeye hazır HTML
+belgesine çevirir. Varsayılan şablon exporters/templates/questions.html.j2;
+HTML_EXPORT_TEMPLATE ile kurumsal bir şablon verilebilir. Şablon
+`template.generate` ile parça parça işlenir ve dosyaya akıtılır.
+
+Şablona verilen değişkenler: title, candidate, session_id, created_at,
+role, salary_coefficient ve sections (name, count, records); records
+alanları text_exporters.CSV_FIELDS ile aynıdır.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+try:
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+except ImportError:
+    raise ImportError("jinja2 kütüphanesi yüklü değil. 'pip install jinja2' komutu ile yükleyin.")
+
+from config.generation_settings import get_export_config
+from exporters.text_exporters import QuestionExporter, category_display_name
+
+# Paketle gelen şablonlar
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+DEFAULT_TEMPLATE = "questions.html.j2"
+
+class HtmlExporter(QuestionExporter):
+    """jinja2 şablonlu, yazdırmaya hazır HTML belge"""
+
+    format_name = "html"
+    extension = "html"
+
+    def __init__(self, template_path: Optional[str] = None):
+        """
+        Args:
+            template_path (str, optional): Şablon dosyası (None ise HTML_EXPORT_TEMPLATE,
+                o da boşsa paketle gelen şablon)
+        """
+        super().__init__()
+        template_path = template_path if template_path is not None else get_export_config()["html_template"]
+        if template_path:
+            template_dir, template_name = str(Path(template_path).resolve().parent), Path(template_path).name
+        else:
+            template_dir, template_name = str(TEMPLATE_DIR), DEFAULT_TEMPLATE
+        environment = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(["html", "j2"]),
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        self.template = environment.get_template(template_name)
+
+    def write(self, handle: TextIO, questions_data: Dict[str, Any], job_description: str):
+        role = questions_data.get("role", "Bilinmeyen Pozisyon")
+        salary_coefficient = questions_data.get("salary_coefficient", 2)
+        context = {
+            "title": f"{role.upper()} {salary_coefficient}x MÜLAKAT SORULARI",
+            "role": role,
+            "salary_coefficient": salary_coefficient,
+            "candidate": questions_data.get("candidate"),
+            "session_id": questions_data.get("session_id"),
+            "created_at": datetime.now().strftime('%d.%m.%Y %H:%M'),
+            "job_description": job_description,
+            "sections": self._sections(questions_data)
+        }
+        for chunk in self.template.generate(**context):
+            handle.write(chunk)
+
+    def _sections(self, questions_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Kategori bölümleri; kayıtlar şablon işlenirken üretilir"""
+        for category_code, category_questions in self.sections(questions_data):
+            yield {
+                "name": category_display_name(category_code),
+                "count": len(category_questions),
+                "records": (
+                    self.question_record(questions_data, category_code, number, question_data)
+                    for number, question_data in enumerate(category_questions, 1)
+                    if question_data.get("success", False)
+                )
+            }
@@ -0,0 +1,62 @@
+"""
+EXPORTER KAYDI
+==============
+
+Çıktı biçimi adı → exporter sınıfı eşlemesi. Tüm exporter'lar aynı arayüzü
+sunar: `generate_filename(role_name, salary_coefficient, base_dir)` ve
+`export_questions(questions_data, job_description, output_path) -> bool`.
+Zamanlayıcı (generators/batch_scheduler.py) ve CLI biçimleri buradan okur;
+yeni bir biçim `register_exporter` ile eklenir.
+
+Örnek:
+    exporter = get_exporter("csv")
+    path = exporter.generate_filename("DevOps Uzmanı", 3, "data/exports")
+    exporter.export_questions(result, job_description, path)
+"""
+
+import logging
+from typing import Any, Dict, Tuple
+
+from exporters.text_exporters import CsvExporter, JsonlExporter, MarkdownExporter
+from exporters.word_exporter import WordExporter
+
+logger = logging.getLogger(__name__)
+
+# Biçim adı → exporter sınıfı (kayıt sırası CLI seçeneklerinin sırasıdır)
+EXPORTERS: Dict[str, type] = {}
+
+def register_exporter(format_name: str, exporter_cls: type):
+    """
+    Exporter sınıfını biçim adıyla kaydet.
+
+    Args:
+        format_name (str): Biçim adı (ör. "csv"); --format değeri olarak kullanılır
+        exporter_cls (type): generate_filename / export_questions sunan sınıf
+    """
+    EXPORTERS[format_name] = exporter_cls
+
+def get_exporter(format_name: str, **kwargs: Any):
+    """
+    Biçim için yeni bir exporter örneği oluştur.
+
+    Raises:
+        ValueError: Kayıtlı olmayan biçim için
+    """
+    if format_name not in EXPORTERS:
+        raise ValueError(f"Geçersiz export biçimi: {format_name}. Geçerli biçimler: {list(EXPORTERS)}")
+    return EXPORTERS[format_name](**kwargs)
+
+def available_formats() -> Tuple[str, ...]:
+    """Kayıtlı export biçimleri"""
+    return tuple(EXPORTERS)
+
+register_exporter("docx", WordExporter)
+register_exporter("jsonl", JsonlExporter)
+register_exporter("csv", CsvExporter)
+register_exporter("md", MarkdownExporter)
+
+try:
+    from exporters.html_exporter import HtmlExporter
+    register_exporter("html", HtmlExporter)
+except ImportError as e:
+    logger.warning(f"HTML export devre dışı: {e}")
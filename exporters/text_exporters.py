@@ -0,0 +1,209 @@
+"""
+METİN TABANLI EXPORT BİÇİMLERİ
+==============================
+
+Üretilen soruları JSONL, CSV ve Markdown olarak yazan exporter'lar. Hepsi
+WordExporter ile aynı arayüzü sunar (generate_filename, export_questions) ve
+exporters/registry.py üzerinden biçim adıyla seçilir.
+
+- jsonl: soru başına bir JSON kaydı (İK sistemine satır satır aktarım)
+- csv: sabit sütunlu tablo (CSV_FIELDS)
+- md: başlık, kategori bölümleri ve kod blokları ile Markdown belge
+
+Kayıtlar soru soru üretilir ve dosyaya akıtılır; tüm belge bellekte
+kurulmaz. Dosya önce geçici ada yazılır, bitince atomik olarak yerine konur.
+"""
+
+import csv
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, TextIO
+
+from config.question_categories import QUESTION_CATEGORIES
+from exporters.word_exporter import WordExporter
+from utils.file_helpers import FileHelper
+from utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# CSV / JSONL kayıt alanları (sıra CSV sütun sırasıdır)
+CSV_FIELDS = [
+    "role", "role_code", "salary_coefficient", "category", "category_name",
+    "number", "rubric_level", "question", "code", "expected_answer", "question_id"
+]
+
+def category_display_name(category_code: str) -> str:
+    """Kategori kodunun görünen adı (ör. "Teorik Bilgi Soruları")"""
+    config = QUESTION_CATEGORIES.get(category_code)
+    return config["name"] if config else category_code.replace("_", " ").title()
+
+class QuestionExporter:
+    """Metin tabanlı exporter'ların ortak temeli (alt sınıf write'ı uygular)"""
+
+    # Biçim adı ve dosya uzantısı (alt sınıflar belirler)
+    format_name = ""
+    extension = ""
+
+    def __init__(self):
+        # Soru / kod ayrımı ve kod normalizasyonu Word çıktısıyla aynı olsun
+        self._layout = WordExporter(engine="stream")
+
+    def generate_filename(
+        self,
+        role_name: str,
+        salary_coefficient: int,
+        base_dir: str = "data/exports"
+    ) -> str:
+        """
+        Dosya ismi oluştur (ör. data/exports/Devops_Uzmani_3x.jsonl).
+
+        Args:
+            role_name (str): Pozisyon ismi
+            salary_coefficient (int): Maaş katsayısı
+            base_dir (str): Ana dizin
+
+        Returns:
+            str: Tam dosya yolu
+        """
+        safe_role_name = FileHelper.get_safe_filename(role_name)
+        return str(Path(base_dir) / f"{safe_role_name}_{salary_coefficient}x.{self.extension}")
+
+    def export_questions(
+        self,
+        questions_data: Dict[str, Any],
+        job_description: str,
+        output_path: str
+    ) -> bool:
+        """
+        Soruları dosyaya export et.
+
+        Args:
+            questions_data (dict): Soru verileri
+            job_description (str): İlan metni
+            output_path (str): Çıktı dosyası yolu
+
+        Returns:
+            bool: Başarı durumu
+        """
+        output_file = Path(output_path)
+        temp_file = output_file.with_name(output_file.name + ".tmp")
+        with span(f"export.{self.format_name}", role=questions_data.get("role"), questions=questions_data.get("total_questions")):
+            try:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_file, "w", encoding="utf-8", newline="") as handle:
+                    self.write(handle, questions_data, job_description)
+                os.replace(temp_file, output_file)
+                logger.info(f"Sorular {self.format_name.upper()} olarak kaydedildi: {output_path}")
+                return True
+            except Exception as e:
+                logger.error(f"{self.format_name.upper()} export hatası: {e}")
+                if temp_file.exists():
+                    temp_file.unlink()
+                return False
+
+    def write(self, handle: TextIO, questions_data: Dict[str, Any], job_description: str):
+        """Belgeyi açık dosyaya yaz (alt sınıflar uygular)"""
+        raise NotImplementedError
+
+    def iter_records(self, questions_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Başarılı soruları düz kayıtlar halinde sırayla üret (CSV_FIELDS alanları).
+
+        Numaralandırma Word çıktısıyla aynıdır (başarısız sorular da sayılır).
+        """
+        for category_code, category_questions in self.sections(questions_data):
+            for number, question_data in enumerate(category_questions, 1):
+                if not question_data.get("success", False):
+                    continue
+                yield self.question_record(questions_data, category_code, number, question_data)
+
+    @staticmethod
+    def sections(questions_data: Dict[str, Any]) -> List[tuple]:
+        """Sorusu olan kategoriler: [(kategori kodu, sorular)]"""
+        questions = questions_data.get("questions", {})
+        return [(code, items) for code, items in questions.items() if items]
+
+    def question_record(
+        self,
+        questions_data: Dict[str, Any],
+        category_code: str,
+        number: int,
+        question_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Tek sorunun düz kaydı (soru metni ve kod bloğu Word çıktısıyla aynı ayrılır)"""
+        question, code = self._layout._split_question_and_code(question_data.get("question", "Soru metni eksik"))
+        # Kod bloğu yalnızca pratik kategoride yazılır
+        if code and category_code == "practical_application":
+            code = self._layout._normalize_code_block_for_display(code)
+        else:
+            code = ""
+        return {
+            "role": questions_data.get("role", ""),
+            "role_code": questions_data.get("role_code", ""),
+            "salary_coefficient": questions_data.get("salary_coefficient", ""),
+            "category": category_code,
+            "category_name": category_display_name(category_code),
+            "number": number,
+            "rubric_level": question_data.get("rubric_level", ""),
+            "question": question,
+            "code": code,
+            "expected_answer": question_data.get("expected_answer", ""),
+            "question_id": question_data.get("id", "")
+        }
+
+class JsonlExporter(QuestionExporter):
+    """Soru başına bir JSON satırı"""
+
+    format_name = "jsonl"
+    extension = "jsonl"
+
+    def write(self, handle: TextIO, questions_data: Dict[str, Any], job_description: str):
+        for record in self.iter_records(questions_data):
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+class CsvExporter(QuestionExporter):
+    """Sabit sütunlu CSV tablosu"""
+
+    format_name = "csv"
+    extension = "csv"
+
+    def write(self, handle: TextIO, questions_data: Dict[str, Any], job_description: str):
+        writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for record in self.iter_records(questions_data):
+            writer.writerow(record)
+
+class MarkdownExporter(QuestionExporter):
+    """Başlık, kategori bölümleri ve kod blokları ile Markdown belge"""
+
+    format_name = "md"
+    extension = "md"
+
+    def write(self, handle: TextIO, questions_data: Dict[str, Any], job_description: str):
+        role = questions_data.get("role", "Bilinmeyen Pozisyon")
+        salary_coefficient = questions_data.get("salary_coefficient", 2)
+        handle.write(f"# {role.upper()} {salary_coefficient}x MÜLAKAT SORULARI\n\n")
+        if questions_data.get("candidate"):
+            handle.write(f"**Aday:** {questions_data['candidate']}  \n")
+        handle.write(f"*Oluşturulma Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M')}*\n")
+
+        for category_code, category_questions in self.sections(questions_data):
+            handle.write(f"\n## {category_display_name(category_code)} ({len(category_questions)} Soru)\n")
+            for number, question_data in enumerate(category_questions, 1):
+                if not question_data.get("success", False):
+                    continue
+                record = self.question_record(questions_data, category_code, number, question_data)
+                level = f"[{record['rubric_level'].split('_', 1)[0]}] " if record["rubric_level"] else ""
+                handle.write(f"\n**{number}. {level}{self._escape(record['question'])}**\n")
+                if record["code"]:
+                    handle.write(f"\n```\n{record['code']}\n```\n")
+                if record["expected_answer"]:
+                    handle.write(f"\n> **Beklenen Cevap:** {self._escape(record['expected_answer'])}\n")
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        """Satır sonlarını Markdown satır kırılmasına çevir"""
+        return str(text).strip().replace("\n", "  \n")
@@ -3,11 +3,30 @@ WORD BELGESİ EXPORT SİSTEMİ
 ===========================
 
 Üretilen soruları profesyonel Word belgesine çeviren sistem.
+
+Belge düzeni (başlık, kategori bölümleri, soru / kod / cevap paragrafları)
+paragraf bloklarına açılır ve iki motordan biriyle yazılır:
+- "stream" (varsayılan): paragraflar doğrudan zip'teki document.xml'e
+  akıtılır (exporters/docx_stream_writer.py); bellek soru sayısından
+  bağımsızdır.
+- "docx": python-docx nesne ağacı kurulup kaydedilir.
+
+İki motor da süreç başına bir kez hazırlanan şablon paketini kullanır:
+WORD_TEMPLATE_PATH ile verilen .dotx/.docx (yoksa python-docx varsayılan
+şablonu), eksik Custom stilleri eklenip gövdesi boşaltılarak önbelleğe alınır;
+her export bu paketten klonlanır.
+
+export_questions örnek durumuna yazmaz (her çağrı kendi belgesini kurar);
+export_multiple_roles rol/katsayı belgelerini süreç havuzunda paralel üretir.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, List
+from io import BytesIO
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -19,66 +38,186 @@ try:
 except ImportError:
     raise ImportError("python-docx kütüphanesi yüklü değil. 'pip install python-docx' komutu ile yükleyin.")
 
+from config.generation_settings import get_word_export_config
 from config.rubric_system import DIFFICULTY_LABELS
+from core.patterns import CODE_BLOCK_LINE_INDICATORS, CONSOLE_WRITE_CALL, STATEMENT_CLOSED
+from exporters.docx_stream_writer import DocxTemplate, StreamingDocxWriter, as_document_package
 from utils.file_helpers import FileHelper
+from utils.tracing import current_span, traced
 
 logger = logging.getLogger(__name__)
 
+# Word export motorları
+WORD_EXPORT_ENGINES = ("stream", "docx")
+
+# Paragraf bloğu türü → (stil, ortala, run kalınlığı); iki motor da bu eşlemeyi kullanır
+BLOCK_FORMATS: Dict[str, Tuple[Optional[str], bool, Optional[bool]]] = {
+    "title": ("Custom Title", False, None),
+    "subtitle": ("Custom Subtitle", False, None),
+    "question": ("Custom Question", False, None),
+    "code": ("Custom Code", False, False),
+    "answer": ("Custom Answer", False, None),
+    "centered": (None, True, None),
+    "text": (None, False, None)
+}
+
+# Paragraf bloğu: (tür, metin)
+Block = Tuple[str, str]
+
+# Şablon yolu ("" = python-docx varsayılanı) → hazırlanmış şablon paketi
+_template_lock = threading.Lock()
+_document_templates: Dict[str, DocxTemplate] = {}
+
+def build_template_package(template_path: str = "") -> bytes:
+    """
+    Şablon paketini hazırla: .dotx/.docx (veya varsayılan şablon) açılır,
+    eksik Custom stilleri eklenir, gövde bölüm ayarları dışında boşaltılır.
+    
+    Args:
+        template_path (str): Şablon dosyası ("" ise python-docx varsayılanı)
+        
+    Returns:
+        bytes: Gövdesi boş .docx paketi
+    """
+    if template_path:
+        document = Document(BytesIO(as_document_package(Path(template_path).read_bytes())))
+    else:
+        document = Document()
+    WordExporter(engine="docx")._setup_document_styles(document)
+    
+    body = document.element.body
+    for child in list(body):
+        if child.tag != qn("w:sectPr"):
+            body.remove(child)
+    
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def get_document_template(template_path: Optional[str] = None) -> DocxTemplate:
+    """
+    Hazırlanmış şablon paketini döndür (yol başına ilk çağrıda bir kez
+    kurulur, süreç boyunca paylaşılır).
+    
+    Args:
+        template_path (str, optional): Şablon dosyası (None ise WORD_TEMPLATE_PATH)
+    """
+    if template_path is None:
+        template_path = get_word_export_config()["template_path"]
+    template = _document_templates.get(template_path)
+    if template is not None:
+        return template
+    with _template_lock:
+        template = _document_templates.get(template_path)
+        if template is None:
+            template = DocxTemplate.from_bytes(build_template_package(template_path))
+            _document_templates[template_path] = template
+            logger.info(f"Word şablonu hazırlandı: {template_path or 'python-docx varsayılanı'}")
+    return template
+
+def export_role_document(
+    questions_data: Dict[str, Any],
+    job_description: str,
+    output_path: str,
+    engine: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Tek bir rol/katsayı belgesini yaz (süreç havuzu görevi; modül düzeyinde
+    olduğu için pickle edilebilir).
+
+    Returns:
+        dict: success, file_path, duration (sn), error
+    """
+    started = time.perf_counter()
+    try:
+        success = WordExporter(engine=engine).export_questions(questions_data, job_description, output_path)
+        error = None if success else "Export işlemi başarısız"
+    except Exception as e:
+        success, error = False, str(e)
+    return {
+        "success": success,
+        "file_path": output_path,
+        "duration": time.perf_counter() - started,
+        "error": error
+    }
+
 class WordExporter:
     """Word belgesi export sınıfı"""
     
-    def __init__(self):
-        """Word exporter başlatıcı"""
+    def __init__(self, engine: Optional[str] = None):
+        """
+        Word exporter başlatıcı
+        
+        Args:
+            engine (str, optional): "stream" veya "docx" (None ise WORD_EXPORT_ENGINE)
+        """
         self.document = None
+        self.engine = engine or get_word_export_config()["engine"]
+        if self.engine not in WORD_EXPORT_ENGINES:
+            raise ValueError(f"Geçersiz Word export motoru: {self.engine}. Geçerli motorlar: {list(WORD_EXPORT_ENGINES)}")
     
     def create_document(self) -> Document:
         """Yeni Word belgesi oluştur"""
-        self.document = Document()
-        self._setup_document_styles()
+        self.document = self._new_document()
         return self.document
     
-    def _setup_document_styles(self):
-        """Belge stillerini ayarla"""
+    def _new_document(self) -> Document:
+        """Önbellekteki şablon paketinden klonlanan yeni belge (örnek durumuna yazmaz)"""
+        return Document(BytesIO(get_document_template().package))
+    
+    def _setup_document_styles(self, document: Optional[Document] = None):
+        """
+        Belge stillerini ayarla (document verilmezse self.document). Şablonda
+        zaten tanımlı Custom stiller korunur.
+        """
+        styles = (self.document if document is None else document).styles
+        
         # Başlık stilleri
-        title_style = self.document.styles.add_style('Custom Title', WD_STYLE_TYPE.PARAGRAPH)
-        title_style.font.name = 'Arial'
-        title_style.font.size = Pt(16)
-        title_style.font.bold = True
-        title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_style.paragraph_format.space_after = Pt(12)
+        if 'Custom Title' not in styles:
+            title_style = styles.add_style('Custom Title', WD_STYLE_TYPE.PARAGRAPH)
+            title_style.font.name = 'Arial'
+            title_style.font.size = Pt(16)
+            title_style.font.bold = True
+            title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            title_style.paragraph_format.space_after = Pt(12)
         
         # Alt başlık stilleri
-        subtitle_style = self.document.styles.add_style('Custom Subtitle', WD_STYLE_TYPE.PARAGRAPH)
-        subtitle_style.font.name = 'Arial'
-        subtitle_style.font.size = Pt(14)
-        subtitle_style.font.bold = True
-        subtitle_style.paragraph_format.space_before = Pt(12)
-        subtitle_style.paragraph_format.space_after = Pt(6)
+        if 'Custom Subtitle' not in styles:
+            subtitle_style = styles.add_style('Custom Subtitle', WD_STYLE_TYPE.PARAGRAPH)
+            subtitle_style.font.name = 'Arial'
+            subtitle_style.font.size = Pt(14)
+            subtitle_style.font.bold = True
+            subtitle_style.paragraph_format.space_before = Pt(12)
+            subtitle_style.paragraph_format.space_after = Pt(6)
         
         # Soru stilleri
-        question_style = self.document.styles.add_style('Custom Question', WD_STYLE_TYPE.PARAGRAPH)
-        question_style.font.name = 'Arial'
-        question_style.font.size = Pt(11)
-        question_style.font.bold = True
-        question_style.paragraph_format.space_before = Pt(8)
-        question_style.paragraph_format.space_after = Pt(4)
+        if 'Custom Question' not in styles:
+            question_style = styles.add_style('Custom Question', WD_STYLE_TYPE.PARAGRAPH)
+            question_style.font.name = 'Arial'
+            question_style.font.size = Pt(11)
+            question_style.font.bold = True
+            question_style.paragraph_format.space_before = Pt(8)
+            question_style.paragraph_format.space_after = Pt(4)
         
         # Cevap stilleri
-        answer_style = self.document.styles.add_style('Custom Answer', WD_STYLE_TYPE.PARAGRAPH)
-        answer_style.font.name = 'Arial'
-        answer_style.font.size = Pt(10)
-        answer_style.paragraph_format.space_after = Pt(8)
-        answer_style.paragraph_format.left_indent = Inches(0.25)
+        if 'Custom Answer' not in styles:
+            answer_style = styles.add_style('Custom Answer', WD_STYLE_TYPE.PARAGRAPH)
+            answer_style.font.name = 'Arial'
+            answer_style.font.size = Pt(10)
+            answer_style.paragraph_format.space_after = Pt(8)
+            answer_style.paragraph_format.left_indent = Inches(0.25)
 
         # Kod stilleri (tek satır veya çok satır kod blokları için)
-        code_style = self.document.styles.add_style('Custom Code', WD_STYLE_TYPE.PARAGRAPH)
-        code_style.font.name = 'Consolas'
-        code_style.font.size = Pt(10)
-        code_style.font.bold = False
-        # 3 boşluk kadar görsel girinti yaklaşığı: küçük bir sol iç boşluk
-        code_style.paragraph_format.left_indent = Inches(0.2)
-        code_style.paragraph_format.space_after = Pt(0)
+        if 'Custom Code' not in styles:
+            code_style = styles.add_style('Custom Code', WD_STYLE_TYPE.PARAGRAPH)
+            code_style.font.name = 'Consolas'
+            code_style.font.size = Pt(10)
+            code_style.font.bold = False
+            # 3 boşluk kadar görsel girinti yaklaşığı: küçük bir sol iç boşluk
+            code_style.paragraph_format.left_indent = Inches(0.2)
+            code_style.paragraph_format.space_after = Pt(0)
     
+    @traced("export.docx")
     def export_questions(
         self,
         questions_data: Dict[str, Any],
@@ -96,21 +235,25 @@ class WordExporter:
         Returns:
             bool: Başarı durumu
         """
+        current_span().set(role=questions_data.get("role"), questions=questions_data.get("total_questions"), engine=self.engine)
         try:
-            # Yeni belge oluştur
-            self.create_document()
-            
-            # Belge başlığını ekle
-            self._add_document_header(questions_data)
-            
-            # Soruları ekle
-            self._add_questions_sections(questions_data)
-            
-            # Dosyayı kaydet
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            if self.engine == "stream":
+                # Paragrafları şablonun stilleriyle doğrudan zip'e akıt
+                with StreamingDocxWriter(get_document_template(), output_path) as writer:
+                    for kind, text in self._document_blocks(questions_data):
+                        style, center, bold = BLOCK_FORMATS.get(kind, BLOCK_FORMATS["text"])
+                        writer.add_paragraph(text, style=style, center=center, bold=bold)
+            else:
+                # Çağrıya özel belge oluştur, blokları ekle (örnek paylaşılabilir)
+                document = self._new_document()
+                for kind, text in self._document_blocks(questions_data):
+                    self._add_block(kind, text, document)
+                
+                # Dosyayı kaydet
+                output_file = Path(output_path)
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                document.save(str(output_file))
             
-            self.document.save(str(output_file))
             logger.info(f"Word belgesi başarıyla kaydedildi: {output_path}")
             return True
             
@@ -118,20 +261,47 @@ class WordExporter:
             logger.error(f"Word export hatası: {e}")
             return False
     
+    def _document_blocks(self, questions_data: Dict[str, Any]) -> Iterator[Block]:
+        """Belgenin tüm paragraf blokları (başlık + soru bölümleri), sırayla"""
+        yield from self._header_blocks(questions_data)
+        yield from self._section_blocks(questions_data)
+    
+    def _add_block(self, kind: str, text: str, document: Optional[Document] = None):
+        """Paragraf bloğunu python-docx belgesine ekle (document verilmezse self.document)"""
+        if document is None:
+            document = self.document
+        style, center, bold = BLOCK_FORMATS.get(kind, BLOCK_FORMATS["text"])
+        if bold is None:
+            paragraph = document.add_paragraph(text, style=style)
+        else:
+            paragraph = document.add_paragraph(style=style)
+            run = paragraph.add_run(text)
+            run.bold = bold
+        if center:
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
     def _add_document_header(self, questions_data: Dict[str, Any]):
         """Belge başlığını ekle"""
+        for block in self._header_blocks(questions_data):
+            self._add_block(*block)
+    
+    def _header_blocks(self, questions_data: Dict[str, Any]) -> Iterator[Block]:
+        """Belge başlığı blokları"""
         role = questions_data.get("role", "Bilinmeyen Pozisyon")
         salary_coefficient = questions_data.get("salary_coefficient", 2)
         
         # Ana başlık - katsayı bilgisiyle
-        title = f"{role.upper()} {salary_coefficient}x MÜLAKAT SORULARI"
-        title_para = self.document.add_paragraph(title, style='Custom Title')
+        yield "title", f"{role.upper()} {salary_coefficient}x MÜLAKAT SORULARI"
+        
+        # Aday formu: aday ve oturum bilgisi
+        if questions_data.get("candidate"):
+            session = f" · Oturum: {questions_data['session_id']}" if questions_data.get("session_id") else ""
+            yield "centered", f"Aday: {questions_data['candidate']}{session}"
         
         # Tarih
-        date_para = self.document.add_paragraph(f"Oluşturulma Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M')}")
-        date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        yield "centered", f"Oluşturulma Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M')}"
         
-        self.document.add_paragraph()  # Boş satır
+        yield "text", ""  # Boş satır
     
     def _add_job_description_section(self, job_description: str):
         """İlan bilgileri bölümünü ekle"""
@@ -181,6 +351,11 @@ class WordExporter:
     
     def _add_questions_sections(self, questions_data: Dict[str, Any]):
         """Soru bölümlerini ekle"""
+        for block in self._section_blocks(questions_data):
+            self._add_block(*block)
+    
+    def _section_blocks(self, questions_data: Dict[str, Any]) -> Iterator[Block]:
+        """Kategori bölümleri ve soruların blokları"""
         questions = questions_data.get("questions", {})
         
         category_names = {
@@ -198,46 +373,51 @@ class WordExporter:
             
             # Kategori başlığı
             section_title = f"{category_name} ({question_count} Soru)"
-            self.document.add_paragraph(section_title, style='Custom Subtitle')
-            self.document.add_paragraph("-" * len(section_title))
+            yield "subtitle", section_title
+            yield "text", "-" * len(section_title)
             
             # Her soruyu ekle
             for i, question_data in enumerate(category_questions, 1):
                 if not question_data.get("success", False):
                     continue
                 
-                self._add_single_question(category_code, i, question_data)
+                yield from self._single_question_blocks(category_code, i, question_data)
             
-            self.document.add_paragraph()  # Kategori arası boşluk
+            yield "text", ""  # Kategori arası boşluk
     
     def _add_single_question(self, category_code: str, question_number: int, question_data: Dict[str, Any]):
         """Tek bir soruyu ekle"""
+        for block in self._single_question_blocks(category_code, question_number, question_data):
+            self._add_block(*block)
+    
+    def _single_question_blocks(self, category_code: str, question_number: int, question_data: Dict[str, Any]) -> Iterator[Block]:
+        """Tek bir sorunun blokları (soru, varsa kod satırları, beklenen cevap)"""
         question_text = question_data.get("question", "Soru metni eksik")
         expected_answer = question_data.get("expected_answer", "Beklenen cevap eksik")
 
         # Soru metni ile olası kod bloğunu ayır
         clean_question, code_block = self._split_question_and_code(question_text)
 
-        # Soru başlığı ve metni (bold)
-        self.document.add_paragraph(f"{question_number}. {clean_question}", style='Custom Question')
+        # Soru başlığı ve metni (bold); havuzdan örneklenen sorularda rübrik seviyesi
+        level = question_data.get("rubric_level")
+        level_prefix = f"[{level.split('_', 1)[0]}] " if level else ""
+        yield "question", f"{question_number}. {level_prefix}{clean_question}"
 
         # Kod bloğu sadece 'practical_application' kategorisinde yazılsın
         if code_block and category_code == 'practical_application':
             # Görselleştirme öncesi kodu normalize et (kaçışları düzelt, eksik kapatmaları tamamla)
             code_block = self._normalize_code_block_for_display(code_block)
-            self.document.add_paragraph("")  # Boş satır
+            yield "text", ""  # Boş satır
             for line in code_block.splitlines():
-                code_para = self.document.add_paragraph(style='Custom Code')
-                run = code_para.add_run(f"   {line.rstrip()}")
-                run.bold = False
+                yield "code", f"   {line.rstrip()}"
             # Kod ile cevap arasında bir boş satır
-            self.document.add_paragraph("")
+            yield "text", ""
 
         # Beklenen cevap
         if expected_answer:
-            self.document.add_paragraph(f"Beklenen Cevap: {expected_answer}", style='Custom Answer')
+            yield "answer", f"Beklenen Cevap: {expected_answer}"
 
-        self.document.add_paragraph()  # Soru arası boşluk
+        yield "text", ""  # Soru arası boşluk
 
     def _split_question_and_code(self, question_text: str) -> tuple:
         """Soru metninden olası kod bloğunu ayır.
@@ -271,40 +451,12 @@ class WordExporter:
         if not text:
             return False
 
-        code_indicators = [
-            # Yaygın anahtar kelimeler
-            r"^\s*(for|if|while|def|class|try|catch|public|private|protected|static|using|import|from)\b",
-            r"\bConsole\.",
-            r"\bprint\(",
-            r"\bSystem\.",
-            r"\bvar\s+\w+\s*=",
-            r"\blet\s+\w+\s*=",
-            r"\bconst\s+\w+\s*=",
-            r"\bNew-[A-Za-z]+\b",   # PowerShell
-            r"\bGet-[A-Za-z]+\b",
-            r"\bSet-[A-Za-z]+\b",
-            r"SELECT\s+.+\s+FROM",
-            r"CREATE\s+TABLE",
-            r"INSERT\s+INTO",
-            r"UPDATE\s+\w+\s+SET",
-            r"DELETE\s+FROM",
-            # Semboller
-            r"[{};=()<>\[\]]",
-            r":\s*$",  # Python bloğu
-        ]
-
-        import re
         lines = [ln for ln in text.splitlines() if ln.strip()]
         if not lines:
             return False
 
-        # Eğer iki veya daha fazla satır varsa ve en az bir satırda belirgin kod göstergesi varsa
-        indicator_regexes = [re.compile(pat, re.IGNORECASE) for pat in code_indicators]
-        hits = 0
-        for ln in lines:
-            if any(r.search(ln) for r in indicator_regexes):
-                hits += 1
-        return hits >= 1 and len(lines) >= 1
+        # En az bir satırda belirgin kod göstergesi varsa (tek birleşik desen)
+        return any(CODE_BLOCK_LINE_INDICATORS.search(ln) for ln in lines)
 
     def _normalize_code_block_for_display(self, text: str) -> str:
         """Kod bloğunu Word çıktısı için güvenli ve mümkün olduğunca tam hale getirir.
@@ -314,7 +466,6 @@ class WordExporter:
         - Parantez/ayraç ve çift tırnakları dengelemeye çalışır
         - Console.WriteLine( … ) gibi yaygın kalıpları kapatır
         """
-        import re
         if not text:
             return text
         # Kaçışları çöz
@@ -327,7 +478,7 @@ class WordExporter:
         fixed_lines = []
         for ln in lines:
             # Console.WriteLine veya benzeri açık parantezle kalan kalıplar
-            if re.search(r"Console\.Write(Line|)\s*\(.*$", ln) and not re.search(r"\)\s*;\s*$", ln):
+            if CONSOLE_WRITE_CALL.search(ln) and not STATEMENT_CLOSED.search(ln):
                 # Kapanışı ekle
                 if ln.endswith('(') or ln.endswith('( '):
                     ln = ln + ')'
@@ -395,62 +546,85 @@ class WordExporter:
         self,
         multiple_questions_data: List[Dict[str, Any]],
         job_descriptions: Dict[str, str],
-        output_dir: str = "data/word_exports"
+        output_dir: str = "data/word_exports",
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Birden fazla rol için Word belgeleri oluştur.
+        Birden fazla rol için Word belgeleri oluştur. Belgeler süreç havuzunda
+        paralel yazılır (tek belge veya tek worker'da süreç açılmaz).
         
         Args:
             multiple_questions_data (list): Çoklu soru verileri
             job_descriptions (dict): İlan metinleri
             output_dir (str): Çıktı dizini
+            max_workers (int, optional): Süreç sayısı (None ise WORD_EXPORT_PROCESSES)
             
         Returns:
-            dict: Export sonuçları
+            dict: Export sonuçları (dosya başına süre "duration" alanında)
         """
         results = {
             "success": True,
             "exported_files": [],
             "failed_exports": []
         }
+        started = time.perf_counter()
         
-        for questions_data in multiple_questions_data:
+        # Görevleri hazırla: (sıra, rol, katsayı, argümanlar)
+        tasks = []
+        for index, questions_data in enumerate(multiple_questions_data):
+            role = questions_data.get("role", "unknown")
+            salary_coefficient = questions_data.get("salary_coefficient", 2)
             try:
-                role = questions_data.get("role", "unknown")
-                salary_coefficient = questions_data.get("salary_coefficient", 2)
-                
-                # Dosya yolu oluştur
                 output_path = self.generate_filename(role, salary_coefficient, output_dir)
-                
-                # İlan metnini al
-                job_description = job_descriptions.get(role, f"{role} pozisyonu için iş tanımı")
-                
-                # Export et
-                export_success = self.export_questions(questions_data, job_description, output_path)
-                
-                if export_success:
-                    results["exported_files"].append({
-                        "role": role,
-                        "salary_coefficient": salary_coefficient,
-                        "file_path": output_path
-                    })
-                else:
-                    results["failed_exports"].append({
-                        "role": role,
-                        "salary_coefficient": salary_coefficient,
-                        "error": "Export işlemi başarısız"
-                    })
-                    
             except Exception as e:
                 logger.error(f"Çoklu export hatası: {e}")
+                results["failed_exports"].append({"role": role, "salary_coefficient": salary_coefficient, "error": str(e)})
+                continue
+            job_description = job_descriptions.get(role, f"{role} pozisyonu için iş tanımı")
+            tasks.append((index, role, salary_coefficient, (questions_data, job_description, output_path, self.engine)))
+        
+        workers = min(max_workers or get_word_export_config()["processes"], len(tasks))
+        outcomes: Dict[int, Dict[str, Any]] = {}
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(export_role_document, *args): index for index, _, _, args in tasks}
+                for future in as_completed(futures):
+                    try:
+                        outcomes[futures[future]] = future.result()
+                    except Exception as e:
+                        # Süreç çöktüyse veya sonuç aktarılamadıysa
+                        logger.error(f"Çoklu export hatası: {e}")
+                        outcomes[futures[future]] = {"success": False, "duration": 0.0, "error": str(e)}
+        else:
+            for index, _, _, args in tasks:
+                outcomes[index] = export_role_document(*args)
+        
+        # Sonuçları girdi sırasıyla topla
+        for index, role, salary_coefficient, _ in tasks:
+            outcome = outcomes[index]
+            if outcome["success"]:
+                results["exported_files"].append({
+                    "role": role,
+                    "salary_coefficient": salary_coefficient,
+                    "file_path": outcome["file_path"],
+                    "duration": outcome["duration"]
+                })
+            else:
                 results["failed_exports"].append({
-                    "role": questions_data.get("role", "unknown"),
-                    "error": str(e)
+                    "role": role,
+                    "salary_coefficient": salary_coefficient,
+                    "error": outcome["error"],
+                    "duration": outcome["duration"]
                 })
         
         # Genel başarı durumu
         if results["failed_exports"]:
             results["success"] = False
+        results["workers"] = max(1, workers)
+        results["duration"] = time.perf_counter() - started
         
-        logger.info(f"Çoklu export tamamlandı: {len(results['exported_files'])} başarılı, {len(results['failed_exports'])} başarısız")
+        logger.info(
+            f"Çoklu export tamamlandı: {len(results['exported_files'])} başarılı, "
+            f"{len(results['failed_exports'])} başarısız ({results['workers']} süreç, {results['duration']:.2f} sn)"
+        )
         return results
\ No newline at end of file
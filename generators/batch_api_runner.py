@@ -0,0 +1,250 @@
+"""
+BATCH API ÜRETİM MODU
+=====================
+
+Gece çalışan havuz yenilemeleri için üretim planının tamamını tek bir
+Batch API girdi dosyasına derler: her rol/katsayı/kategori için bir satır.
+Satırlar canlı üretimle aynı plan (fazla üretim) ve rol bağlamı +
+BATCH_PROMPT_TEMPLATE prompt'u ile oluşturulur. Batch gönderilir, tamamlanana kadar yoklanır ve
+dönen yanıtlar üreticiye yüklenir; ardından BatchScheduler normal akışta
+çalışır ve generate_questions_batch bu yanıtları aynı parse / filtre /
+metadata yolundan geçirir. Yanıtı gelmeyen kategoriler ve eksik kalan
+soruların doldurma istekleri canlı gönderilir.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.openai_settings import get_batch_api_config
+from config.question_categories import get_active_question_categories
+from config.roles_config import get_role_config
+from core.batch_api import CHAT_COMPLETIONS_ENDPOINT, BatchAPIClient, BatchAPIError
+from generators.run_journal import RunJournal
+from core.usage_tracker import pop_usage_context, push_usage_context
+from generators.single_generator import SingleGenerator
+
+logger = logging.getLogger(__name__)
+
+class BatchAPIRunner:
+    """Üretim planını Batch API üzerinden önceden yanıtlatan çalıştırıcı"""
+
+    def __init__(
+        self,
+        generator: SingleGenerator,
+        client: Optional[BatchAPIClient] = None,
+        journal: Optional[RunJournal] = None,
+        job_descriptions: Optional[Dict[str, str]] = None,
+        directory: Optional[str] = None
+    ):
+        """
+        Args:
+            generator: Yanıtların yükleneceği (zamanlayıcıyla paylaşılan) üretici
+            client: Batch API istemcisi (None ise OPENAI_* ayarlarıyla)
+            journal: Çalıştırma günlüğü (batch kimliği kaydedilir, devamda yeniden gönderilmez)
+            job_descriptions: {rol_kodu: ilan metni} (verilmeyen roller için ilan dosyası)
+            directory: Girdi/çıktı JSONL dizini (None ise BATCH_API_DIR)
+        """
+        self.generator = generator
+        self.client = client or BatchAPIClient()
+        self.journal = journal
+        self.job_descriptions = job_descriptions or {}
+        self.directory = directory or get_batch_api_config()["directory"]
+
+    def compile_requests(self, units: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Birimleri Batch API satırlarına derle.
+
+        Günlükte tamamlanmış birimler ve kategoriler atlanır.
+
+        Returns:
+            tuple: (JSONL satırları, {custom_id: rol adı / katsayı / kategori / istenen sayı})
+        """
+        question_generator = self.generator.question_generator
+        lines: List[Dict[str, Any]] = []
+        requests: Dict[str, Dict[str, Any]] = {}
+
+        for unit in units:
+            unit_id = unit["unit_id"]
+            completed = {}
+            if self.journal is not None:
+                if self.journal.completed_unit(unit_id) is not None:
+                    continue
+                completed = self.journal.completed_categories(unit_id)
+
+            role_config = get_role_config(unit["role_code"])
+            job_context = self.job_descriptions.get(unit["role_code"])
+            if job_context is None:
+                job_context = self.generator.load_job_description(unit["role_code"])
+
+            for category_code, category_name, category_description in get_active_question_categories():
+                question_count = unit["question_counts"].get(category_code, 0)
+                if question_count <= 0 or category_code in completed:
+                    continue
+
+                request = question_generator.build_batch_request(
+                    role_name=role_config["name"],
+                    job_context=job_context,
+                    description=role_config["description"],
+                    salary_coefficient=unit["difficulty"],
+                    question_type=category_code,
+                    type_name=category_name,
+                    type_description=category_description,
+                    question_count=question_count
+                )
+                custom_id = f"{unit_id}/{category_code}"
+                lines.append({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": CHAT_COMPLETIONS_ENDPOINT,
+                    "body": request["body"]
+                })
+                requests[custom_id] = {
+                    "role_name": role_config["name"],
+                    "difficulty": unit["difficulty"],
+                    "category": category_code,
+                    "question_count": question_count,
+                    "request_count": request["request_count"]
+                }
+
+        return lines, requests
+
+    def run(
+        self,
+        units: List[Dict[str, Any]],
+        on_status: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Batch'i derle, gönder (devamda mevcut batch'i kullan), bekle ve
+        yanıtları üreticiye yükle.
+
+        Gönderimden sonraki hatalarda (yoklama tekrarları tükendi, bekleme
+        süresi doldu, çıktı indirilemedi) batch sunucuda işlenmeye ve
+        faturalanmaya devam edebilir; bu durumda istekler canlı üretime
+        düşürülmez, pending=True döner ve çalıştırma --resume ile aynı
+        batch'ten devam ettirilmelidir. Yalnızca gönderim başarısız olursa
+        (failed=requests) veya batch biterken başarısız / süresi dolmuş
+        satırlar kalırsa (failed=eksik yanıtlar) o istekler canlı üretilir.
+
+        Returns:
+            dict: success, batch_id, status, requests, loaded, failed, pending
+                (ve hata varsa error)
+        """
+        batch_id = None
+        if self.journal is not None and self.journal.batch is not None:
+            batch_id = self.journal.batch["batch_id"]
+            requests = self.journal.batch["requests"]
+            logger.info(f"Günlükteki Batch API batch'ine devam ediliyor: {batch_id}")
+        else:
+            lines, requests = self.compile_requests(units)
+            if not lines:
+                logger.info("Batch API: gönderilecek istek yok")
+                return {
+                    "success": True, "batch_id": None, "status": None,
+                    "requests": 0, "loaded": 0, "failed": 0, "pending": False
+                }
+
+        if batch_id is None:
+            try:
+                batch_id = self._submit(lines, requests)
+            except BatchAPIError as e:
+                logger.error(f"Batch API gönderimi başarısız, istekler canlı üretilecek: {e}")
+                return {
+                    "success": False, "batch_id": None, "status": None, "requests": len(requests),
+                    "loaded": 0, "failed": len(requests), "pending": False, "error": str(e)
+                }
+
+        try:
+            batch = self.client.wait_for_batch(batch_id, on_status=on_status)
+            responses, failed = self._collect_responses(batch, requests)
+        except BatchAPIError as e:
+            logger.error(f"Batch API {batch_id} sonucu alınamadı (batch sunucuda sürüyor olabilir): {e}")
+            return {
+                "success": False, "batch_id": batch_id, "status": None, "requests": len(requests),
+                "loaded": 0, "failed": 0, "pending": True, "error": str(e)
+            }
+
+        self.generator.question_generator.load_prefetched_responses(responses)
+
+        status = batch.get("status")
+        logger.info(
+            f"Batch API {batch_id} ({status}): {len(responses)}/{len(requests)} yanıt yüklendi, "
+            f"{failed} istek canlı üretime kalacak"
+        )
+        return {
+            "success": status == "completed",
+            "batch_id": batch_id,
+            "status": status,
+            "requests": len(requests),
+            "loaded": len(responses),
+            "failed": failed,
+            "pending": False
+        }
+
+    def _submit(self, lines: List[Dict[str, Any]], requests: Dict[str, Dict[str, Any]]) -> str:
+        """Girdi dosyasını diske yaz, yükle ve batch'i oluştur"""
+        content = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("utf-8")
+        input_path = Path(self.directory) / f"{self.generator.run_id}_input.jsonl"
+        input_path.parent.mkdir(parents=True, exist_ok=True)
+        input_path.write_bytes(content)
+
+        input_file_id = self.client.upload_file(content, filename=input_path.name)
+        batch = self.client.create_batch(input_file_id, metadata={"run_id": self.generator.run_id})
+        batch_id = batch["id"]
+        logger.info(f"📦 Batch API: {len(lines)} istek gönderildi (batch {batch_id}, girdi {input_path})")
+
+        if self.journal is not None:
+            self.journal.record_batch(batch_id, requests)
+        return batch_id
+
+    def _collect_responses(
+        self,
+        batch: Dict[str, Any],
+        requests: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[Tuple[str, int, str], Dict[str, Any]], int]:
+        """
+        Çıktı dosyasını indir ve başarılı satırları üretici anahtarlarına çevir.
+
+        Returns:
+            tuple: ({(rol_adı, katsayı, kategori): {"text", "request_count"}}, başarısız istek sayısı)
+        """
+        responses: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
+        output_file_id = batch.get("output_file_id")
+        if output_file_id:
+            content = self.client.download_file(output_file_id)
+            output_path = Path(self.directory) / f"{self.generator.run_id}_output.jsonl"
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(content, encoding="utf-8")
+
+            for record in self.client.parse_output(content):
+                request = requests.get(record["custom_id"])
+                if request is None:
+                    logger.warning(f"Batch çıktısında bilinmeyen custom_id: {record['custom_id']}")
+                    continue
+                if record["status_code"] != 200 or not record["body"]:
+                    logger.warning(f"Batch isteği başarısız ({record['custom_id']}): {record['error'] or record['status_code']}")
+                    continue
+                try:
+                    text = record["body"]["choices"][0]["message"]["content"].strip()
+                except (KeyError, IndexError, TypeError, AttributeError):
+                    logger.warning(f"Batch yanıtı beklenen biçimde değil: {record['custom_id']}")
+                    continue
+                context_token = push_usage_context(
+                    role=request["role_name"], difficulty=request["difficulty"], category=request["category"],
+                    question_count=request.get("question_count"), call_site="batch"
+                )
+                try:
+                    self.generator.question_generator.usage_tracker.record(
+                        record["body"].get("usage"), model=record["body"].get("model"), batch_api=True
+                    )
+                finally:
+                    pop_usage_context(context_token)
+                responses[(request["role_name"], request["difficulty"], request["category"])] = {
+                    "text": text,
+                    "request_count": request["request_count"]
+                }
+        else:
+            logger.error(f"Batch {batch.get('id')} çıktı dosyası yok (durum: {batch.get('status')})")
+
+        return responses, len(requests) - len(responses)
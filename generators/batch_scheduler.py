@@ -0,0 +1,378 @@
+"""
+TOPLU ÜRETİM ZAMANLAYICISI
+==========================
+
+Üretim planını (rol → katsayı → soru sayısı) görev grafiğine çevirir:
+her rol/katsayı birimi için "üret → JSON kaydet → Word / diğer export'lar"
+zinciri. JSON'dan sonraki biçimler (docx, jsonl, csv, md, html;
+exporters/registry.py) birim içinde eşzamanlı yazılır.
+Üretim görevleri sınırlı eşzamanlılıkla, export görevleri ise ayrı bir
+worker havuzunda çalışır; böylece export hiçbir zaman sıradaki API
+isteğini bekletmez.
+
+Bir çalıştırma günlüğü (RunJournal) verilirse tamamlanan kategori batch'leri,
+export'lar ve birimler diske yazılır; aynı günlükle yeniden çalıştırıldığında
+biten birimler atlanır ve yalnızca eksik kategoriler istenir.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Optional, Callable
+
+from config.roles_config import ROLES
+from config.generation_settings import get_export_config, get_generation_config
+from generators.single_generator import SingleGenerator
+from generators.run_journal import RunJournal
+from exporters.registry import available_formats, get_exporter
+from utils.file_helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+# Birim başına üretilebilecek çıktı biçimleri (json + kayıtlı exporter'lar)
+OUTPUT_FORMATS = ("json",) + available_formats()
+# Biçim verilmediğinde üretilenler
+DEFAULT_OUTPUT_FORMATS = ("json", "docx")
+
+class BatchScheduler:
+    """Üretim planını paralel görevler halinde çalıştıran zamanlayıcı"""
+
+    def __init__(
+        self,
+        generator: Optional[SingleGenerator] = None,
+        max_concurrency: Optional[int] = None,
+        export_workers: Optional[int] = None,
+        json_output_dir: str = "data/generated_questions",
+        word_output_dir: str = "data/word_exports",
+        export_output_dir: Optional[str] = None,
+        output_formats: Optional[Iterable[str]] = None,
+        job_descriptions: Optional[Dict[str, str]] = None,
+        journal: Optional[RunJournal] = None
+    ):
+        """
+        Zamanlayıcı başlatıcı
+
+        Args:
+            generator (SingleGenerator, optional): Paylaşılan soru üretici
+            max_concurrency (int, optional): Aynı anda çalışacak üretim görevi sayısı
+            export_workers (int, optional): JSON/Word export worker sayısı
+            json_output_dir (str): JSON çıktı dizini
+            word_output_dir (str): Word çıktı dizini
+            export_output_dir (str, optional): jsonl / csv / md / html çıktı dizini
+                (None ise EXPORT_OUTPUT_DIR)
+            output_formats (iterable, optional): Üretilecek çıktılar (None ise DEFAULT_OUTPUT_FORMATS)
+            job_descriptions (dict, optional): {rol_kodu: ilan metni}; verilmeyen roller
+                için ilan dosyası kullanılır
+            journal (RunJournal, optional): İlerlemenin yazılacağı / devam
+                edilecek çalıştırma günlüğü
+        """
+        formats = tuple(output_formats) if output_formats is not None else DEFAULT_OUTPUT_FORMATS
+        unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(f"Geçersiz çıktı biçimi: {unknown}. Geçerli biçimler: {list(OUTPUT_FORMATS)}")
+        generation_config = get_generation_config()
+        self.generator = generator or SingleGenerator()
+        self.max_concurrency = max(1, max_concurrency or generation_config["batch_concurrency"])
+        self.export_workers = max(1, export_workers or generation_config["export_workers"])
+        self.json_output_dir = json_output_dir
+        self.word_output_dir = word_output_dir
+        self.export_output_dir = export_output_dir or get_export_config()["output_dir"]
+        self.output_formats = formats
+        self.job_descriptions = job_descriptions or {}
+        self.journal = journal
+        self._timings: List[Dict[str, Any]] = []
+        self._timings_lock = threading.Lock()
+
+    def build_units(
+        self,
+        generation_plan: Dict[str, Dict[int, int]],
+        distribution_fn: Callable[[int], Dict[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Üretim planını rol/katsayı birimlerine aç.
+
+        Args:
+            generation_plan (dict): {rol_kodu: {katsayı: soru_sayısı}}
+            distribution_fn (callable): Toplam sayıyı kategorilere dağıtan fonksiyon
+
+        Returns:
+            list: Plan sırasını koruyan üretim birimleri
+        """
+        units = []
+        for role_code, difficulties in generation_plan.items():
+            for difficulty, count in difficulties.items():
+                units.append({
+                    "index": len(units),
+                    "unit_id": f"{role_code}/{difficulty}x",
+                    "role_code": role_code,
+                    "role_name": ROLES[role_code]["name"],
+                    "difficulty": difficulty,
+                    "count": count,
+                    "question_counts": distribution_fn(count)
+                })
+        return units
+
+    def run(
+        self,
+        generation_plan: Dict[str, Dict[int, int]],
+        distribution_fn: Callable[[int], Dict[str, int]],
+        progress_callback: Optional[Callable[[str, Dict[str, Any], Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Planı çalıştır.
+
+        Args:
+            generation_plan (dict): {rol_kodu: {katsayı: soru_sayısı}}
+            distribution_fn (callable): Kategori dağılım fonksiyonu
+            progress_callback (callable, optional): (olay, birim, veri) bildirimi
+
+        Returns:
+            dict: display_results ile uyumlu "results" listesi ve görev süreleri
+        """
+        units = self.build_units(generation_plan, distribution_fn)
+        self._timings = []
+        notify = progress_callback or (lambda event, unit, payload: None)
+
+        logger.info(
+            f"Zamanlayıcı başlıyor: {len(units)} birim, "
+            f"üretim eşzamanlılığı={self.max_concurrency}, export worker={self.export_workers}"
+        )
+
+        started = time.perf_counter()
+        unit_results: Dict[int, Dict[str, Any]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.export_workers, thread_name_prefix="export") as export_pool:
+            export_futures = []
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="generate") as generate_pool:
+                generate_futures = {}
+                for unit in units:
+                    summary = self._journaled_unit(unit)
+                    if summary is not None:
+                        unit_results[unit["index"]] = {"index": unit["index"], **summary}
+                        notify("unit_skipped", unit, summary)
+                        continue
+                    notify("generate_started", unit, {})
+                    # Her görev kendi bağlam kopyasında: span'ler batch.run altında kalır
+                    generate_futures[
+                        generate_pool.submit(contextvars.copy_context().run, self._generate_unit, unit)
+                    ] = unit
+
+                for future in as_completed(generate_futures):
+                    unit = generate_futures[future]
+                    result = future.result()
+
+                    if not result.get("success", False):
+                        notify("generate_failed", unit, result)
+                        continue
+
+                    notify("generate_completed", unit, result)
+                    export_futures.append(
+                        export_pool.submit(contextvars.copy_context().run, self._export_unit, unit, result, notify)
+                    )
+
+            for future in as_completed(export_futures):
+                unit_result = future.result()
+                unit_results[unit_result["index"]] = unit_result
+
+        results = []
+        for index in sorted(unit_results):
+            unit_result = dict(unit_results[index])
+            unit_result.pop("index", None)
+            results.append(unit_result)
+
+        total_duration = time.perf_counter() - started
+        logger.info(f"Zamanlayıcı tamamlandı: {len(results)}/{len(units)} birim, {total_duration:.2f} sn")
+        if self.journal is not None and not self.journal.completed and len(results) == len(units):
+            self.journal.record_run_completed(len(units))
+
+        return {
+            "results": results,
+            "timings": sorted(self._timings, key=lambda t: t["started_at"]),
+            "total_duration": total_duration
+        }
+
+    def _journaled_unit(self, unit: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Günlükte tamamlanmış ve dosyaları hâlâ diskte olan birimin özeti"""
+        if self.journal is None:
+            return None
+        summary = self.journal.completed_unit(unit["unit_id"])
+        if summary is None:
+            return None
+        files = [summary.get("json_file"), summary.get("word_file"), *summary.get("files", {}).values()]
+        if any(file_path and not os.path.exists(file_path) for file_path in files):
+            logger.info(f"{unit['unit_id']}: günlükteki export dosyası eksik, yeniden oluşturulacak")
+            return None
+        return summary
+
+    def _generate_unit(self, unit: Dict[str, Any]) -> Dict[str, Any]:
+        """Bir birim için soru üretimi (JSON kaydı ayrı görevde yapılır)"""
+        completed_questions = None
+        on_category_completed = None
+        if self.journal is not None:
+            completed_questions = self.journal.completed_categories(unit["unit_id"])
+            on_category_completed = (
+                lambda category_code, questions: self.journal.record_category(unit["unit_id"], category_code, questions)
+            )
+
+        with self._timed(unit, "generate") as timing:
+            try:
+                result = self.generator.generate_questions(
+                    role_code=unit["role_code"],
+                    salary_coefficient=unit["difficulty"],
+                    question_counts=unit["question_counts"],
+                    job_description=self.job_descriptions.get(unit["role_code"]),
+                    save_json=False,
+                    completed_questions=completed_questions,
+                    on_category_completed=on_category_completed
+                )
+            except Exception as e:
+                logger.error(f"Üretim görevi hatası ({unit['unit_id']}): {e}")
+                result = {"success": False, "error": str(e)}
+            timing["success"] = result.get("success", False)
+        return result
+
+    def _export_unit(
+        self,
+        unit: Dict[str, Any],
+        result: Dict[str, Any],
+        notify: Callable[[str, Dict[str, Any], Dict[str, Any]], None]
+    ) -> Dict[str, Any]:
+        """Üretilen birim için JSON kaydet → Word / diğer export'lar zincirini çalıştır"""
+        role_name = unit["role_name"]
+        difficulty = unit["difficulty"]
+
+        # JSON kaydet
+        json_file = self._journaled_export(unit, "json")
+        if "json" in self.output_formats and json_file is None:
+            with self._timed(unit, "save_json") as timing:
+                json_filename = (
+                    f"{self.json_output_dir}/{FileHelper.get_safe_filename(role_name)}_{difficulty}x_questions.json"
+                )
+                if FileHelper.save_questions_json(result, json_filename):
+                    json_file = json_filename
+                    result["json_file"] = json_filename
+                    self._record_export(unit, "json", json_file)
+                timing["success"] = json_file is not None
+
+        # Word ve diğer biçimler: günlükte olmayanlar birim içinde eşzamanlı yazılır
+        files = {fmt: self._journaled_export(unit, fmt) for fmt in self.output_formats if fmt != "json"}
+        pending = [fmt for fmt, file_path in files.items() if file_path is None]
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="export-format") as format_pool:
+                futures = {
+                    fmt: format_pool.submit(contextvars.copy_context().run, self._export_format, unit, result, fmt, notify)
+                    for fmt in pending
+                }
+                for fmt, future in futures.items():
+                    files[fmt] = future.result()
+        elif pending:
+            files[pending[0]] = self._export_format(unit, result, pending[0], notify)
+        word_file = files.pop("docx", None)
+
+        summary = {
+            "role": role_name,
+            "difficulty": difficulty,
+            "count": result.get("total_questions", 0),
+            "word_file": word_file,
+            "json_file": json_file
+        }
+        if files:
+            summary["files"] = files
+        # İstenen tüm çıktılar oluştuysa birim devam ederken atlanabilir
+        requested_files = {"json": json_file, "docx": word_file, **files}
+        if self.journal is not None and all(requested_files[fmt] for fmt in self.output_formats):
+            try:
+                self.journal.record_unit(unit["unit_id"], summary)
+            except OSError as e:
+                logger.error(f"Günlük yazma hatası ({unit['unit_id']}): {e}")
+        return {"index": unit["index"], **summary}
+
+    def _export_format(
+        self,
+        unit: Dict[str, Any],
+        result: Dict[str, Any],
+        output_format: str,
+        notify: Callable[[str, Dict[str, Any], Dict[str, Any]], None]
+    ) -> Optional[str]:
+        """Birimi tek bir biçimde (docx, jsonl, csv, md, html) export et; dosya yolunu döndür"""
+        output_file = None
+        with self._timed(unit, f"export_{output_format}") as timing:
+            try:
+                # Exporter'lar durumsuz; görev başına örnek yalnızca ayarları taşır
+                exporter = get_exporter(output_format)
+                job_description = self.job_descriptions.get(unit["role_code"])
+                if job_description is None:
+                    job_file_path = f"data/job_descriptions/{ROLES[unit['role_code']]['job_description_file']}"
+                    job_description = FileHelper.load_job_description(job_file_path)
+
+                base_dir = self.word_output_dir if output_format == "docx" else self.export_output_dir
+                filename = exporter.generate_filename(unit["role_name"], unit["difficulty"], base_dir)
+                if exporter.export_questions(result, job_description, filename):
+                    output_file = filename
+                    self._record_export(unit, output_format, output_file)
+                    payload = {"format": output_format, "file": output_file}
+                    if output_format == "docx":
+                        payload["word_file"] = output_file
+                    notify("export_completed", unit, payload)
+                else:
+                    notify("export_failed", unit, {"format": output_format, "error": f"{output_format} oluşturulamadı"})
+            except Exception as export_error:
+                logger.error(f"{output_format} export görevi hatası ({unit['unit_id']}): {export_error}")
+                notify("export_failed", unit, {"format": output_format, "error": str(export_error)})
+            timing["success"] = output_file is not None
+        return output_file
+
+    def _journaled_export(self, unit: Dict[str, Any], output_format: str) -> Optional[str]:
+        """Devam edilen çalıştırmada bu birim için zaten oluşturulmuş export dosyası"""
+        if self.journal is None or output_format not in self.output_formats:
+            return None
+        return self.journal.completed_export(unit["unit_id"], output_format)
+
+    def _record_export(self, unit: Dict[str, Any], output_format: str, file_path: str):
+        """Export'u günlüğe yaz; günlük hatası export'u bozmaz"""
+        if self.journal is None:
+            return
+        try:
+            self.journal.record_export(unit["unit_id"], output_format, file_path)
+        except OSError as e:
+            logger.error(f"Günlük yazma hatası ({unit['unit_id']}): {e}")
+
+    def _timed(self, unit: Dict[str, Any], task: str) -> "_TaskTimer":
+        """Görev süresini ölçen context manager döndür"""
+        return _TaskTimer(self, unit, task)
+
+    def _record_timing(self, timing: Dict[str, Any]):
+        """Görev süresini thread-safe şekilde kaydet"""
+        with self._timings_lock:
+            self._timings.append(timing)
+
+class _TaskTimer:
+    """Tek bir görevin başlangıç/süre bilgisini tutan yardımcı"""
+
+    def __init__(self, scheduler: BatchScheduler, unit: Dict[str, Any], task: str):
+        self.scheduler = scheduler
+        self.timing = {
+            "unit": unit["unit_id"],
+            "role": unit["role_name"],
+            "difficulty": unit["difficulty"],
+            "task": task,
+            "success": False
+        }
+        self._start = 0.0
+
+    def __enter__(self) -> Dict[str, Any]:
+        self._start = time.perf_counter()
+        self.timing["started_at"] = time.time()
+        return self.timing
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timing["duration"] = time.perf_counter() - self._start
+        if exc_type is not None:
+            self.timing["success"] = False
+            self.timing["error"] = str(exc)
+        self.scheduler._record_timing(self.timing)
+        return False
@@ -0,0 +1,340 @@
+"""
+ADAY SORU FORMU ÜRETİCİ
+=======================
+
+Mülakat günü için her adaya ayrı bir soru formu hazırlar. Sorular kalıcı
+havuzdan (utils/question_pool_store.py) örneklenir; LLM çağrısı yapılmaz.
+
+- Her kategori için istenen soru sayısı, maaş katsayısının K1-K5 rübrik
+  dağılımına (get_difficulty_distribution_by_multiplier) göre seviyelere
+  bölünür. Seviye etiketi olmayan havuz soruları metinden sınıflandırılır
+  (DifficultyManager.classify_question_level).
+- Aynı oturumdaki adaylar arasında soru tekrar etmez: her (kategori, seviye)
+  kovası bir kez karıştırılır ve sorular kovadan çekilerek dağıtılır. Bir
+  seviyede soru kalmazsa en yakın seviyeden tamamlanır.
+- Formlar akışlı DOCX motoruyla yazılır (süreç havuzu ile paralel), sorular
+  havuzda aday bağlamıyla kullanıldı olarak işaretlenir ve oturum özeti
+  (manifest.json) form dizinine yazılır.
+
+Örnek:
+    generator = CandidateSheetGenerator(seed=42)
+    result = generator.generate_session("devops_uzmani", 3, candidates=1000)
+"""
+
+import json
+import logging
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config.generation_settings import get_candidate_sheet_config, get_word_export_config
+from config.question_categories import get_active_question_categories
+from config.roles_config import get_role_config
+from config.rubric_system import RUBRIC_LEVELS
+from core.difficulty_manager import DifficultyManager
+from exporters.word_exporter import WordExporter, export_role_document
+from utils.file_helpers import FileHelper
+from utils.question_pool_store import QuestionStore, new_run_id
+from utils.tracing import current_span, traced
+
+logger = logging.getLogger(__name__)
+
+# Seviye sırası (K1 → K5); formda sorular bu sırayla, kolaydan zora dizilir
+RUBRIC_ORDER = list(RUBRIC_LEVELS)
+
+class CandidateSheetGenerator:
+    """Havuzdan aday bazlı, örtüşmesiz soru formları üreten sınıf"""
+
+    def __init__(self, store: Optional[QuestionStore] = None, seed: Optional[int] = None):
+        """
+        Args:
+            store (QuestionStore, optional): Soru havuzu (None ise QUESTION_POOL_PATH)
+            seed (int, optional): Tekrarlanabilir örnekleme için tohum
+        """
+        self.store = store or QuestionStore()
+        self.config = get_candidate_sheet_config()
+        self.random = random.Random(seed)
+
+    def load_pool(
+        self,
+        role_code: str,
+        salary_coefficient: int,
+        unused_for_days: Optional[float] = None
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Rol/katsayı havuzunu kategori → seviye → sorular kovalarına ayır.
+
+        Args:
+            role_code (str): Rol kodu
+            salary_coefficient (int): Maaş katsayısı
+            unused_for_days (float, optional): Yalnızca son N günde kullanılmamış sorular
+
+        Returns:
+            dict: {kategori: {seviye: [soru]}} (kovalar karıştırılmış)
+        """
+        questions = self.store.query(
+            role_code=role_code,
+            salary_coefficient=salary_coefficient,
+            limit=None,
+            unused_for_days=unused_for_days
+        )
+        buckets: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for question in questions:
+            level = question.get("rubric_level")
+            if level not in RUBRIC_LEVELS:
+                level = DifficultyManager.classify_question_level(question["question"])
+            question["rubric_level"] = level
+            buckets.setdefault(question.get("question_type"), {}).setdefault(level, []).append(question)
+
+        for levels in buckets.values():
+            for bucket in levels.values():
+                self.random.shuffle(bucket)
+        return buckets
+
+    @staticmethod
+    def level_quotas(salary_coefficient: int, per_category: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+        """
+        Kategori başına soru sayısını K1-K5 dağılımına göre seviyelere böl.
+
+        Returns:
+            dict: {kategori: {seviye: soru sayısı}}
+        """
+        return {
+            category: DifficultyManager.calculate_question_distribution(count, salary_coefficient)
+            for category, count in per_category.items()
+            if count > 0
+        }
+
+    @traced("sheets.sample")
+    def sample_sheets(
+        self,
+        role_code: str,
+        salary_coefficient: int,
+        candidates: List[str],
+        per_category: Dict[str, int],
+        unused_for_days: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Adaylar için örtüşmesiz soru setleri örnekle.
+
+        Args:
+            role_code (str): Rol kodu
+            salary_coefficient (int): Maaş katsayısı
+            candidates (list): Aday kimlikleri
+            per_category (dict): Kategori → aday başına soru sayısı
+            unused_for_days (float, optional): Yalnızca son N günde kullanılmamış sorular
+
+        Returns:
+            list: Aday başına {"candidate", "questions": {kategori: [soru]}}
+
+        Raises:
+            ValueError: Havuz tüm adaylara örtüşmesiz yetmiyorsa
+        """
+        buckets = self.load_pool(role_code, salary_coefficient, unused_for_days)
+        quotas = self.level_quotas(salary_coefficient, per_category)
+
+        # Kategori bazında yeterlilik kontrolü (seviye eksikleri yakın seviyeden tamamlanır)
+        shortages = []
+        for category, count in per_category.items():
+            available = sum(len(bucket) for bucket in buckets.get(category, {}).values())
+            needed = count * len(candidates)
+            if needed > available:
+                shortages.append(f"{category}: {needed} soru gerekli, havuzda {available}")
+        if shortages:
+            raise ValueError(f"Havuz {len(candidates)} aday için yetersiz ({'; '.join(shortages)})")
+
+        sheets = []
+        for candidate in candidates:
+            questions: Dict[str, List[Dict[str, Any]]] = {}
+            for category, levels in quotas.items():
+                picked = []
+                for level, count in levels.items():
+                    picked.extend(self._take(buckets[category], level, count))
+                picked.sort(key=lambda question: RUBRIC_ORDER.index(question["rubric_level"]))
+                questions[category] = picked
+            sheets.append({"candidate": candidate, "questions": questions})
+
+        current_span().set(candidates=len(candidates), questions=sum(per_category.values()) * len(candidates))
+        return sheets
+
+    @staticmethod
+    def _take(levels: Dict[str, List[Dict[str, Any]]], level: str, count: int) -> List[Dict[str, Any]]:
+        """Seviye kovasından count soru çek; kova biterse en yakın seviyelerden tamamla"""
+        target = RUBRIC_ORDER.index(level)
+        nearest = sorted(RUBRIC_ORDER, key=lambda name: (abs(RUBRIC_ORDER.index(name) - target), RUBRIC_ORDER.index(name)))
+        taken = []
+        for name in nearest:
+            bucket = levels.get(name)
+            while bucket and len(taken) < count:
+                taken.append(bucket.pop())
+            if len(taken) == count:
+                break
+        return taken
+
+    @traced("sheets.render")
+    def render_sheets(
+        self,
+        sheets: List[Dict[str, Any]],
+        role_code: str,
+        salary_coefficient: int,
+        output_dir: str,
+        session_id: str,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Formları akışlı DOCX motoruyla yaz (birden çok CPU varsa süreç havuzunda).
+
+        Returns:
+            dict: export_multiple_roles ile aynı exported_files / failed_exports yapısı
+        """
+        role_name = get_role_config(role_code)["name"]
+        exporter = WordExporter(engine="stream")
+        tasks = []
+        for sheet in sheets:
+            questions = {
+                category: [{**question, "success": True} for question in category_questions]
+                for category, category_questions in sheet["questions"].items()
+            }
+            questions_data = {
+                "role": role_name,
+                "role_code": role_code,
+                "salary_coefficient": salary_coefficient,
+                "candidate": sheet["candidate"],
+                "session_id": session_id,
+                "total_questions": sum(len(items) for items in questions.values()),
+                "questions": questions
+            }
+            safe_candidate = FileHelper.get_safe_filename(str(sheet["candidate"]))
+            output_path = str(Path(output_dir) / f"{FileHelper.get_safe_filename(role_name)}_{salary_coefficient}x_{safe_candidate}.docx")
+            tasks.append((questions_data, "", output_path, exporter.engine))
+
+        workers = min(max_workers or get_word_export_config()["processes"], len(tasks))
+        if workers > 1:
+            chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_export_task, tasks, chunksize=chunksize))
+        else:
+            outcomes = [_export_task(task) for task in tasks]
+
+        results = {"success": True, "exported_files": [], "failed_exports": []}
+        for sheet, outcome in zip(sheets, outcomes):
+            entry = {"candidate": sheet["candidate"], "duration": outcome["duration"]}
+            if outcome["success"]:
+                results["exported_files"].append({**entry, "file_path": outcome["file_path"]})
+            else:
+                results["failed_exports"].append({**entry, "error": outcome["error"]})
+        results["success"] = not results["failed_exports"]
+        results["workers"] = max(1, workers)
+        return results
+
+    def generate_session(
+        self,
+        role_code: str,
+        salary_coefficient: int,
+        candidates: Any,
+        per_category: Optional[Dict[str, int]] = None,
+        session_id: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        unused_for_days: Optional[float] = None,
+        mark_used: bool = True,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Bir mülakat oturumu için tüm aday formlarını üret.
+
+        Args:
+            role_code (str): Rol kodu
+            salary_coefficient (int): Maaş katsayısı
+            candidates (int | list): Aday sayısı veya aday kimlikleri
+            per_category (dict, optional): Kategori → aday başına soru sayısı
+                (None ise rolün kategorilerine SHEET_QUESTIONS_PER_CATEGORY)
+            session_id (str, optional): Oturum kimliği (None ise üretilir)
+            output_dir (str, optional): Ana dizin (None ise CANDIDATE_SHEET_DIR); formlar
+                <output_dir>/<session_id>/ altına yazılır
+            unused_for_days (float, optional): Yalnızca son N günde kullanılmamış sorular
+            mark_used (bool): Formdaki soruları havuzda kullanıldı olarak işaretle
+            max_workers (int, optional): Süreç sayısı (None ise WORD_EXPORT_PROCESSES)
+
+        Returns:
+            dict: success, session_id, output_dir, manifest, exported_files,
+                failed_exports, duration (veya error)
+        """
+        started = time.perf_counter()
+        session_id = session_id or new_run_id()
+        if isinstance(candidates, int):
+            candidates = [f"aday_{index:04d}" for index in range(1, candidates + 1)]
+        candidates = [str(candidate) for candidate in candidates]
+        if not candidates:
+            return {"success": False, "session_id": session_id, "error": "Aday listesi boş"}
+        if len(set(candidates)) != len(candidates):
+            return {"success": False, "session_id": session_id, "error": "Aday kimlikleri benzersiz olmalı"}
+
+        try:
+            role_config = get_role_config(role_code)
+        except KeyError as e:
+            return {"success": False, "session_id": session_id, "error": e.args[0]}
+        if per_category is None:
+            count = self.config["questions_per_category"]
+            per_category = {
+                code: count for code, _, _ in get_active_question_categories()
+                if code in role_config.get("categories", [])
+            }
+
+        try:
+            sheets = self.sample_sheets(role_code, salary_coefficient, candidates, per_category, unused_for_days)
+        except ValueError as e:
+            logger.error(f"Aday formu örnekleme hatası: {e}")
+            return {"success": False, "session_id": session_id, "error": str(e)}
+
+        session_dir = Path(output_dir or self.config["output_dir"]) / FileHelper.get_safe_filename(session_id)
+        results = self.render_sheets(sheets, role_code, salary_coefficient, str(session_dir), session_id, max_workers)
+        exported = {entry["candidate"]: entry["file_path"] for entry in results["exported_files"]}
+
+        # Yalnızca yazılan formların soruları kullanıldı sayılır
+        if mark_used:
+            for sheet in sheets:
+                if sheet["candidate"] in exported:
+                    question_ids = [question["id"] for items in sheet["questions"].values() for question in items]
+                    self.store.mark_used(question_ids, context=f"{session_id}/{sheet['candidate']}")
+
+        manifest_path = session_dir / "manifest.json"
+        manifest = {
+            "session_id": session_id,
+            "role_code": role_code,
+            "salary_coefficient": salary_coefficient,
+            "per_category": per_category,
+            "created_at": time.time(),
+            "candidates": [
+                {
+                    "candidate": sheet["candidate"],
+                    "file_path": exported.get(sheet["candidate"]),
+                    "questions": {
+                        category: [{"id": question["id"], "rubric_level": question["rubric_level"]} for question in items]
+                        for category, items in sheet["questions"].items()
+                    }
+                }
+                for sheet in sheets
+            ]
+        }
+        session_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+        duration = time.perf_counter() - started
+        logger.info(
+            f"📋 Oturum {session_id}: {len(exported)}/{len(candidates)} aday formu yazıldı "
+            f"({results['workers']} süreç, {duration:.2f} sn)"
+        )
+        return {
+            **results,
+            "session_id": session_id,
+            "output_dir": str(session_dir),
+            "manifest": str(manifest_path),
+            "duration": duration
+        }
+
+def _export_task(task: tuple) -> Dict[str, Any]:
+    """Süreç havuzu görevi: (questions_data, job_description, output_path, engine)"""
+    return export_role_document(*task)
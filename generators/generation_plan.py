@@ -0,0 +1,138 @@
+"""
+ÜRETİM PLANI DOSYASI
+====================
+
+Etkileşimsiz (zamanlanmış / container) toplu üretim için plan dosyasını
+okur ve doğrular. JSON veya YAML desteklenir (YAML için PyYAML gerekir).
+
+Örnek (YAML):
+    concurrency: 3          # isteğe bağlı, CLI bayrakları önceliklidir
+    cache: readwrite
+    formats: [json, docx]
+    roles:
+      devops_uzmani:
+        3: 20
+        4: 10
+      kidemli_yazilim_gelistirme_uzmani:
+        3x: 15
+
+"roles" anahtarı olmadan doğrudan {rol_kodu: {katsayı: soru_sayısı}}
+eşlemesi de kabul edilir.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from config.roles_config import ROLES
+
+logger = logging.getLogger(__name__)
+
+# Plan dosyasında rollerle birlikte verilebilen çalışma ayarları
+PLAN_SETTINGS = ("concurrency", "export_workers", "concurrent_categories", "cache", "formats", "structured_output", "batch_api", "trace")
+
+class GenerationPlanError(ValueError):
+    """Plan dosyası okunamadığında veya geçersiz olduğunda"""
+
+def read_plan_file(path: str) -> Dict[str, Any]:
+    """
+    Plan dosyasını (JSON / YAML) ham sözlük olarak oku.
+
+    Args:
+        path (str): .json, .yaml veya .yml dosyası
+
+    Returns:
+        dict: Dosya içeriği
+
+    Raises:
+        GenerationPlanError: Dosya okunamazsa veya kök eşleme değilse
+    """
+    file_path = Path(path)
+    try:
+        text = file_path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise GenerationPlanError(f"Plan dosyası okunamadı: {path} ({e})")
+
+    if file_path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise GenerationPlanError(
+                "YAML plan dosyası için PyYAML gerekli. 'pip install pyyaml' ile yükleyin veya JSON kullanın."
+            )
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise GenerationPlanError(f"YAML plan dosyası çözülemedi: {e}")
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise GenerationPlanError(f"JSON plan dosyası çözülemedi: {e}")
+
+    if not isinstance(data, dict):
+        raise GenerationPlanError("Plan dosyasının kökü bir eşleme (rol → katsayı → sayı) olmalı")
+    return data
+
+def parse_generation_plan(data: Dict[str, Any]) -> Dict[str, Dict[int, int]]:
+    """
+    Ham plan sözlüğünü doğrulayıp {rol_kodu: {katsayı: soru_sayısı}} biçimine çevir.
+
+    Katsayı anahtarları 3, "3" veya "3x" olabilir; 0 soru verilen girdiler atlanır.
+
+    Raises:
+        GenerationPlanError: Bilinmeyen rol, desteklenmeyen katsayı veya geçersiz sayı
+    """
+    roles = data.get("roles", {k: v for k, v in data.items() if k not in PLAN_SETTINGS})
+    if not isinstance(roles, dict):
+        raise GenerationPlanError("'roles' bir eşleme olmalı")
+
+    errors: List[str] = []
+    plan: Dict[str, Dict[int, int]] = {}
+    for role_code, difficulties in roles.items():
+        if role_code not in ROLES:
+            errors.append(f"Bilinmeyen rol: {role_code}")
+            continue
+        if not isinstance(difficulties, dict):
+            errors.append(f"{role_code}: katsayı → soru sayısı eşlemesi bekleniyor")
+            continue
+
+        allowed = ROLES[role_code]["salary_multipliers"]
+        for raw_multiplier, raw_count in difficulties.items():
+            try:
+                multiplier = int(str(raw_multiplier).strip().rstrip("xX"))
+                count = int(raw_count)
+            except (TypeError, ValueError):
+                errors.append(f"{role_code}: geçersiz girdi {raw_multiplier!r}: {raw_count!r}")
+                continue
+            if multiplier not in allowed:
+                errors.append(f"{role_code}: {multiplier}x desteklenmiyor (geçerli: {allowed})")
+            elif count < 0:
+                errors.append(f"{role_code} {multiplier}x: negatif soru sayısı")
+            elif count > 0:
+                plan.setdefault(role_code, {})[multiplier] = count
+
+    if errors:
+        raise GenerationPlanError("Plan dosyası geçersiz:\n  - " + "\n  - ".join(errors))
+    return plan
+
+def load_generation_plan(path: str) -> Dict[str, Any]:
+    """
+    Plan dosyasını oku ve doğrula.
+
+    Args:
+        path (str): Plan dosyası yolu
+
+    Returns:
+        dict: "plan" ({rol_kodu: {katsayı: soru_sayısı}}) ve dosyada verilen
+            çalışma ayarları (concurrency, export_workers, concurrent_categories,
+            cache, formats, structured_output, batch_api, trace)
+    """
+    data = read_plan_file(path)
+    result = {"plan": parse_generation_plan(data)}
+    for key in PLAN_SETTINGS:
+        if data.get(key) is not None:
+            result[key] = data[key]
+    logger.info(f"Plan dosyası yüklendi: {path} ({len(result['plan'])} rol)")
+    return result
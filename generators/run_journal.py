@@ -0,0 +1,211 @@
+"""
+ÇALIŞTIRMA GÜNLÜĞÜ (CHECKPOINT JOURNAL)
+=======================================
+
+Toplu üretimin ilerlemesini satır satır JSONL dosyasına yazan ileri-yazım
+(write-ahead) günlüğü. Her tamamlanan kategori batch'i (soruları ile
+birlikte), her export ve her biten rol/katsayı birimi ayrı bir olay olarak
+diske yazılır (flush + fsync). Çalıştırma yarıda kalırsa (timeout, Ctrl-C,
+OOM) `--resume <run-id>` ile biten birimler atlanır, yalnızca eksik
+kategoriler yeniden istenir.
+
+Olaylar:
+    run_started        plan ve çıktı biçimleri
+    category_completed birim, kategori ve üretilen sorular
+    export_completed   birim, biçim (json/docx/jsonl/csv/md/html) ve dosya yolu
+    batch_submitted    Batch API batch kimliği ve istek eşlemesi
+    unit_completed     display_results ile uyumlu birim özeti
+    run_completed      tüm birimler bitti
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.generation_settings import get_run_journal_config
+from utils.question_pool_store import new_run_id
+
+logger = logging.getLogger(__name__)
+
+class RunJournalError(ValueError):
+    """Günlük bulunamadığında veya okunamadığında"""
+
+class RunJournal:
+    """Toplu üretim ilerlemesini kaydeden ve devam ettirmeyi sağlayan günlük"""
+
+    def __init__(self, path: str, run_id: str):
+        """
+        Args:
+            path (str): JSONL günlük dosyası
+            run_id (str): Çalıştırma kimliği
+        """
+        self.path = path
+        self.run_id = run_id
+        self.plan: Dict[str, Dict[int, int]] = {}
+        self.output_formats: Optional[List[str]] = None
+        self.completed = False
+        self.batch: Optional[Dict[str, Any]] = None
+        self._categories: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._exports: Dict[str, Dict[str, str]] = {}
+        self._units: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def journal_path(run_id: str, directory: Optional[str] = None) -> str:
+        """Çalıştırma kimliğinin günlük dosyası yolu"""
+        return str(Path(directory or get_run_journal_config()["directory"]) / f"{run_id}.jsonl")
+
+    @classmethod
+    def create(
+        cls,
+        generation_plan: Dict[str, Dict[int, int]],
+        output_formats: Optional[Iterable[str]] = None,
+        run_id: Optional[str] = None,
+        directory: Optional[str] = None
+    ) -> "RunJournal":
+        """
+        Yeni çalıştırma için günlük oluştur ve planı yaz.
+
+        Args:
+            generation_plan (dict): {rol_kodu: {katsayı: soru_sayısı}}
+            output_formats (iterable, optional): Çıktı biçimleri (None ise DEFAULT_OUTPUT_FORMATS)
+            run_id (str, optional): Çalıştırma kimliği (None ise yeni üretilir)
+            directory (str, optional): Günlük dizini (None ise RUN_JOURNAL_DIR)
+        """
+        run_id = run_id or new_run_id()
+        journal = cls(cls.journal_path(run_id, directory), run_id)
+        Path(journal.path).parent.mkdir(parents=True, exist_ok=True)
+        journal._write({
+            "event": "run_started",
+            "plan": {
+                role_code: {str(difficulty): count for difficulty, count in difficulties.items()}
+                for role_code, difficulties in generation_plan.items()
+            },
+            "output_formats": list(output_formats) if output_formats is not None else None
+        })
+        logger.info(f"Çalıştırma günlüğü oluşturuldu: {journal.path}")
+        return journal
+
+    @classmethod
+    def open(cls, run_id: str, directory: Optional[str] = None) -> "RunJournal":
+        """
+        Yarıda kalmış bir çalıştırmanın günlüğünü oku.
+
+        Raises:
+            RunJournalError: Günlük yoksa veya run_started olayı okunamazsa
+        """
+        journal = cls(cls.journal_path(run_id, directory), run_id)
+        if not os.path.exists(journal.path):
+            raise RunJournalError(f"Çalıştırma günlüğü bulunamadı: {journal.path}")
+
+        journal._truncate_torn_tail()
+        with open(journal.path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+        started = False
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Günlük satırı okunamadı, atlanıyor: {journal.path}:{line_number}")
+                continue
+            started = started or event.get("event") == "run_started"
+            journal._apply(event)
+
+        if not started:
+            raise RunJournalError(f"Günlükte run_started olayı yok: {journal.path}")
+
+        logger.info(
+            f"Günlük yüklendi ({run_id}): {len(journal._units)} birim tamamlanmış, "
+            f"{sum(len(c) for c in journal._categories.values())} kategori kayıtlı"
+        )
+        return journal
+
+    def _truncate_torn_tail(self):
+        """Çökme anında yarım yazılmış son satırı kes (yeni olaylar ona eklenmesin)"""
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if not data or data.endswith(b"\n"):
+                return
+            keep = data.rfind(b"\n") + 1
+            logger.warning(f"Günlüğün yarım kalmış son satırı atılıyor: {self.path} ({len(data) - keep} bayt)")
+            f.truncate(keep)
+
+    def _apply(self, event: Dict[str, Any]):
+        """Olayı bellekteki duruma uygula (yazarken ve yeniden oynatırken ortak)"""
+        kind = event.get("event")
+        unit_id = event.get("unit")
+        if kind == "run_started":
+            self.plan = {
+                role_code: {int(difficulty): count for difficulty, count in difficulties.items()}
+                for role_code, difficulties in event["plan"].items()
+            }
+            self.output_formats = event.get("output_formats")
+        elif kind == "category_completed":
+            self._categories.setdefault(unit_id, {})[event["category"]] = event["questions"]
+        elif kind == "export_completed":
+            self._exports.setdefault(unit_id, {})[event["format"]] = event["file"]
+        elif kind == "batch_submitted":
+            self.batch = {"batch_id": event["batch_id"], "requests": event["requests"]}
+        elif kind == "unit_completed":
+            self._units[unit_id] = event["summary"]
+        elif kind == "run_completed":
+            self.completed = True
+
+    def _write(self, event: Dict[str, Any]):
+        """Olayı diske yaz (fsync) ve duruma uygula"""
+        event = {"ts": time.time(), **event}
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(event)
+
+    def record_category(self, unit_id: str, category_code: str, questions: List[Dict[str, Any]]):
+        """Bir kategori batch'inin sorularını kaydet"""
+        self._write({
+            "event": "category_completed",
+            "unit": unit_id,
+            "category": category_code,
+            "questions": questions
+        })
+
+    def record_export(self, unit_id: str, output_format: str, file_path: str):
+        """Bir export dosyasını kaydet"""
+        self._write({"event": "export_completed", "unit": unit_id, "format": output_format, "file": file_path})
+
+    def record_batch(self, batch_id: str, requests: Dict[str, Dict[str, Any]]):
+        """Gönderilen Batch API batch'ini kaydet (devamda yeniden gönderilmez, yoklanır)"""
+        self._write({"event": "batch_submitted", "batch_id": batch_id, "requests": requests})
+
+    def record_unit(self, unit_id: str, summary: Dict[str, Any]):
+        """Bitmiş birimin özetini kaydet"""
+        self._write({"event": "unit_completed", "unit": unit_id, "summary": summary})
+
+    def record_run_completed(self, unit_count: int):
+        """Tüm birimlerin bittiğini kaydet"""
+        self._write({"event": "run_completed", "units": unit_count})
+
+    def completed_categories(self, unit_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Birimin tamamlanmış kategorileri {kategori_kodu: sorular}"""
+        with self._lock:
+            return dict(self._categories.get(unit_id, {}))
+
+    def completed_export(self, unit_id: str, output_format: str) -> Optional[str]:
+        """Birimin bu biçimde hâlâ diskte duran export dosyası (yoksa None)"""
+        with self._lock:
+            file_path = self._exports.get(unit_id, {}).get(output_format)
+        return file_path if file_path and os.path.exists(file_path) else None
+
+    def completed_unit(self, unit_id: str) -> Optional[Dict[str, Any]]:
+        """Bitmiş birimin özeti (bitmemişse None)"""
+        with self._lock:
+            return self._units.get(unit_id)
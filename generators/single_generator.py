@@ -6,32 +6,61 @@ Tek bir rol ve zorluk seviyesi için özelleştirilmiş soru üretim sistemi.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 
 from core.question_generator import QuestionGenerator
 from core.difficulty_manager import DifficultyManager
 from config.roles_config import get_role_config
 from config.question_categories import get_active_question_categories, get_category_config
+from config.generation_settings import get_pool_config
 from utils.file_helpers import FileHelper
+from utils.question_pool_store import QuestionStore, new_run_id
+from utils.tracing import current_span, traced
 
 logger = logging.getLogger(__name__)
 
 class SingleGenerator:
     """Tekil soru üretim sınıfı"""
     
-    def __init__(self):
-        """Single generator başlatıcı"""
-        self.question_generator = QuestionGenerator()
+    def __init__(
+        self,
+        concurrent_categories: Optional[bool] = None,
+        question_store: Optional[QuestionStore] = None,
+        run_id: Optional[str] = None,
+        structured_output: Optional[bool] = None
+    ):
+        """
+        Single generator başlatıcı
+        
+        Args:
+            concurrent_categories (bool, optional): Kategori isteklerini eşzamanlı gönder
+            question_store (QuestionStore, optional): Kalıcı soru havuzu
+                (None ise QUESTION_POOL_ENABLED açıksa varsayılan havuz)
+            run_id (str, optional): Havuza yazılan soruların çalıştırma kimliği
+            structured_output (bool, optional): JSON şemalı yanıt modu
+                (None ise GENERATION_STRUCTURED_OUTPUT)
+        """
+        self.question_generator = QuestionGenerator(
+            concurrent_categories=concurrent_categories,
+            structured_output=structured_output
+        )
         self.difficulty_manager = DifficultyManager()
         self.file_helper = FileHelper()
+        if question_store is None and get_pool_config()["enabled"]:
+            question_store = QuestionStore()
+        self.question_store = question_store
+        self.run_id = run_id or new_run_id()
     
+    @traced("single.generate_questions")
     def generate_questions(
         self,
         role_code: str,
         salary_coefficient: int,
         question_counts: Dict[str, int],
         job_description: Optional[str] = None,
-        save_json: bool = True
+        save_json: bool = True,
+        completed_questions: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        on_category_completed: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
     ) -> Dict[str, Any]:
         """
         Belirtilen rol ve zorluk seviyesi için sorular üret.
@@ -42,10 +71,15 @@ class SingleGenerator:
             question_counts (dict): Her kategori için soru sayıları
             job_description (str, optional): İlan metni (None ise dosyadan yükle)
             save_json (bool): JSON olarak kaydet
+            completed_questions (dict, optional): Devam edilen çalıştırmada
+                tamamlanmış kategoriler {kategori_kodu: sorular} (yeniden istenmez)
+            on_category_completed (callable, optional): Her kategori batch'i
+                tamamlandığında (kategori_kodu, sorular) ile çağrılır
             
         Returns:
             dict: Üretim sonuçları
         """
+        current_span().set(role=role_code, difficulty=salary_coefficient, question_count=sum(question_counts.values()))
         try:
             # Rol konfigürasyonunu doğrula
             validation_result = self.difficulty_manager.validate_difficulty_requirements(
@@ -66,22 +100,22 @@ class SingleGenerator:
             
             # İlan metnini yükle
             if job_description is None:
-                job_file = f"data/job_descriptions/{role_config['job_description_file']}"
-                try:
-                    job_description = self.file_helper.load_job_description(job_file)
-                except FileNotFoundError:
-                    logger.warning(f"İlan dosyası bulunamadı: {job_file}. Varsayılan metin kullanılıyor.")
-                    job_description = f"{role_name} pozisyonu için mülakat soruları"
+                job_description = self.load_job_description(role_code)
             
             logger.info(f"{role_name} ({salary_coefficient}x) için soru üretimi başlatılıyor")
             
+            # Rolün havuzdaki geçmişini yakın-tekrar indeksine yükle
+            self._preload_near_duplicates(role_code, role_name)
+            
             # Soruları üret
             result = self.question_generator.generate_questions_for_role(
                 role_name=role_name,
                 job_context=job_description,
                 description=description,
                 salary_coefficient=salary_coefficient,
-                question_counts=question_counts
+                question_counts=question_counts,
+                completed_questions=completed_questions,
+                on_category_completed=on_category_completed
             )
             
             # Ek bilgileri ekle
@@ -94,6 +128,9 @@ class SingleGenerator:
                     "job_description_length": len(job_description) if job_description else 0
                 }
                 
+                # Kalıcı havuza ekle (JSON çıktısından bağımsız)
+                self._append_to_pool(result)
+                
                 # JSON olarak kaydet
                 if save_json:
                     json_filename = f"data/generated_questions/{FileHelper.get_safe_filename(role_name)}_{salary_coefficient}x_questions.json"
@@ -115,6 +152,40 @@ class SingleGenerator:
                 "error": str(e)
             }
     
+    def load_job_description(self, role_code: str) -> str:
+        """Rolün ilan metnini dosyadan yükle (dosya yoksa varsayılan metin)"""
+        role_config = get_role_config(role_code)
+        job_file = f"data/job_descriptions/{role_config['job_description_file']}"
+        try:
+            return self.file_helper.load_job_description(job_file)
+        except FileNotFoundError:
+            logger.warning(f"İlan dosyası bulunamadı: {job_file}. Varsayılan metin kullanılıyor.")
+            return f"{role_config['name']} pozisyonu için mülakat soruları"
+    
+    def _preload_near_duplicates(self, role_code: str, role_name: str):
+        """Rolün havuzdaki sorularını yakın-tekrar indeksine yükle (rol başına bir kez)"""
+        detector = self.question_generator.near_duplicates
+        if detector is None or self.question_store is None or detector.is_loaded(role_name):
+            return
+        try:
+            detector.preload(role_name, self.question_store.near_duplicate_rows(role_code))
+        except Exception as e:
+            logger.error(f"Yakın-tekrar indeksi havuzdan yüklenemedi: {e}")
+    
+    def _append_to_pool(self, result: Dict[str, Any]):
+        """Üretilen soruları kalıcı havuza ekle; havuz hatası üretimi bozmaz"""
+        if self.question_store is None:
+            return
+        try:
+            pool_stats = self.question_store.add_generation_result(result, run_id=self.run_id)
+            result["pool"] = pool_stats
+            logger.info(
+                f"Soru havuzu: {pool_stats['inserted']} yeni soru eklendi, "
+                f"{pool_stats['duplicates']} tekrar atlandı"
+            )
+        except Exception as e:
+            logger.error(f"Soru havuzuna yazma hatası: {e}")
+    
     def generate_by_category(
         self,
         role_code: str,
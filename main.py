@@ -1,31 +1,227 @@
+"""
+MÜLAKAT SORU HAVUZU CLI
+=======================
+
+Etkileşimsiz üretim komutları (zamanlanmış çalıştırma, CI ve Docker için).
+
+Örnekler:
+    python main.py generate --role devops_uzmani --difficulty 3 --count 20
+    python main.py batch-generate --config-file plan.yaml --concurrency 3 --cache readwrite
+    python main.py batch-generate --config-file plan.json --format json --dry-run
+    python main.py batch-generate --resume 20250101-120000-a1b2c3
+    python main.py batch-generate --config-file plan.yaml --batch-api
+    python main.py candidate-sheets --role devops_uzmani --difficulty 3 --candidates 40 --per-category 4
+"""
+
 import os
 import sys
+from typing import Any, Dict, Optional
+
 import click
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_generate import (
+    display_cache_stats, display_cost_summary, display_parse_stats, display_plan, display_results,
+    display_task_timings, display_trace_summary, display_usage_stats, generate_questions, merge_plan_settings
+)
+from config.openai_settings import validate_api_key
+from config.roles_config import ROLES
+from core.response_cache import CACHE_MODES, configure_shared_response_cache
+from generators.batch_scheduler import OUTPUT_FORMATS
+from generators.candidate_sheets import CandidateSheetGenerator
+from generators.generation_plan import GenerationPlanError, load_generation_plan, parse_generation_plan
+from generators.run_journal import RunJournal, RunJournalError
+from utils.file_helpers import FileHelper
+
+def run_options(command):
+    """generate ve batch-generate için ortak çalışma bayrakları"""
+    options = [
+        click.option('--concurrency', type=click.IntRange(min=1), default=None,
+                     help='Aynı anda çalışacak rol/katsayı üretim görevi sayısı'),
+        click.option('--export-workers', type=click.IntRange(min=1), default=None,
+                     help='Export worker sayısı (JSON, Word ve diğer biçimler)'),
+        click.option('--concurrent-categories/--sequential-categories', default=None,
+                     help='Bir rolün kategorilerini eşzamanlı üret'),
+        click.option('--cache', type=click.Choice(CACHE_MODES), default=None,
+                     help='LLM yanıt önbelleği modu'),
+        click.option('--format', 'formats', type=click.Choice(OUTPUT_FORMATS), multiple=True,
+                     help='Çıktı biçimi (birden çok verilebilir; varsayılan: json, docx)'),
+        click.option('--structured-output/--no-structured-output', default=None,
+                     help='Soru dizisi isteklerinde JSON şeması (response_format) gönder'),
+        click.option('--batch-api/--no-batch-api', default=None,
+                     help='Kategori isteklerini OpenAI Batch API ile toplu gönder (yarı fiyat, yanıt ≤24 saat)'),
+        click.option('--trace/--no-trace', default=None,
+                     help='Aşama sürelerini izle, JSONL ve Chrome trace olarak yaz (TRACE_DIR)'),
+        click.option('--dry-run', is_flag=True, help='Planı göster, üretim yapma'),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+def run_plan(
+    generation_plan: Dict[str, Dict[int, int]],
+    settings: Dict[str, Any],
+    job_descriptions: Optional[Dict[str, str]] = None,
+    journal: Optional[RunJournal] = None
+) -> int:
+    """
+    Planı BatchScheduler ile çalıştır.
+
+    Args:
+        generation_plan: {rol_kodu: {katsayı: soru_sayısı}}
+        settings: concurrency, export_workers, concurrent_categories, cache, formats,
+            structured_output, batch_api, trace, dry_run
+        job_descriptions: {rol_kodu: ilan metni} (None ise ilan dosyaları)
+        journal: Devam edilecek çalıştırmanın günlüğü
+
+    Returns:
+        int: Çıkış kodu (başarısız birim varsa 1)
+    """
+    configure_shared_response_cache(mode=settings.get("cache"))
+
+    if not display_plan(
+        generation_plan,
+        concurrency=settings.get("concurrency"),
+        batch_api=bool(settings.get("batch_api"))
+    ):
+        return 1
+    if settings.get("dry_run"):
+        click.echo("🧪 Dry run: üretim yapılmadı.")
+        return 0
+
+    if not validate_api_key():
+        click.echo("❌ OPENAI_API_KEY environment variable tanımlı değil!", err=True)
+        return 1
+
+    results, timings, failures = generate_questions(
+        generation_plan,
+        concurrency=settings.get("concurrency"),
+        export_workers=settings.get("export_workers"),
+        concurrent_categories=settings.get("concurrent_categories"),
+        output_formats=settings.get("formats"),
+        job_descriptions=job_descriptions,
+        journal=journal,
+        batch_api=bool(settings.get("batch_api")),
+        structured_output=settings.get("structured_output"),
+        trace=settings.get("trace")
+    )
+
+    display_results(results)
+    display_task_timings(timings)
+    display_cache_stats()
+    display_parse_stats()
+    display_usage_stats()
+    display_cost_summary()
+    display_trace_summary()
+
+    if failures:
+        click.echo(f"\n❌ {len(failures)} birim başarısız: " + ", ".join(f["unit"] for f in failures), err=True)
+        return 1
+    return 0
+
+def merge_settings(file_settings: Dict[str, Any], **cli_settings: Any) -> Dict[str, Any]:
+    """Plan dosyası ayarlarını CLI bayraklarıyla birleştir (CLI önceliklidir)"""
+    try:
+        return merge_plan_settings(file_settings, **cli_settings)
+    except GenerationPlanError as e:
+        raise click.ClickException(str(e))
+
 @click.group()
 def cli():
     """Mülakat Soru Havuzu CLI"""
     pass
 
 @cli.command()
-@click.option('--role', required=False, help='Rol kodu')
-@click.option('--difficulty', required=False, type=int, help='Zorluk katsayısı (2,3,4)')
-@click.option('--count', required=False, type=int, default=10, help='Üretilecek soru sayısı')
-@click.option('--job-file', required=False, type=click.Path(exists=True), help='İlan metni dosyası')
-def generate(role, difficulty, count, job_file):
-    """Soru üret (PLACEHOLDER)."""
-    click.echo("CLI iskeleti hazır. Üretim mantığı eklenecek.")
-    if job_file:
-        click.echo(f"İlan dosyası: {job_file}")
-    click.echo(f"role={role} difficulty={difficulty} count={count}")
+@click.option('--role', required=True, help='Rol kodu')
+@click.option('--difficulty', required=True, type=int, help='Zorluk (maaş) katsayısı')
+@click.option('--count', type=click.IntRange(min=1), default=10, show_default=True,
+              help='Üretilecek soru sayısı (kategorilere 1:2:2 dağıtılır)')
+@click.option('--job-file', type=click.Path(exists=True, dir_okay=False), help='İlan metni dosyası')
+@run_options
+def generate(role, difficulty, count, job_file, **options):
+    """Tek bir rol/katsayı için soru üret."""
+    try:
+        generation_plan = parse_generation_plan({role: {difficulty: count}})
+    except GenerationPlanError as e:
+        raise click.BadParameter(str(e))
+
+    job_descriptions = {role: FileHelper.load_job_description(job_file)} if job_file else None
+    sys.exit(run_plan(generation_plan, merge_settings({}, **options), job_descriptions))
 
 @cli.command('batch-generate')
-@click.option('--config-file', required=False, type=click.Path(exists=True))
-def batch_generate(config_file):
-    """Toplu soru üret (PLACEHOLDER)."""
-    click.echo("Batch üretim CLI iskeleti hazır. Mantık eklenecek.")
-    if config_file:
-        click.echo(f"Config: {config_file}")
+@click.option('--config-file', type=click.Path(exists=True, dir_okay=False),
+              help='Plan dosyası (JSON/YAML): rol → katsayı → soru sayısı')
+@click.option('--resume', 'resume_run_id', metavar='RUN_ID',
+              help='Yarıda kalan çalıştırmaya günlüğünden devam et')
+@run_options
+def batch_generate(config_file, resume_run_id, **options):
+    """Plan dosyasındaki tüm rol/katsayılar için soru üret."""
+    if bool(config_file) == bool(resume_run_id):
+        raise click.UsageError("--config-file veya --resume seçeneklerinden biri verilmeli")
+
+    if resume_run_id:
+        try:
+            journal = RunJournal.open(resume_run_id)
+        except RunJournalError as e:
+            raise click.ClickException(str(e))
+        file_settings = {"formats": journal.output_formats} if journal.output_formats else {}
+        sys.exit(run_plan(journal.plan, merge_settings(file_settings, **options), journal=journal))
+
+    try:
+        loaded = load_generation_plan(config_file)
+    except GenerationPlanError as e:
+        raise click.ClickException(str(e))
+
+    generation_plan = loaded.pop("plan")
+    sys.exit(run_plan(generation_plan, merge_settings(loaded, **options)))
+
+@cli.command('candidate-sheets')
+@click.option('--role', required=True, help='Rol kodu')
+@click.option('--difficulty', required=True, type=int, help='Zorluk (maaş) katsayısı')
+@click.option('--candidates', type=click.IntRange(min=1), help='Aday sayısı (aday_0001 ...)')
+@click.option('--candidate-file', type=click.Path(exists=True, dir_okay=False),
+              help='Satır başına bir aday kimliği içeren dosya')
+@click.option('--per-category', type=click.IntRange(min=1), default=None,
+              help='Kategori başına soru sayısı (varsayılan: SHEET_QUESTIONS_PER_CATEGORY)')
+@click.option('--session', 'session_id', help='Oturum kimliği (varsayılan: zaman damgası)')
+@click.option('--output-dir', type=click.Path(file_okay=False), help='Ana çıktı dizini (varsayılan: CANDIDATE_SHEET_DIR)')
+@click.option('--unused-for-days', type=float, default=None, help='Yalnızca son N günde kullanılmamış sorular')
+@click.option('--seed', type=int, default=None, help='Tekrarlanabilir örnekleme tohumu')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='Form yazım süreç sayısı (varsayılan: WORD_EXPORT_PROCESSES)')
+@click.option('--mark-used/--no-mark-used', default=True, show_default=True,
+              help='Formdaki soruları havuzda kullanıldı olarak işaretle')
+def candidate_sheets(role, difficulty, candidates, candidate_file, per_category, session_id, output_dir,
+                     unused_for_days, seed, workers, mark_used):
+    """Soru havuzundan aday başına örtüşmesiz mülakat formları üret (LLM çağrısı yok)."""
+    if bool(candidates) == bool(candidate_file):
+        raise click.UsageError("--candidates veya --candidate-file seçeneklerinden biri verilmeli")
+    if candidate_file:
+        with open(candidate_file, encoding='utf-8') as handle:
+            candidates = [line.strip() for line in handle if line.strip()]
+
+    generator = CandidateSheetGenerator(seed=seed)
+    categories = None
+    if per_category is not None:
+        categories = {code: per_category for code in ROLES.get(role, {}).get("categories", [])}
+    result = generator.generate_session(
+        role, difficulty, candidates,
+        per_category=categories,
+        session_id=session_id,
+        output_dir=output_dir,
+        unused_for_days=unused_for_days,
+        mark_used=mark_used,
+        max_workers=workers
+    )
+    if "error" in result:
+        raise click.ClickException(result["error"])
+
+    click.echo(f"📋 Oturum: {result['session_id']}")
+    click.echo(f"   ✅ {len(result['exported_files'])} aday formu: {result['output_dir']}")
+    for failed in result["failed_exports"]:
+        click.echo(f"   ❌ {failed['candidate']}: {failed['error']}")
+    click.echo(f"   🗂️ Özet: {result['manifest']} ({result['duration']:.2f} sn, {result['workers']} süreç)")
+    sys.exit(0 if result["success"] else 1)
 
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,30 @@
+"""
+TEST ORTAMI
+===========
+
+Testler sahte LLM backend'iyle çalışır; paylaşılan önbellek, havuz, defter
+ve günlük dosyaları depodaki data/ yerine geçici bir dizine yazılır.
+Değişkenler test modülleri içe aktarılmadan (paylaşılan nesneler
+oluşturulmadan) önce ayarlanır.
+"""
+
+import os
+import tempfile
+
+_DATA_DIR = tempfile.mkdtemp(prefix="soru-uretici-test-")
+
+for _name, _value in {
+    "LLM_BACKEND": "fake",
+    "LLM_CACHE_MODE": "off",
+    "OPENAI_RATE_LIMIT_ENABLED": "false",
+    "LLM_CACHE_PATH": os.path.join(_DATA_DIR, "llm_responses.sqlite3"),
+    "QUESTION_POOL_PATH": os.path.join(_DATA_DIR, "question_pool.sqlite3"),
+    "OVERGENERATION_STATS_PATH": os.path.join(_DATA_DIR, "acceptance_stats.sqlite3"),
+    "COST_LEDGER_PATH": os.path.join(_DATA_DIR, "cost_ledger.sqlite3"),
+    "RUN_JOURNAL_DIR": os.path.join(_DATA_DIR, "runs"),
+    "TRACE_DIR": os.path.join(_DATA_DIR, "traces"),
+    "BATCH_API_DIR": os.path.join(_DATA_DIR, "batch_api"),
+    "EXPORT_OUTPUT_DIR": os.path.join(_DATA_DIR, "exports"),
+    "CANDIDATE_SHEET_DIR": os.path.join(_DATA_DIR, "candidate_sheets"),
+}.items():
+    os.environ.setdefault(_name, _value)
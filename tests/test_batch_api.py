@@ -0,0 +1,126 @@
+"""
+BATCH API YOKLAMA TESTLERİ
+==========================
+
+Yoklamadaki geçici hataların tekrar denendiğini ve gönderilmiş bir batch'in
+sonucu alınamadığında isteklerin canlı üretime düşürülmediğini (çift ücret
+ödenmediğini) doğrular.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from core.batch_api import BatchAPIClient, BatchAPIError
+from generators.batch_api_runner import BatchAPIRunner
+
+class FakeResponse:
+    """requests.Response yerine geçen en küçük yanıt"""
+
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text if payload is None else json.dumps(payload)
+
+    def json(self):
+        return self._payload
+
+class FakeSession:
+    """Sıradaki yanıtı (veya istisnayı) döndüren oturum"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.headers = {}
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+def make_client(outcomes, max_retries=3):
+    client = BatchAPIClient(
+        api_key="test", base_url="http://batch.test", session=FakeSession(outcomes), max_retries=max_retries
+    )
+    client.max_backoff = 0.01
+    return client
+
+def test_wait_for_batch_retries_transient_errors():
+    client = make_client([
+        requests.ConnectionError("bağlantı koptu"),
+        FakeResponse(503, text="Service Unavailable"),
+        FakeResponse(200, {"id": "b1", "status": "in_progress"}),
+        FakeResponse(429, text="Too Many Requests"),
+        FakeResponse(200, {"id": "b1", "status": "completed", "output_file_id": "f1"}),
+    ])
+
+    batch = client.wait_for_batch("b1", poll_interval=0.001, max_wait=10)
+
+    assert batch["status"] == "completed"
+    assert len(client.session.calls) == 5
+
+def test_permanent_error_is_not_retried():
+    client = make_client([FakeResponse(404, text="Not Found")])
+
+    with pytest.raises(BatchAPIError) as error:
+        client.get_batch("b1", retry_delay=0.001)
+
+    assert not error.value.transient
+    assert len(client.session.calls) == 1
+
+def test_retries_are_bounded():
+    client = make_client([FakeResponse(502, text="Bad Gateway")] * 3, max_retries=2)
+
+    with pytest.raises(BatchAPIError) as error:
+        client.get_batch("b1", retry_delay=0.001)
+
+    assert error.value.transient
+    assert len(client.session.calls) == 3
+
+def make_runner(client, tmp_path, loaded):
+    requests_ = {
+        "r1": {"role_name": "Rol", "difficulty": 1, "category": "teorik", "question_count": 2, "request_count": 2},
+        "r2": {"role_name": "Rol", "difficulty": 1, "category": "pratik", "question_count": 2, "request_count": 2},
+    }
+    question_generator = SimpleNamespace(
+        load_prefetched_responses=loaded.update,
+        usage_tracker=SimpleNamespace(record=lambda *args, **kwargs: None)
+    )
+    generator = SimpleNamespace(run_id="test-run", question_generator=question_generator)
+    journal = SimpleNamespace(batch={"batch_id": "b1", "requests": requests_}, run_id="test-run")
+    return BatchAPIRunner(generator, client=client, journal=journal, directory=str(tmp_path))
+
+def test_runner_keeps_submitted_batch_pending_when_polling_fails(tmp_path):
+    client = make_client([requests.ConnectionError("bağlantı koptu")] * 2, max_retries=1)
+    loaded = {}
+    runner = make_runner(client, tmp_path, loaded)
+    client.wait_for_batch = lambda batch_id, on_status=None: BatchAPIClient.wait_for_batch(
+        client, batch_id, poll_interval=0.001, max_wait=10, on_status=on_status
+    )
+
+    report = runner.run([])
+
+    assert report["pending"] is True
+    assert report["batch_id"] == "b1"
+    assert report["failed"] == 0
+    assert loaded == {}
+
+def test_runner_sends_only_failed_rows_live(tmp_path):
+    body = {"choices": [{"message": {"content": "[]"}}], "usage": None, "model": "m"}
+    output = json.dumps({"custom_id": "r1", "response": {"status_code": 200, "body": body}, "error": None})
+    client = make_client([
+        FakeResponse(200, {"id": "b1", "status": "expired", "output_file_id": "f1"}),
+        FakeResponse(200, text=output + "\n"),
+    ])
+    loaded = {}
+    runner = make_runner(client, tmp_path, loaded)
+
+    report = runner.run([])
+
+    assert report["pending"] is False
+    assert (report["loaded"], report["failed"]) == (1, 1)
+    assert list(loaded) == [("Rol", 1, "teorik")]
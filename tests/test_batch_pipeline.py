@@ -0,0 +1,147 @@
+"""
+BATCH FİLTRE / DOLDURMA AKIŞI TESTLERİ
+======================================
+
+Senkron ve async üreticinin generate_questions_batch'i aynı _batch_pipeline
+akışını kullanır; Batch API ön yanıtları iki yolda da tüketilir.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from core.async_question_generator import AsyncQuestionGenerator
+from core.llm_backends import FakeBackend
+from core.overgeneration_planner import STRICT_SUFFIX
+from core.question_generator import QuestionGenerator
+from utils.near_duplicate import NearDuplicateDetector
+
+ROLE = "DevOps Uzmanı"
+
+class RecordingPlanner:
+    """Sabit plan döndüren, kabul kayıtlarını biriktiren planlayıcı"""
+
+    def __init__(self, speculative: bool = False):
+        self.speculative = speculative
+        self.records = []
+
+    def plan(self, role_name, question_type, question_count):
+        return {
+            "request_count": question_count + 2, "acceptance_rate": 0.3, "samples": 5,
+            "speculative": self.speculative and question_type == "practical_application",
+            "fallback_count": question_count
+        }
+
+    def record(self, role_name, question_type, requested, accepted):
+        self.records.append((question_type, requested, accepted))
+
+class RecordingBackend(FakeBackend):
+    """İstek prompt'larını ve gönderildikleri thread'i kaydeden sahte backend"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def complete(self, messages, params):
+        self.requests.append((threading.current_thread().name, messages[-1]["content"]))
+        return super().complete(messages, params)
+
+def generate(generator_class, question_type, planner, prefetched=None, backend=None, near_duplicates=None):
+    generator = generator_class(
+        backend=backend or FakeBackend(), overgeneration_planner=planner, stream=False,
+        near_duplicates=near_duplicates
+    )
+    if prefetched:
+        generator.load_prefetched_responses(prefetched)
+    result = generator.generate_questions_batch(
+        ROLE, "ilan", "tanım", 3, question_type, "Kategori", "açıklama", 4
+    )
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return generator, result
+
+@pytest.mark.parametrize("speculative", [False, True])
+@pytest.mark.parametrize("question_type", ["practical_application", "theoretical_knowledge"])
+def test_sync_and_async_pipelines_match(question_type, speculative):
+    outcomes = []
+    for generator_class in (QuestionGenerator, AsyncQuestionGenerator):
+        planner = RecordingPlanner(speculative)
+        _, result = generate(generator_class, question_type, planner)
+        assert result["success"]
+        outcomes.append((len(result["questions"]), planner.records))
+    assert outcomes[0] == outcomes[1]
+
+def test_practical_deficit_uses_strict_refill():
+    planner = RecordingPlanner()
+    _, result = generate(QuestionGenerator, "practical_application", planner)
+    assert len(result["questions"]) == 4
+    assert [record[0] for record in planner.records] == ["practical_application", "practical_application" + STRICT_SUFFIX]
+
+@pytest.mark.parametrize("generator_class", [QuestionGenerator, AsyncQuestionGenerator])
+def test_prefetched_response_is_consumed(generator_class):
+    text = json.dumps([
+        {"question": f"{topic} nasıl yapılandırılır?", "expected_answer": "Açıklama"}
+        for topic in ("Nginx", "Prometheus", "Terraform", "Ansible", "Vault", "Consul")
+    ], ensure_ascii=False)
+    prefetched = {(ROLE, 3, "theoretical_knowledge"): {"text": text, "request_count": 6}}
+    generator, result = generate(generator_class, "theoretical_knowledge", RecordingPlanner(), prefetched)
+
+    assert result["success"]
+    assert generator._prefetched_responses == {}
+    assert any("Nginx" in question["question"] for question in result["questions"])
+
+def test_speculative_fallbacks_avoid_known_questions():
+    known = "Kubernetes cluster'ında rolling update stratejisini nasıl planlarsınız?"
+    detector = NearDuplicateDetector()
+    detector.register(ROLE, [{"question": known}])
+    backend = RecordingBackend()
+
+    _, result = generate(
+        QuestionGenerator, "practical_application", RecordingPlanner(speculative=True),
+        backend=backend, near_duplicates=detector
+    )
+
+    assert result["success"]
+    speculative = [prompt for thread, prompt in backend.requests if thread.startswith("speculative")]
+    assert len(speculative) == 2
+    assert all(known in prompt for prompt in speculative)
+
+@pytest.mark.parametrize("generator_class", [QuestionGenerator, AsyncQuestionGenerator])
+def test_streamed_questions_are_filtered_before_callback(generator_class):
+    generator = generator_class(backend=FakeBackend(), overgeneration_planner=RecordingPlanner(), stream=True)
+    emitted = []
+    result = generator.generate_questions_batch(
+        ROLE, "ilan", "tanım", 3, "practical_application", "Kategori", "açıklama", 4,
+        on_question=emitted.append
+    )
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+
+    assert result["success"]
+    # Ana yanıttaki soruların hiçbiri 5–10 satır kod şartını sağlamıyor; katı mod dolduruyor
+    assert all(generator._has_valid_code_block(question) for question in emitted)
+    assert emitted == []
+
+@pytest.mark.parametrize("concurrent", [False, True])
+@pytest.mark.parametrize("generator_class", [QuestionGenerator, AsyncQuestionGenerator])
+def test_resumed_role_skips_completed_categories(generator_class, concurrent):
+    completed = [{"question": "Günlükten gelen soru?", "expected_answer": "Cevap"}]
+    generator = generator_class(
+        backend=FakeBackend(), overgeneration_planner=RecordingPlanner(), stream=False,
+        concurrent_categories=concurrent
+    )
+    notified = []
+    result = generator.generate_questions_for_role(
+        ROLE, "ilan", "tanım", 3,
+        {"professional_experience": 1, "theoretical_knowledge": 2, "practical_application": 1},
+        completed_questions={"theoretical_knowledge": completed},
+        on_category_completed=lambda category_code, questions: notified.append(category_code)
+    )
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+
+    assert result["success"]
+    assert sorted(notified) == ["practical_application", "professional_experience"]
+    assert [question["question"] for question in result["questions"]["theoretical_knowledge"]] == ["Günlükten gelen soru?"]
@@ -0,0 +1,111 @@
+"""
+ADAY SORU FORMU TESTLERİ
+========================
+
+Geçici havuzdan üretilen aday formlarında hiçbir sorunun form içinde ve
+adaylar arasında tekrar etmediğini, DOCX'teki soruların manifest ile aynı
+olduğunu ve yazılan formların sorularının havuzda kullanıldı olarak
+işaretlendiğini doğrular.
+"""
+
+import json
+import re
+
+import pytest
+from docx import Document
+
+from generators.candidate_sheets import RUBRIC_ORDER, CandidateSheetGenerator
+from utils.near_duplicate import MinHasher
+from utils.question_pool_store import QuestionStore
+
+ROLE_CODE = "devops_uzmani"
+CANDIDATES = 3
+PER_CATEGORY = {"professional_experience": 4, "theoretical_knowledge": 4, "practical_application": 4}
+QUESTION_PARAGRAPH = re.compile(r"^\d+\. \[K\d\] (.+)$")
+
+def pool_questions():
+    """Kategori başına aday sayısı × kota kadar soru; pratik sorular tek seviyede"""
+    questions = []
+    for category in PER_CATEGORY:
+        for index in range(CANDIDATES * PER_CATEGORY[category]):
+            level = "K2_Uygulamali" if category == "practical_application" else RUBRIC_ORDER[index % 4]
+            questions.append({
+                "question": f"{category} sorusu {index}: Kubernetes kümesinde {index}. senaryoyu nasıl ele alırsınız?",
+                "expected_answer": "Cevap",
+                "question_type": category,
+                "role": "DevOps Uzmanı",
+                "salary_coefficient": 3,
+                "rubric_level": level
+            })
+    return questions
+
+@pytest.fixture
+def store(tmp_path):
+    store = QuestionStore(str(tmp_path / "pool.sqlite3"), hasher=MinHasher(num_perm=32))
+    store.add_questions(pool_questions(), ROLE_CODE)
+    yield store
+    store.close()
+
+def generate(store, tmp_path, **kwargs):
+    generator = CandidateSheetGenerator(store=store, seed=7)
+    return generator.generate_session(
+        ROLE_CODE, 3, CANDIDATES, per_category=PER_CATEGORY, session_id="oturum-1",
+        output_dir=str(tmp_path / "sheets"), max_workers=1, **kwargs
+    )
+
+def use_counts(store):
+    return {row["id"]: row["use_count"] for row in store.query(role_code=ROLE_CODE, limit=None)}
+
+def test_sheets_do_not_repeat_questions(store, tmp_path):
+    result = generate(store, tmp_path)
+
+    assert result["success"], result.get("error")
+    with open(result["manifest"], encoding="utf-8") as f:
+        manifest = json.load(f)
+    texts = {row["id"]: row["question"] for row in store.query(role_code=ROLE_CODE, limit=None)}
+
+    seen = set()
+    for entry in manifest["candidates"]:
+        ids = [question["id"] for items in entry["questions"].values() for question in items]
+        assert len(ids) == sum(PER_CATEGORY.values())
+        # Form içinde ve oturumdaki adaylar arasında tekrar yok
+        assert len(set(ids)) == len(ids)
+        assert seen.isdisjoint(ids)
+        seen.update(ids)
+
+        # Formdaki sorular manifestteki sırayla DOCX'e yazılır
+        document = Document(entry["file_path"])
+        written = [
+            QUESTION_PARAGRAPH.match(paragraph.text).group(1)
+            for paragraph in document.paragraphs
+            if paragraph.style.name == "Custom Question"
+        ]
+        assert written == [texts[question_id] for question_id in ids]
+        assert any(paragraph.text.startswith(f"Aday: {entry['candidate']}") for paragraph in document.paragraphs)
+
+        # Seviye kotası K1→K4 sırasıyla; pratik kovası tek seviyeden tamamlanır
+        levels = [question["rubric_level"] for question in entry["questions"]["theoretical_knowledge"]]
+        assert levels == RUBRIC_ORDER[:4]
+        assert {question["rubric_level"] for question in entry["questions"]["practical_application"]} == {"K2_Uygulamali"}
+
+def test_written_sheets_mark_questions_used(store, tmp_path):
+    result = generate(store, tmp_path)
+    with open(result["manifest"], encoding="utf-8") as f:
+        manifest = json.load(f)
+    used = {question["id"] for entry in manifest["candidates"] for items in entry["questions"].values() for question in items}
+
+    counts = use_counts(store)
+    assert all(counts[question_id] == 1 for question_id in used)
+    assert all(count == 0 for question_id, count in counts.items() if question_id not in used)
+
+    # Havuzun tamamı kullanıldı; kullanılmamışlık penceresiyle ikinci oturum yetersiz kalır
+    second = generate(store, tmp_path, unused_for_days=30)
+    assert not second["success"]
+    assert "yetersiz" in second["error"]
+
+def test_mark_used_can_be_disabled(store, tmp_path):
+    result = generate(store, tmp_path, mark_used=False)
+
+    assert result["success"]
+    assert set(use_counts(store).values()) == {0}
+    assert generate(store, tmp_path, unused_for_days=30)["success"]
@@ -0,0 +1,101 @@
+"""
+AKIŞLI DOCX YAZICI TESTLERİ
+===========================
+
+Akışlı motorun yazdığı belgenin python-docx ile açılabildiğini, soru sayısı,
+metinleri ve stillerinin python-docx motoruyla aynı olduğunu ve yazım
+yarıda kesildiğinde yarım dosya bırakılmadığını doğrular.
+"""
+
+import pytest
+from docx import Document
+
+from exporters import docx_stream_writer
+from exporters.docx_stream_writer import StreamingDocxWriter
+from exporters.word_exporter import WordExporter, get_document_template
+
+QUESTION_COUNT = 120
+
+def questions_data():
+    theoretical = [
+        {
+            "success": True,
+            "question": f"Soru {index}: <ağ> & \"güvenlik\" katmanları nelerdir?",
+            "expected_answer": f"Cevap {index}: ĞÜŞİÖÇ\tsekmeli"
+        }
+        for index in range(1, QUESTION_COUNT + 1)
+    ]
+    theoretical.insert(3, {"success": False, "question": "Üretilemedi"})
+    return {
+        "role": "Kıdemli Ağ Uzmanı",
+        "salary_coefficient": 3,
+        "total_questions": QUESTION_COUNT + 1,
+        "questions": {
+            "theoretical_knowledge": theoretical,
+            "practical_application": [{
+                "success": True,
+                "question": "Aşağıdaki kodu inceleyin:\n```python\ndef topla(a, b):\n    return a + b\n```",
+                "expected_answer": "Toplama"
+            }]
+        }
+    }
+
+def export(engine, tmp_path):
+    path = tmp_path / f"{engine}.docx"
+    assert WordExporter(engine=engine).export_questions(questions_data(), "İlan metni", str(path))
+    return Document(str(path))
+
+def paragraphs(document):
+    return [(paragraph.style.name, paragraph.text) for paragraph in document.paragraphs]
+
+def test_streamed_document_has_every_question(tmp_path, monkeypatch):
+    # Küçük eşikle document.xml birçok parça halinde yazılır
+    monkeypatch.setattr(docx_stream_writer, "FLUSH_THRESHOLD", 512)
+    document = export("stream", tmp_path)
+
+    questions = [text for style, text in paragraphs(document) if style == "Custom Question"]
+    answers = [text for style, text in paragraphs(document) if style == "Custom Answer"]
+    code = [text for style, text in paragraphs(document) if style == "Custom Code"]
+
+    assert len(questions) == QUESTION_COUNT + 1
+    assert questions[0] == '1. Soru 1: <ağ> & "güvenlik" katmanları nelerdir?'
+    # Başarısız soru atlanır, numaralandırma kaynak sırasını korur
+    assert questions[3].startswith("5. Soru 4:")
+    assert questions[-1] == "1. Aşağıdaki kodu inceleyin:"
+    assert answers[0] == "Beklenen Cevap: Cevap 1: ĞÜŞİÖÇ\tsekmeli"
+    assert code == ["   ```python", "   def topla(a, b):", "       return a + b", "   ```"]
+    assert "Teorik Bilgi Soruları (120 Soru)" in [text for _, text in paragraphs(document)]
+
+def test_stream_and_docx_engines_match(tmp_path):
+    streamed = paragraphs(export("stream", tmp_path))
+    built = paragraphs(export("docx", tmp_path))
+
+    # Oluşturulma tarihi dakikaya bağlı; yalnızca metin ve stil karşılaştırılır
+    assert [style for style, _ in streamed] == [style for style, _ in built]
+    assert [text for _, text in streamed if not text.startswith("Oluşturulma Tarihi")] == \
+        [text for _, text in built if not text.startswith("Oluşturulma Tarihi")]
+
+def test_writer_escapes_and_drops_invalid_characters(tmp_path):
+    path = tmp_path / "ham.docx"
+    with StreamingDocxWriter(get_document_template(), str(path)) as writer:
+        writer.add_paragraph("Başlık", style="Custom Title")
+        writer.add_paragraph("a < b && c\x00\x0b > d\nikinci satır", style="Custom Code", bold=False)
+        writer.add_paragraph()
+    assert writer.paragraphs == 3
+
+    document = Document(str(path))
+    title, code, empty = document.paragraphs
+    assert (title.style.name, title.text) == ("Custom Title", "Başlık")
+    assert code.text == "a < b && c > d\nikinci satır"
+    assert code.runs[0].bold is False
+    assert empty.text == ""
+
+def test_interrupted_write_leaves_no_file(tmp_path):
+    path = tmp_path / "yarim.docx"
+
+    with pytest.raises(RuntimeError):
+        with StreamingDocxWriter(get_document_template(), str(path)) as writer:
+            writer.add_paragraph("Yarım kalacak")
+            raise RuntimeError("kesildi")
+
+    assert list(tmp_path.iterdir()) == []
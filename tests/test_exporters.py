@@ -0,0 +1,92 @@
+"""
+METİN EXPORT TESTLERİ
+=====================
+
+İK sistemine aktarılan JSONL ve CSV dosyalarının geri okunduğunda aynı
+kayıtları verdiğini (tırnak, virgül, soru içi satır sonu, Türkçe karakter)
+ve biçimlerin batch_generate.py komut satırından seçilebildiğini doğrular.
+"""
+
+import csv
+import json
+import sys
+
+import pytest
+
+import batch_generate
+from exporters.registry import available_formats, get_exporter
+from exporters.text_exporters import CSV_FIELDS
+
+QUESTIONS_DATA = {
+    "role": "Kıdemli Ağ Uzmanı",
+    "role_code": "kidemli_ag_uzmani",
+    "salary_coefficient": 3,
+    "total_questions": 3,
+    "questions": {
+        "theoretical_knowledge": [
+            {
+                "success": True, "id": "q1", "rubric_level": "Orta",
+                "question": 'OSPF ile BGP arasındaki "temel" farklar nelerdir, hangisini; neden seçersiniz?\nİkinci satırda ağ güvenliği de tartışılsın, ĞÜŞİÖÇ ğüşıöç.',
+                "expected_answer": 'Yönlendirme protokolleri,\n"iç" ve "dış" ağ geçidi ayrımı.'
+            },
+            {"success": False, "question": "Üretilemedi"},
+            {"success": True, "id": "q3", "question": "Tek satırlık soru", "expected_answer": ""}
+        ],
+        "practical_application": [
+            {
+                "success": True, "id": "q4",
+                "question": "Aşağıdaki kodu inceleyin:\n```csharp\npublic int Topla(int a, int b)\n{\n    var s = a + b;\n    return s;\n}\n```",
+                "expected_answer": "Toplama işlemi"
+            }
+        ]
+    }
+}
+
+def export(format_name, tmp_path):
+    exporter = get_exporter(format_name)
+    path = exporter.generate_filename(QUESTIONS_DATA["role"], 3, str(tmp_path))
+    assert exporter.export_questions(QUESTIONS_DATA, "İlan metni", path)
+    return exporter, path
+
+def expected_records(exporter):
+    return [
+        {key: str(value) for key, value in record.items()}
+        for record in exporter.iter_records(QUESTIONS_DATA)
+    ]
+
+def test_jsonl_round_trip(tmp_path):
+    exporter, path = export("jsonl", tmp_path)
+
+    with open(path, encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert len(records) == 3
+    assert records == list(exporter.iter_records(QUESTIONS_DATA))
+    assert [record["number"] for record in records] == [1, 3, 1]
+    assert "\n" in records[0]["question"] and "ĞÜŞİÖÇ" in records[0]["question"]
+    assert records[2]["code"].startswith("```csharp")
+    # Türkçe karakterler kaçışsız yazılır
+    assert "ğüşıöç" in lines[0]
+
+def test_csv_round_trip(tmp_path):
+    exporter, path = export("csv", tmp_path)
+
+    with open(path, encoding="utf-8", newline="") as handle:
+        reader = csv.DictReader(handle)
+        assert reader.fieldnames == CSV_FIELDS
+        records = list(reader)
+
+    assert records == expected_records(exporter)
+    assert records[0]["question"].count("\n") == 1
+    assert records[0]["expected_answer"] == 'Yönlendirme protokolleri,\n"iç" ve "dış" ağ geçidi ayrımı.'
+
+@pytest.mark.parametrize("formats", [["jsonl"], ["csv", "html"]])
+def test_batch_generate_accepts_format_option(formats, monkeypatch):
+    argv = ["batch_generate.py"]
+    for format_name in formats:
+        argv += ["--format", format_name]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    assert batch_generate.parse_args().formats == formats
+    assert set(formats) <= set(available_formats())
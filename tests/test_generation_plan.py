@@ -0,0 +1,71 @@
+"""
+ÜRETİM PLANI DOSYASI TESTLERİ
+=============================
+
+YAML plan dosyasındaki çalışma ayarlarının hem main.py hem batch_generate.py
+girişinde uygulandığını doğrular.
+"""
+
+import sys
+
+import pytest
+
+import batch_generate
+from batch_generate import merge_plan_settings
+from generators.generation_plan import GenerationPlanError, load_generation_plan
+
+PLAN_YAML = """\
+concurrency: 3
+cache: read
+formats: [json, csv]
+concurrent_categories: false
+roles:
+  devops_uzmani:
+    3x: 5
+"""
+
+@pytest.fixture
+def plan_file(tmp_path):
+    path = tmp_path / "plan.yaml"
+    path.write_text(PLAN_YAML, encoding="utf-8")
+    return str(path)
+
+def test_yaml_plan_carries_settings(plan_file):
+    loaded = load_generation_plan(plan_file)
+
+    assert loaded.pop("plan") == {"devops_uzmani": {3: 5}}
+    assert loaded == {"concurrency": 3, "cache": "read", "formats": ["json", "csv"], "concurrent_categories": False}
+
+def test_cli_values_override_file_settings():
+    settings = merge_plan_settings(
+        {"concurrency": 3, "formats": "json", "cache": "read"},
+        concurrency=5, formats=(), cache=None
+    )
+
+    assert settings == {"concurrency": 5, "formats": ["json"], "cache": "read"}
+
+@pytest.mark.parametrize("file_settings", [{"formats": ["pdf"]}, {"cache": "sometimes"}])
+def test_invalid_settings_are_rejected(file_settings):
+    with pytest.raises(GenerationPlanError):
+        merge_plan_settings(file_settings)
+
+def test_batch_generate_applies_plan_file_settings(plan_file, monkeypatch):
+    calls = {}
+
+    def fake_generate_questions(generation_plan, **kwargs):
+        calls.update(kwargs, plan=generation_plan)
+        return [], [], []
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(batch_generate, "display_plan", lambda *args, **kwargs: True)
+    monkeypatch.setattr(batch_generate, "configure_shared_response_cache", lambda mode=None: calls.update(cache=mode))
+    monkeypatch.setattr(batch_generate, "generate_questions", fake_generate_questions)
+    monkeypatch.setattr(sys, "argv", ["batch_generate.py", "--config-file", plan_file, "--concurrency", "2"])
+
+    batch_generate.main()
+
+    assert calls["plan"] == {"devops_uzmani": {3: 5}}
+    assert calls["concurrency"] == 2
+    assert calls["output_formats"] == ["json", "csv"]
+    assert calls["concurrent_categories"] is False
+    assert calls["cache"] == "read"
@@ -0,0 +1,93 @@
+"""
+TOLERANSLI JSON TARAYICI TESTLERİ
+=================================
+
+Bozuk model çıktılarında tarayıcının sonlandığını ve soruları koruduğunu
+doğrular (dizi içinde "]" ile kapanan / "}" eksik nesneler).
+"""
+
+import json
+import random
+import signal
+from contextlib import contextmanager
+
+import pytest
+
+from core.json_scanner import scan_questions
+from core.llm_backends import FakeBackend
+from core.question_generator import QuestionGenerator
+
+@contextmanager
+def time_limit(seconds: float):
+    """Sonsuz döngüye giren taramayı testi asmadan başarısız say"""
+    def on_timeout(signum, frame):
+        raise TimeoutError(f"Tarama {seconds} sn içinde bitmedi")
+
+    previous = signal.signal(signal.SIGALRM, on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def test_object_closed_with_bracket():
+    with time_limit(2):
+        result = scan_questions('[{"question": "a"]')
+    assert result["questions"] == [{"question": "a"}]
+    assert "unbalanced_brace" in result["repairs"]
+
+def test_object_missing_closing_brace_before_next_object():
+    text = '[{"question": "x", "expected_answer": "y", {"question": "z", "expected_answer": "w"}]'
+    with time_limit(2):
+        result = scan_questions(text)
+    assert result["questions"] == [
+        {"question": "x", "expected_answer": "y"},
+        {"question": "z", "expected_answer": "w"}
+    ]
+    assert result["repairs"] == ["unbalanced_brace"]
+
+@pytest.mark.parametrize("text", [
+    '[{"question": "q", "difficulty": ]',
+    '[{"question": "q", "difficulty": }]',
+    '[{"question": "q", "difficulty": , "expected_answer": "a"}]'
+])
+def test_member_without_value(text):
+    with time_limit(2):
+        result = scan_questions(text)
+    assert result["questions"][0]["question"] == "q"
+    assert result["questions"][0]["difficulty"] == ""
+    assert "missing_value" in result["repairs"]
+
+def test_nested_object_closed_with_bracket():
+    with time_limit(2):
+        result = scan_questions('[{"question": "q", "meta": {"a": 1]}]')
+    assert result["questions"][0]["question"] == "q"
+
+def test_generator_parse_terminates():
+    generator = QuestionGenerator(backend=FakeBackend(), structured_output=False)
+    with time_limit(5):
+        questions = generator._parse_generated_questions('[{"question": "Docker nedir?", "difficulty": 1]')
+    assert [q["question"] for q in questions] == ["Docker nedir?"]
+
+def test_mutated_responses_terminate():
+    base = json.dumps([
+        {"question": "Docker nedir? \"imaj\" ile farkı", "expected_answer": "Konteyner", "difficulty": 1},
+        {"question": "Kod:\nint x = 0;", "expected_answer": "Sıfır", "tags": [1, 2, {"k": None}]}
+    ], ensure_ascii=False)
+    alphabet = '[]{}",:\\ \nabc01tfn-'
+    rng = random.Random(7)
+    for _ in range(3000):
+        chars = list(base)
+        for _ in range(rng.randint(1, 3)):
+            position = rng.randrange(len(chars))
+            operation = rng.randrange(3)
+            if operation == 0:
+                chars.pop(position)
+            elif operation == 1:
+                chars.insert(position, rng.choice(alphabet))
+            else:
+                chars[position] = rng.choice(alphabet)
+        text = "".join(chars)
+        with time_limit(2):
+            scan_questions(text)
@@ -0,0 +1,122 @@
+"""
+YAKIN-TEKRAR TESPİTİ TESTLERİ
+=============================
+
+Türkçe parafrazların varsayılan eşikte yakalandığını, farklı soruların
+geçtiğini ve eşzamanlı filtre / kayıt çağrılarının tutarlı kaldığını doğrular.
+"""
+
+import threading
+
+import pytest
+
+from utils.near_duplicate import MinHasher, NearDuplicateDetector
+
+ROLE = "devops_uzmani"
+
+PARAPHRASES = [
+    ("Docker ile Kubernetes arasındaki fark nedir?", "Kubernetes ve Docker arasındaki farklar nelerdir?"),
+    (
+        "PostgreSQL'de indeks kullanımının sorgu performansına etkisini açıklayınız.",
+        "PostgreSQL'de indekslerin sorgu performansına etkisini açıklar mısınız?"
+    ),
+]
+
+DISTINCT = [
+    ("Docker ile Kubernetes arasındaki fark nedir?", "Docker konteynerlerinde kalıcı veri nasıl saklanır?"),
+    ("CI/CD hattında otomatik testler nasıl çalıştırılır?", "Mikroservis mimarisinde servisler arası iletişim nasıl sağlanır?"),
+]
+
+def as_items(*texts):
+    return [{"question": text} for text in texts]
+
+@pytest.mark.parametrize("original, paraphrase", PARAPHRASES)
+def test_paraphrase_is_rejected_against_history(original, paraphrase):
+    detector = NearDuplicateDetector(threshold=0.7)
+    detector.register(ROLE, as_items(original))
+
+    kept, rejected = detector.filter(ROLE, as_items(paraphrase))
+
+    assert kept == []
+    assert rejected[0]["duplicate_of"] == original
+    assert rejected[0]["similarity"] >= 0.7
+    assert detector.stats()["rejected"] == 1
+
+@pytest.mark.parametrize("original, other", DISTINCT)
+def test_distinct_questions_pass(original, other):
+    detector = NearDuplicateDetector(threshold=0.7)
+    detector.register(ROLE, as_items(original))
+
+    kept, rejected = detector.filter(ROLE, as_items(other))
+
+    assert (len(kept), rejected) == (1, [])
+
+def test_duplicates_within_batch_and_accepted():
+    detector = NearDuplicateDetector(threshold=0.7)
+    original, paraphrase = PARAPHRASES[0]
+    distinct = DISTINCT[0][1]
+
+    kept, rejected = detector.filter(ROLE, as_items(original, paraphrase, distinct))
+    assert [item["question"] for item in kept] == [original, distinct]
+    assert [entry["question"]["question"] for entry in rejected] == [paraphrase]
+
+    kept, _ = detector.filter(ROLE, as_items(paraphrase), accepted=as_items(original), record_stats=False)
+    assert kept == []
+    # Ön kontroller sayaçları değiştirmez; filtre indekse eklemez
+    assert detector.stats() == {"checked": 3, "rejected": 1, "roles": {ROLE: 0}}
+
+def test_threshold_controls_rejection():
+    hasher = MinHasher(64)
+    original, paraphrase = PARAPHRASES[1]
+    similarity = MinHasher.similarity(hasher.signature(original), hasher.signature(paraphrase))
+
+    strict = NearDuplicateDetector(threshold=min(1.0, similarity + 0.05))
+    loose = NearDuplicateDetector(threshold=similarity - 0.05)
+    for detector in (strict, loose):
+        detector.register(ROLE, as_items(original))
+
+    assert len(strict.filter(ROLE, as_items(paraphrase))[0]) == 1
+    assert loose.filter(ROLE, as_items(paraphrase))[0] == []
+
+def test_concurrent_filter_and_register():
+    detector = NearDuplicateDetector(threshold=0.7)
+    detector.preload(ROLE, [(1, PARAPHRASES[0][0], None)])
+    errors = []
+
+    def worker(offset):
+        try:
+            for index in range(20):
+                items = as_items(f"Soru {offset}-{index}: Ansible rol yapısını {offset * 100 + index} adımda açıklayın")
+                kept, _ = detector.filter(ROLE, items + as_items(PARAPHRASES[0][1]))
+                detector.register(ROLE, kept)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = detector.stats()
+    assert errors == []
+    assert stats["checked"] == 4 * 20 * 2
+    # Parafraz her seferinde geçmişteki soruya takılır
+    assert stats["rejected"] >= 4 * 20
+    assert stats["roles"][ROLE] == 1 + 4 * 20 - (stats["rejected"] - 4 * 20)
+
+def test_signatures_are_computed_outside_the_lock(monkeypatch):
+    detector = NearDuplicateDetector(threshold=0.7, num_perm=32)
+    signature = detector.hasher.signature
+    lock_held = []
+
+    def checked_signature(text):
+        lock_held.append(detector._lock.locked())
+        return signature(text)
+
+    monkeypatch.setattr(detector.hasher, "signature", checked_signature)
+    detector.preload(ROLE, [(1, PARAPHRASES[0][0], None)])
+    detector.register(ROLE, as_items(DISTINCT[1][0]))
+    detector.filter(ROLE, as_items(*DISTINCT[1]))
+
+    assert lock_held and not any(lock_held)
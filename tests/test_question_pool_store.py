@@ -0,0 +1,114 @@
+"""
+SORU HAVUZU DEPOSU TESTLERİ
+===========================
+
+Geçici SQLite havuzunda tekrar eklemeyi, kullanılmamışlık filtresini,
+kullanım işaretlemeyi ve eksik MinHash imzalarının tamamlanmasını doğrular.
+"""
+
+import time
+
+import pytest
+
+from utils.near_duplicate import MinHasher
+from utils.question_pool_store import QuestionStore
+
+ROLE_CODE = "devops_uzmani"
+
+def question(text, question_type="theoretical_knowledge", **fields):
+    return {
+        "question": text, "expected_answer": "Cevap", "question_type": question_type,
+        "role": "DevOps Uzmanı", "salary_coefficient": 3, **fields
+    }
+
+@pytest.fixture
+def store(tmp_path):
+    store = QuestionStore(str(tmp_path / "pool.sqlite3"), hasher=MinHasher(num_perm=32))
+    yield store
+    store.close()
+
+def test_duplicate_inserts_are_ignored(store):
+    first = store.add_questions([
+        question("Kubernetes'te pod nedir?"),
+        question("Terraform state dosyası ne işe yarar?")
+    ], ROLE_CODE, run_id="run-1")
+    # Büyük/küçük harf ve boşluk farkı aynı soru sayılır; başka rolde aynı metin ayrı kayıttır
+    second = store.add_questions([question("  kubernetes'te   POD nedir? ")], ROLE_CODE, run_id="run-2")
+    other_role = store.add_questions([question("Kubernetes'te pod nedir?")], "kidemli_ag_uzmani")
+
+    assert first == {"inserted": 2, "duplicates": 0}
+    assert second == {"inserted": 0, "duplicates": 1}
+    assert other_role == {"inserted": 1, "duplicates": 0}
+    assert store.count(role_code=ROLE_CODE) == 2
+    assert store.contains(ROLE_CODE, "KUBERNETES'TE POD NEDİR?")
+
+def test_metadata_round_trip(store):
+    store.add_questions([question("Helm chart nasıl sürümlenir?", id="q-1", rubric_level="Orta", success=True)], ROLE_CODE)
+
+    row, = store.query(role_code=ROLE_CODE)
+
+    assert row["question"] == "Helm chart nasıl sürümlenir?"
+    # Havuz id'si sorunun üretim id'sini ezer; diğer alanlar metadata'dan döner
+    assert isinstance(row["id"], int)
+    assert (row["rubric_level"], row["role"]) == ("Orta", "DevOps Uzmanı")
+    assert "success" not in row and "minhash" not in row
+
+def test_mark_used_and_unused_for_days(store):
+    store.add_questions([question(f"Soru {index} için izleme stratejisi nedir?") for index in range(4)], ROLE_CODE)
+    rows = store.query(role_code=ROLE_CODE, limit=None)
+    used = [rows[0]["id"], rows[1]["id"]]
+
+    store.mark_used(used, context="aday_0001")
+    store.mark_used(used[:1], context="aday_0002")
+
+    fresh = store.query(role_code=ROLE_CODE, unused_for_days=30, limit=None, random_order=True)
+    assert sorted(row["id"] for row in fresh) == sorted(row["id"] for row in rows[2:])
+
+    by_id = {row["id"]: row for row in store.query(role_code=ROLE_CODE, limit=None)}
+    assert (by_id[used[0]]["use_count"], by_id[used[1]]["use_count"]) == (2, 1)
+    with store._lock:
+        usage = store._connection().execute("SELECT COUNT(*) FROM question_usage").fetchone()[0]
+    assert usage == 3
+
+    # Kullanım kaydı pencereden eskiyse soru yeniden seçilebilir
+    with store._lock:
+        store._connection().execute(
+            "UPDATE questions SET last_used_at = ? WHERE id = ?", (time.time() - 40 * 86400, used[1])
+        )
+    fresh_ids = {row["id"] for row in store.query(role_code=ROLE_CODE, unused_for_days=30, limit=None)}
+    assert used[1] in fresh_ids and used[0] not in fresh_ids
+
+def test_query_filters_and_excludes(store):
+    store.add_questions([
+        question("Prometheus alarm kuralı nasıl yazılır?"),
+        question("Bir Dockerfile'ı nasıl küçültürsünüz?", question_type="practical_application")
+    ], ROLE_CODE)
+
+    practical = store.query(role_code=ROLE_CODE, question_type="practical_application")
+    assert [row["question"] for row in practical] == ["Bir Dockerfile'ı nasıl küçültürsünüz?"]
+    assert store.query(role_code=ROLE_CODE, exclude_ids=[practical[0]["id"]], question_type="practical_application") == []
+
+def test_missing_signatures_are_backfilled(store, tmp_path):
+    store.add_questions([
+        question("Ansible playbook'larında idempotency nasıl sağlanır?"),
+        question("CI hattında gizli anahtarlar nasıl saklanır?")
+    ], ROLE_CODE)
+    with store._lock:
+        conn = store._connection()
+        conn.execute("UPDATE questions SET minhash = NULL")
+        conn.commit()
+
+    rows = store.near_duplicate_rows(ROLE_CODE)
+
+    assert len(rows) == 2
+    assert all(len(signature) == 32 for _, _, signature in rows)
+    with store._lock:
+        missing = store._connection().execute("SELECT COUNT(*) FROM questions WHERE minhash IS NULL").fetchone()[0]
+    assert missing == 0
+
+    # Farklı num_perm ile açılan havuz imzaları yeniden hesaplar
+    wider = QuestionStore(store.path, hasher=MinHasher(num_perm=64))
+    try:
+        assert all(len(signature) == 64 for _, _, signature in wider.near_duplicate_rows(ROLE_CODE))
+    finally:
+        wider.close()
@@ -0,0 +1,118 @@
+"""
+HIZ SINIRLAYICI TESTLERİ
+========================
+
+Yerel sahte bir OpenAI uyumlu sunucuya (429 + Retry-After, sonra 200)
+HTTPBackend ile istek gönderilir; AIMD düşüşü, Retry-After beklemesi ve
+iptal / kesmede eşzamanlılık slotunun bırakıldığı doğrulanır.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.llm_backends import HTTPBackend
+from core.rate_limiter import RateLimiter
+
+RETRY_AFTER = 0.3
+MESSAGES = [{"role": "user", "content": "Soru üret"}]
+PARAMS = {"model": "gpt-4o-mini"}
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """İlk isteği 429 + Retry-After ile reddeden, sonrakileri yanıtlayan sunucu"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.hits += 1
+        if self.server.hits == 1:
+            body = b'{"error": {"message": "Rate limit reached"}}'
+            self.send_response(429)
+            self.send_header("Retry-After", str(RETRY_AFTER))
+        else:
+            body = json.dumps({
+                "choices": [{"message": {"content": "[]"}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+            }).encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+    httpd.hits = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def make_limiter():
+    return RateLimiter(requests_per_minute=0, tokens_per_minute=0, max_concurrency=4, max_retries=2)
+
+def assert_backed_off(limiter, server, elapsed):
+    stats = limiter.stats()
+    assert server.hits == 2
+    assert (stats["rate_limited"], stats["retries"], stats["failures"]) == (1, 1, 0)
+    assert elapsed >= RETRY_AFTER
+    # 429'da 4 -> 2, ardından başarıda 2 + 1/2
+    assert stats["concurrency_limit"] == 2.5
+    assert stats["in_flight"] == 0
+
+def test_sync_call_honours_retry_after(server):
+    backend = HTTPBackend(base_url=f"http://127.0.0.1:{server.server_port}")
+    limiter = make_limiter()
+
+    started = time.monotonic()
+    text, usage = limiter.call(lambda: backend.complete(MESSAGES, PARAMS))
+
+    assert text == "[]"
+    assert_backed_off(limiter, server, time.monotonic() - started)
+
+def test_async_call_honours_retry_after(server):
+    pytest.importorskip("httpx")
+    backend = HTTPBackend(base_url=f"http://127.0.0.1:{server.server_port}")
+    limiter = make_limiter()
+
+    async def run():
+        started = time.monotonic()
+        result = await limiter.acall(lambda: backend.acomplete(MESSAGES, PARAMS))
+        return result, time.monotonic() - started
+
+    (text, usage), elapsed = asyncio.run(run())
+
+    assert text == "[]"
+    assert_backed_off(limiter, server, elapsed)
+
+def test_cancelled_async_call_releases_slot():
+    limiter = make_limiter()
+
+    async def run():
+        task = asyncio.create_task(limiter.acall(lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0.05)
+        assert limiter.concurrency.in_flight == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert limiter.concurrency.in_flight == 0
+
+def test_interrupted_sync_call_releases_slot():
+    limiter = make_limiter()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        limiter.call(interrupted)
+    assert limiter.concurrency.in_flight == 0
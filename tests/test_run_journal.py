@@ -0,0 +1,130 @@
+"""
+ÇALIŞTIRMA GÜNLÜĞÜ TESTLERİ
+===========================
+
+Yarım yazılmış son satırın kesildiğini, category_completed / export_completed
+olaylarının yeniden oynatıldığını ve --resume yolunda BatchScheduler'ın
+yalnızca eksik kategorileri yeniden istediğini doğrular.
+"""
+
+import json
+import os
+
+import pytest
+
+from batch_generate import calculate_question_distribution
+from generators.batch_scheduler import BatchScheduler
+from generators.run_journal import RunJournal, RunJournalError
+from generators.single_generator import SingleGenerator
+
+PLAN = {"kidemli_yazilim_gelistirme_uzmani": {3: 5}, "yazilim_gelistirme_uzmani": {2: 5}}
+DONE_UNIT = "kidemli_yazilim_gelistirme_uzmani/3x"
+RESUMED_UNIT = "yazilim_gelistirme_uzmani/2x"
+JOURNAL_QUESTIONS = [
+    {"success": True, "question": "Günlükten gelen birinci soru?", "expected_answer": "Cevap"},
+    {"success": True, "question": "Günlükten gelen ikinci soru?", "expected_answer": "Cevap"}
+]
+
+def tear_tail(journal, event):
+    """Çökme anındaki gibi son olayı satır sonu olmadan yarım yaz"""
+    line = json.dumps(event, ensure_ascii=False)
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write(line[:len(line) // 2])
+
+def test_torn_tail_is_truncated_and_journal_stays_appendable(tmp_path):
+    journal = RunJournal.create(PLAN, ["json"], run_id="run-torn", directory=str(tmp_path))
+    journal.record_category(RESUMED_UNIT, "theoretical_knowledge", JOURNAL_QUESTIONS)
+    size = os.path.getsize(journal.path)
+    tear_tail(journal, {"event": "category_completed", "unit": RESUMED_UNIT, "category": "practical_application", "questions": []})
+
+    reopened = RunJournal.open("run-torn", directory=str(tmp_path))
+
+    assert os.path.getsize(reopened.path) == size
+    assert reopened.plan == PLAN
+    assert reopened.output_formats == ["json"]
+    assert list(reopened.completed_categories(RESUMED_UNIT)) == ["theoretical_knowledge"]
+
+    # Kesilen satırın yerine yazılan olay bir sonraki açılışta okunur
+    reopened.record_category(RESUMED_UNIT, "practical_application", JOURNAL_QUESTIONS[:1])
+    again = RunJournal.open("run-torn", directory=str(tmp_path))
+    assert sorted(again.completed_categories(RESUMED_UNIT)) == ["practical_application", "theoretical_knowledge"]
+
+def test_category_and_export_events_are_replayed(tmp_path):
+    json_file = tmp_path / "devops.json"
+    json_file.write_text("{}", encoding="utf-8")
+    journal = RunJournal.create(PLAN, run_id="run-replay", directory=str(tmp_path))
+    journal.record_category(DONE_UNIT, "theoretical_knowledge", JOURNAL_QUESTIONS)
+    journal.record_export(DONE_UNIT, "json", str(json_file))
+    journal.record_export(DONE_UNIT, "docx", str(tmp_path / "hic_yazilmadi.docx"))
+
+    reopened = RunJournal.open("run-replay", directory=str(tmp_path))
+
+    assert reopened.completed_categories(DONE_UNIT) == {"theoretical_knowledge": JOURNAL_QUESTIONS}
+    assert reopened.completed_categories(RESUMED_UNIT) == {}
+    assert reopened.completed_export(DONE_UNIT, "json") == str(json_file)
+    # Diskte olmayan export yeniden üretilmek üzere None döner
+    assert reopened.completed_export(DONE_UNIT, "docx") is None
+    json_file.unlink()
+    assert reopened.completed_export(DONE_UNIT, "json") is None
+    assert reopened.completed_unit(DONE_UNIT) is None and not reopened.completed
+
+def test_missing_or_headless_journal_is_rejected(tmp_path):
+    with pytest.raises(RunJournalError):
+        RunJournal.open("yok", directory=str(tmp_path))
+
+    (tmp_path / "basliksiz.jsonl").write_text('{"event": "run_completed", "units": 0}\n', encoding="utf-8")
+    with pytest.raises(RunJournalError):
+        RunJournal.open("basliksiz", directory=str(tmp_path))
+
+def test_resume_requests_only_missing_categories(tmp_path):
+    done_json = tmp_path / "json" / "done.json"
+    done_json.parent.mkdir()
+    done_json.write_text("{}", encoding="utf-8")
+    summary = {"role": "Kıdemli Yazılım Geliştirme Uzmanı", "difficulty": 3, "count": 5, "word_file": None, "json_file": str(done_json)}
+
+    journal = RunJournal.create(PLAN, ["json"], run_id="run-resume", directory=str(tmp_path))
+    journal.record_export(DONE_UNIT, "json", str(done_json))
+    journal.record_unit(DONE_UNIT, summary)
+    journal.record_category(RESUMED_UNIT, "theoretical_knowledge", JOURNAL_QUESTIONS)
+    tear_tail(journal, {"event": "category_completed", "unit": RESUMED_UNIT, "category": "practical_application", "questions": []})
+
+    scheduler = BatchScheduler(
+        generator=SingleGenerator(structured_output=False),
+        json_output_dir=str(tmp_path / "json"),
+        word_output_dir=str(tmp_path / "word"),
+        export_output_dir=str(tmp_path / "exports"),
+        output_formats=("json",),
+        journal=RunJournal.open("run-resume", directory=str(tmp_path))
+    )
+    question_generator = scheduler.generator.question_generator
+    generate_batch = question_generator.generate_questions_batch
+    requested = []
+
+    def recording_batch(**kwargs):
+        requested.append((kwargs["role_name"], kwargs["question_type"]))
+        return generate_batch(**kwargs)
+
+    question_generator.generate_questions_batch = recording_batch
+    events = []
+    report = scheduler.run(
+        PLAN, distribution_fn=calculate_question_distribution,
+        progress_callback=lambda event, unit, payload: events.append((event, unit["unit_id"]))
+    )
+
+    # Tamamlanmış birim ve günlükteki kategori yeniden istenmez
+    assert sorted(question_type for _, question_type in requested) == ["practical_application", "professional_experience"]
+    assert {role_name for role_name, _ in requested} == {"Yazılım Geliştirme Uzmanı"}
+    assert ("unit_skipped", DONE_UNIT) in events
+
+    done, resumed = report["results"]
+    assert done["json_file"] == str(done_json)
+    with open(resumed["json_file"], encoding="utf-8") as f:
+        saved = json.load(f)
+    assert [q["question"] for q in saved["questions"]["theoretical_knowledge"]] == [q["question"] for q in JOURNAL_QUESTIONS]
+
+    finished = RunJournal.open("run-resume", directory=str(tmp_path))
+    assert finished.completed
+    assert finished.completed_unit(RESUMED_UNIT)["json_file"] == resumed["json_file"]
+    assert sorted(finished.completed_categories(RESUMED_UNIT)) == [
+        "practical_application", "professional_experience", "theoretical_knowledge"
+    ]
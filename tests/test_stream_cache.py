@@ -0,0 +1,34 @@
+"""
+AKIŞ YANITI ÖNBELLEK TESTLERİ
+=============================
+
+Akış modunda tamamlanan yanıtın, tam yanıt yolundaki gibi model bilgisiyle
+önbelleğe yazıldığını doğrular.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from core.async_question_generator import AsyncQuestionGenerator
+from core.llm_backends import FakeBackend
+from core.question_generator import QuestionGenerator
+from core.response_cache import ResponseCache
+
+PROMPT = 'Docker hakkında 3 soru üret: [{"question": "...", "expected_answer": "..."}]'
+
+@pytest.mark.parametrize("generator_class", [QuestionGenerator, AsyncQuestionGenerator])
+def test_streamed_response_is_cached_with_model(generator_class, tmp_path):
+    cache_path = str(tmp_path / "llm_cache.sqlite3")
+    generator = generator_class(
+        backend=FakeBackend(), response_cache=ResponseCache(cache_path, mode="readwrite"), stream=True
+    )
+    questions = generator._stream_questions(PROMPT)
+    if asyncio.iscoroutine(questions):
+        questions = asyncio.run(questions)
+    assert questions
+
+    with sqlite3.connect(cache_path) as conn:
+        models = [row[0] for row in conn.execute("SELECT model FROM llm_responses")]
+    assert models == [generator.openai_config["model"]]
@@ -0,0 +1,40 @@
+"""
+AKIŞ MODU RATE LIMIT UZLAŞTIRMA TESTLERİ
+========================================
+
+Akış isteği için max_tokens ile ayrılan TPM rezervasyonunun, akış bitince
+gerçek kullanıma göre düzeltildiğini doğrular.
+"""
+
+import asyncio
+
+from core.async_question_generator import AsyncQuestionGenerator
+from core.llm_backends import FakeBackend
+from core.question_generator import QuestionGenerator
+from core.rate_limiter import RateLimiter
+
+PROMPT = 'Docker hakkında 3 soru üret: [{"question": "...", "expected_answer": "..."}]'
+
+def stream_spent_tokens(generator_class) -> float:
+    """Bir akış isteğinin token kovasından düştüğü miktar"""
+    generator = generator_class(backend=FakeBackend(), stream=True)
+    generator.rate_limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=200000, max_concurrency=4)
+    bucket = generator.rate_limiter.token_bucket
+    before = bucket.tokens
+
+    deltas = []
+    result = generator._stream_chat_completion(generator._build_messages(PROMPT), deltas.append)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+
+    assert result is None
+    assert deltas
+    return before - bucket.tokens
+
+def test_sync_stream_reservation_is_reconciled():
+    spent = stream_spent_tokens(QuestionGenerator)
+    assert 0 < spent < QuestionGenerator(backend=FakeBackend()).openai_config["max_tokens"]
+
+def test_async_stream_reservation_is_reconciled():
+    spent = stream_spent_tokens(AsyncQuestionGenerator)
+    assert 0 < spent < QuestionGenerator(backend=FakeBackend()).openai_config["max_tokens"]
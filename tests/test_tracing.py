@@ -0,0 +1,57 @@
+"""
+İZLEME (TRACING) TESTLERİ
+=========================
+
+Sahte backend'le izlenen bir toplu çalıştırmada üretim, kategori ve export
+thread'lerinde açılan span'lerin batch.run altında kaldığını doğrular.
+"""
+
+from batch_generate import calculate_question_distribution
+from generators.batch_scheduler import BatchScheduler
+from generators.single_generator import SingleGenerator
+from utils.tracing import get_shared_tracer
+
+PLAN = {"kidemli_yazilim_gelistirme_uzmani": {3: 6}, "yazilim_gelistirme_uzmani": {2: 6}}
+
+def test_thread_pool_spans_keep_their_parent(tmp_path):
+    scheduler = BatchScheduler(
+        generator=SingleGenerator(concurrent_categories=True, structured_output=False),
+        max_concurrency=2,
+        json_output_dir=str(tmp_path / "json"),
+        word_output_dir=str(tmp_path / "word"),
+        export_output_dir=str(tmp_path / "exports"),
+        output_formats=("json", "docx", "jsonl")
+    )
+    tracer = get_shared_tracer()
+    tracer.reset()
+    tracer.enable()
+    try:
+        with tracer.span("batch.run"):
+            report = scheduler.run(PLAN, distribution_fn=calculate_question_distribution)
+    finally:
+        tracer.enable(False)
+    assert len(report["results"]) == 2
+    assert all(result.get("json_file") for result in report["results"])
+
+    spans = tracer.spans()
+    by_id = {span.span_id: span for span in spans}
+    root = next(span for span in spans if span.name == "batch.run")
+
+    def ancestors(span):
+        names = []
+        while span.parent_id is not None:
+            span = by_id[span.parent_id]
+            names.append(span.name)
+        return names
+
+    names = {span.name for span in spans}
+    assert {"single.generate_questions", "generate.batch"} <= names
+    assert any(name.startswith("export.") for name in names)
+    # Ana thread dışındaki span'ler dahil hepsi batch.run'a bağlı
+    assert any(span.thread_name.startswith("category") for span in spans)
+    for span in spans:
+        if span is not root:
+            assert ancestors(span)[-1:] == ["batch.run"], span.name
+    for span in spans:
+        if span.name == "generate.batch":
+            assert "single.generate_questions" in ancestors(span)
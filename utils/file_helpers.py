@@ -11,6 +11,8 @@ import logging
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from utils.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 class FileHelper:
@@ -57,6 +59,7 @@ class FileHelper:
             raise
     
     @staticmethod
+    @traced("export.json")
     def save_questions_json(
         questions_data: Dict[str, Any], 
         output_path: str
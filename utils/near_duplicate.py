@@ -0,0 +1,367 @@
+"""
+YAKIN-TEKRAR TESPİTİ (MinHash / LSH)
+====================================
+
+Aynı soruyu farklı kelimelerle soran parafrazları ("Docker ile Kubernetes
+arasındaki fark nedir?" ~ "Kubernetes ve Docker farkları nelerdir?") rol
+bazında, o role ait daha önce üretilmiş TÜM sorulara karşı yakalar.
+
+- Soru metni Türkçe normalize edilip kök kümesine indirilir
+  (utils.text_normalization.question_shingles).
+- Kök kümesinin MinHash imzası çıkarılır: her kök için num_perm adet
+  bağımsız 32-bit hash (tek SHAKE-128 özeti), konum bazında minimum.
+- İmza bantlara bölünür; LSH tablolarında aynı bantı paylaşan sorular aday
+  olur ve yalnızca adayların imza benzerliği (tahmini Jaccard) hesaplanır.
+  Sorgu maliyeti havuz boyutundan bağımsızdır.
+
+Saf Python'dur (numpy, ağ veya GPU gerektirmez). İmzalar kalıcı havuzda
+saklanabilir (QuestionStore), böylece indeks her çalıştırmada yeniden
+hesaplanmadan yüklenir.
+"""
+
+import hashlib
+import logging
+import operator
+import threading
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.generation_settings import get_near_duplicate_config
+from utils.text_normalization import question_shingles
+
+logger = logging.getLogger(__name__)
+
+class MinHasher:
+    """Kök kümelerinden sabit uzunlukta MinHash imzası üretir"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1, cache_size: int = 50000):
+        """
+        Args:
+            num_perm (int): İmza uzunluğu (hash fonksiyonu sayısı)
+            seed (int): Hash tohumu (kalıcı imzalar için sabit kalmalı)
+            cache_size (int): Kök başına hash dizisi önbelleğinin üst sınırı
+        """
+        self.num_perm = num_perm
+        self.seed = seed
+        self._salt = f"{seed}:".encode("utf-8")
+        self._cache: Dict[str, array] = {}
+        self._cache_size = cache_size
+
+    def _shingle_hashes(self, shingle: str) -> array:
+        """Kökün num_perm adet bağımsız 32-bit hash'i (tek SHAKE-128 çağrısı)"""
+        hashes = self._cache.get(shingle)
+        if hashes is None:
+            hashes = array("I")
+            hashes.frombytes(hashlib.shake_128(self._salt + shingle.encode("utf-8")).digest(4 * self.num_perm))
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[shingle] = hashes
+        return hashes
+
+    def signature(self, text: str) -> Optional[array]:
+        """Soru metninin imzası (anlamlı kelime yoksa None)"""
+        return self.signature_from_shingles(question_shingles(text))
+
+    def signature_from_shingles(self, shingles: Iterable[str]) -> Optional[array]:
+        """Kök kümesinin imzası: her konumda köklerin hash'lerinin minimumu (küme boşsa None)"""
+        hashes = [self._shingle_hashes(shingle) for shingle in shingles]
+        if not hashes:
+            return None
+        if len(hashes) == 1:
+            return array("I", hashes[0])
+        return array("I", map(min, *hashes))
+
+    @staticmethod
+    def similarity(first: array, second: array) -> float:
+        """İki imzanın tahmini Jaccard benzerliği (eşit konumların oranı)"""
+        return sum(map(operator.eq, first, second)) / len(first)
+
+    def to_bytes(self, signature: Optional[array]) -> bytes:
+        """İmzayı kalıcı saklama için bayt dizisine çevir (None → boş)"""
+        return signature.tobytes() if signature is not None else b""
+
+    def from_bytes(self, data: Optional[bytes]) -> Optional[array]:
+        """
+        Saklanan imzayı geri yükle.
+
+        Returns:
+            array | None: İmza; veri yoksa veya farklı num_perm ile üretilmişse None
+        """
+        if not data:
+            return None
+        signature = array("I")
+        signature.frombytes(data)
+        return signature if len(signature) == self.num_perm else None
+
+class NearDuplicateIndex:
+    """Tek bir rolün LSH indeksi"""
+
+    def __init__(
+        self,
+        hasher: MinHasher,
+        threshold: float = 0.7,
+        bands: int = 16,
+        max_bucket_size: int = 256
+    ):
+        """
+        Args:
+            hasher (MinHasher): İmza üretici
+            threshold (float): Bu benzerlik ve üstü yakın-tekrar sayılır
+            bands (int): LSH bant sayısı (num_perm'i bölmeli; fazla bant = yüksek duyarlılık)
+            max_bucket_size (int): Bu boyutu aşan kovalar sorguda atlanır. Rolün çok
+                yaygın bir kelimesi ("docker") bazı bantlarda havuzun büyük kısmını
+                tek kovaya toplar; gerçek bir yakın-tekrar zaten birkaç bantta daha
+                çakıştığı için bu kovaları taramak gereksizdir.
+        """
+        self.hasher = hasher
+        self.threshold = threshold
+        self.max_bucket_size = max_bucket_size
+        self.bands = max(1, min(bands, hasher.num_perm))
+        self.rows = hasher.num_perm // self.bands
+        self._tables: List[Dict[int, Any]] = [{} for _ in range(self.bands)]
+        self._signatures: List[array] = []
+        self._texts: List[str] = []
+        self._keys: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: array) -> List[int]:
+        rows = self.rows
+        return [hash(signature[i * rows:(i + 1) * rows].tobytes()) for i in range(self.bands)]
+
+    def add(self, text: str, key: Any = None, signature: Optional[array] = None) -> bool:
+        """
+        Soruyu indekse ekle.
+
+        Args:
+            text (str): Soru metni
+            key (any, optional): Dış kimlik (ör. havuz id'si)
+            signature (array, optional): Önceden hesaplanmış imza
+
+        Returns:
+            bool: Eklendiyse True (anlamlı kelime içermeyen metinler eklenmez)
+        """
+        if signature is None:
+            signature = self.hasher.signature(text)
+        if signature is None:
+            return False
+
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        self._texts.append(text)
+        self._keys.append(key)
+        for table, band_key in zip(self._tables, self._band_keys(signature)):
+            bucket = table.get(band_key)
+            if bucket is None:
+                table[band_key] = position
+            elif isinstance(bucket, list):
+                bucket.append(position)
+            else:
+                table[band_key] = [bucket, position]
+        return True
+
+    def recent(self, limit: int) -> List[str]:
+        """Son eklenen soru metinleri (yeniden eskiye)"""
+        return self._texts[-limit:][::-1] if limit > 0 else []
+
+    def find(self, text: str = "", signature: Optional[array] = None) -> Optional[Dict[str, Any]]:
+        """
+        Eşik üstü en benzer kayıtlı soruyu bul.
+
+        Returns:
+            dict | None: {"question", "key", "similarity"} veya None
+        """
+        if signature is None:
+            signature = self.hasher.signature(text)
+        if signature is None or not self._signatures:
+            return None
+
+        candidates = set()
+        for table, band_key in zip(self._tables, self._band_keys(signature)):
+            bucket = table.get(band_key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, list):
+                if len(bucket) <= self.max_bucket_size:
+                    candidates.update(bucket)
+            else:
+                candidates.add(bucket)
+
+        best_position, best_similarity = -1, 0.0
+        for position in candidates:
+            similarity = MinHasher.similarity(signature, self._signatures[position])
+            if similarity > best_similarity:
+                best_position, best_similarity = position, similarity
+
+        if best_position < 0 or best_similarity < self.threshold:
+            return None
+        return {
+            "question": self._texts[best_position],
+            "key": self._keys[best_position],
+            "similarity": best_similarity
+        }
+
+class NearDuplicateDetector:
+    """Rol bazlı yakın-tekrar indeksleri (thread-safe)"""
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None
+    ):
+        """
+        Args:
+            threshold (float, optional): Yakın-tekrar eşiği (None ise NEAR_DUPLICATE_THRESHOLD)
+            num_perm (int, optional): İmza uzunluğu (None ise NEAR_DUPLICATE_NUM_PERM)
+            bands (int, optional): LSH bant sayısı (None ise NEAR_DUPLICATE_BANDS)
+        """
+        config = get_near_duplicate_config()
+        self.threshold = config["threshold"] if threshold is None else threshold
+        self.bands = config["bands"] if bands is None else bands
+        self.hasher = get_minhasher(config["num_perm"] if num_perm is None else num_perm)
+        self._indexes: Dict[str, NearDuplicateIndex] = {}
+        self._loaded_roles = set()
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.rejected = 0
+
+    def _index_for(self, role: str) -> NearDuplicateIndex:
+        index = self._indexes.get(role)
+        if index is None:
+            index = NearDuplicateIndex(self.hasher, self.threshold, self.bands)
+            self._indexes[role] = index
+        return index
+
+    def is_loaded(self, role: str) -> bool:
+        """Rolün geçmiş soruları indekse yüklendi mi?"""
+        return role in self._loaded_roles
+
+    def preload(self, role: str, rows: Iterable[Tuple[Any, str, Optional[array]]]) -> int:
+        """
+        Rolün daha önce üretilmiş sorularını indekse yükle (rol başına bir kez).
+
+        Args:
+            role (str): Rol anahtarı
+            rows (iterable): (anahtar, soru metni, imza veya None) üçlüleri
+
+        Returns:
+            int: Yüklenen soru sayısı
+        """
+        if role in self._loaded_roles:
+            return 0
+        # İmzası olmayan satırlar kilit dışında hash'lenir
+        rows = [
+            (key, text, signature if signature is not None else self.hasher.signature(text))
+            for key, text, signature in rows
+        ]
+        with self._lock:
+            if role in self._loaded_roles:
+                return 0
+            index = self._index_for(role)
+            loaded = sum(
+                1 for key, text, signature in rows
+                if signature is not None and index.add(text, key=key, signature=signature)
+            )
+            self._loaded_roles.add(role)
+        if loaded:
+            logger.info(f"🧬 Yakın-tekrar indeksi: {role} için {loaded} geçmiş soru yüklendi")
+        return loaded
+
+    def filter(
+        self,
+        role: str,
+        items: List[Dict[str, Any]],
+        text_of: Callable[[Dict[str, Any]], str] = lambda item: item.get("question", ""),
+        accepted: Iterable[Dict[str, Any]] = (),
+        record_stats: bool = True
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Rolün geçmişine, accepted listesine veya aynı listedeki önceki bir
+        soruya yakın olan soruları ayıkla. İndekse ekleme yapmaz (bkz. register).
+
+        İmzalar kilit alınmadan hesaplanır; kilit yalnızca rol indeksinde
+        arama süresince tutulur (eşzamanlı kategori thread'leri CPU işinde
+        birbirini beklemez).
+
+        Args:
+            role (str): Rol anahtarı
+            items (list): Aday soru sözlükleri
+            text_of (callable): Sözlükten karşılaştırılacak metni veren fonksiyon
+            accepted (iterable): Bu batch'te zaten kabul edilmiş sorular
+            record_stats (bool): Kontrol/red sayaçlarını güncelle (ön kontrollerde False)
+
+        Returns:
+            tuple: (kabul edilenler, reddedilenler) — reddedilen her girdi
+                {"question": soru sözlüğü, "duplicate_of": metin, "similarity": oran}
+        """
+        batch = NearDuplicateIndex(self.hasher, self.threshold, self.bands)
+        for item in accepted:
+            batch.add(text_of(item))
+
+        texts = [text_of(item) for item in items]
+        signatures = [self.hasher.signature(text) for text in texts]
+        with self._lock:
+            index = self._index_for(role)
+            history_matches = [index.find(signature=signature) for signature in signatures]
+
+        kept: List[Dict[str, Any]] = []
+        rejected: List[Dict[str, Any]] = []
+        for item, text, signature, match in zip(items, texts, signatures, history_matches):
+            match = match or batch.find(signature=signature)
+            if match:
+                rejected.append({
+                    "question": item,
+                    "duplicate_of": match["question"],
+                    "similarity": match["similarity"]
+                })
+                continue
+            batch.add(text, signature=signature)
+            kept.append(item)
+        if record_stats:
+            with self._lock:
+                self.checked += len(items)
+                self.rejected += len(rejected)
+        return kept, rejected
+
+    def register(
+        self,
+        role: str,
+        items: Iterable[Dict[str, Any]],
+        text_of: Callable[[Dict[str, Any]], str] = lambda item: item.get("question", "")
+    ) -> int:
+        """Kabul edilen soruları rolün indeksine ekle; eklenen sayıyı döndür"""
+        entries = [(text, self.hasher.signature(text)) for text in map(text_of, items)]
+        with self._lock:
+            index = self._index_for(role)
+            return sum(1 for text, signature in entries if signature is not None and index.add(text, signature=signature))
+
+    def recent(self, role: str, limit: int = 10) -> List[str]:
+        """Rolün indeksine son eklenen soru metinleri (yeniden eskiye)"""
+        with self._lock:
+            index = self._indexes.get(role)
+            return index.recent(limit) if index is not None else []
+
+    def stats(self) -> Dict[str, Any]:
+        """Kontrol/red sayıları ve rol başına indeks boyutu"""
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "rejected": self.rejected,
+                "roles": {role: len(index) for role, index in self._indexes.items()}
+            }
+
+_hashers: Dict[int, MinHasher] = {}
+_hashers_lock = threading.Lock()
+
+def get_minhasher(num_perm: Optional[int] = None) -> MinHasher:
+    """Verilen imza uzunluğu için paylaşılan MinHasher (None ise NEAR_DUPLICATE_NUM_PERM)"""
+    if num_perm is None:
+        num_perm = get_near_duplicate_config()["num_perm"]
+    with _hashers_lock:
+        hasher = _hashers.get(num_perm)
+        if hasher is None:
+            hasher = MinHasher(num_perm)
+            _hashers[num_perm] = hasher
+        return hasher
@@ -0,0 +1,381 @@
+"""
+SORU HAVUZU DEPOSU
+==================
+
+Üretilen soruları kalıcı bir SQLite havuzunda biriktirir. Her çalıştırmanın
+soruları eklenir (JSON dosyaları gibi üzerine yazılmaz), normalize edilmiş
+metin hash'i ile aynı rol için tekrar eden sorular eklenmez ve rol, katsayı,
+kategori, tarih ve kullanım geçmişine göre indeksli sorgu yapılabilir.
+Her sorunun MinHash imzası da saklanır; yakın-tekrar indeksi
+(utils/near_duplicate.py) rol geçmişini yeniden hash'lemeden yükler.
+
+Örnek:
+    store = QuestionStore()
+    store.query(role_code="devops_uzmani", salary_coefficient=3,
+                question_type="practical_application", limit=20,
+                random_order=True, unused_for_days=180)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config.generation_settings import get_pool_config
+from utils.near_duplicate import MinHasher, get_minhasher
+from utils.text_normalization import question_text_hash
+
+logger = logging.getLogger(__name__)
+
+# Havuzda ayrı sütun olarak tutulan veya saklanmayan soru alanları
+_COLUMN_FIELDS = {
+    "question", "expected_answer", "question_type", "type_name",
+    "role", "salary_coefficient"
+}
+_TRANSIENT_FIELDS = {"success", "raw_response", "difficulty_distribution", "api_used"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    role_code TEXT NOT NULL,
+    role_name TEXT,
+    salary_coefficient INTEGER,
+    question_type TEXT,
+    type_name TEXT,
+    question TEXT NOT NULL,
+    expected_answer TEXT,
+    text_hash TEXT NOT NULL,
+    run_id TEXT,
+    metadata TEXT,
+    created_at REAL NOT NULL,
+    last_used_at REAL,
+    use_count INTEGER NOT NULL DEFAULT 0,
+    minhash BLOB,
+    UNIQUE (role_code, text_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_questions_role_code ON questions(role_code);
+CREATE INDEX IF NOT EXISTS idx_questions_salary_coefficient ON questions(salary_coefficient);
+CREATE INDEX IF NOT EXISTS idx_questions_question_type ON questions(question_type);
+CREATE INDEX IF NOT EXISTS idx_questions_created_at ON questions(created_at);
+CREATE INDEX IF NOT EXISTS idx_questions_text_hash ON questions(text_hash);
+CREATE INDEX IF NOT EXISTS idx_questions_lookup
+    ON questions(role_code, salary_coefficient, question_type, last_used_at);
+
+CREATE TABLE IF NOT EXISTS question_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question_id INTEGER NOT NULL REFERENCES questions(id),
+    used_at REAL NOT NULL,
+    context TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_question_usage_question_id ON question_usage(question_id);
+"""
+
+class QuestionStore:
+    """SQLite tabanlı kalıcı soru havuzu"""
+
+    def __init__(self, path: Optional[str] = None, hasher: Optional[MinHasher] = None):
+        """
+        Args:
+            path (str, optional): SQLite dosya yolu (None ise QUESTION_POOL_PATH)
+            hasher (MinHasher, optional): İmza üretici (None ise NEAR_DUPLICATE_NUM_PERM)
+        """
+        self.path = path or get_pool_config()["path"]
+        self.hasher = hasher or get_minhasher()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(questions)")}
+            if "minhash" not in columns:  # imza sütunundan önce oluşturulmuş havuzlar
+                self._conn.execute("ALTER TABLE questions ADD COLUMN minhash BLOB")
+            self._conn.commit()
+        return self._conn
+
+    def add_questions(
+        self,
+        questions: Iterable[Dict[str, Any]],
+        role_code: str,
+        run_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Soruları havuza ekle; aynı rolde normalize metni aynı olanlar atlanır.
+
+        Args:
+            questions (iterable): Soru sözlükleri (question, expected_answer, question_type ...)
+            role_code (str): Rol kodu
+            run_id (str, optional): Çalıştırma kimliği
+
+        Returns:
+            dict: inserted / duplicates sayıları
+        """
+        now = time.time()
+        rows = []
+        for question in questions:
+            text = str(question.get("question", "")).strip()
+            if not text:
+                continue
+            metadata = {
+                key: value for key, value in question.items()
+                if key not in _COLUMN_FIELDS and key not in _TRANSIENT_FIELDS
+            }
+            rows.append((
+                role_code,
+                question.get("role"),
+                question.get("salary_coefficient"),
+                question.get("question_type"),
+                question.get("type_name"),
+                text,
+                question.get("expected_answer", ""),
+                question_text_hash(text),
+                run_id,
+                json.dumps(metadata, ensure_ascii=False) if metadata else None,
+                now,
+                self.hasher.to_bytes(self.hasher.signature(text))
+            ))
+
+        if not rows:
+            return {"inserted": 0, "duplicates": 0}
+
+        with self._lock:
+            conn = self._connection()
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO questions (
+                    role_code, role_name, salary_coefficient, question_type, type_name,
+                    question, expected_answer, text_hash, run_id, metadata, created_at, minhash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            conn.commit()
+            inserted = conn.total_changes - before
+
+        return {"inserted": inserted, "duplicates": len(rows) - inserted}
+
+    def add_generation_result(self, result: Dict[str, Any], run_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        SingleGenerator sonucundaki ({kategori: [sorular]}) tüm soruları ekle.
+
+        Args:
+            result (dict): generate_questions sonucu (role_code içermeli)
+            run_id (str, optional): Çalıştırma kimliği
+
+        Returns:
+            dict: inserted / duplicates sayıları
+        """
+        questions = result.get("questions", {})
+        if isinstance(questions, dict):
+            flat = [question for category in questions.values() for question in category]
+        else:
+            flat = list(questions)
+        return self.add_questions(flat, result["role_code"], run_id=run_id)
+
+    def query(
+        self,
+        role_code: Optional[str] = None,
+        salary_coefficient: Optional[int] = None,
+        question_type: Optional[str] = None,
+        limit: Optional[int] = 20,
+        random_order: bool = False,
+        unused_for_days: Optional[float] = None,
+        created_after: Optional[float] = None,
+        exclude_ids: Optional[Iterable[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Filtreli soru sorgusu.
+
+        Args:
+            role_code (str, optional): Rol kodu
+            salary_coefficient (int, optional): Maaş katsayısı
+            question_type (str, optional): Kategori kodu
+            limit (int, optional): Maksimum sonuç (None ise sınırsız)
+            random_order (bool): Rastgele sırala (False ise en yeni önce)
+            unused_for_days (float, optional): Son N günde kullanılmamış olanlar
+            created_after (float, optional): Bu zaman damgasından sonra eklenenler
+            exclude_ids (iterable, optional): Hariç tutulacak soru id'leri
+
+        Returns:
+            list: Soru sözlükleri (id, metadata alanları dahil)
+        """
+        clauses = []
+        params: List[Any] = []
+
+        for column, value in (
+            ("role_code", role_code),
+            ("salary_coefficient", salary_coefficient),
+            ("question_type", question_type)
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if unused_for_days is not None:
+            clauses.append("(last_used_at IS NULL OR last_used_at < ?)")
+            params.append(time.time() - unused_for_days * 86400)
+
+        if created_after is not None:
+            clauses.append("created_at > ?")
+            params.append(created_after)
+
+        excluded = list(exclude_ids or [])
+        if excluded:
+            clauses.append(f"id NOT IN ({','.join('?' * len(excluded))})")
+            params.extend(excluded)
+
+        sql = "SELECT * FROM questions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY RANDOM()" if random_order else " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [self._row_to_question(row) for row in rows]
+
+    def count(
+        self,
+        role_code: Optional[str] = None,
+        salary_coefficient: Optional[int] = None,
+        question_type: Optional[str] = None
+    ) -> int:
+        """Filtreye uyan soru sayısı"""
+        clauses = []
+        params: List[Any] = []
+        for column, value in (
+            ("role_code", role_code),
+            ("salary_coefficient", salary_coefficient),
+            ("question_type", question_type)
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        sql = "SELECT COUNT(*) FROM questions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+
+        with self._lock:
+            return self._connection().execute(sql, params).fetchone()[0]
+
+    def mark_used(self, question_ids: Iterable[int], context: Optional[str] = None):
+        """
+        Soruları kullanıldı olarak işaretle (ör. bir adaya sorulduğunda).
+
+        Args:
+            question_ids (iterable): Soru id'leri
+            context (str, optional): Kullanım bağlamı (aday, oturum vb.)
+        """
+        ids = list(question_ids)
+        if not ids:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "UPDATE questions SET last_used_at = ?, use_count = use_count + 1 WHERE id = ?",
+                [(now, question_id) for question_id in ids]
+            )
+            conn.executemany(
+                "INSERT INTO question_usage (question_id, used_at, context) VALUES (?, ?, ?)",
+                [(question_id, now, context) for question_id in ids]
+            )
+            conn.commit()
+
+    def contains(self, role_code: str, question_text: str) -> bool:
+        """Aynı rolde normalize metni aynı olan soru var mı?"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM questions WHERE role_code = ? AND text_hash = ? LIMIT 1",
+                (role_code, question_text_hash(question_text))
+            ).fetchone()
+        return row is not None
+
+    def near_duplicate_rows(self, role_code: str) -> List[Tuple[int, str, Optional[array]]]:
+        """
+        Rolün tüm sorularını yakın-tekrar indeksine yüklemek için döndür.
+
+        İmzası olmayan (eski) veya farklı num_perm ile hesaplanmış satırların
+        imzası yeniden hesaplanıp havuza yazılır.
+
+        Args:
+            role_code (str): Rol kodu
+
+        Returns:
+            list: (id, soru metni, imza) üçlüleri
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id, question, minhash FROM questions WHERE role_code = ?", (role_code,)
+            ).fetchall()
+
+        result = []
+        backfill = []
+        for row in rows:
+            if row["minhash"] == b"":  # anlamlı kelime içermeyen soru, indekslenmez
+                continue
+            signature = self.hasher.from_bytes(row["minhash"])
+            if signature is None:
+                signature = self.hasher.signature(row["question"])
+                backfill.append((self.hasher.to_bytes(signature), row["id"]))
+            if signature is not None:
+                result.append((row["id"], row["question"], signature))
+
+        if backfill:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany("UPDATE questions SET minhash = ? WHERE id = ?", backfill)
+                conn.commit()
+            logger.info(f"🧬 {role_code}: {len(backfill)} sorunun MinHash imzası hesaplandı")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Rol/katsayı/kategori bazında soru sayıları"""
+        with self._lock:
+            conn = self._connection()
+            total = conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+            groups = conn.execute(
+                """
+                SELECT role_code, salary_coefficient, question_type, COUNT(*) AS total
+                FROM questions
+                GROUP BY role_code, salary_coefficient, question_type
+                ORDER BY role_code, salary_coefficient, question_type
+                """
+            ).fetchall()
+        return {"total": total, "groups": [dict(row) for row in groups]}
+
+    def close(self):
+        """SQLite bağlantısını kapat"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _row_to_question(row: sqlite3.Row) -> Dict[str, Any]:
+        question = dict(row)
+        metadata = question.pop("metadata", None)
+        if metadata:
+            for key, value in json.loads(metadata).items():
+                question.setdefault(key, value)
+        question["role"] = question.pop("role_name")
+        question.pop("minhash", None)
+        return question
+
+def new_run_id() -> str:
+    """Çalıştırma kimliği üret (zaman damgası + kısa rastgele ek)"""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
@@ -0,0 +1,115 @@
+"""
+TÜRKÇE METİN NORMALİZASYONU
+===========================
+
+Soru metinlerini karşılaştırma ve tekilleştirme için normalize eden
+yardımcı fonksiyonlar. Türkçe büyük/küçük harf dönüşümü (I → ı, İ → i)
+str.lower()'dan farklı olduğu için ayrıca ele alınır. Yakın-tekrar tespiti
+için etkisiz kelimeleri atılmış, ek budanmış kelime kökü kümesi de üretilir.
+"""
+
+import functools
+import hashlib
+import re
+import unicodedata
+from typing import FrozenSet
+
+_TURKISH_UPPER_MAP = str.maketrans({"I": "ı", "İ": "i"})
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+# Soru kalıbı ve bağlaç kelimeleri: ifade değişse de sorunun konusunu değiştirmez
+TURKISH_STOPWORDS: FrozenSet[str] = frozenset("""
+    acaba ama ancak arasında arasındaki açıklayın açıklayınız açıklar mısınız anlatın anlatınız
+    bana belirtin belirtiniz bir biri birkaç bu bunu bunun bunlar burada da daha de diye
+    en gibi hangi hangileri her hem için ile ise kadar ki mi mı mu mü midir mıdır
+    nasıl ne neden nedir nelerdir nerede niçin o olan olarak olur olduğu onu siz size
+    sizce sizin söyleyin şu tanımlayın ve veya ya yani örnek örnekle örneklerle
+""".split())
+
+# Kök budamada sırayla denenen Türkçe çekim ekleri (uzundan kısaya)
+_TURKISH_SUFFIXES = tuple(sorted(
+    {
+        "larından", "lerinden", "larında", "lerinde", "larını", "lerini", "ların", "lerin",
+        "ları", "leri", "lar", "ler", "ında", "inde", "undan", "ünden", "ından", "inden",
+        "dır", "dir", "dur", "dür", "tır", "tir", "tur", "tür", "nın", "nin", "nun", "nün",
+        "dan", "den", "tan", "ten", "da", "de", "ta", "te", "ın", "in", "un", "ün",
+        "yı", "yi", "yu", "yü", "ya", "ye", "sı", "si", "su", "sü",
+        "ı", "i", "u", "ü", "a", "e",
+    },
+    key=len, reverse=True
+))
+_MIN_STEM_LENGTH = 3
+_STEM_PREFIX_LENGTH = 5
+
+def turkish_lower(text: str) -> str:
+    """Türkçe kurallarına göre küçük harfe çevir"""
+    return text.translate(_TURKISH_UPPER_MAP).lower()
+
+def normalize_question_text(text: str) -> str:
+    """
+    Soru metnini karşılaştırma için normalize et.
+
+    Unicode NFKC, Türkçe küçük harf, noktalama ve fazla boşlukların
+    kaldırılması. Kod blokları korunur (kodlu sorular kodla ayırt edilir).
+
+    Args:
+        text (str): Ham soru metni
+
+    Returns:
+        str: Normalize edilmiş metin
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text)
+    text = turkish_lower(text).replace("\u0307", "")  # ayrık yazılmış "i̇" birleşik noktası
+    return _NON_WORD.sub(" ", text).strip()
+
+def question_text_hash(text: str) -> str:
+    """
+    Normalize edilmiş soru metninin hash'i (tekilleştirme anahtarı).
+
+    Args:
+        text (str): Ham soru metni
+
+    Returns:
+        str: SHA-1 hex
+    """
+    return hashlib.sha1(normalize_question_text(text).encode("utf-8")).hexdigest()
+
+@functools.lru_cache(maxsize=65536)
+def stem_turkish_token(token: str) -> str:
+    """
+    Türkçe kelimeyi kaba köküne indir.
+
+    Çekim ekleri sondan en fazla üç kez budanır, sonuç ilk 5 karaktere
+    kesilir (Türkçe bilgi erişiminde yaygın "F5" yaklaşımı). Sözlük
+    gerektirmez; "farkları", "farkı" ve "fark" aynı köke iner.
+    """
+    for _ in range(3):
+        for suffix in _TURKISH_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= _MIN_STEM_LENGTH:
+                token = token[:-len(suffix)]
+                break
+        else:
+            break
+    return token[:_STEM_PREFIX_LENGTH]
+
+def question_shingles(text: str) -> FrozenSet[str]:
+    """
+    Yakın-tekrar karşılaştırması için soru metninin kök kümesi.
+
+    Normalize metin kelimelere bölünür, tek harfli parçalar ve etkisiz
+    kelimeler atılır, kalanlar köke indirilir. Kelime sırası dikkate
+    alınmaz ("Docker ile Kubernetes" ~ "Kubernetes ve Docker").
+
+    Args:
+        text (str): Ham soru metni
+
+    Returns:
+        frozenset: Kök kümesi (boş olabilir)
+    """
+    return frozenset(
+        stem_turkish_token(token)
+        for token in normalize_question_text(text).split()
+        if len(token) > 1 and token not in TURKISH_STOPWORDS
+    )
@@ -0,0 +1,310 @@
+"""
+AŞAMA SÜRESİ İZLEME (TRACING)
+=============================
+
+Hafif span / zamanlayıcı API'si: bir çalıştırmanın süresinin API gecikmesi,
+parse denemeleri veya DOCX yazımı arasında nasıl dağıldığını gösterir.
+
+    with span("llm.complete", model="gpt-4o-mini") as current:
+        ...
+        current.set(tokens=812)
+
+    @traced("export.docx")
+    def export_questions(...): ...
+
+Span'ler iç içe geçer (üst span contextvars ile izlenir; thread havuzlarına
+`contextvars.copy_context().run` ile aktarılır). Kayıtlar JSONL'e veya
+Chrome trace biçimine (chrome://tracing, Perfetto) yazılabilir.
+
+İzleme kapalıyken (TRACE_ENABLED=false, varsayılan) `span` paylaşılan boş
+bir context manager döndürür ve `traced` fonksiyonu doğrudan çağırır;
+maliyet tek bir bayrak kontrolüdür.
+"""
+
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config.generation_settings import get_tracing_config
+
+logger = logging.getLogger(__name__)
+
+# Geçerli (açık) span; yeni span'lerin üstü olur
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+class Span:
+    """Tamamlanmış veya açık tek bir zaman aralığı"""
+
+    __slots__ = ("span_id", "parent_id", "name", "attrs", "thread_id", "thread_name", "start_ns", "end_ns", "error")
+
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, attrs: Dict[str, Any]):
+        thread = threading.current_thread()
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attrs):
+        """Span'e öznitelik ekle (ör. token sayısı, bulunan soru sayısı)"""
+        self.attrs.update(attrs)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1_000_000
+
+class _NoopSpan:
+    """İzleme kapalıyken dönen, hiçbir şey yapmayan span"""
+
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NOOP_SPAN = _NoopSpan()
+
+class _SpanContext:
+    """Span'i açıp kapatan context manager"""
+
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]):
+        self._tracer = tracer
+        parent = _current_span.get()
+        self._span = Span(next(tracer._ids), parent.span_id if parent is not None else None, name, attrs)
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        self._span.start_ns = time.perf_counter_ns()
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        self._span.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self._span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer._finish(self._span)
+        return False
+
+class Tracer:
+    """Span'leri toplayan ve dışa aktaran izleyici (thread-safe)"""
+
+    def __init__(self, enabled: Optional[bool] = None, max_spans: Optional[int] = None):
+        """
+        Args:
+            enabled: İzleme açık mı (None ise TRACE_ENABLED)
+            max_spans: Bellekte tutulacak en fazla span (None ise TRACE_MAX_SPANS);
+                sınır aşılırsa yeni span'ler sayılıp atılır
+        """
+        config = get_tracing_config()
+        self.enabled = config["enabled"] if enabled is None else enabled
+        self.max_spans = max_spans or config["max_spans"]
+        self.directory = config["directory"]
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.reset()
+
+    def reset(self):
+        """Toplanan span'leri sil"""
+        with self._lock:
+            self._spans: List[Span] = []
+            self.dropped = 0
+            self.last_export: Dict[str, str] = {}
+            self._origin_ns = time.perf_counter_ns()
+            self._origin_wall = time.time()
+
+    def enable(self, enabled: bool = True):
+        """İzlemeyi aç / kapat"""
+        self.enabled = enabled
+
+    def span(self, name: str, **attrs):
+        """
+        Zaman aralığı aç (context manager). İzleme kapalıysa boş span döner.
+
+        Args:
+            name: Aşama adı (ör. "llm.complete", "parse.scanner")
+            **attrs: Span öznitelikleri
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _SpanContext(self, name, attrs)
+
+    def _finish(self, span: Span):
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+
+    def spans(self) -> List[Span]:
+        """Tamamlanmış span'lerin kopyası (başlangıç sırasına göre)"""
+        with self._lock:
+            spans = list(self._spans)
+        return sorted(spans, key=lambda item: item.start_ns)
+
+    def _span_record(self, span: Span) -> Dict[str, Any]:
+        return {
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start_ms": (span.start_ns - self._origin_ns) / 1_000_000,
+            "duration_ms": span.duration_ms,
+            "thread": span.thread_name,
+            "attrs": span.attrs,
+            "error": span.error
+        }
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aşama bazında özet (toplam süreye göre azalan).
+
+        Returns:
+            list: name, count, errors, total_ms, avg_ms, max_ms
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans():
+            row = stats.setdefault(span.name, {"name": span.name, "count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+            row["count"] += 1
+            row["errors"] += 1 if span.error else 0
+            row["total_ms"] += span.duration_ms
+            row["max_ms"] = max(row["max_ms"], span.duration_ms)
+        for row in stats.values():
+            row["avg_ms"] = row["total_ms"] / row["count"]
+        return sorted(stats.values(), key=lambda row: row["total_ms"], reverse=True)
+
+    def export_jsonl(self, path: str) -> int:
+        """Span'leri satır başına bir JSON kaydı olarak yaz; yazılan span sayısını döndür"""
+        spans = self.spans()
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("w", encoding="utf-8") as handle:
+            for span in spans:
+                handle.write(json.dumps(self._span_record(span), ensure_ascii=False, default=str) + "\n")
+        return len(spans)
+
+    def export_chrome(self, path: str) -> int:
+        """Span'leri Chrome trace biçiminde (chrome://tracing, Perfetto) yaz"""
+        spans = self.spans()
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+        for span in spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            args = dict(span.attrs)
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms",
+                        "otherData": {"started_at": self._origin_wall}}, ensure_ascii=False, default=str),
+            encoding="utf-8"
+        )
+        return len(spans)
+
+    def export(self, run_id: str, directory: Optional[str] = None) -> Dict[str, str]:
+        """
+        Span'leri TRACE_DIR altına <run_id>.jsonl ve <run_id>.trace.json olarak yaz.
+
+        Returns:
+            dict: "jsonl" ve "chrome" dosya yolları (span yoksa boş)
+        """
+        if not self._spans:
+            return {}
+        base = Path(directory or self.directory) / run_id
+        paths = {"jsonl": f"{base}.jsonl", "chrome": f"{base}.trace.json"}
+        count = self.export_jsonl(paths["jsonl"])
+        self.export_chrome(paths["chrome"])
+        self.last_export = paths
+        logger.info(f"🔬 {count} span yazıldı: {paths['jsonl']}, {paths['chrome']}")
+        if self.dropped:
+            logger.warning(f"TRACE_MAX_SPANS aşıldı, {self.dropped} span atlandı")
+        return paths
+
+# Tüm katmanların paylaştığı izleyici
+_shared_tracer = Tracer()
+
+def get_shared_tracer() -> Tracer:
+    """Paylaşılan izleyiciyi döndür"""
+    return _shared_tracer
+
+def span(name: str, **attrs):
+    """Paylaşılan izleyicide span aç (bkz. Tracer.span)"""
+    return _shared_tracer.span(name, **attrs)
+
+def current_span():
+    """
+    Açık span (öznitelik eklemek için); izleme kapalıysa veya span yoksa boş span.
+    """
+    return _current_span.get() or _NOOP_SPAN
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Fonksiyonu paylaşılan izleyicide span ile saran decorator (sync ve async).
+
+    Liste döndüren fonksiyonlarda eleman sayısı "items" özniteliğine yazılır
+    (ör. hangi parse stratejisinin kaç soru bulduğu).
+
+    Args:
+        name: Span adı (None ise fonksiyonun nitelikli adı)
+    """
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not _shared_tracer.enabled:
+                    return await fn(*args, **kwargs)
+                with _SpanContext(_shared_tracer, span_name, {}) as current:
+                    result = await fn(*args, **kwargs)
+                    if isinstance(result, list):
+                        current.set(items=len(result))
+                    return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _shared_tracer.enabled:
+                return fn(*args, **kwargs)
+            with _SpanContext(_shared_tracer, span_name, {}) as current:
+                result = fn(*args, **kwargs)
+                if isinstance(result, list):
+                    current.set(items=len(result))
+                return result
+        return wrapper
+
+    return decorator